@@ -1,9 +1,11 @@
+-- name: list_tables
 -- 테이블 목록 조회
 SELECT table_name
 FROM information_schema.tables
 WHERE table_schema = DATABASE()
 ORDER BY table_name;
 
+-- name: table_columns
 -- 테이블 정보 조회
 SELECT 
     column_name AS 'Field',
@@ -14,9 +16,10 @@ SELECT
     extra AS 'Extra'
 FROM information_schema.columns
 WHERE table_schema = DATABASE()
-AND table_name = ?
+AND table_name = :table_name
 ORDER BY ordinal_position;
 
+-- name: table_foreign_keys
 -- 테이블 외래키 관계 조회
 SELECT 
     tc.constraint_name,
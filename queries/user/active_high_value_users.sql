@@ -1,19 +1,11 @@
 -- 7일 이상 게임 기록이 있고 전체 유효배팅의 합이 50,000 이상인 사용자 ID 조회
+-- (high_value_users 스냅샷 테이블 기준, src/database/high_value_snapshot.py 참고)
 SELECT 
-    pl.id AS player_id, 
-    pl.userId AS username,
-    COUNT(DISTINCT gs.gameDate) AS distinct_play_days,
-    SUM(gs.netBet) AS total_valid_betting
+    h.player_id, 
+    h.userId AS username,
+    h.play_days AS distinct_play_days,
+    h.total_valid_bet AS total_valid_betting
 FROM 
-    players pl
-JOIN 
-    game_scores gs ON pl.userId = gs.userId
-WHERE 
-    gs.netBet > 0
-GROUP BY 
-    pl.id, pl.userId
-HAVING 
-    COUNT(DISTINCT gs.gameDate) >= 7
-    AND SUM(gs.netBet) >= 50000
+    high_value_users h
 ORDER BY 
-    total_valid_betting DESC;
\ No newline at end of file
+    total_valid_betting DESC;
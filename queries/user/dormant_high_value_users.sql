@@ -1,33 +1,15 @@
 -- 고가치 사용자 중 휴면 상태인 사용자 식별 (최근 30일 이내 활동 없음)
-WITH high_value_users AS (
-    SELECT 
-        pl.id AS player_id, 
-        pl.userId AS username,
-        COUNT(DISTINCT gs.gameDate) AS distinct_play_days,
-        SUM(gs.netBet) AS total_valid_betting,
-        MAX(gs.gameDate) AS last_play_date
-    FROM 
-        players pl
-    JOIN 
-        game_scores gs ON pl.userId = gs.userId
-    WHERE 
-        gs.netBet > 0
-    GROUP BY 
-        pl.id, pl.userId
-    HAVING 
-        COUNT(DISTINCT gs.gameDate) >= 7
-        AND SUM(gs.netBet) >= 50000
-)
+-- (high_value_users 스냅샷 테이블 기준, src/database/high_value_snapshot.py 참고)
 SELECT 
-    hvu.player_id,
-    hvu.username,
-    hvu.distinct_play_days,
-    hvu.total_valid_betting,
-    hvu.last_play_date,
-    DATEDIFF(CURRENT_DATE, hvu.last_play_date) AS days_since_last_play
+    h.player_id,
+    h.userId AS username,
+    h.play_days AS distinct_play_days,
+    h.total_valid_bet AS total_valid_betting,
+    h.last_play_date,
+    DATEDIFF(CURRENT_DATE, h.last_play_date) AS days_since_last_play
 FROM 
-    high_value_users hvu
+    high_value_users h
 WHERE 
-    DATEDIFF(CURRENT_DATE, hvu.last_play_date) > 30
+    h.last_play_date < CURRENT_DATE - INTERVAL 30 DAY
 ORDER BY 
-    total_valid_betting DESC;
\ No newline at end of file
+    total_valid_betting DESC;
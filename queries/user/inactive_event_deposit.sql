@@ -2,8 +2,9 @@
 -- 생성일: 2025년 5월 17일
 -- 설명: 10일 이상 게임을 하지 않은 사용자 중 이벤트 지급을 받은 후 입금 기록이 있는 사용자를 찾는 쿼리
 
--- 분석 단계별 쿼리
+-- 분석 단계별 쿼리 (SQL 카탈로그에서 '-- name:' 섹션 이름으로 조회, :days_inactive 파라미터 사용)
 
+-- name: inactive_users
 -- 1. 10일 이상 게임을 하지 않은 사용자 찾기
 SELECT 
     id,
@@ -11,8 +12,9 @@ SELECT
     lastPlayDate
 FROM players
 WHERE lastPlayDate IS NOT NULL 
-AND lastPlayDate < DATE_SUB(CURRENT_DATE(), INTERVAL 10 DAY);
+AND lastPlayDate < DATE_SUB(CURRENT_DATE(), INTERVAL :days_inactive DAY);
 
+-- name: event_reward_users
 -- 2. 이벤트를 받은 사용자 찾기
 SELECT 
     p.player, 
@@ -24,6 +26,7 @@ JOIN players pl ON p.player = pl.id
 WHERE p.appliedAt IS NOT NULL
 GROUP BY p.player, pl.userId;
 
+-- name: event_deposit_users
 -- 3. 이벤트 이후 입금 기록이 있는 사용자 찾기
 WITH FirstPromotion AS (
     SELECT 
@@ -52,7 +55,7 @@ JOIN
 JOIN 
     money_flows mf ON pl.id = mf.player
 WHERE 
-    pl.lastPlayDate < DATE_SUB(CURRENT_DATE(), INTERVAL 10 DAY)
+    pl.lastPlayDate < DATE_SUB(CURRENT_DATE(), INTERVAL :days_inactive DAY)
     AND mf.type = 0 -- 입금
 GROUP BY 
     pl.id, pl.userId, fp.first_promotion_date, pl.lastPlayDate
@@ -61,6 +64,7 @@ HAVING
 ORDER BY 
     pl.lastPlayDate DESC;
 
+-- name: inactive_event_deposit_users
 -- 4. 최종 쿼리: 모든 조건을 만족하는 사용자 찾기
 WITH FirstPromotion AS (
     -- 각 사용자의 첫 이벤트 지급 날짜
@@ -84,7 +88,7 @@ InactiveUsers AS (
         players
     WHERE 
         lastPlayDate IS NOT NULL 
-        AND lastPlayDate < DATE_SUB(CURRENT_DATE(), INTERVAL 10 DAY)
+        AND lastPlayDate < DATE_SUB(CURRENT_DATE(), INTERVAL :days_inactive DAY)
 ),
 EventUsers AS (
     -- 이벤트를 받은 사용자
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+계층적 클러스터링 벤치마크
+
+전체 데이터에 AgglomerativeClustering(Ward)을 적용하는 기존 방식과
+src.analysis.two_stage_clustering의 2단계 방식(미세 클러스터 + 가중 Ward)을
+같은 데이터로 실행해 실행 시간, 최대 메모리 사용량, 레이블 일치도(ARI)를 비교합니다.
+기존 방식은 메모리가 행 수의 제곱에 비례하므로 --exact-limit 행까지만 실행합니다.
+
+사용법:
+    python scripts/benchmark_hierarchical_clustering.py --rows 5000 20000 200000 1000000
+"""
+
+import sys
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+from sklearn.cluster import AgglomerativeClustering
+from sklearn.metrics import adjusted_rand_score
+
+# 프로젝트 루트 디렉토리를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis.two_stage_clustering import TwoStageWardClustering
+
+def make_data(rows: int, n_features: int = 8, n_centers: int = 6) -> np.ndarray:
+    """벤치마크용 표준화 특성 데이터 생성 (군집 + 잡음)"""
+    rng = np.random.default_rng(42)
+    centers = rng.normal(scale=3.0, size=(n_centers, n_features))
+    labels = rng.integers(0, n_centers, rows)
+    return centers[labels] + rng.normal(size=(rows, n_features))
+
+def measured(func):
+    """실행 시간(초)과 최대 메모리(MB), 결과 반환"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024, result
+
+def main():
+    parser = argparse.ArgumentParser(description='계층적 클러스터링 벤치마크')
+    parser.add_argument('--rows', type=int, nargs='+', default=[5_000, 20_000, 200_000], help='벤치마크 행 수')
+    parser.add_argument('--clusters', type=int, default=5, help='최종 클러스터 수')
+    parser.add_argument('--micro-clusters', type=int, default=1000, help='2단계 방식의 미세 클러스터 수')
+    parser.add_argument('--exact-limit', type=int, default=20_000, help='기존 방식을 실행할 최대 행 수')
+    args = parser.parse_args()
+
+    print(f"{'rows':>10}{'exact s':>10}{'exact MB':>10}{'two-stage s':>13}{'two-stage MB':>14}{'ARI':>7}")
+    for rows in args.rows:
+        data = make_data(rows)
+
+        two_time, two_mem, two_labels = measured(
+            lambda: TwoStageWardClustering(args.clusters, n_micro_clusters=args.micro_clusters).fit_predict(data)
+        )
+
+        if rows <= args.exact_limit:
+            exact_time, exact_mem, exact_labels = measured(
+                lambda: AgglomerativeClustering(n_clusters=args.clusters, linkage='ward').fit_predict(data)
+            )
+            ari = f"{adjusted_rand_score(exact_labels, two_labels):.3f}"
+            exact = f"{exact_time:>10.2f}{exact_mem:>10.0f}"
+        else:
+            ari = '-'
+            exact = f"{'skipped':>10}{'-':>10}"
+
+        print(f"{rows:>10,}{exact}{two_time:>13.2f}{two_mem:>14.0f}{ari:>7}")
+
+if __name__ == '__main__':
+    main()
@@ -14,6 +14,7 @@ from datetime import datetime
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.database.connection import DatabaseConnection
+from src.database.high_value_snapshot import HighValueSnapshot
 
 def main():
     """메인 함수"""
@@ -26,38 +27,16 @@ def main():
         # 쿼리 실행
         print(f"[{datetime.now()}] 고가치 사용자 유저명과 실제 이름 조회 중...")
         
-        query = """
-        WITH high_value_users AS (
-            SELECT 
-                pl.userId AS username,
-                COUNT(DISTINCT gs.gameDate) AS distinct_play_days,
-                SUM(gs.netBet) AS total_valid_betting
-            FROM 
-                players pl
-            JOIN 
-                game_scores gs ON pl.userId = gs.userId
-            WHERE 
-                gs.netBet > 0
-            GROUP BY 
-                pl.userId
-            HAVING 
-                COUNT(DISTINCT gs.gameDate) >= 7
-                AND SUM(gs.netBet) >= 50000
-        )
-        SELECT 
-            h.username AS userId,
-            p.name,
-            h.distinct_play_days,
-            h.total_valid_betting
-        FROM 
-            high_value_users h
-        JOIN 
-            players p ON h.username = p.userId
-        ORDER BY 
-            h.total_valid_betting DESC;
-        """
-        
-        results = db.query(query)
+        # high_value_users 스냅샷에서 조회
+        results = [
+            {
+                'userId': row['username'],
+                'name': row['name'],
+                'distinct_play_days': row['play_days'],
+                'total_valid_betting': row['total_valid_bet']
+            }
+            for row in HighValueSnapshot(db).read(with_names=True)
+        ]
         
         # 결과 확인
         print(f"[{datetime.now()}] 조회된 사용자: {len(results)}명")
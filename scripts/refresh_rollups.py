@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+일 단위 롤업 테이블 갱신
+
+분석 API(이벤트 효과, 휴면 세그먼트, 고가치 사용자)가 읽는 롤업 테이블에
+마지막 실행 이후 추가된 원본 행을 반영하고, game_scores를 반영한 경우
+high_value_users 스냅샷도 갱신합니다. cron 등으로 주기적으로 실행합니다.
+
+사용법:
+    python scripts/refresh_rollups.py
+    python scripts/refresh_rollups.py --source game_scores
+    python scripts/refresh_rollups.py --rebuild
+"""
+
+import sys
+import argparse
+import logging
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from src.database.mariadb_connection import MariaDBConnection
+from src.database.rollups import DEFAULT_ID_RESCAN_WINDOW, DailyRollups, ROLLUP_SOURCES
+from src.database.high_value_snapshot import HighValueSnapshot
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="일 단위 롤업 테이블 갱신")
+    parser.add_argument('--source', action='append', choices=sorted(ROLLUP_SOURCES),
+                        help="반영할 원본 테이블 (여러 번 지정 가능, 기본값은 전체)")
+    parser.add_argument('--rebuild', action='store_true',
+                        help="롤업과 워터마크를 비우고 전체 이력을 다시 적재")
+    parser.add_argument('--safety-lag', type=int, default=60,
+                        help="최근 행을 다음 실행으로 미루는 지연 시간(초)")
+    parser.add_argument('--id-window', type=int, default=DEFAULT_ID_RESCAN_WINDOW,
+                        help="game_scores에서 워터마크 아래로 다시 계산하는 id 개수")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    with MariaDBConnection() as db:
+        rollups = DailyRollups(db, safety_lag_seconds=args.safety_lag, id_rescan_window=args.id_window)
+        if args.rebuild:
+            counts = rollups.rebuild(args.source)
+        else:
+            counts = rollups.refresh(args.source)
+
+        if 'game_scores' in counts:
+            snapshot = HighValueSnapshot(db, rollups)
+            snapshot_rows = snapshot.rebuild() if args.rebuild else snapshot.refresh()
+            print(f"high_value_users: {snapshot_rows} snapshot rows affected")
+
+    for source, count in counts.items():
+        print(f"{source}: {count} rollup rows affected")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,6 +3,8 @@
 API 서버 실행 스크립트
 
 이 스크립트는 고가치 사용자 데이터 API 서버를 실행합니다.
+HIGH_VALUE_REFRESH_MINUTES(기본값 15, 0이면 사용 안 함)마다 high_value_users
+스냅샷을 백그라운드에서 갱신합니다.
 """
 
 import sys
@@ -15,6 +17,7 @@ sys.path.insert(0, str(project_root))
 
 # API 모듈 임포트
 from src.api.high_value_users_api import app
+from src.database.high_value_snapshot import start_scheduler
 
 if __name__ == "__main__":
     print("=" * 80)
@@ -25,4 +28,11 @@ if __name__ == "__main__":
     print(f"API 서버가 http://localhost:{port} 에서 실행됩니다...")
     print(f"고가치 사용자 목록 API: http://localhost:{port}/api/high-value-users")
     
+    # 디버그 리로더의 감시 프로세스가 아닌 실제 서버 프로세스에서만 스케줄러 시작
+    refresh_minutes = float(os.environ.get('HIGH_VALUE_REFRESH_MINUTES', 15))
+    if refresh_minutes > 0 and os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        from src.database.mariadb_connection import MariaDBConnection
+        start_scheduler(MariaDBConnection, interval_minutes=refresh_minutes,
+                        parquet_path=os.environ.get('HIGH_VALUE_PARQUET_PATH'))
+    
     app.run(host='0.0.0.0', port=port, debug=True)
@@ -0,0 +1,288 @@
+"""
+확장 가능한 클러스터 수 탐색 모듈
+
+이 모듈은 대용량 데이터에서 최적 클러스터 수를 찾기 위한 탐색 도구를 제공합니다.
+각 k는 MiniBatchKMeans로 학습하고, 실루엣 점수는 고정 크기 표본으로 계산하며,
+k 후보들은 프로세스 풀에서 동시에 평가합니다. 이전 실행의 중심점으로 학습을
+시작(warm start)하고, 데이터 지문별로 선택된 k를 캐시해 같은 데이터의 반복 실행은
+탐색을 건너뜁니다.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.metrics import silhouette_score, calinski_harabasz_score, davies_bouldin_score
+
+logger = logging.getLogger(__name__)
+
+def data_fingerprint(data: pd.DataFrame) -> str:
+    """
+    데이터 지문(해시) 계산
+
+    열 이름과 모든 값의 행 해시를 기반으로 하므로 값이나 열 구성이 바뀌면
+    다른 지문이 됩니다. 행 인덱스는 지문에 포함하지 않습니다.
+
+    Args:
+        data (pd.DataFrame): 클러스터링할 데이터
+
+    Returns:
+        str: SHA-1 지문
+    """
+    digest = hashlib.sha1()
+    digest.update(json.dumps([str(col) for col in data.columns]).encode('utf-8'))
+    digest.update(str(data.shape).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(data, index=False).values.tobytes())
+    return digest.hexdigest()
+
+def recommend_cluster_count(best_counts: Iterable[int]) -> int:
+    """
+    지표별 최적 클러스터 수 중 최빈값 선택 (동률이면 가장 작은 값)
+
+    Args:
+        best_counts (Iterable[int]): 지표별 최적 클러스터 수
+
+    Returns:
+        int: 추천 클러스터 수
+    """
+    counts = Counter(int(n) for n in best_counts)
+    top = max(counts.values())
+    return min(n for n, count in counts.items() if count == top)
+
+def evaluate_cluster_count(values: np.ndarray, n_clusters: int, init: Optional[np.ndarray] = None,
+                           batch_size: int = 4096, silhouette_sample_size: int = 10000,
+                           random_state: int = 42) -> Dict[str, Any]:
+    """
+    하나의 k에 대해 MiniBatchKMeans 학습 및 평가 지표 계산
+
+    프로세스 풀에서 실행되므로 모듈 수준 함수로 둡니다.
+
+    Args:
+        values (np.ndarray): 표준화된 데이터 배열
+        n_clusters (int): 클러스터 수
+        init (np.ndarray, optional): 초기 중심점 (n_clusters x 특성 수). 없으면 k-means++.
+        batch_size (int, optional): 미니배치 크기. 기본값은 4096.
+        silhouette_sample_size (int, optional): 실루엣 점수 표본 크기. 기본값은 10000.
+        random_state (int, optional): 난수 시드. 기본값은 42.
+
+    Returns:
+        Dict[str, Any]: k, 평가 지표, 관성, 중심점
+    """
+    if init is not None:
+        model = MiniBatchKMeans(n_clusters=n_clusters, init=init, n_init=1,
+                                batch_size=batch_size, random_state=random_state)
+    else:
+        model = MiniBatchKMeans(n_clusters=n_clusters, init='k-means++', n_init=3,
+                                batch_size=batch_size, random_state=random_state)
+    labels = model.fit_predict(values)
+
+    if len(np.unique(labels)) > 1:
+        sample_size = min(silhouette_sample_size, len(values))
+        try:
+            silhouette = silhouette_score(values, labels, sample_size=sample_size, random_state=random_state)
+        except ValueError:
+            # 표본에 클러스터가 하나만 뽑힌 경우
+            silhouette = 0.0
+        ch_score = calinski_harabasz_score(values, labels)
+        db_score = davies_bouldin_score(values, labels)
+    else:
+        silhouette, ch_score, db_score = 0.0, 0.0, float('inf')
+
+    return {
+        'n_clusters': n_clusters,
+        'silhouette_score': float(silhouette),
+        'calinski_harabasz_score': float(ch_score),
+        'davies_bouldin_score': float(db_score),
+        'inertia': float(model.inertia_),
+        'cluster_centers': model.cluster_centers_,
+    }
+
+class ClusterCountSearch:
+    """
+    MiniBatchKMeans 기반 클러스터 수 탐색기
+
+    캐시 파일(JSON)에는 데이터 지문별 탐색 결과와, warm start에 쓰는
+    최근 탐색의 k별 중심점이 저장됩니다.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, max_workers: Optional[int] = None,
+                 silhouette_sample_size: int = 10000, batch_size: int = 4096,
+                 random_state: int = 42, max_cache_entries: int = 20):
+        """
+        ClusterCountSearch 초기화
+
+        Args:
+            cache_path (str, optional): 캐시 파일 경로. None이면 캐시를 사용하지 않음.
+            max_workers (int, optional): 프로세스 풀 크기. None이면 CPU 수,
+                1이면 현재 프로세스에서 순차 실행.
+            silhouette_sample_size (int, optional): 실루엣 점수 표본 크기. 기본값은 10000.
+            batch_size (int, optional): 미니배치 크기. 기본값은 4096.
+            random_state (int, optional): 난수 시드. 기본값은 42.
+            max_cache_entries (int, optional): 보관할 최대 지문 수. 기본값은 20.
+        """
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self.silhouette_sample_size = silhouette_sample_size
+        self.batch_size = batch_size
+        self.random_state = random_state
+        self.max_cache_entries = max_cache_entries
+
+    def _load_cache(self) -> Dict[str, Any]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {'results': {}, 'warm_start': {}}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            cache.setdefault('results', {})
+            cache.setdefault('warm_start', {})
+            return cache
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to read cluster search cache %s: %s", self.cache_path, str(e))
+            return {'results': {}, 'warm_start': {}}
+
+    def _save_cache(self, cache: Dict[str, Any]) -> None:
+        if not self.cache_path:
+            return
+        # 오래된 지문부터 정리
+        results = cache['results']
+        if len(results) > self.max_cache_entries:
+            ordered = sorted(results, key=lambda key: results[key].get('created_at', ''))
+            for key in ordered[:len(results) - self.max_cache_entries]:
+                del results[key]
+        tmp_path = None
+        try:
+            cache_dir = os.path.dirname(self.cache_path) or '.'
+            os.makedirs(cache_dir, exist_ok=True)
+            # 동시에 저장하는 프로세스끼리 임시 파일을 덮어쓰지 않도록 고유한 이름 사용
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f".{os.path.basename(self.cache_path)}.",
+                                            suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning("Failed to write cluster search cache %s: %s", self.cache_path, str(e))
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _warm_start_centers(self, cache: Dict[str, Any], columns: List[str], n_clusters: int) -> Optional[np.ndarray]:
+        """이전 탐색의 중심점 중 특성 구성과 형태가 맞는 것 반환"""
+        warm_start = cache.get('warm_start', {})
+        if warm_start.get('columns') != columns:
+            return None
+        centers = warm_start.get('centers', {}).get(str(n_clusters))
+        if centers is None:
+            return None
+        centers = np.asarray(centers, dtype=float)
+        if centers.shape != (n_clusters, len(columns)):
+            return None
+        return centers
+
+    def _evaluate_all(self, values: np.ndarray, cluster_range: List[int],
+                      inits: Dict[int, Optional[np.ndarray]]) -> List[Dict[str, Any]]:
+        kwargs = {
+            'batch_size': self.batch_size,
+            'silhouette_sample_size': self.silhouette_sample_size,
+            'random_state': self.random_state,
+        }
+        if self.max_workers != 1 and len(cluster_range) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = [executor.submit(evaluate_cluster_count, values, k, inits.get(k), **kwargs)
+                               for k in cluster_range]
+                    return [future.result() for future in futures]
+            except (OSError, RuntimeError) as e:
+                logger.warning("Process pool unavailable, evaluating cluster counts sequentially: %s", str(e))
+        return [evaluate_cluster_count(values, k, inits.get(k), **kwargs) for k in cluster_range]
+
+    def search(self, data: pd.DataFrame, cluster_range: Iterable[int], use_cache: bool = True) -> Dict[str, Any]:
+        """
+        클러스터 수 탐색
+
+        Args:
+            data (pd.DataFrame): 표준화된 클러스터링 데이터
+            cluster_range (Iterable[int]): 평가할 클러스터 수 목록
+            use_cache (bool, optional): 지문 캐시 사용 여부. 기본값은 True.
+
+        Returns:
+            Dict[str, Any]: cluster_range, 지표별 점수 목록, 지표별 최적 k,
+                recommended_n_clusters, fingerprint, from_cache
+        """
+        cluster_range = [int(k) for k in cluster_range]
+        columns = [str(col) for col in data.columns]
+        fingerprint = data_fingerprint(data)
+        cache_key = f"{fingerprint}:{cluster_range[0]}-{cluster_range[-1]}" if cluster_range else fingerprint
+        cache = self._load_cache() if self.cache_path else {'results': {}, 'warm_start': {}}
+
+        if use_cache and cache_key in cache['results']:
+            cached = dict(cache['results'][cache_key])
+            cached['from_cache'] = True
+            logger.info("Cluster count cache hit for fingerprint %s: %d clusters",
+                        fingerprint[:12], cached['recommended_n_clusters'])
+            return cached
+
+        values = data.to_numpy(dtype=float)
+        inits = {k: self._warm_start_centers(cache, columns, k) for k in cluster_range}
+        warm_started = sorted(k for k, init in inits.items() if init is not None)
+        if warm_started:
+            logger.info("Warm-starting cluster counts %s from previous centroids", warm_started)
+
+        evaluations = self._evaluate_all(values, cluster_range, inits)
+
+        silhouette_scores = [e['silhouette_score'] for e in evaluations]
+        ch_scores = [e['calinski_harabasz_score'] for e in evaluations]
+        db_scores = [e['davies_bouldin_score'] for e in evaluations]
+        inertia_values = [e['inertia'] for e in evaluations]
+
+        best_silhouette_idx = int(np.argmax(silhouette_scores))
+        best_ch_idx = int(np.argmax(ch_scores))
+        best_db_idx = int(np.argmin(db_scores))
+        recommended_n = recommend_cluster_count([
+            cluster_range[best_silhouette_idx],
+            cluster_range[best_ch_idx],
+            cluster_range[best_db_idx],
+        ])
+
+        results = {
+            'cluster_range': cluster_range,
+            'silhouette_scores': silhouette_scores,
+            'calinski_harabasz_scores': ch_scores,
+            'davies_bouldin_scores': db_scores,
+            'inertia_values': inertia_values,
+            'best_silhouette': {
+                'n_clusters': cluster_range[best_silhouette_idx],
+                'score': silhouette_scores[best_silhouette_idx]
+            },
+            'best_calinski_harabasz': {
+                'n_clusters': cluster_range[best_ch_idx],
+                'score': ch_scores[best_ch_idx]
+            },
+            'best_davies_bouldin': {
+                'n_clusters': cluster_range[best_db_idx],
+                'score': db_scores[best_db_idx]
+            },
+            'recommended_n_clusters': recommended_n,
+            'fingerprint': fingerprint,
+            'warm_started': warm_started,
+            'created_at': datetime.now().isoformat(),
+        }
+
+        if self.cache_path:
+            cache['results'][cache_key] = results
+            cache['warm_start'] = {
+                'columns': columns,
+                'centers': {str(e['n_clusters']): e['cluster_centers'].tolist() for e in evaluations},
+            }
+            self._save_cache(cache)
+
+        results = dict(results)
+        results['from_cache'] = False
+        return results
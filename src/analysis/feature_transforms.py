@@ -0,0 +1,113 @@
+"""
+벡터화 특성 변환 모듈
+
+이 모듈은 점수화, 예측 모델, 이벤트 분석에서 공통으로 쓰는 행 단위 계산
+(안전한 나눗셈, 비율, 경과 일수, 로그 정규화, 변화율)을 NumPy 연산으로 제공합니다.
+DataFrame.apply(axis=1) 대신 열 전체에 한 번에 적용되며, pandas Series를 넘기면
+같은 인덱스의 Series를 반환합니다.
+"""
+
+from datetime import datetime
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+ArrayLike = Union[pd.Series, np.ndarray, float, int]
+
+def _wrap(result: np.ndarray, like: ArrayLike) -> ArrayLike:
+    """입력이 Series면 같은 인덱스의 Series로 감싸서 반환"""
+    if isinstance(like, pd.Series):
+        return pd.Series(result, index=like.index)
+    return result
+
+def _values(values: ArrayLike) -> np.ndarray:
+    """숫자 배열로 변환 (Decimal/object 열 포함)"""
+    return np.asarray(values, dtype=float)
+
+def safe_divide(numerator: ArrayLike, denominator: ArrayLike, default: ArrayLike = 0.0) -> ArrayLike:
+    """
+    분모가 양수인 행만 나누고 나머지는 기본값 사용
+
+    Args:
+        numerator (ArrayLike): 분자
+        denominator (ArrayLike): 분모
+        default (ArrayLike, optional): 분모가 0 이하(또는 NaN)인 행의 값.
+            스칼라 또는 행별 배열. 기본값은 0.0.
+
+    Returns:
+        ArrayLike: 나눗셈 결과
+    """
+    num = _values(numerator)
+    den = _values(denominator)
+    num, den = np.broadcast_arrays(num, den)
+    out = np.broadcast_to(_values(default), num.shape).copy()
+    np.divide(num, den, out=out, where=den > 0)
+    return _wrap(out, numerator if isinstance(numerator, pd.Series) else denominator)
+
+def ratio(numerator: ArrayLike, denominator: ArrayLike, min_denominator: float = 1.0) -> ArrayLike:
+    """
+    분모를 최소값 이상으로 보정한 비율 (x / max(y, min_denominator))
+
+    Args:
+        numerator (ArrayLike): 분자
+        denominator (ArrayLike): 분모
+        min_denominator (float, optional): 분모의 최소값. 기본값은 1.0.
+
+    Returns:
+        ArrayLike: 비율
+    """
+    result = _values(numerator) / np.maximum(_values(denominator), min_denominator)
+    return _wrap(result, numerator if isinstance(numerator, pd.Series) else denominator)
+
+def change_rate(after: ArrayLike, before: ArrayLike) -> ArrayLike:
+    """
+    전후 변화율(%) 계산
+
+    이전 값이 양수면 (이후/이전 - 1) * 100, 이전 값이 0 이하이면 이후 값이
+    양수일 때 inf, 아니면 0을 반환합니다.
+
+    Args:
+        after (ArrayLike): 이후 값
+        before (ArrayLike): 이전 값
+
+    Returns:
+        ArrayLike: 변화율(%)
+    """
+    post = _values(after)
+    default = np.where(post > 0, np.inf, 0.0)
+    rate = _values(safe_divide(post, _values(before), default=np.nan))
+    result = np.where(np.isnan(rate), default, (rate - 1) * 100)
+    return _wrap(result, after if isinstance(after, pd.Series) else before)
+
+def days_since(dates: pd.Series, now: Optional[datetime] = None, default: int = 365) -> pd.Series:
+    """
+    기준 시각부터 경과한 일수 (datetime.timedelta.days와 같은 내림 방식)
+
+    Args:
+        dates (pd.Series): 날짜/시각 열
+        now (datetime, optional): 기준 시각. 기본값은 현재 시각.
+        default (int, optional): 날짜가 없는 행의 값. 기본값은 365.
+
+    Returns:
+        pd.Series: 경과 일수 (정수)
+    """
+    now = now or datetime.now()
+    elapsed = (pd.Timestamp(now) - pd.to_datetime(dates)).dt.days
+    return elapsed.fillna(default).astype(int)
+
+def log_normalize(values: ArrayLike, max_value: Optional[float] = None) -> ArrayLike:
+    """
+    log1p 스케일로 0~1 정규화 (log1p(x) / log1p(max(최대값, 1)))
+
+    Args:
+        values (ArrayLike): 값
+        max_value (float, optional): 정규화 기준 최대값. 기본값은 values의 최대값.
+
+    Returns:
+        ArrayLike: 정규화된 값
+    """
+    arr = _values(values)
+    if max_value is None:
+        max_value = np.nanmax(arr) if arr.size else 1.0
+    return _wrap(np.log1p(arr) / np.log1p(max(max_value, 1)), values)
@@ -43,6 +43,7 @@ sys.path.append(str(project_root))
 
 # Import database connection
 from src.database.mariadb_connection import MariaDBConnection
+from src.analysis.feature_transforms import safe_divide, days_since
 
 # Setup logging
 logging.basicConfig(
@@ -58,14 +59,17 @@ class InactiveUserPredictionModel:
     through events.
     """
     
-    def __init__(self, config_path: str = None):
+    def __init__(self, config_path: str = None, feature_store=None):
         """
         Initialize the prediction model.
         
         Args:
             config_path: Path to the configuration file
+            feature_store: Optional PlayerFeatureStore; when given, training data is
+                read from the incrementally refreshed store instead of raw tables
         """
         self.db_connection = MariaDBConnection()
+        self.feature_store = feature_store
         self.models = {}
         self.feature_columns = []
         self.categorical_features = []
@@ -161,16 +165,10 @@ class InactiveUserPredictionModel:
                     )
                     
                     # Calculate conversion rate
-                    events_df['conversion_rate'] = events_df.apply(
-                        lambda x: x['converted_users'] / x['total_users'] if x['total_users'] > 0 else 0,
-                        axis=1
-                    )
+                    events_df['conversion_rate'] = safe_divide(events_df['converted_users'], events_df['total_users'])
                     
                     # Calculate ROI (Return on Investment)
-                    events_df['roi'] = events_df.apply(
-                        lambda x: x['avg_deposit_amount'] / x['avg_reward'] if x['avg_reward'] > 0 else 0,
-                        axis=1
-                    )
+                    events_df['roi'] = safe_divide(events_df['avg_deposit_amount'], events_df['avg_reward'])
                 else:
                     events_df['conversion_rate'] = 0
                     events_df['roi'] = 0
@@ -208,6 +206,9 @@ class InactiveUserPredictionModel:
         Returns:
             DataFrame containing the training data
         """
+        if self.feature_store is not None:
+            return self._fetch_training_data_from_store()
+        
         cutoff_date = datetime.now() - timedelta(days=lookback_days)
         cutoff_date_str = cutoff_date.strftime('%Y-%m-%d')
         
@@ -270,6 +271,38 @@ class InactiveUserPredictionModel:
             logger.error(f"Error fetching training data: {str(e)}")
             raise
     
+    def _fetch_training_data_from_store(self) -> pd.DataFrame:
+        """
+        Refresh the feature store with new rows and read training data from it.
+        
+        Returns:
+            DataFrame with the same columns as the raw-table training query
+        """
+        try:
+            self.feature_store.refresh()
+            df = self.feature_store.get_features(require_events=True)
+        except Exception as e:
+            logger.error(f"Error fetching training data from feature store: {str(e)}")
+            raise
+        
+        columns = [
+            'userId', 'total_deposits_1y', 'total_withdrawals_1y', 'avg_deposit_amount',
+            'game_count', 'last_played_date', 'events_received', 'converted_after_event',
+            'status', 'days_inactive'
+        ]
+        logger.info(f"Fetched {len(df)} records for model training from feature store")
+        return df[columns]
+    
+    @staticmethod
+    def _deposit_withdrawal_ratio(df: pd.DataFrame) -> pd.Series:
+        """
+        Deposit/withdrawal ratio; without withdrawals it is 1.0 for users with no
+        deposits and the deposit total otherwise.
+        """
+        deposits = df['total_deposits_1y'].astype(float)
+        no_withdrawal_ratio = np.where(deposits == 0, 1.0, deposits)
+        return safe_divide(deposits, df['total_withdrawals_1y'], default=no_withdrawal_ratio)
+    
     def preprocess_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
         """
         Preprocess the data for model training.
@@ -293,20 +326,13 @@ class InactiveUserPredictionModel:
         }, inplace=True)
         
         # Calculate days since last played
-        df['days_since_last_play'] = pd.to_datetime(df['last_played_date']).apply(
-            lambda x: (datetime.now() - x).days if pd.notnull(x) else 365
-        )
+        df['days_since_last_play'] = days_since(df['last_played_date'])
         
         # Define inactive users (90+ days without playing)
         df['is_inactive'] = df['days_since_last_play'] >= 90
         
         # Create features
-        df['deposit_withdrawal_ratio'] = df.apply(
-            lambda x: x['total_deposits_1y'] / x['total_withdrawals_1y'] 
-            if x['total_withdrawals_1y'] > 0 else 
-            (1.0 if x['total_deposits_1y'] == 0 else float(x['total_deposits_1y'])), 
-            axis=1
-        )
+        df['deposit_withdrawal_ratio'] = self._deposit_withdrawal_ratio(df)
         
         # Define the target variable: users who were inactive, received an event, and then made a deposit
         target = df['converted_after_event']
@@ -882,18 +908,21 @@ class InactiveUserPredictionModel:
         
         # Calculate days since last played if not present
         if 'days_since_last_play' not in processed_data.columns and 'last_played_date' in processed_data.columns:
-            processed_data['days_since_last_play'] = pd.to_datetime(processed_data['last_played_date']).apply(
-                lambda x: (datetime.now() - x).days if pd.notnull(x) else 365
-            )
+            processed_data['days_since_last_play'] = days_since(processed_data['last_played_date'])
         
         # Calculate deposit_withdrawal_ratio if not present
         if 'deposit_withdrawal_ratio' not in processed_data.columns:
-            processed_data['deposit_withdrawal_ratio'] = processed_data.apply(
-                lambda x: x['total_deposits_1y'] / x['total_withdrawals_1y'] 
-                if 'total_withdrawals_1y' in processed_data.columns and x['total_withdrawals_1y'] > 0 else 
-                (1.0 if 'total_deposits_1y' in processed_data.columns and x['total_deposits_1y'] == 0 else 10.0), 
-                axis=1
-            )
+            if 'total_deposits_1y' in processed_data.columns:
+                deposits = processed_data['total_deposits_1y']
+                no_withdrawal_ratio = np.where(deposits == 0, 1.0, 10.0)
+                if 'total_withdrawals_1y' in processed_data.columns:
+                    processed_data['deposit_withdrawal_ratio'] = safe_divide(
+                        deposits, processed_data['total_withdrawals_1y'], default=no_withdrawal_ratio
+                    )
+                else:
+                    processed_data['deposit_withdrawal_ratio'] = no_withdrawal_ratio
+            else:
+                processed_data['deposit_withdrawal_ratio'] = 10.0
         
         # Ensure all required feature columns are present
         for feature in self.feature_columns:
@@ -1078,16 +1107,8 @@ class InactiveUserPredictionModel:
                     return pd.DataFrame()
                 
                 # Process data for prediction
-                inactive_df['days_since_last_play'] = pd.to_datetime(inactive_df['last_played_date']).apply(
-                    lambda x: (datetime.now() - x).days if pd.notnull(x) else 365
-                )
-                
-                inactive_df['deposit_withdrawal_ratio'] = inactive_df.apply(
-                    lambda x: x['total_deposits_1y'] / x['total_withdrawals_1y'] 
-                    if x['total_withdrawals_1y'] > 0 else 
-                    (1.0 if x['total_deposits_1y'] == 0 else float(x['total_deposits_1y'])), 
-                    axis=1
-                )
+                inactive_df['days_since_last_play'] = days_since(inactive_df['last_played_date'])
+                inactive_df['deposit_withdrawal_ratio'] = self._deposit_withdrawal_ratio(inactive_df)
                 
                 # Make predictions
                 predictions = self.predict_reengagement(inactive_df)
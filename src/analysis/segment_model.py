@@ -0,0 +1,270 @@
+"""
+세그먼트 모델 저장/적용 모듈
+
+이 모듈은 세그먼테이션에서 학습한 전처리 상태(특성 목록, 이상치 제한 경계, 표준화 평균/표준편차)와
+KMeans 중심점을 버전이 있는 JSON 파일로 저장하고, 새 사용자를 다시 학습하지 않고
+가장 가까운 중심점에 배정하는 기능을 제공합니다. 배정은 청크 단위 NumPy 연산으로
+수행되며, 학습 시점 분포와 비교한 드리프트 지표로 재학습 시점을 판단합니다.
+"""
+
+import os
+import re
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MODEL_FILE_PATTERN = re.compile(r'^segment_model_v(\d+)\.json$')
+
+class SegmentModel:
+    """
+    저장 가능한 세그먼트 배정 모델
+
+    배정 결과의 segment_id는 학습 시점의 클러스터 번호와 같으므로, 모델을 다시
+    학습하기 전까지는 실행마다 세그먼트 번호와 이름이 바뀌지 않습니다.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, features: List[str], lower_bounds: List[float], upper_bounds: List[float],
+                 scaler_mean: List[float], scaler_scale: List[float], centroids: List[List[float]],
+                 segment_shares: Optional[List[float]] = None, mean_distance: Optional[float] = None,
+                 segment_definitions: Optional[Dict[str, Dict[str, Any]]] = None,
+                 version: int = 0, created_at: Optional[str] = None, n_samples: int = 0):
+        """
+        SegmentModel 초기화
+
+        Args:
+            features (List[str]): 특성 목록 (순서 유지)
+            lower_bounds (List[float]): 특성별 하한 (학습 데이터 1% 분위수)
+            upper_bounds (List[float]): 특성별 상한 (학습 데이터 99% 분위수)
+            scaler_mean (List[float]): 표준화 평균
+            scaler_scale (List[float]): 표준화 표준편차
+            centroids (List[List[float]]): 표준화 공간의 클러스터 중심점
+            segment_shares (List[float], optional): 학습 데이터의 세그먼트별 비율
+            mean_distance (float, optional): 학습 데이터의 중심점까지 평균 거리
+            segment_definitions (Dict, optional): 세그먼트 정의 (이름, 특성, 전략)
+            version (int, optional): 모델 버전. 저장 시 지정됨.
+            created_at (str, optional): 생성 시각 (ISO 형식)
+            n_samples (int, optional): 학습 데이터 행 수
+        """
+        self.features = list(features)
+        self.lower_bounds = np.asarray(lower_bounds, dtype=float)
+        self.upper_bounds = np.asarray(upper_bounds, dtype=float)
+        self.scaler_mean = np.asarray(scaler_mean, dtype=float)
+        self.scaler_scale = np.asarray(scaler_scale, dtype=float)
+        self.centroids = np.asarray(centroids, dtype=float)
+        self.segment_shares = None if segment_shares is None else np.asarray(segment_shares, dtype=float)
+        self.mean_distance = mean_distance
+        self.segment_definitions = segment_definitions or {}
+        self.version = version
+        self.created_at = created_at or datetime.now().isoformat()
+        self.n_samples = n_samples
+
+    @property
+    def n_clusters(self) -> int:
+        """클러스터 수"""
+        return len(self.centroids)
+
+    @property
+    def segment_names(self) -> Dict[int, str]:
+        """세그먼트 번호와 이름 매핑"""
+        return {int(seg_id): definition.get('name', f"세그먼트 {seg_id}")
+                for seg_id, definition in self.segment_definitions.items()}
+
+    def transform(self, data: pd.DataFrame) -> np.ndarray:
+        """
+        학습 시점 전처리 적용 (결측치 0 대체, 경계 제한, 표준화)
+
+        Args:
+            data (pd.DataFrame): 원본 특성을 포함한 데이터
+
+        Returns:
+            np.ndarray: 표준화된 특성 배열
+
+        Raises:
+            KeyError: 모델 특성이 데이터에 없는 경우
+        """
+        missing = [f for f in self.features if f not in data.columns]
+        if missing:
+            raise KeyError(f"Missing segment model features: {missing}")
+        values = data[self.features].to_numpy(dtype=float, na_value=0.0, copy=True)
+        values = np.nan_to_num(values, nan=0.0)
+        np.clip(values, self.lower_bounds, self.upper_bounds, out=values)
+        values -= self.scaler_mean
+        values /= self.scaler_scale
+        return values
+
+    def assign(self, data: pd.DataFrame, chunk_size: int = 100000) -> pd.DataFrame:
+        """
+        가장 가까운 중심점으로 세그먼트 배정
+
+        거리는 ||x||² - 2x·c + ||c||² 형태의 행렬 연산으로 청크마다 계산하므로
+        메모리 사용량은 chunk_size x 클러스터 수에 비례합니다.
+
+        Args:
+            data (pd.DataFrame): 배정할 데이터
+            chunk_size (int, optional): 한 번에 처리할 행 수. 기본값은 100000.
+
+        Returns:
+            pd.DataFrame: data와 같은 인덱스의 segment_id, segment_distance 열
+        """
+        labels = np.empty(len(data), dtype=int)
+        distances = np.empty(len(data), dtype=float)
+        centroid_norms = (self.centroids ** 2).sum(axis=1)
+
+        for start in range(0, len(data), chunk_size):
+            chunk = self.transform(data.iloc[start:start + chunk_size])
+            squared = (chunk ** 2).sum(axis=1)[:, None] - 2 * chunk @ self.centroids.T + centroid_norms
+            nearest = squared.argmin(axis=1)
+            labels[start:start + len(chunk)] = nearest
+            distances[start:start + len(chunk)] = np.sqrt(np.maximum(squared[np.arange(len(chunk)), nearest], 0))
+
+        return pd.DataFrame({'segment_id': labels, 'segment_distance': distances}, index=data.index)
+
+    def drift(self, data: pd.DataFrame, assignment: Optional[pd.DataFrame] = None,
+              chunk_size: int = 100000) -> Dict[str, Any]:
+        """
+        학습 시점 대비 드리프트 지표 계산
+
+        - segment_psi: 세그먼트 비율의 PSI (Population Stability Index)
+        - max_feature_shift: 표준화 공간에서 특성 평균의 최대 이동량 (표준편차 단위)
+        - distance_ratio: 중심점까지 평균 거리의 학습 시점 대비 비율
+
+        Args:
+            data (pd.DataFrame): 새 데이터
+            assignment (pd.DataFrame, optional): assign() 결과. 없으면 새로 배정.
+            chunk_size (int, optional): 한 번에 처리할 행 수. 기본값은 100000.
+
+        Returns:
+            Dict[str, Any]: 드리프트 지표
+        """
+        if assignment is None:
+            assignment = self.assign(data, chunk_size)
+        if data.empty:
+            return {'segment_psi': 0.0, 'max_feature_shift': 0.0, 'distance_ratio': 1.0, 'feature_shift': {}}
+
+        # 세그먼트 비율 PSI
+        counts = np.bincount(assignment['segment_id'].to_numpy(), minlength=self.n_clusters)
+        current = np.clip(counts / counts.sum(), 1e-4, None)
+        expected = np.clip(self.segment_shares if self.segment_shares is not None
+                           else np.full(self.n_clusters, 1.0 / self.n_clusters), 1e-4, None)
+        psi = float(np.sum((current - expected) * np.log(current / expected)))
+
+        # 특성 평균 이동량 (학습 데이터의 표준화 평균은 0)
+        sums = np.zeros(len(self.features))
+        for start in range(0, len(data), chunk_size):
+            sums += self.transform(data.iloc[start:start + chunk_size]).sum(axis=0)
+        shifts = np.abs(sums / len(data))
+
+        distance_ratio = 1.0
+        if self.mean_distance:
+            distance_ratio = float(assignment['segment_distance'].mean() / self.mean_distance)
+
+        return {
+            'segment_psi': psi,
+            'max_feature_shift': float(shifts.max()) if len(shifts) else 0.0,
+            'distance_ratio': distance_ratio,
+            'feature_shift': dict(zip(self.features, shifts.round(4).tolist())),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON으로 저장할 수 있는 딕셔너리로 변환"""
+        return {
+            'format_version': self.FORMAT_VERSION,
+            'version': self.version,
+            'created_at': self.created_at,
+            'n_samples': self.n_samples,
+            'features': self.features,
+            'lower_bounds': self.lower_bounds.tolist(),
+            'upper_bounds': self.upper_bounds.tolist(),
+            'scaler_mean': self.scaler_mean.tolist(),
+            'scaler_scale': self.scaler_scale.tolist(),
+            'centroids': self.centroids.tolist(),
+            'segment_shares': None if self.segment_shares is None else self.segment_shares.tolist(),
+            'mean_distance': self.mean_distance,
+            'segment_definitions': self.segment_definitions,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> 'SegmentModel':
+        """
+        to_dict() 결과에서 모델 생성
+
+        Raises:
+            ValueError: 지원하지 않는 형식 버전인 경우
+        """
+        if payload.get('format_version') != cls.FORMAT_VERSION:
+            raise ValueError(f"Unsupported segment model format: {payload.get('format_version')}")
+        fields = {key: value for key, value in payload.items() if key != 'format_version'}
+        return cls(**fields)
+
+    def save(self, model_dir: str) -> str:
+        """
+        다음 버전 번호로 모델 저장 (segment_model_v{버전}.json)
+
+        Args:
+            model_dir (str): 모델 저장 디렉토리
+
+        Returns:
+            str: 저장된 파일 경로
+        """
+        os.makedirs(model_dir, exist_ok=True)
+        self.version = latest_model_version(model_dir) + 1
+        path = os.path.join(model_dir, f"segment_model_v{self.version}.json")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+        logger.info("Saved segment model v%d to %s", self.version, path)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> 'SegmentModel':
+        """
+        파일에서 모델 로드
+
+        Args:
+            path (str): 모델 파일 경로
+
+        Returns:
+            SegmentModel: 로드된 모델
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    @classmethod
+    def load_latest(cls, model_dir: str) -> Optional['SegmentModel']:
+        """
+        디렉토리에서 가장 높은 버전의 모델 로드
+
+        Args:
+            model_dir (str): 모델 저장 디렉토리
+
+        Returns:
+            Optional[SegmentModel]: 로드된 모델. 저장된 모델이 없으면 None.
+        """
+        version = latest_model_version(model_dir)
+        if version == 0:
+            return None
+        return cls.load(os.path.join(model_dir, f"segment_model_v{version}.json"))
+
+def latest_model_version(model_dir: str) -> int:
+    """
+    디렉토리에 저장된 가장 높은 모델 버전 반환
+
+    Args:
+        model_dir (str): 모델 저장 디렉토리
+
+    Returns:
+        int: 최신 버전 번호. 저장된 모델이 없으면 0.
+    """
+    if not os.path.isdir(model_dir):
+        return 0
+    versions = [int(match.group(1)) for match in map(MODEL_FILE_PATTERN.match, os.listdir(model_dir)) if match]
+    return max(versions, default=0)
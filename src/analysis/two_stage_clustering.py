@@ -0,0 +1,199 @@
+"""
+2단계 계층적 클러스터링 모듈
+
+전체 데이터에 AgglomerativeClustering(Ward)을 적용하면 메모리가 행 수의 제곱에 비례합니다.
+이 모듈은 먼저 MiniBatchKMeans로 전체 데이터를 천 개 안팎의 미세 클러스터로 요약한 뒤,
+미세 클러스터 중심점에 사용자 수를 가중치로 둔 Ward 연결을 수행하고,
+각 사용자를 자신이 속한 미세 클러스터의 최종(매크로) 클러스터에 배정합니다.
+메모리는 미세 클러스터 수의 제곱에만 비례하므로 수백만 행에도 적용할 수 있습니다.
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
+
+logger = logging.getLogger(__name__)
+
+def weighted_ward_linkage(centers: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    가중치가 있는 점들의 Ward 연결 행렬 계산 (nearest-neighbor chain 방식)
+
+    두 클러스터 A, B의 거리는 scipy의 Ward 정의와 같은
+    sqrt(2 * nA * nB / (nA + nB)) * ||cA - cB|| 이며, nA, nB는 가중치 합입니다.
+    모든 가중치가 1이면 scipy.cluster.hierarchy.linkage(centers, 'ward')와 같은 결과입니다.
+
+    Args:
+        centers (np.ndarray): 점 좌표 (m x 특성 수)
+        weights (np.ndarray): 점별 가중치 (사용자 수)
+
+    Returns:
+        np.ndarray: scipy 형식 연결 행렬 ((m-1) x 4: 클러스터1, 클러스터2, 거리, 가중치 합)
+    """
+    m = len(centers)
+    if m < 2:
+        return np.empty((0, 4))
+
+    centroids = np.asarray(centers, dtype=float).copy()
+    sizes = np.asarray(weights, dtype=float).copy()
+    active = np.ones(m, dtype=bool)
+    merges: List[Tuple[int, int, float]] = []
+
+    def nearest(i: int) -> Tuple[int, float]:
+        diff = centroids - centroids[i]
+        dist = 2 * sizes[i] * sizes / (sizes[i] + sizes) * np.einsum('ij,ij->i', diff, diff)
+        dist[~active] = np.inf
+        dist[i] = np.inf
+        j = int(np.argmin(dist))
+        return j, dist[j]
+
+    chain: List[int] = []
+    remaining = m
+    while remaining > 1:
+        if not chain:
+            chain.append(int(np.flatnonzero(active)[0]))
+        i = chain[-1]
+        j, dist = nearest(i)
+        # 체인의 이전 점과 거리가 같으면 이전 점을 우선 (순환 방지)
+        if len(chain) > 1:
+            prev = chain[-2]
+            diff = centroids[prev] - centroids[i]
+            prev_dist = 2 * sizes[i] * sizes[prev] / (sizes[i] + sizes[prev]) * diff.dot(diff)
+            if prev_dist <= dist:
+                j, dist = prev, prev_dist
+        if len(chain) > 1 and j == chain[-2]:
+            chain.pop()
+            chain.pop()
+            # 병합 결과는 더 작은 슬롯에 저장
+            keep, drop = min(i, j), max(i, j)
+            total = sizes[i] + sizes[j]
+            centroids[keep] = (sizes[i] * centroids[i] + sizes[j] * centroids[j]) / total
+            sizes[keep] = total
+            active[drop] = False
+            merges.append((keep, drop, float(np.sqrt(dist))))
+            remaining -= 1
+        else:
+            chain.append(j)
+
+    # 거리 순으로 정렬한 뒤 scipy 클러스터 번호(원래 점 0..m-1, 병합 결과 m..)로 변환
+    order = sorted(range(len(merges)), key=lambda k: merges[k][2])
+    cluster_id = list(range(m))
+    cluster_size = list(np.asarray(weights, dtype=float))
+    linkage_matrix = np.empty((m - 1, 4))
+    for step, k in enumerate(order):
+        keep, drop, dist = merges[k]
+        a, b = cluster_id[keep], cluster_id[drop]
+        size = cluster_size[a] + cluster_size[b]
+        linkage_matrix[step] = [min(a, b), max(a, b), dist, size]
+        cluster_id[keep] = m + step
+        cluster_size.append(size)
+    return linkage_matrix
+
+def cut_linkage(linkage_matrix: np.ndarray, n_clusters: int) -> np.ndarray:
+    """
+    연결 행렬을 n_clusters개 클러스터로 자르기
+
+    Args:
+        linkage_matrix (np.ndarray): scipy 형식 연결 행렬
+        n_clusters (int): 클러스터 수
+
+    Returns:
+        np.ndarray: 점별 클러스터 레이블 (0부터, 점 순서상 처음 나타나는 순서로 번호 부여)
+    """
+    m = len(linkage_matrix) + 1
+    parent = list(range(2 * m - 1))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for step in range(max(m - n_clusters, 0)):
+        a, b = int(linkage_matrix[step, 0]), int(linkage_matrix[step, 1])
+        parent[find(a)] = m + step
+        parent[find(b)] = m + step
+
+    roots = np.array([find(i) for i in range(m)])
+    _, labels = np.unique(roots, return_inverse=True)
+    # 번호를 점 순서상 처음 나타나는 순서로 정렬
+    _, first_index = np.unique(labels, return_index=True)
+    relabel = np.empty(len(first_index), dtype=int)
+    relabel[np.argsort(first_index)] = np.arange(len(first_index))
+    return relabel[labels]
+
+class TwoStageWardClustering:
+    """
+    미세 클러스터 + 가중 Ward 연결 방식의 2단계 계층적 클러스터링
+
+    학습 후 속성:
+        micro_centers_ (np.ndarray): 미세 클러스터 중심점 (빈 클러스터 제외)
+        micro_weights_ (np.ndarray): 미세 클러스터별 사용자 수
+        micro_labels_ (np.ndarray): 미세 클러스터별 최종 클러스터 레이블
+        linkage_matrix_ (np.ndarray): 미세 클러스터의 Ward 연결 행렬 (덴드로그램용)
+        labels_ (np.ndarray): 사용자별 최종 클러스터 레이블
+    """
+
+    def __init__(self, n_clusters: int = 5, n_micro_clusters: int = 1000,
+                 batch_size: int = 4096, random_state: int = 42):
+        """
+        TwoStageWardClustering 초기화
+
+        Args:
+            n_clusters (int, optional): 최종 클러스터 수. 기본값은 5.
+            n_micro_clusters (int, optional): 미세 클러스터 수. 데이터가 이보다 작으면
+                모든 점을 그대로 사용(일반 Ward와 동일). 기본값은 1000.
+            batch_size (int, optional): MiniBatchKMeans 배치 크기. 기본값은 4096.
+            random_state (int, optional): 난수 시드. 기본값은 42.
+        """
+        self.n_clusters = n_clusters
+        self.n_micro_clusters = n_micro_clusters
+        self.batch_size = batch_size
+        self.random_state = random_state
+        self.micro_centers_: Optional[np.ndarray] = None
+        self.micro_weights_: Optional[np.ndarray] = None
+        self.micro_labels_: Optional[np.ndarray] = None
+        self.linkage_matrix_: Optional[np.ndarray] = None
+        self.labels_: Optional[np.ndarray] = None
+
+    def _micro_cluster(self, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """미세 클러스터 중심점, 가중치, 점별 미세 클러스터 번호 반환"""
+        if len(values) <= self.n_micro_clusters:
+            return values, np.ones(len(values)), np.arange(len(values))
+
+        micro = MiniBatchKMeans(
+            n_clusters=self.n_micro_clusters,
+            batch_size=max(self.batch_size, 3 * self.n_micro_clusters),
+            n_init=1,
+            random_state=self.random_state
+        )
+        assignment = micro.fit_predict(values)
+
+        # 빈 미세 클러스터 제거 후 번호 재지정
+        weights = np.bincount(assignment, minlength=self.n_micro_clusters)
+        used = np.flatnonzero(weights)
+        remap = np.full(self.n_micro_clusters, -1)
+        remap[used] = np.arange(len(used))
+        return micro.cluster_centers_[used], weights[used].astype(float), remap[assignment]
+
+    def fit_predict(self, values: np.ndarray) -> np.ndarray:
+        """
+        클러스터링 수행
+
+        Args:
+            values (np.ndarray): 표준화된 데이터 배열 (n x 특성 수)
+
+        Returns:
+            np.ndarray: 사용자별 클러스터 레이블
+        """
+        values = np.asarray(values, dtype=float)
+        centers, weights, assignment = self._micro_cluster(values)
+        logger.info("Two-stage Ward: %d rows summarized into %d micro-clusters", len(values), len(centers))
+
+        self.micro_centers_ = centers
+        self.micro_weights_ = weights
+        self.linkage_matrix_ = weighted_ward_linkage(centers, weights)
+        self.micro_labels_ = cut_linkage(self.linkage_matrix_, min(self.n_clusters, len(centers)))
+        self.labels_ = self.micro_labels_[assignment]
+        return self.labels_
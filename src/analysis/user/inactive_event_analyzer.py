@@ -18,24 +18,34 @@ project_root = Path(__file__).parent.parent.parent.parent
 sys.path.append(str(project_root))
 
 from src.database.mock_connection import MariaDBConnection
+from src.database.sql_catalog import get_catalog, run_named_query
+from src.utils.memoize import MemoizedMixin, memoized
+from src.analysis.feature_transforms import change_rate
 
-class InactiveUserEventAnalyzer:
+class InactiveUserEventAnalyzer(MemoizedMixin):
     """
     비활성 사용자의 이벤트 참여 및 입금 전환 분석 클래스
+    
+    get_* 조회 메서드는 memo_scope() 범위 안에서 메서드와 인자별로 한 번만
+    실행됩니다. 보고서 생성은 자체적으로 범위를 엽니다.
     """
     
-    def __init__(self, db_connection=None):
+    def __init__(self, db_connection=None, memo_ttl=None):
         """
         InactiveUserEventAnalyzer 초기화
         
         Args:
             db_connection (MariaDBConnection, optional): 데이터베이스 연결 객체. 기본값은 None.
                 None인 경우 새로운 연결을 생성합니다.
+            memo_ttl (float, optional): memo_scope() 밖의 조회 결과를 재사용할 시간(초).
+                기본값은 None(범위 밖에서는 재사용하지 않음).
         """
         self.db = db_connection if db_connection is not None else MariaDBConnection()
         self.query_dir = project_root / "queries"
-        self.cached_data = {}
+        self.catalog = get_catalog(self.query_dir)
+        self.init_memoization(default_memo_ttl=memo_ttl)
         
+    @memoized
     def get_inactive_users(self, days_inactive=10):
         """
         지정된 일수 이상 게임을 하지 않은 사용자 목록 조회
@@ -62,6 +72,7 @@ class InactiveUserEventAnalyzer:
         result = self.db.query(query)
         return pd.DataFrame(result)
     
+    @memoized
     def get_event_participants(self):
         """
         이벤트에 참여한 사용자 목록 조회
@@ -86,6 +97,7 @@ class InactiveUserEventAnalyzer:
         result = self.db.query(query)
         return pd.DataFrame(result)
     
+    @memoized
     def get_deposits_after_event(self):
         """
         이벤트 이후 입금 기록이 있는 사용자 조회
@@ -93,10 +105,6 @@ class InactiveUserEventAnalyzer:
         Returns:
             pd.DataFrame: 이벤트 이후 입금 사용자 데이터프레임
         """
-        # 캐싱된 데이터가 있으면 반환
-        if 'deposits_after_event' in self.cached_data:
-            return self.cached_data['deposits_after_event']
-            
         query = """
         WITH FirstPromotion AS (
             SELECT 
@@ -130,13 +138,9 @@ class InactiveUserEventAnalyzer:
         """
         
         result = self.db.query(query)
-        df = pd.DataFrame(result)
-        
-        # 결과 캐싱
-        self.cached_data['deposits_after_event'] = df
-        
-        return df
+        return pd.DataFrame(result)
         
+    @memoized
     def get_login_frequency(self, days_lookback=90):
         """
         사용자별 로그인 빈도 분석
@@ -171,6 +175,7 @@ class InactiveUserEventAnalyzer:
         result = self.db.query(query)
         return pd.DataFrame(result)
         
+    @memoized
     def get_session_duration(self, days_lookback=90):
         """
         사용자별 세션 기간 분석
@@ -220,25 +225,35 @@ class InactiveUserEventAnalyzer:
         result = self.db.query(query)
         return pd.DataFrame(result)
     
-    def analyze_activity_metrics(self, days_lookback=90, inactive_threshold=10):
+    def analyze_activity_metrics(self, days_lookback=90, inactive_threshold=10,
+                                 login_frequency=None, session_duration=None, inactive_users=None):
         """
         통합 사용자 활동 메트릭 분석
         
         Args:
             days_lookback (int): 분석할 과거 기간(일). 기본값은 90.
             inactive_threshold (int): 비활성으로 간주할 최소 일수. 기본값은 10.
+            login_frequency (pd.DataFrame, optional): 같은 기간으로 미리 조회한 로그인 빈도.
+                None이면 새로 조회합니다.
+            session_duration (pd.DataFrame, optional): 같은 기간으로 미리 조회한 세션 기간.
+                None이면 새로 조회합니다.
+            inactive_users (pd.DataFrame, optional): 같은 기준으로 미리 조회한 비활성 사용자.
+                None이면 새로 조회합니다.
             
         Returns:
             dict: 분석 결과가 포함된 딕셔너리
         """
         # 로그인 빈도 데이터 가져오기
-        login_frequency = self.get_login_frequency(days_lookback)
+        if login_frequency is None:
+            login_frequency = self.get_login_frequency(days_lookback)
         
         # 세션 기간 데이터 가져오기
-        session_duration = self.get_session_duration(days_lookback)
+        if session_duration is None:
+            session_duration = self.get_session_duration(days_lookback)
         
         # 비활성 사용자 데이터 가져오기
-        inactive_users = self.get_inactive_users(inactive_threshold)
+        if inactive_users is None:
+            inactive_users = self.get_inactive_users(inactive_threshold)
         
         # 데이터 통합
         # 로그인 빈도와 세션 기간 병합
@@ -299,6 +314,7 @@ class InactiveUserEventAnalyzer:
             'raw_data': merged_data
         }
         
+    @memoized
     def get_inactive_event_deposit_users(self, days_inactive=10):
         """
         비활성 상태에서 이벤트 후 입금한 사용자 조회
@@ -309,27 +325,13 @@ class InactiveUserEventAnalyzer:
         Returns:
             pd.DataFrame: 분석 결과 데이터프레임
         """
-        query_file = self.query_dir / "user" / "inactive_event_deposit.sql"
-        
-        if query_file.exists():
-            with open(query_file, 'r', encoding='utf-8') as file:
-                sql_content = file.read()
-                
-            # 쿼리 내용에서 최종 쿼리 부분만 추출
-            sql_parts = sql_content.split('-- 4. 최종 쿼리: 모든 조건을 만족하는 사용자 찾기')
-            if len(sql_parts) > 1:
-                query = sql_parts[1].strip()
-                
-                # days_inactive 값 업데이트
-                query = query.replace(
-                    "lastPlayDate < DATE_SUB(CURRENT_DATE(), INTERVAL 10 DAY)",
-                    f"lastPlayDate < DATE_SUB(CURRENT_DATE(), INTERVAL {days_inactive} DAY)"
-                )
-                
-                result = self.db.query(query)
-                return pd.DataFrame(result)
+        # queries/user/inactive_event_deposit.sql의 'inactive_event_deposit_users' 섹션
+        if 'inactive_event_deposit_users' in self.catalog:
+            result = run_named_query(self.db, 'inactive_event_deposit_users',
+                                     {'days_inactive': days_inactive}, catalog=self.catalog)
+            return pd.DataFrame(result)
         
-        # 쿼리 파일이 없거나 파싱 실패 시 대체 쿼리 실행
+        # 카탈로그에 쿼리가 없는 경우 대체 쿼리 실행
         query = f"""
         WITH FirstPromotion AS (
             SELECT 
@@ -410,24 +412,34 @@ class InactiveUserEventAnalyzer:
         result = self.db.query(query)
         return pd.DataFrame(result)
     
-    def analyze_conversion_by_inactive_period(self, max_days=365):
+    def analyze_conversion_by_inactive_period(self, max_days=365, all_inactive_users=None,
+                                              event_participants=None, deposit_after_event=None):
         """
         비활성 기간별 전환율 분석
         
         Args:
             max_days (int): 분석할 최대 비활성 일수. 기본값은 365.
+            all_inactive_users (pd.DataFrame, optional): 미리 조회한 전체 비활성 사용자
+                (days_inactive=0). None이면 새로 조회합니다.
+            event_participants (pd.DataFrame, optional): 미리 조회한 이벤트 참여자.
+                None이면 새로 조회합니다.
+            deposit_after_event (pd.DataFrame, optional): 미리 조회한 이벤트 후 입금자.
+                None이면 새로 조회합니다.
             
         Returns:
             dict: 분석 결과가 포함된 딕셔너리
         """
         # 1. 모든 비활성 사용자 가져오기
-        all_inactive_users = self.get_inactive_users(days_inactive=0)
+        if all_inactive_users is None:
+            all_inactive_users = self.get_inactive_users(days_inactive=0)
         
         # 2. 이벤트 참여자 가져오기
-        event_participants = self.get_event_participants()
+        if event_participants is None:
+            event_participants = self.get_event_participants()
         
         # 3. 이벤트 후 입금자 가져오기
-        deposit_after_event = self.get_deposits_after_event()
+        if deposit_after_event is None:
+            deposit_after_event = self.get_deposits_after_event()
         
         # 4. 데이터 통합 및 분석
         merged_data = pd.merge(
@@ -481,6 +493,7 @@ class InactiveUserEventAnalyzer:
             'raw_data': merged_data
         }
     
+    @memoized
     def get_feature_usage(self, days_lookback=90):
         """
         사용자별 기능 사용 분석
@@ -557,6 +570,7 @@ class InactiveUserEventAnalyzer:
                 # 빈 데이터프레임 반환
                 return pd.DataFrame(columns=['player_id', 'userId', 'name', 'feature_type', 'usage_count', 'first_usage', 'last_usage'])
     
+    @memoized
     def get_content_interaction(self, days_lookback=90):
         """
         사용자별 콘텐츠 상호작용 분석
@@ -645,12 +659,14 @@ class InactiveUserEventAnalyzer:
                                             'interaction_count', 'total_duration', 'avg_duration', 
                                             'total_bet', 'total_win', 'net_profit', 'content_type'])
     
-    def analyze_user_engagement(self, days_lookback=90):
+    def analyze_user_engagement(self, days_lookback=90, login_frequency=None):
         """
         사용자 참여도 종합 분석
         
         Args:
             days_lookback (int): 분석할 과거 기간(일). 기본값은 90.
+            login_frequency (pd.DataFrame, optional): 같은 기간으로 미리 조회한 로그인 빈도.
+                None이면 새로 조회합니다.
             
         Returns:
             dict: 분석 결과가 포함된 딕셔너리
@@ -664,7 +680,8 @@ class InactiveUserEventAnalyzer:
         content_interaction = self.get_content_interaction(days_lookback)
         
         # 3. 로그인 빈도 데이터 가져오기
-        login_frequency = self.get_login_frequency(days_lookback)
+        if login_frequency is None:
+            login_frequency = self.get_login_frequency(days_lookback)
         
         # 빈 데이터프레임이 아닌 경우에만 처리
         player_engagement = None
@@ -1060,21 +1077,28 @@ class InactiveUserEventAnalyzer:
             }
         }
         
-    def analyze_conversion_by_event_amount(self, bin_count=10):
+    def analyze_conversion_by_event_amount(self, bin_count=10, event_participants=None,
+                                           deposit_after_event=None):
         """
         이벤트 지급 금액별 전환율 분석
         
         Args:
             bin_count (int): 금액 구간 수. 기본값은 10.
+            event_participants (pd.DataFrame, optional): 미리 조회한 이벤트 참여자.
+                None이면 새로 조회합니다.
+            deposit_after_event (pd.DataFrame, optional): 미리 조회한 이벤트 후 입금자.
+                None이면 새로 조회합니다.
             
         Returns:
             dict: 분석 결과가 포함된 딕셔너리
         """
         # 1. 이벤트 참여자 가져오기
-        event_participants = self.get_event_participants()
+        if event_participants is None:
+            event_participants = self.get_event_participants()
         
         # 2. 이벤트 후 입금자 가져오기
-        deposit_after_event = self.get_deposits_after_event()
+        if deposit_after_event is None:
+            deposit_after_event = self.get_deposits_after_event()
         
         # 3. 데이터 통합
         merged_data = pd.merge(
@@ -1117,6 +1141,9 @@ class InactiveUserEventAnalyzer:
         """
         분석 보고서 생성
         
+        보고서 한 번을 하나의 메모이제이션 범위로 실행하므로 여러 분석 단계에서
+        공유하는 조회(이벤트 참여자, 이벤트 후 입금자 등)는 한 번만 실행됩니다.
+        
         Args:
             output_dir (str, optional): 결과 저장 디렉토리. 기본값은 None.
                 None인 경우 프로젝트 루트의 reports 디렉토리를 사용합니다.
@@ -1124,6 +1151,11 @@ class InactiveUserEventAnalyzer:
         Returns:
             dict: 분석 결과가 포함된 딕셔너리
         """
+        with self.memo_scope():
+            return self._build_analysis_report(output_dir)
+    
+    def _build_analysis_report(self, output_dir=None):
+        """generate_analysis_report의 본문 (메모이제이션 범위 안에서 실행)"""
         if output_dir is None:
             output_dir = project_root / "reports" / "user"
             os.makedirs(output_dir, exist_ok=True)
@@ -1301,28 +1333,36 @@ class InactiveUserEventAnalyzer:
             # 유효한 활동 데이터만 필터링
             activity_data_valid = activity_data.dropna(subset=['activity_period'])
             
-            # 각 사용자별로 코호트 기간과 활동 기간 간의 차이 계산
-            activity_data_valid['period_number'] = activity_data_valid.apply(lambda x: self._calculate_period_diff(x['cohort_period'], x['activity_period'], cohort_period), axis=1)
+            # 코호트 기간과 활동 기간을 정수 서수로 바꿔 기간 차이를 한 번에 계산
+            period_number = (
+                self._period_ordinals(activity_data_valid['activity_period'], cohort_period)
+                - self._period_ordinals(activity_data_valid['cohort_period'], cohort_period)
+            )
+            retention_table = pd.DataFrame({
+                'cohort_period': activity_data_valid['cohort_period'].to_numpy(),
+                'player_id': activity_data_valid['player_id'].to_numpy(),
+                'period_number': period_number,
+            })
+            retention_table = retention_table[
+                (retention_table['period_number'] >= 0) & (retention_table['period_number'] <= lookback_periods)
+            ].drop_duplicates()
             
-            # 각 코호트의 각 기간별 활성 사용자 수 계산
-            retention_table = activity_data_valid.drop_duplicates(subset=['cohort_period', 'player_id', 'period_number'])
-            retention_counts = retention_table.groupby(['cohort_period', 'period_number']).size().reset_index(name='active_users')
+            # 코호트 × 기간별 활성 사용자 수 행렬 (단일 groupby)
+            periods = list(range(lookback_periods + 1))
+            active_users = (
+                retention_table.groupby(['cohort_period', 'period_number']).size()
+                .unstack(fill_value=0)
+                .reindex(index=cohort_sizes['cohort_period'], columns=periods, fill_value=0)
+            )
             
             # 코호트별 유지율 계산
-            retention_matrix = pd.DataFrame()
+            sizes = cohort_sizes['users'].to_numpy(dtype=float)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rates = np.where(sizes[:, None] > 0, active_users.to_numpy() / sizes[:, None] * 100, 0.0)
             
-            for cohort in cohort_sizes['cohort_period'].unique():
-                cohort_retention = retention_counts[retention_counts['cohort_period'] == cohort]
-                total_users = cohort_sizes[cohort_sizes['cohort_period'] == cohort]['users'].values[0]
-                
-                retention_row = {'cohort_period': cohort, 'cohort_size': total_users}
-                
-                for period in range(lookback_periods + 1):
-                    period_users = cohort_retention[cohort_retention['period_number'] == period]['active_users'].values[0] if period in cohort_retention['period_number'].values else 0
-                    retention_rate = (period_users / total_users) * 100 if total_users > 0 else 0
-                    retention_row[f'period_{period}'] = retention_rate
-                
-                retention_matrix = pd.concat([retention_matrix, pd.DataFrame([retention_row])], ignore_index=True)
+            retention_matrix = pd.DataFrame(rates, columns=[f'period_{period}' for period in periods])
+            retention_matrix.insert(0, 'cohort_period', cohort_sizes['cohort_period'].to_numpy())
+            retention_matrix.insert(1, 'cohort_size', cohort_sizes['users'].to_numpy())
             
             # 이탈률 계산 (1 - 유지율)
             churn_matrix = retention_matrix.copy()
@@ -1365,36 +1405,111 @@ class InactiveUserEventAnalyzer:
             'avg_retention': avg_retention
         }
     
-    def _calculate_period_diff(self, cohort_period, activity_period, period_type):
+    @staticmethod
+    def _period_ordinals(periods, period_type):
         """
-        코호트 기간과 활동 기간 간의 차이 계산
+        DATE_FORMAT으로 만든 기간 문자열을 정수 서수로 변환
+        
+        같은 기간 타입의 두 서수의 차이가 기간 차이가 됩니다. 고유한 기간 문자열만
+        변환한 뒤 인덱스로 펼치므로 행 수가 많아도 변환 비용은 고유 기간 수에 비례합니다.
         
         Args:
-            cohort_period (str): 코호트 기간
-            activity_period (str): 활동 기간
+            periods (pd.Series): 기간 문자열 ('%Y-%m-%d', '%Y-%U', '%Y-%m')
             period_type (str): 기간 타입 ('day', 'week', 'month')
             
         Returns:
-            int: 기간 차이
+            np.ndarray: 기간별 정수 서수 (일/주/월 단위)
         """
+        codes, uniques = pd.factorize(periods.astype(str))
+        uniques = pd.Series(uniques)
+        
         if period_type == 'day':
-            cohort_date = datetime.strptime(cohort_period, '%Y-%m-%d')
-            activity_date = datetime.strptime(activity_period, '%Y-%m-%d')
-            return (activity_date - cohort_date).days
+            days = pd.to_datetime(uniques, format='%Y-%m-%d').to_numpy().astype('datetime64[D]').astype(np.int64)
+            ordinals = days
         elif period_type == 'week':
-            cohort_year, cohort_week = map(int, cohort_period.split('-'))
-            activity_year, activity_week = map(int, activity_period.split('-'))
-            
-            cohort_date = datetime.strptime(f'{cohort_year}-{cohort_week}-1', '%Y-%U-%w')
-            activity_date = datetime.strptime(f'{activity_year}-{activity_week}-1', '%Y-%U-%w')
-            
-            return ((activity_date - cohort_date).days // 7)
+            # 각 주의 월요일 날짜로 변환 (%U: 일요일 시작 주차)
+            mondays = pd.to_datetime(uniques + '-1', format='%Y-%U-%w').to_numpy().astype('datetime64[D]').astype(np.int64)
+            ordinals = mondays // 7
         else: # month
-            cohort_year, cohort_month = map(int, cohort_period.split('-'))
-            activity_year, activity_month = map(int, activity_period.split('-'))
+            ordinals = uniques.str[:4].astype(np.int64).to_numpy() * 12 + uniques.str[5:7].astype(np.int64).to_numpy()
+        
+        return np.asarray(ordinals, dtype=np.int64)[codes]
             
-            return (activity_year - cohort_year) * 12 + (activity_month - cohort_month)
+    # 이벤트 전후 활동 집계 원본: (이름, 테이블, 시각 컬럼, 추가 조건, 합계 컬럼)
+    _EVENT_WINDOW_SOURCES = [
+        ('login', 'login_history', 'loginTime', None, None),
+        ('play', 'game_plays', 'playTime', None, None),
+        ('deposit', 'money_flows', 'createdAt', 'src.type = 0', 'amount'),
+    ]
+    
+    def _event_window_activity(self, name, table, time_column, pre_event_days, post_event_days,
+                               condition=None, amount_column=None):
+        """
+        한 원본 테이블의 첫 이벤트 전후 기간 활동 집계
+        
+        첫 이벤트 일자 기준 전후 기간에 속한 행만 조인한 뒤 플레이어별로 집계하므로
+        비용은 해당 테이블의 기간 내 행 수에 비례합니다.
+        
+        Args:
+            name (str): 결과 컬럼 이름에 쓸 원본 이름 (예: 'login')
+            table (str): 원본 테이블
+            time_column (str): 활동 시각 컬럼
+            pre_event_days (int): 이벤트 전 분석 기간(일)
+            post_event_days (int): 이벤트 후 분석 기간(일)
+            condition (str, optional): 추가 WHERE 조건 (원본 테이블 별칭은 src)
+            amount_column (str, optional): 기간별 합계를 낼 금액 컬럼
             
+        Returns:
+            pd.DataFrame: player, pre/post_event_{name}_days[, pre/post_event_{name}_amount]
+        """
+        ts = f"src.{time_column}"
+        pre_window = f"{ts} BETWEEN DATE_SUB(eu.first_event_date, INTERVAL %s DAY) AND eu.first_event_date"
+        post_window = f"{ts} BETWEEN eu.first_event_date AND DATE_ADD(eu.first_event_date, INTERVAL %s DAY)"
+        
+        columns = [
+            f"COUNT(DISTINCT CASE WHEN {pre_window} THEN DATE({ts}) END) AS pre_event_{name}_days",
+            f"COUNT(DISTINCT CASE WHEN {post_window} THEN DATE({ts}) END) AS post_event_{name}_days",
+        ]
+        params = [pre_event_days, post_event_days]
+        if amount_column:
+            columns += [
+                f"SUM(CASE WHEN {pre_window} THEN src.{amount_column} ELSE 0 END) AS pre_event_{name}_amount",
+                f"SUM(CASE WHEN {post_window} THEN src.{amount_column} ELSE 0 END) AS post_event_{name}_amount",
+            ]
+            params += [pre_event_days, post_event_days]
+        params += [pre_event_days, post_event_days]
+        
+        query = f"""
+        WITH EventUsers AS (
+            SELECT
+                player,
+                MIN(appliedAt) AS first_event_date
+            FROM
+                promotion_players
+            WHERE
+                appliedAt IS NOT NULL
+            GROUP BY
+                player
+        )
+        SELECT
+            eu.player,
+            {', '.join(columns)}
+        FROM
+            EventUsers eu
+        JOIN
+            {table} src ON src.player = eu.player
+            AND {ts} BETWEEN DATE_SUB(eu.first_event_date, INTERVAL %s DAY)
+                         AND DATE_ADD(eu.first_event_date, INTERVAL %s DAY)
+        {f'WHERE {condition}' if condition else ''}
+        GROUP BY
+            eu.player
+        """
+        
+        result = pd.DataFrame(self.db.query(query, tuple(params)))
+        if result.empty:
+            result = pd.DataFrame(columns=['player'] + [col.rsplit(' AS ', 1)[1] for col in columns])
+        return result
+    
     def analyze_event_retention(self, pre_event_days=30, post_event_days=90):
         """
         이벤트 전후 유지율 분석
@@ -1436,98 +1551,20 @@ class InactiveUserEventAnalyzer:
                 'retention_impact': pd.DataFrame()
             }
         
-        # 2. 이벤트 참여 사용자의 이벤트 전 활동 데이터
-        pre_event_query = """
-        WITH EventUsers AS (
-            SELECT
-                player,
-                MIN(appliedAt) AS first_event_date
-            FROM
-                promotion_players
-            WHERE
-                appliedAt IS NOT NULL
-            GROUP BY
-                player
-        )
-        SELECT
-            eu.player,
-            p.userId,
-            p.name,
-            eu.first_event_date,
-            COUNT(DISTINCT CASE WHEN l.loginTime BETWEEN DATE_SUB(eu.first_event_date, INTERVAL %s DAY) AND eu.first_event_date THEN DATE(l.loginTime) END) AS pre_event_login_days,
-            COUNT(DISTINCT CASE WHEN gp.playTime BETWEEN DATE_SUB(eu.first_event_date, INTERVAL %s DAY) AND eu.first_event_date THEN DATE(gp.playTime) END) AS pre_event_play_days,
-            COUNT(DISTINCT CASE WHEN mf.createdAt BETWEEN DATE_SUB(eu.first_event_date, INTERVAL %s DAY) AND eu.first_event_date AND mf.type = 0 THEN DATE(mf.createdAt) END) AS pre_event_deposit_days,
-            SUM(CASE WHEN mf.createdAt BETWEEN DATE_SUB(eu.first_event_date, INTERVAL %s DAY) AND eu.first_event_date AND mf.type = 0 THEN mf.amount ELSE 0 END) AS pre_event_deposit_amount
-        FROM
-            EventUsers eu
-        JOIN
-            players p ON eu.player = p.id
-        LEFT JOIN
-            login_history l ON eu.player = l.player
-        LEFT JOIN
-            game_plays gp ON eu.player = gp.player
-        LEFT JOIN
-            money_flows mf ON eu.player = mf.player
-        GROUP BY
-            eu.player, p.userId, p.name, eu.first_event_date
-        """
-        
-        pre_event_params = (pre_event_days, pre_event_days, pre_event_days, pre_event_days)
-        pre_event_data = pd.DataFrame(self.db.query(pre_event_query, pre_event_params))
-        
-        # 3. 이벤트 참여 사용자의 이벤트 후 활동 데이터
-        post_event_query = """
-        WITH EventUsers AS (
-            SELECT
-                player,
-                MIN(appliedAt) AS first_event_date
-            FROM
-                promotion_players
-            WHERE
-                appliedAt IS NOT NULL
-            GROUP BY
-                player
-        )
-        SELECT
-            eu.player,
-            p.userId,
-            p.name,
-            eu.first_event_date,
-            COUNT(DISTINCT CASE WHEN l.loginTime BETWEEN eu.first_event_date AND DATE_ADD(eu.first_event_date, INTERVAL %s DAY) THEN DATE(l.loginTime) END) AS post_event_login_days,
-            COUNT(DISTINCT CASE WHEN gp.playTime BETWEEN eu.first_event_date AND DATE_ADD(eu.first_event_date, INTERVAL %s DAY) THEN DATE(gp.playTime) END) AS post_event_play_days,
-            COUNT(DISTINCT CASE WHEN mf.createdAt BETWEEN eu.first_event_date AND DATE_ADD(eu.first_event_date, INTERVAL %s DAY) AND mf.type = 0 THEN DATE(mf.createdAt) END) AS post_event_deposit_days,
-            SUM(CASE WHEN mf.createdAt BETWEEN eu.first_event_date AND DATE_ADD(eu.first_event_date, INTERVAL %s DAY) AND mf.type = 0 THEN mf.amount ELSE 0 END) AS post_event_deposit_amount
-        FROM
-            EventUsers eu
-        JOIN
-            players p ON eu.player = p.id
-        LEFT JOIN
-            login_history l ON eu.player = l.player
-        LEFT JOIN
-            game_plays gp ON eu.player = gp.player
-        LEFT JOIN
-            money_flows mf ON eu.player = mf.player
-        GROUP BY
-            eu.player, p.userId, p.name, eu.first_event_date
-        """
-        
-        post_event_params = (post_event_days, post_event_days, post_event_days, post_event_days)
-        post_event_data = pd.DataFrame(self.db.query(post_event_query, post_event_params))
-        
-        # 4. 데이터 통합 및 이벤트 효과 분석
-        # 이벤트 데이터와 전/후 활동 데이터 통합
-        if not pre_event_data.empty and 'player' in pre_event_data.columns:
-            combined_data = pd.merge(event_data, pre_event_data, left_on='player', right_on='player', how='left')
-        else:
-            combined_data = event_data.copy()
-            for col in ['pre_event_login_days', 'pre_event_play_days', 'pre_event_deposit_days', 'pre_event_deposit_amount']:
-                combined_data[col] = 0
-        
-        if not post_event_data.empty and 'player' in post_event_data.columns:
-            combined_data = pd.merge(combined_data, post_event_data, left_on='player', right_on='player', how='left', suffixes=('', '_post'))
-        else:
-            for col in ['post_event_login_days', 'post_event_play_days', 'post_event_deposit_days', 'post_event_deposit_amount']:
-                combined_data[col] = 0
+        # 2. 이벤트 전후 활동 데이터
+        # 원본별로 별도의 그룹 집계를 실행한 뒤 플레이어 단위의 작은 결과만 병합
+        # (여러 원본을 한 번에 LEFT JOIN하면 로그인 × 플레이 × 입금 행이 곱해져
+        #  비용이 커지고 입금 합계도 부풀려짐)
+        combined_data = event_data.copy()
+        for name, table, time_column, condition, amount_column in self._EVENT_WINDOW_SOURCES:
+            window_data = self._event_window_activity(
+                name, table, time_column, pre_event_days, post_event_days, condition, amount_column
+            )
+            if not window_data.empty:
+                combined_data = pd.merge(combined_data, window_data, on='player', how='left')
+            else:
+                for col in window_data.columns.drop('player'):
+                    combined_data[col] = 0
         
         # NaN 값을 0으로 대체
         combined_data = combined_data.fillna(0)
@@ -1539,25 +1576,10 @@ class InactiveUserEventAnalyzer:
         combined_data['deposit_amount_change'] = combined_data['post_event_deposit_amount'] - combined_data['pre_event_deposit_amount']
         
         # 변화율 계산 (0으로 나누는 것 방지)
-        combined_data['login_days_change_rate'] = combined_data.apply(
-            lambda x: ((x['post_event_login_days'] / x['pre_event_login_days']) - 1) * 100 if x['pre_event_login_days'] > 0 else (float('inf') if x['post_event_login_days'] > 0 else 0),
-            axis=1
-        )
-        
-        combined_data['play_days_change_rate'] = combined_data.apply(
-            lambda x: ((x['post_event_play_days'] / x['pre_event_play_days']) - 1) * 100 if x['pre_event_play_days'] > 0 else (float('inf') if x['post_event_play_days'] > 0 else 0),
-            axis=1
-        )
-        
-        combined_data['deposit_days_change_rate'] = combined_data.apply(
-            lambda x: ((x['post_event_deposit_days'] / x['pre_event_deposit_days']) - 1) * 100 if x['pre_event_deposit_days'] > 0 else (float('inf') if x['post_event_deposit_days'] > 0 else 0),
-            axis=1
-        )
-        
-        combined_data['deposit_amount_change_rate'] = combined_data.apply(
-            lambda x: ((x['post_event_deposit_amount'] / x['pre_event_deposit_amount']) - 1) * 100 if x['pre_event_deposit_amount'] > 0 else (float('inf') if x['post_event_deposit_amount'] > 0 else 0),
-            axis=1
-        )
+        for metric in ['login_days', 'play_days', 'deposit_days', 'deposit_amount']:
+            combined_data[f'{metric}_change_rate'] = change_rate(
+                combined_data[f'post_event_{metric}'], combined_data[f'pre_event_{metric}']
+            )
         
         # 사용자 그룹화 (이벤트 효과에 따라)
         conditions = [
@@ -22,7 +22,6 @@ from sklearn.decomposition import PCA
 from sklearn.cluster import KMeans, DBSCAN, AgglomerativeClustering
 from sklearn.metrics import silhouette_score, calinski_harabasz_score, davies_bouldin_score
 from scipy.cluster.hierarchy import dendrogram, linkage
-from scipy.stats import mode
 
 # 프로젝트 루트 디렉토리를 sys.path에 추가
 project_root = Path(__file__).parent.parent.parent.parent
@@ -30,6 +29,9 @@ sys.path.append(str(project_root))
 
 from src.database.mariadb_connection import MariaDBConnection
 from src.analysis.user.inactive_user_targeting_pipeline import InactiveUserTargetingPipeline
+from src.analysis.cluster_search import ClusterCountSearch, recommend_cluster_count
+from src.analysis.segment_model import SegmentModel
+from src.analysis.two_stage_clustering import TwoStageWardClustering
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -39,15 +41,25 @@ class InactiveUserSegmentation:
     비활성 사용자 세그먼테이션 알고리즘 클래스
     """
     
-    def __init__(self, data_dir=None):
+    def __init__(self, data_dir=None, scalable_threshold: int = 50000, silhouette_sample_size: int = 10000,
+                 hierarchical_exact_limit: int = 10000):
         """
         InactiveUserSegmentation 초기화
         
         Args:
             data_dir (str, optional): 데이터 저장 디렉토리 경로
+            scalable_threshold (int, optional): 클러스터 수 탐색을 확장 모드로 수행할 최소 행 수.
+                기본값은 50000.
+            silhouette_sample_size (int, optional): 확장 모드의 실루엣 점수 표본 크기. 기본값은 10000.
+            hierarchical_exact_limit (int, optional): 계층적 클러스터링을 전체 데이터에 직접
+                수행할 최대 행 수. 넘으면 2단계 방식 사용. 기본값은 10000.
         """
         self.data_dir = data_dir if data_dir is not None else str(project_root / "data" / "user_targeting")
         self.output_dir = str(project_root / "data" / "user_segments")
+        self.scalable_threshold = scalable_threshold
+        self.silhouette_sample_size = silhouette_sample_size
+        self.hierarchical_exact_limit = hierarchical_exact_limit
+        self.cluster_search_cache_path = os.path.join(self.output_dir, "cluster_search_cache.json")
         
         # 출력 디렉토리 생성
         os.makedirs(self.output_dir, exist_ok=True)
@@ -57,6 +69,9 @@ class InactiveUserSegmentation:
         self.cluster_models = {}
         self.segment_profiles = {}
         self.feature_importances = {}
+        self.preprocessing_state = {}
+        self.model_dir = os.path.join(self.output_dir, "models")
+        self.segment_model = None
         
         logger.info("InactiveUserSegmentation initialized with data directory: %s", self.data_dir)
     
@@ -170,15 +185,23 @@ class InactiveUserSegmentation:
         clustering_data.fillna(0, inplace=True)
         
         # 이상치 처리 (상위/하위 1%를 제한)
-        for feature in available_features:
-            lower_bound = clustering_data[feature].quantile(0.01)
-            upper_bound = clustering_data[feature].quantile(0.99)
-            clustering_data[feature] = clustering_data[feature].clip(lower_bound, upper_bound)
+        lower_bounds = clustering_data.quantile(0.01)
+        upper_bounds = clustering_data.quantile(0.99)
+        clustering_data = clustering_data.clip(lower_bounds, upper_bounds, axis=1)
         
         # 특성 표준화
         scaler = StandardScaler()
         scaled_data = scaler.fit_transform(clustering_data)
         
+        # 세그먼트 모델 저장에 사용할 전처리 상태
+        self.preprocessing_state = {
+            'features': available_features,
+            'lower_bounds': lower_bounds.tolist(),
+            'upper_bounds': upper_bounds.tolist(),
+            'scaler_mean': scaler.mean_.tolist(),
+            'scaler_scale': scaler.scale_.tolist()
+        }
+        
         # 결과 저장
         clustering_data_scaled = pd.DataFrame(
             scaled_data, 
@@ -189,13 +212,19 @@ class InactiveUserSegmentation:
         logger.info("Preprocessed data for clustering with %d features", len(available_features))
         return clustering_data_scaled, available_features
     
-    def determine_optimal_clusters(self, data: pd.DataFrame, max_clusters: int = 10) -> Dict[str, Any]:
+    def determine_optimal_clusters(self, data: pd.DataFrame, max_clusters: int = 10,
+                                   scalable: Optional[bool] = None, max_workers: Optional[int] = None,
+                                   use_cache: bool = True) -> Dict[str, Any]:
         """
         최적의 클러스터 수 결정
         
         Args:
             data (pd.DataFrame): 클러스터링할 데이터
             max_clusters (int, optional): 평가할 최대 클러스터 수. 기본값은 10.
+            scalable (bool, optional): MiniBatchKMeans/표본 실루엣/병렬 평가를 사용하는
+                확장 모드 여부. None이면 데이터가 scalable_threshold 행 이상일 때 사용.
+            max_workers (int, optional): 확장 모드의 프로세스 풀 크기. 기본값은 CPU 수.
+            use_cache (bool, optional): 확장 모드에서 데이터 지문별 캐시 사용 여부. 기본값은 True.
             
         Returns:
             Dict[str, Any]: 다양한 평가 지표 결과
@@ -204,15 +233,21 @@ class InactiveUserSegmentation:
             logger.warning("No data for cluster evaluation")
             return {}
         
+        # 클러스터 수 범위 (2부터 max_clusters까지)
+        cluster_range = range(2, min(max_clusters + 1, len(data) // 10 + 1))
+        
+        if scalable is None:
+            scalable = len(data) >= self.scalable_threshold
+        
+        if scalable:
+            return self._determine_optimal_clusters_scalable(data, cluster_range, max_workers, use_cache)
+        
         # 평가 지표
         silhouette_scores = []
         ch_scores = []
         db_scores = []
         inertia_values = []
         
-        # 클러스터 수 범위 (2부터 max_clusters까지)
-        cluster_range = range(2, min(max_clusters + 1, len(data) // 10 + 1))
-        
         for n_clusters in cluster_range:
             # KMeans 클러스터링
             kmeans = KMeans(
@@ -249,34 +284,102 @@ class InactiveUserSegmentation:
         best_db_n = cluster_range[best_db_idx]
         
         # 종합적인 추천
-        recommended_n = mode([best_silhouette_n, best_ch_n, best_db_n]).mode[0]
+        recommended_n = recommend_cluster_count([best_silhouette_n, best_ch_n, best_db_n])
         
         # 시각화
+        plot_path = self._plot_cluster_evaluation(
+            list(cluster_range), silhouette_scores, ch_scores, db_scores, inertia_values
+        )
+        
+        evaluation_results = {
+            'cluster_range': list(cluster_range),
+            'silhouette_scores': silhouette_scores,
+            'calinski_harabasz_scores': ch_scores,
+            'davies_bouldin_scores': db_scores,
+            'inertia_values': inertia_values,
+            'best_silhouette': {
+                'n_clusters': best_silhouette_n,
+                'score': silhouette_scores[best_silhouette_idx]
+            },
+            'best_calinski_harabasz': {
+                'n_clusters': best_ch_n,
+                'score': ch_scores[best_ch_idx]
+            },
+            'best_davies_bouldin': {
+                'n_clusters': best_db_n,
+                'score': db_scores[best_db_idx]
+            },
+            'recommended_n_clusters': recommended_n,
+            'plot_path': plot_path
+        }
+        
+        logger.info("Cluster evaluation completed. Recommended clusters: %d", recommended_n)
+        return evaluation_results
+    
+    def _determine_optimal_clusters_scalable(self, data: pd.DataFrame, cluster_range: range,
+                                             max_workers: Optional[int], use_cache: bool) -> Dict[str, Any]:
+        """
+        확장 모드 클러스터 수 탐색 (MiniBatchKMeans, 표본 실루엣, 프로세스 풀 병렬 평가)
+        
+        같은 데이터 지문의 결과는 캐시에서 바로 반환하고, 새로 탐색할 때는
+        이전 탐색의 k별 중심점으로 학습을 시작합니다.
+        """
+        search = ClusterCountSearch(
+            cache_path=self.cluster_search_cache_path,
+            max_workers=max_workers,
+            silhouette_sample_size=self.silhouette_sample_size
+        )
+        evaluation_results = search.search(data, cluster_range, use_cache=use_cache)
+        
+        if not evaluation_results.get('from_cache'):
+            evaluation_results['plot_path'] = self._plot_cluster_evaluation(
+                evaluation_results['cluster_range'],
+                evaluation_results['silhouette_scores'],
+                evaluation_results['calinski_harabasz_scores'],
+                evaluation_results['davies_bouldin_scores'],
+                evaluation_results['inertia_values']
+            )
+        else:
+            evaluation_results.setdefault('plot_path', None)
+        
+        logger.info("Scalable cluster evaluation completed (cached: %s). Recommended clusters: %d",
+                    evaluation_results['from_cache'], evaluation_results['recommended_n_clusters'])
+        return evaluation_results
+    
+    def _plot_cluster_evaluation(self, cluster_range: List[int], silhouette_scores: List[float],
+                                 ch_scores: List[float], db_scores: List[float],
+                                 inertia_values: List[float]) -> str:
+        """
+        클러스터 수별 평가 지표 시각화
+        
+        Returns:
+            str: 저장된 그래프 경로
+        """
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
         
         # Silhouette Score
-        axes[0, 0].plot(list(cluster_range), silhouette_scores, 'o-')
+        axes[0, 0].plot(cluster_range, silhouette_scores, 'o-')
         axes[0, 0].set_title('Silhouette Score')
         axes[0, 0].set_xlabel('Number of Clusters')
         axes[0, 0].set_ylabel('Score')
         axes[0, 0].grid(True)
         
         # Calinski-Harabasz Score
-        axes[0, 1].plot(list(cluster_range), ch_scores, 'o-')
+        axes[0, 1].plot(cluster_range, ch_scores, 'o-')
         axes[0, 1].set_title('Calinski-Harabasz Score')
         axes[0, 1].set_xlabel('Number of Clusters')
         axes[0, 1].set_ylabel('Score')
         axes[0, 1].grid(True)
         
         # Davies-Bouldin Score
-        axes[1, 0].plot(list(cluster_range), db_scores, 'o-')
+        axes[1, 0].plot(cluster_range, db_scores, 'o-')
         axes[1, 0].set_title('Davies-Bouldin Score')
         axes[1, 0].set_xlabel('Number of Clusters')
         axes[1, 0].set_ylabel('Score')
         axes[1, 0].grid(True)
         
         # Elbow Method (Inertia)
-        axes[1, 1].plot(list(cluster_range), inertia_values, 'o-')
+        axes[1, 1].plot(cluster_range, inertia_values, 'o-')
         axes[1, 1].set_title('Elbow Method (KMeans Inertia)')
         axes[1, 1].set_xlabel('Number of Clusters')
         axes[1, 1].set_ylabel('Inertia')
@@ -290,30 +393,7 @@ class InactiveUserSegmentation:
         plt.savefig(plot_path)
         plt.close()
         
-        evaluation_results = {
-            'cluster_range': list(cluster_range),
-            'silhouette_scores': silhouette_scores,
-            'calinski_harabasz_scores': ch_scores,
-            'davies_bouldin_scores': db_scores,
-            'inertia_values': inertia_values,
-            'best_silhouette': {
-                'n_clusters': best_silhouette_n,
-                'score': silhouette_scores[best_silhouette_idx]
-            },
-            'best_calinski_harabasz': {
-                'n_clusters': best_ch_n,
-                'score': ch_scores[best_ch_idx]
-            },
-            'best_davies_bouldin': {
-                'n_clusters': best_db_n,
-                'score': db_scores[best_db_idx]
-            },
-            'recommended_n_clusters': recommended_n,
-            'plot_path': plot_path
-        }
-        
-        logger.info("Cluster evaluation completed. Recommended clusters: %d", recommended_n)
-        return evaluation_results
+        return plot_path
     
     def perform_clustering(self, data: pd.DataFrame, n_clusters: int = 5) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
@@ -384,13 +464,18 @@ class InactiveUserSegmentation:
         logger.info("KMeans clustering completed with %d clusters", n_clusters)
         return cluster_labels, model_info
     
-    def perform_hierarchical_clustering(self, data: pd.DataFrame, n_clusters: int = 5) -> Tuple[np.ndarray, Dict[str, Any]]:
+    def perform_hierarchical_clustering(self, data: pd.DataFrame, n_clusters: int = 5,
+                                        two_stage: Optional[bool] = None,
+                                        n_micro_clusters: int = 1000) -> Tuple[np.ndarray, Dict[str, Any]]:
         """
         계층적 클러스터링 수행
         
         Args:
             data (pd.DataFrame): 클러스터링할 데이터
             n_clusters (int, optional): 클러스터 수. 기본값은 5.
+            two_stage (bool, optional): 미세 클러스터 + 가중 Ward 연결의 2단계 방식 사용 여부.
+                None이면 데이터가 hierarchical_exact_limit 행을 넘을 때 사용.
+            n_micro_clusters (int, optional): 2단계 방식의 미세 클러스터 수. 기본값은 1000.
             
         Returns:
             Tuple[np.ndarray, Dict[str, Any]]: 클러스터 레이블과 모델 정보
@@ -399,22 +484,35 @@ class InactiveUserSegmentation:
             logger.warning("No data for hierarchical clustering")
             return np.array([]), {}
         
-        # 계층적 클러스터링
-        hc = AgglomerativeClustering(
-            n_clusters=n_clusters,
-            linkage='ward'
-        )
-        cluster_labels = hc.fit_predict(data)
-        
-        # 덴드로그램 생성 (시각화 목적)
-        # 데이터가 너무 큰 경우 샘플링
-        max_samples = 1000
-        if len(data) > max_samples:
-            sample_idx = np.random.choice(len(data), max_samples, replace=False)
-            sample_data = data.iloc[sample_idx]
-            Z = linkage(sample_data, 'ward')
+        if two_stage is None:
+            two_stage = len(data) > self.hierarchical_exact_limit
+        
+        if two_stage:
+            # 2단계 계층적 클러스터링 (메모리는 미세 클러스터 수의 제곱에 비례)
+            hc = TwoStageWardClustering(n_clusters=n_clusters, n_micro_clusters=n_micro_clusters)
+            cluster_labels = hc.fit_predict(data.to_numpy(dtype=float))
+            
+            # 덴드로그램은 미세 클러스터 연결 행렬 사용
+            Z = hc.linkage_matrix_
+            algorithm = 'TwoStageWard'
         else:
-            Z = linkage(data, 'ward')
+            # 계층적 클러스터링
+            hc = AgglomerativeClustering(
+                n_clusters=n_clusters,
+                linkage='ward'
+            )
+            cluster_labels = hc.fit_predict(data)
+            
+            # 덴드로그램 생성 (시각화 목적)
+            # 데이터가 너무 큰 경우 샘플링
+            max_samples = 1000
+            if len(data) > max_samples:
+                sample_idx = np.random.choice(len(data), max_samples, replace=False)
+                sample_data = data.iloc[sample_idx]
+                Z = linkage(sample_data, 'ward')
+            else:
+                Z = linkage(data, 'ward')
+            algorithm = 'AgglomerativeClustering'
         
         plt.figure(figsize=(16, 10))
         dendrogram(Z, truncate_mode='level', p=5)
@@ -428,9 +526,10 @@ class InactiveUserSegmentation:
         plt.savefig(plot_path)
         plt.close()
         
-        # 클러스터 평가
+        # 클러스터 평가 (2단계 방식은 실루엣 점수를 표본으로 계산)
         if len(np.unique(cluster_labels)) > 1:
-            silhouette_avg = silhouette_score(data, cluster_labels)
+            sample_size = min(self.silhouette_sample_size, len(data)) if two_stage else None
+            silhouette_avg = silhouette_score(data, cluster_labels, sample_size=sample_size, random_state=42)
             ch_score = calinski_harabasz_score(data, cluster_labels)
             db_score = davies_bouldin_score(data, cluster_labels)
         else:
@@ -444,7 +543,7 @@ class InactiveUserSegmentation:
         
         # 모델 정보
         model_info = {
-            'algorithm': 'AgglomerativeClustering',
+            'algorithm': algorithm,
             'n_clusters': n_clusters,
             'linkage': 'ward',
             'evaluation': {
@@ -458,6 +557,8 @@ class InactiveUserSegmentation:
             },
             'dendrogram_path': plot_path
         }
+        if two_stage:
+            model_info['n_micro_clusters'] = len(hc.micro_centers_)
         
         # 모델 저장
         self.cluster_models['hierarchical'] = {
@@ -960,6 +1061,174 @@ class InactiveUserSegmentation:
             logger.error("Failed to save segment results: %s", str(e))
             return ""
     
+    def build_segment_model(self, data: pd.DataFrame,
+                            segment_definitions: Optional[Dict[str, Dict[str, Any]]] = None) -> Optional[SegmentModel]:
+        """
+        마지막 전처리 상태와 KMeans 중심점으로 세그먼트 모델 생성
+        
+        Args:
+            data (pd.DataFrame): 학습에 사용한 원본 데이터 (세그먼트 비율/평균 거리 계산용)
+            segment_definitions (Dict[str, Dict[str, Any]], optional): 세그먼트 정의
+            
+        Returns:
+            Optional[SegmentModel]: 생성된 모델. 전처리나 클러스터링 결과가 없으면 None.
+        """
+        if not self.preprocessing_state or 'kmeans' not in self.cluster_models:
+            logger.warning("No preprocessing state or KMeans model to build a segment model from")
+            return None
+        
+        model = SegmentModel(
+            centroids=self.cluster_models['kmeans']['model'].cluster_centers_.tolist(),
+            segment_definitions=segment_definitions,
+            n_samples=len(data),
+            **self.preprocessing_state
+        )
+        
+        # 학습 시점 기준값 (드리프트 비교용)
+        assignment = model.assign(data)
+        counts = np.bincount(assignment['segment_id'].to_numpy(), minlength=model.n_clusters)
+        model.segment_shares = counts / max(counts.sum(), 1)
+        model.mean_distance = float(assignment['segment_distance'].mean()) if len(assignment) else None
+        return model
+    
+    def save_segment_model(self, model: SegmentModel) -> str:
+        """
+        세그먼트 모델을 새 버전으로 저장
+        
+        Args:
+            model (SegmentModel): 저장할 모델
+            
+        Returns:
+            str: 저장된 파일 경로
+        """
+        path = model.save(self.model_dir)
+        self.segment_model = model
+        return path
+    
+    def load_segment_model(self, path: Optional[str] = None) -> Optional[SegmentModel]:
+        """
+        저장된 세그먼트 모델 로드
+        
+        Args:
+            path (str, optional): 모델 파일 경로. 기본값은 None (최신 버전 로드).
+            
+        Returns:
+            Optional[SegmentModel]: 로드된 모델. 저장된 모델이 없거나 읽지 못하면 None.
+        """
+        try:
+            model = SegmentModel.load(path) if path else SegmentModel.load_latest(self.model_dir)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.error("Failed to load segment model: %s", str(e))
+            return None
+        
+        if model is not None:
+            logger.info("Loaded segment model v%d with %d segments", model.version, model.n_clusters)
+        self.segment_model = model
+        return model
+    
+    def assign_segments(self, data: pd.DataFrame, chunk_size: int = 100000) -> pd.DataFrame:
+        """
+        저장된 세그먼트 모델로 사용자 세그먼트 배정 (재학습 없음)
+        
+        Args:
+            data (pd.DataFrame): 배정할 데이터
+            chunk_size (int, optional): 한 번에 처리할 행 수. 기본값은 100000.
+            
+        Returns:
+            pd.DataFrame: segment_id, segment_name, segment_distance 열이 추가된 데이터
+            
+        Raises:
+            ValueError: 로드된 세그먼트 모델이 없는 경우
+        """
+        if self.segment_model is None and self.load_segment_model() is None:
+            raise ValueError("No segment model available; run segment_users() or run_segmentation() first")
+        
+        model = self.segment_model
+        assignment = model.assign(data, chunk_size=chunk_size)
+        segmented_data = self._label_segments(data, model, assignment)
+        
+        logger.info("Assigned %d users to %d segments with model v%d", len(data), model.n_clusters, model.version)
+        return segmented_data
+    
+    @staticmethod
+    def _label_segments(data: pd.DataFrame, model: SegmentModel, assignment: pd.DataFrame) -> pd.DataFrame:
+        """배정 결과를 세그먼트 번호/이름/거리 열로 추가"""
+        segmented_data = data.copy()
+        segmented_data['segment_id'] = assignment['segment_id']
+        segmented_data['segment_name'] = assignment['segment_id'].map(model.segment_names).fillna(
+            "세그먼트 " + assignment['segment_id'].astype(str)
+        )
+        segmented_data['segment_distance'] = assignment['segment_distance']
+        return segmented_data
+    
+    def segment_users(self, data: pd.DataFrame, n_clusters: Optional[int] = None,
+                      psi_threshold: float = 0.2, shift_threshold: float = 0.5,
+                      force_refit: bool = False) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        저장된 모델로 세그먼트를 배정하고, 드리프트가 임계값을 넘을 때만 재학습
+        
+        Args:
+            data (pd.DataFrame): 세그먼테이션할 데이터
+            n_clusters (int, optional): 재학습 시 클러스터 수. None이면 최적 클러스터 수 탐색.
+            psi_threshold (float, optional): 세그먼트 비율 PSI 임계값. 기본값은 0.2.
+            shift_threshold (float, optional): 특성 평균 이동량 임계값(표준편차 단위). 기본값은 0.5.
+            force_refit (bool, optional): 드리프트와 관계없이 재학습. 기본값은 False.
+            
+        Returns:
+            Tuple[pd.DataFrame, Dict[str, Any]]: 세그먼트가 배정된 데이터와 실행 정보
+                (refit, reason, drift, model_version, segment_definitions)
+        """
+        model = self.segment_model or self.load_segment_model()
+        drift = None
+        reason = 'forced' if force_refit else 'no_model'
+        
+        if model is not None and not force_refit:
+            if all(f in data.columns for f in model.features):
+                assignment = model.assign(data)
+                drift = model.drift(data, assignment)
+                if drift['segment_psi'] <= psi_threshold and drift['max_feature_shift'] <= shift_threshold:
+                    segmented_data = self._label_segments(data, model, assignment)
+                    logger.info("Segment model v%d reused (PSI %.3f, max shift %.3f)",
+                                model.version, drift['segment_psi'], drift['max_feature_shift'])
+                    return segmented_data, {
+                        'refit': False,
+                        'reason': 'within_threshold',
+                        'drift': drift,
+                        'model_version': model.version,
+                        'segment_definitions': model.segment_definitions
+                    }
+                reason = 'drift'
+                logger.info("Segment drift exceeded threshold (PSI %.3f, max shift %.3f), refitting",
+                            drift['segment_psi'], drift['max_feature_shift'])
+            else:
+                reason = 'feature_mismatch'
+        
+        # 전체 재학습
+        preprocessed_data, features = self.preprocess_for_clustering(data)
+        if preprocessed_data.empty:
+            logger.error("Failed to preprocess data for segment model refit")
+            return data, {'refit': False, 'reason': 'no_features', 'drift': drift,
+                          'model_version': None, 'segment_definitions': {}}
+        
+        if n_clusters is None:
+            evaluation = self.determine_optimal_clusters(preprocessed_data)
+            n_clusters = evaluation.get('recommended_n_clusters', 5)
+        
+        cluster_labels, _ = self.perform_clustering(preprocessed_data, n_clusters)
+        cluster_analysis = self.analyze_clusters(data, cluster_labels, features)
+        segment_definitions = self.create_segment_definitions(cluster_analysis.get('cluster_profiles', {}))
+        
+        model = self.build_segment_model(data, segment_definitions)
+        self.save_segment_model(model)
+        
+        return self.assign_segments(data), {
+            'refit': True,
+            'reason': reason,
+            'drift': drift,
+            'model_version': model.version,
+            'segment_definitions': segment_definitions
+        }
+    
     def run_segmentation(self, data: Optional[pd.DataFrame] = None, n_clusters: Optional[int] = None) -> Dict[str, Any]:
         """
         전체 세그먼테이션 과정 실행
@@ -35,6 +35,7 @@ from src.database.mariadb_connection import MariaDBConnection
 from src.analysis.user.inactive_user_segmentation import InactiveUserSegmentation
 from src.analysis.predictive_models.inactive_user_model import InactiveUserPredictionModel
 from src.analysis.user.user_value_scoring import UserValueScoring
+from src.analysis.feature_transforms import safe_divide
 
 # 로깅 설정
 logging.basicConfig(
@@ -216,34 +217,14 @@ class InactiveUserTargetingEngine:
         
         # 4. 사용자 세그먼테이션 수행
         try:
-            # 세그먼테이션 실행
-            preprocessed_data, features = self.segmentation.preprocess_for_clustering(scored_users)
+            # 세그먼테이션 실행 (저장된 모델로 배정, 드리프트가 크면 재학습)
+            segmented_users, segmentation_info = self.segmentation.segment_users(scored_users)
+            segment_definitions = segmentation_info.get('segment_definitions', {})
             
-            if not preprocessed_data.empty and len(features) > 0:
-                # 최적 클러스터 수 결정
-                cluster_eval = self.segmentation.determine_optimal_clusters(preprocessed_data)
-                n_clusters = cluster_eval.get('recommended_n_clusters', 5)
-                
-                # 클러스터링 수행
-                cluster_labels, _ = self.segmentation.perform_clustering(preprocessed_data, n_clusters)
-                
-                # 클러스터 분석
-                self.segmentation.analyze_clusters(scored_users, cluster_labels, features)
-                
-                # 세그먼트 정의 생성
-                segment_definitions = self.segmentation.create_segment_definitions()
-                
+            if 'segment_id' in segmented_users.columns:
                 # 결과에 세그먼트 정보 추가
-                scored_users['segment_id'] = cluster_labels
-                
-                # 세그먼트 이름 매핑
-                segment_names = {}
-                for seg_id, definition in segment_definitions.items():
-                    segment_names[int(seg_id)] = definition['name']
-                
-                scored_users['segment_name'] = scored_users['segment_id'].map(
-                    lambda x: segment_names.get(x, f"세그먼트 {x}")
-                )
+                scored_users['segment_id'] = segmented_users['segment_id']
+                scored_users['segment_name'] = segmented_users['segment_name']
                 
                 # 세그먼트 가중치 적용
                 scored_users['segment_weight'] = scored_users['segment_name'].apply(
@@ -316,11 +297,9 @@ class InactiveUserTargetingEngine:
             targets['expected_deposit'] = targets['reengagement_probability'] * targets['avg_deposit_amount']
             
             # 예상 ROI (투자수익률)
-            targets['expected_roi'] = targets.apply(
-                lambda x: (x['expected_deposit'] / x['recommended_reward']) - 1 
-                if x['recommended_reward'] > 0 else 0,
-                axis=1
-            )
+            targets['expected_roi'] = safe_divide(
+                targets['expected_deposit'], targets['recommended_reward'], default=1.0
+            ) - 1
         
         # 8. 결과 저장
         self.targeting_results = targets
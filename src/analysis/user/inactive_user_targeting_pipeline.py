@@ -23,6 +23,7 @@ sys.path.append(str(project_root))
 
 from src.database.mariadb_connection import MariaDBConnection
 from src.analysis.user.inactive_event_analyzer import InactiveUserEventAnalyzer
+from src.utils.dag_executor import DAGExecutor
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -32,18 +33,26 @@ class InactiveUserTargetingPipeline:
     비활성 사용자 타겟팅을 위한 데이터 통합 및 전처리 파이프라인 클래스
     """
     
-    def __init__(self, db_connection=None, data_dir=None):
+    def __init__(self, db_connection=None, data_dir=None, feature_store=None, max_workers=4):
         """
         InactiveUserTargetingPipeline 초기화
         
         Args:
             db_connection (MariaDBConnection, optional): 데이터베이스 연결 객체
             data_dir (str, optional): 데이터 저장 디렉토리 경로
+            feature_store (PlayerFeatureStore, optional): 지정하면 플레이어별 집계를
+                증분 갱신되는 특성 저장소에서 가져와 'player_features' 데이터 소스로 추가
+            max_workers (int, optional): 데이터 소스를 동시에 가져올 최대 작업 수.
+                각 작업은 연결 풀의 연결을 하나씩 사용하므로 풀 크기보다 작게 설정합니다.
+                기본값은 4.
         """
         self.db = db_connection if db_connection is not None else MariaDBConnection()
+        self.feature_store = feature_store
         self.data_dir = data_dir if data_dir is not None else str(project_root / "data" / "user_targeting")
         self.inactive_analyzer = InactiveUserEventAnalyzer(db_connection=self.db)
         self.processed_data = {}  # 처리된 데이터 캐싱
+        self.max_workers = max_workers
+        self.source_timings = {}  # 마지막 데이터 소스 조회의 노드별 실행 시간(초)
         
         # 데이터 디렉토리 생성
         os.makedirs(self.data_dir, exist_ok=True)
@@ -78,51 +87,59 @@ class InactiveUserTargetingPipeline:
         logger.info("Fetching all data sources with days_inactive=%d, days_lookback=%d", 
                    days_inactive, days_lookback)
         
-        # User Behavior Analysis Module에서 데이터 가져오기
-        inactive_users = self.inactive_analyzer.get_inactive_users(days_inactive)
-        login_frequency = self.inactive_analyzer.get_login_frequency(days_lookback)
-        session_duration = self.inactive_analyzer.get_session_duration(days_lookback)
-        
-        # 활동 메트릭 분석 실행
-        activity_metrics = self.inactive_analyzer.analyze_activity_metrics(days_lookback, days_inactive)
-        activity_data = activity_metrics['raw_data'] if 'raw_data' in activity_metrics else pd.DataFrame()
-        
-        # 사용자 참여도 분석 실행
-        engagement_analysis = self.inactive_analyzer.analyze_user_engagement(days_lookback)
-        engagement_data = engagement_analysis['raw_data'] if 'raw_data' in engagement_analysis else pd.DataFrame()
-        
-        # Event Effect Analysis Module에서 데이터 가져오기
-        event_participants = self.inactive_analyzer.get_event_participants()
-        deposits_after_event = self.inactive_analyzer.get_deposits_after_event()
-        
-        # 전환 퍼널 분석 실행
-        conversion_funnel = self.inactive_analyzer.analyze_conversion_funnel(days_lookback, days_inactive)
-        
-        # 비활성 기간별 전환율 분석 실행
-        inactive_period_analysis = self.inactive_analyzer.analyze_conversion_by_inactive_period()
-        inactive_period_data = inactive_period_analysis['raw_data'] if 'raw_data' in inactive_period_analysis else pd.DataFrame()
-        
-        # 이벤트 금액별 전환율 분석 실행
-        event_amount_analysis = self.inactive_analyzer.analyze_conversion_by_event_amount()
-        event_amount_data = event_amount_analysis['raw_data'] if 'raw_data' in event_amount_analysis else pd.DataFrame()
-        
-        # 이벤트 전후 유지율 분석 실행
-        event_retention_analysis = self.inactive_analyzer.analyze_event_retention(30, 60)
-        event_retention_data = event_retention_analysis['user_data'] if 'user_data' in event_retention_analysis else pd.DataFrame()
+        analyzer = self.inactive_analyzer
+        dag = DAGExecutor(max_workers=self.max_workers)
+        
+        # User Behavior Analysis Module 데이터 (공유 하위 조회는 한 번만 실행)
+        dag.add('inactive_users', lambda: analyzer.get_inactive_users(days_inactive))
+        dag.add('login_frequency', lambda: analyzer.get_login_frequency(days_lookback))
+        dag.add('session_duration', lambda: analyzer.get_session_duration(days_lookback))
+        dag.add('activity_data',
+                lambda **deps: self._raw_data(analyzer.analyze_activity_metrics(
+                    days_lookback, days_inactive, **deps)),
+                deps=['login_frequency', 'session_duration', 'inactive_users'])
+        dag.add('engagement_data',
+                lambda login_frequency: self._raw_data(analyzer.analyze_user_engagement(
+                    days_lookback, login_frequency=login_frequency)),
+                deps=['login_frequency'])
+        
+        # Event Effect Analysis Module 데이터
+        dag.add('event_participants', analyzer.get_event_participants)
+        dag.add('deposits_after_event', analyzer.get_deposits_after_event)
+        dag.add('all_inactive_users', lambda: analyzer.get_inactive_users(days_inactive=0))
+        dag.add('inactive_period_data',
+                lambda all_inactive_users, event_participants, deposits_after_event: self._raw_data(
+                    analyzer.analyze_conversion_by_inactive_period(
+                        all_inactive_users=all_inactive_users,
+                        event_participants=event_participants,
+                        deposit_after_event=deposits_after_event)),
+                deps=['all_inactive_users', 'event_participants', 'deposits_after_event'])
+        dag.add('event_amount_data',
+                lambda event_participants, deposits_after_event: self._raw_data(
+                    analyzer.analyze_conversion_by_event_amount(
+                        event_participants=event_participants,
+                        deposit_after_event=deposits_after_event)),
+                deps=['event_participants', 'deposits_after_event'])
+        dag.add('event_retention_data',
+                lambda: analyzer.analyze_event_retention(30, 60).get('user_data', pd.DataFrame()))
+        
+        # 특성 저장소에서 플레이어별 집계 가져오기 (마지막 실행 이후 증분만 반영)
+        if self.feature_store is not None:
+            dag.add('player_features', lambda: self._fetch_player_features(days_inactive))
+        
+        # 데이터 소스 조회 한 번을 하나의 메모이제이션 범위로 실행
+        with analyzer.memo_scope():
+            results = dag.run()
+        self.source_timings = dict(dag.timings)
         
         # 데이터 소스 취합
         data_sources = {
-            'inactive_users': inactive_users,
-            'login_frequency': login_frequency,
-            'session_duration': session_duration,
-            'activity_data': activity_data,
-            'engagement_data': engagement_data,
-            'event_participants': event_participants,
-            'deposits_after_event': deposits_after_event,
-            'inactive_period_data': inactive_period_data,
-            'event_amount_data': event_amount_data,
-            'event_retention_data': event_retention_data
+            name: results[name]
+            for name in ['inactive_users', 'login_frequency', 'session_duration', 'activity_data',
+                         'engagement_data', 'event_participants', 'deposits_after_event',
+                         'inactive_period_data', 'event_amount_data', 'event_retention_data']
         }
+        data_sources['player_features'] = results.get('player_features', pd.DataFrame())
         
         # 각 데이터셋의 크기 로깅
         for name, df in data_sources.items():
@@ -140,6 +157,20 @@ class InactiveUserTargetingPipeline:
         
         return data_sources
     
+    @staticmethod
+    def _raw_data(analysis: Dict[str, Any]) -> pd.DataFrame:
+        """분석 결과 딕셔너리에서 원본 데이터 추출"""
+        return analysis['raw_data'] if 'raw_data' in analysis else pd.DataFrame()
+    
+    def _fetch_player_features(self, days_inactive: int) -> pd.DataFrame:
+        """특성 저장소를 증분 갱신한 뒤 비활성 플레이어 특성 조회"""
+        try:
+            self.feature_store.refresh()
+            return self.feature_store.get_features(days_inactive=days_inactive)
+        except Exception as e:
+            logger.warning("Failed to load player features from feature store: %s", str(e))
+            return pd.DataFrame()
+    
     def preprocess_data(self, data_sources: Dict[str, pd.DataFrame]) -> pd.DataFrame:
         """
         데이터 전처리 및 통합
@@ -242,6 +273,23 @@ class InactiveUserTargetingPipeline:
                 inactive_users['deposit_amount_after_event'].fillna(0, inplace=True)
                 inactive_users['deposit_count_after_event'].fillna(0, inplace=True)
         
+        # 4.1 특성 저장소의 플레이어별 집계 병합 (기존 열과 겹치지 않는 열만)
+        if 'player_features' in data_sources and not data_sources['player_features'].empty:
+            feature_data = data_sources['player_features'].rename(columns={'player_id': 'id'})
+            feature_cols = [
+                col for col in ['total_deposits_1y', 'total_withdrawals_1y', 'avg_deposit_amount',
+                                'game_count', 'total_games_played', 'total_days_played',
+                                'total_deposits_count', 'avg_net_bet', 'total_win_loss_1y']
+                if col not in inactive_users.columns
+            ]
+            inactive_users = pd.merge(
+                inactive_users,
+                feature_data[['id'] + feature_cols],
+                on='id',
+                how='left'
+            )
+            inactive_users[feature_cols] = inactive_users[feature_cols].fillna(0)
+        
         # 5. 추가 특성 계산
         
         # 5.1 비활성 기간 계산
@@ -15,9 +15,11 @@ import numpy as np
 import json
 import logging
 import pickle
+import time
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Any, Union
 
@@ -27,6 +29,7 @@ sys.path.append(str(project_root))
 
 from src.database.mariadb_connection import MariaDBConnection
 from src.analysis.predictive_models.inactive_user_model import InactiveUserPredictionModel
+from src.analysis.feature_transforms import ratio, log_normalize
 
 # 로깅 설정
 logging.basicConfig(
@@ -40,15 +43,18 @@ class UserValueScoring:
     사용자 가치 점수화 및 순위 지정 시스템 클래스
     """
     
-    def __init__(self, db_connection=None, data_dir=None):
+    def __init__(self, db_connection=None, data_dir=None, feature_store=None):
         """
         UserValueScoring 초기화
         
         Args:
             db_connection (MariaDBConnection, optional): 데이터베이스 연결 객체
             data_dir (str, optional): 데이터 저장 디렉토리 경로
+            feature_store (PlayerFeatureStore, optional): 지정하면 사용자 데이터를
+                원본 테이블 대신 증분 갱신되는 특성 저장소에서 가져옴
         """
         self.db = db_connection if db_connection is not None else MariaDBConnection()
+        self.feature_store = feature_store
         self.data_dir = data_dir if data_dir is not None else str(project_root / "data" / "user_value")
         self.visualizations_dir = str(project_root / "data" / "user_value" / "visualizations")
         self.prediction_model = InactiveUserPredictionModel()
@@ -175,115 +181,209 @@ class UserValueScoring:
         self.save_config()
         return True
     
-    def fetch_user_data(self, days_inactive=30) -> pd.DataFrame:
+    # 사용자 특성 추출용 그룹 집계 쿼리 (테이블당 1회 스캔)
+    # 비활성 기준을 만족하는 사용자 기본 정보와 게임 집계
+    _GAME_FEATURES_QUERY = """
+        SELECT
+            p.userId,
+            p.id AS player_id,
+            p.status,
+            DATEDIFF(NOW(), g.last_played_date) AS days_inactive,
+            g.last_played_date,
+            g.game_count,
+            g.total_games_played,
+            g.total_days_played,
+            g.avg_net_bet,
+            g.total_win_loss_1y
+        FROM players p
+        JOIN (
+            SELECT
+                userId,
+                MAX(gameDate) AS last_played_date,
+                SUM(gameDate >= DATE_SUB(NOW(), INTERVAL 365 DAY)) AS game_count,
+                COUNT(*) AS total_games_played,
+                COUNT(DISTINCT DATE(gameDate)) AS total_days_played,
+                IFNULL(AVG(CASE WHEN gameDate >= DATE_SUB(NOW(), INTERVAL 365 DAY)
+                                THEN ROUND(netBet) END), 0) AS avg_net_bet,
+                IFNULL(SUM(CASE WHEN gameDate >= DATE_SUB(NOW(), INTERVAL 365 DAY)
+                                THEN ROUND(winLoss) END), 0) AS total_win_loss_1y
+            FROM game_scores
+            GROUP BY userId
+            HAVING MAX(gameDate) < DATE_SUB(NOW(), INTERVAL %s DAY)
+        ) g ON g.userId = p.userId
+        WHERE p.status = 0  -- 활성 계정만 포함
+    """
+
+    # 입출금 집계
+    _MONEY_FEATURES_QUERY = """
+        SELECT
+            player AS player_id,
+            SUM(CASE WHEN type = 0 AND createdAt >= DATE_SUB(NOW(), INTERVAL 365 DAY)
+                     THEN amount ELSE 0 END) AS total_deposits_1y,
+            SUM(CASE WHEN type = 1 AND createdAt >= DATE_SUB(NOW(), INTERVAL 365 DAY)
+                     THEN amount ELSE 0 END) AS total_withdrawals_1y,
+            AVG(CASE WHEN type = 0 AND createdAt >= DATE_SUB(NOW(), INTERVAL 365 DAY)
+                     THEN amount END) AS avg_deposit_amount,
+            SUM(type = 0) AS total_deposits_count
+        FROM money_flows
+        GROUP BY player
+    """
+
+    # 이벤트 수령 집계
+    _EVENT_FEATURES_QUERY = """
+        SELECT
+            player AS player_id,
+            COUNT(*) AS events_received
+        FROM promotion_players
+        WHERE appliedAt IS NOT NULL
+        GROUP BY player
+    """
+
+    # 첫 이벤트 이후 입금 집계 (플레이어별 첫 이벤트 일자를 파생 테이블로 한 번만 계산)
+    _POST_EVENT_FEATURES_QUERY = """
+        SELECT
+            mf.player AS player_id,
+            COUNT(*) AS deposits_after_event,
+            SUM(mf.amount) AS deposit_amount_after_event
+        FROM money_flows mf
+        JOIN (
+            SELECT player, MIN(appliedAt) AS first_event_date
+            FROM promotion_players
+            WHERE appliedAt IS NOT NULL
+            GROUP BY player
+        ) fe ON fe.player = mf.player
+        WHERE mf.type = 0 AND mf.createdAt > fe.first_event_date
+        GROUP BY mf.player
+    """
+
+    USER_DATA_COLUMNS = [
+        'userId', 'player_id', 'days_inactive', 'total_deposits_1y', 'total_withdrawals_1y',
+        'avg_deposit_amount', 'game_count', 'last_played_date', 'events_received',
+        'converted_after_event', 'deposit_amount_after_event', 'status', 'total_games_played',
+        'total_days_played', 'total_deposits_count', 'avg_net_bet', 'total_win_loss_1y'
+    ]
+
+    def _read_frame(self, query: str, params: Optional[tuple] = None) -> pd.DataFrame:
+        """
+        풀에서 연결을 하나 받아 쿼리 결과를 DataFrame으로 반환
+        
+        Args:
+            query (str): 실행할 SQL 쿼리
+            params (tuple, optional): 쿼리 파라미터
+            
+        Returns:
+            pd.DataFrame: 쿼리 결과
+        """
+        with self.db.get_connection() as conn:
+            return pd.read_sql(query, conn, params=params)
+
+    def fetch_user_data(self, days_inactive=30, limit: Optional[int] = None,
+                        max_workers: int = 4) -> pd.DataFrame:
         """
         데이터베이스에서 사용자 데이터 가져오기
         
+        플레이어별 상관 서브쿼리 대신 테이블별 그룹 집계 쿼리를 실행하고
+        결과를 pandas에서 병합합니다. 각 집계 쿼리는 연결 풀의 서로 다른
+        연결에서 병렬로 실행됩니다.
+        
         Args:
             days_inactive (int): 비활성으로 간주할 최소 일수. 기본값은 30.
+            limit (int, optional): 반환할 최대 사용자 수. 기본값은 None(전체).
+            max_workers (int, optional): 동시에 실행할 집계 쿼리 수. 1이면 순차 실행.
+                기본값은 4.
             
         Returns:
             pd.DataFrame: 사용자 데이터
         """
         logger.info(f"Fetching inactive user data with days_inactive={days_inactive}")
         
-        query = f"""
-        SELECT 
-            p.userId,  -- Using userId as the identifier instead of id or name
-            p.id as player_id,
-            DATEDIFF(NOW(), (SELECT MAX(gameDate) FROM game_scores 
-                             WHERE userId = p.userId)) AS days_inactive,
-            ROUND(IFNULL(
-                (SELECT SUM(amount) FROM money_flows 
-                 WHERE player = p.id AND type = 0 AND createdAt >= DATE_SUB(NOW(), INTERVAL 365 DAY)), 
-                0
-            )) AS total_deposits_1y,
-            ROUND(IFNULL(
-                (SELECT SUM(amount) FROM money_flows 
-                 WHERE player = p.id AND type = 1 AND createdAt >= DATE_SUB(NOW(), INTERVAL 365 DAY)), 
-                0
-            )) AS total_withdrawals_1y,
-            ROUND(IFNULL(
-                (SELECT AVG(amount) FROM money_flows 
-                 WHERE player = p.id AND type = 0 AND createdAt >= DATE_SUB(NOW(), INTERVAL 365 DAY)), 
-                0
-            )) AS avg_deposit_amount,
-            (SELECT COUNT(*) FROM game_scores 
-             WHERE userId = p.userId AND gameDate >= DATE_SUB(NOW(), INTERVAL 365 DAY)) AS game_count,
-            (SELECT MAX(gameDate) FROM game_scores 
-             WHERE userId = p.userId) AS last_played_date,
-            (SELECT COUNT(*) FROM promotion_players pp 
-             WHERE pp.player = p.id AND pp.appliedAt IS NOT NULL) AS events_received,
-            CASE 
-                WHEN (SELECT COUNT(*) FROM money_flows 
-                      WHERE player = p.id AND type = 0 AND 
-                      createdAt > (SELECT MIN(pp2.appliedAt) FROM promotion_players pp2 
-                                   WHERE pp2.player = p.id AND pp2.appliedAt IS NOT NULL)) > 0 
-                THEN 1 ELSE 0 
-            END AS converted_after_event,
-            ROUND(IFNULL(
-                (SELECT SUM(amount) FROM money_flows 
-                 WHERE player = p.id AND type = 0 AND 
-                 createdAt > (SELECT MIN(pp2.appliedAt) FROM promotion_players pp2 
-                             WHERE pp2.player = p.id AND pp2.appliedAt IS NOT NULL)), 
-                0
-            )) AS deposit_amount_after_event,
-            p.status,
-            IFNULL(
-                (SELECT COUNT(*) FROM game_scores 
-                 WHERE userId = p.userId), 
-                0
-            ) AS total_games_played,
-            IFNULL(
-                (SELECT COUNT(DISTINCT DATE(gameDate)) FROM game_scores 
-                 WHERE userId = p.userId), 
-                0
-            ) AS total_days_played,
-            IFNULL(
-                (SELECT COUNT(*) FROM money_flows 
-                 WHERE player = p.id AND type = 0), 
-                0
-            ) AS total_deposits_count,
-            IFNULL(
-                (SELECT AVG(ROUND(netBet)) FROM game_scores 
-                 WHERE userId = p.userId AND gameDate >= DATE_SUB(NOW(), INTERVAL 365 DAY)), 
-                0
-            ) AS avg_net_bet,
-            IFNULL(
-                (SELECT SUM(ROUND(winLoss)) FROM game_scores 
-                 WHERE userId = p.userId AND gameDate >= DATE_SUB(NOW(), INTERVAL 365 DAY)), 
-                0
-            ) AS total_win_loss_1y
-        FROM 
-            players p
-        WHERE 
-            p.status = 0  -- 활성 계정만 포함
-            AND (
-                -- days_inactive 일 이상 활동이 없지만 과거에는 플레이한 적 있음
-                SELECT MAX(gameDate) FROM game_scores WHERE userId = p.userId
-            ) < DATE_SUB(NOW(), INTERVAL {days_inactive} DAY)
-            AND (
-                -- 적어도 한 번은 플레이함
-                SELECT COUNT(*) FROM game_scores WHERE userId = p.userId
-            ) > 0
-        LIMIT 5000  -- 데이터베이스 부하 방지를 위한 제한
-        """
+        if self.feature_store is not None:
+            return self._fetch_user_data_from_store(days_inactive, limit)
+        
+        queries = {
+            'game': (self._GAME_FEATURES_QUERY, (int(days_inactive),)),
+            'money': (self._MONEY_FEATURES_QUERY, None),
+            'event': (self._EVENT_FEATURES_QUERY, None),
+            'post_event': (self._POST_EVENT_FEATURES_QUERY, None),
+        }
         
         try:
-            with self.db.get_connection() as conn:
-                user_df = pd.read_sql(query, conn)
-                
-                if user_df.empty:
-                    logger.warning(f"No inactive users found with days_inactive={days_inactive}")
-                    return pd.DataFrame()
-                
-                logger.info(f"Fetched {len(user_df)} inactive users")
-                return user_df
+            start_time = time.time()
+            if max_workers > 1:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as executor:
+                    futures = {
+                        name: executor.submit(self._read_frame, query, params)
+                        for name, (query, params) in queries.items()
+                    }
+                    frames = {name: future.result() for name, future in futures.items()}
+            else:
+                frames = {name: self._read_frame(query, params) for name, (query, params) in queries.items()}
+            
+            user_df = frames['game']
+            if user_df.empty:
+                logger.warning(f"No inactive users found with days_inactive={days_inactive}")
+                return pd.DataFrame()
+            
+            for name in ('money', 'event', 'post_event'):
+                user_df = user_df.merge(frames[name], on='player_id', how='left')
+            
+            count_columns = [
+                'game_count', 'total_games_played', 'total_days_played',
+                'total_deposits_count', 'events_received', 'deposits_after_event'
+            ]
+            amount_columns = [
+                'total_deposits_1y', 'total_withdrawals_1y', 'avg_deposit_amount',
+                'deposit_amount_after_event', 'avg_net_bet', 'total_win_loss_1y'
+            ]
+            user_df[count_columns] = user_df[count_columns].fillna(0).astype(int)
+            user_df[amount_columns] = user_df[amount_columns].astype(float).fillna(0)
+            # SQL ROUND와 같이 .5는 0에서 먼 쪽으로 반올림 (pandas round는 짝수 쪽)
+            for column in ('total_deposits_1y', 'total_withdrawals_1y',
+                           'avg_deposit_amount', 'deposit_amount_after_event'):
+                values = user_df[column]
+                user_df[column] = np.sign(values) * np.floor(values.abs() + 0.5)
+            user_df['converted_after_event'] = (user_df['deposits_after_event'] > 0).astype(int)
+            
+            user_df = user_df[self.USER_DATA_COLUMNS]
+            if limit is not None:
+                user_df = user_df.head(limit)
+            
+            logger.info(f"Fetched {len(user_df)} inactive users in {time.time() - start_time:.2f}s")
+            return user_df.reset_index(drop=True)
                 
         except Exception as e:
             logger.error(f"Error fetching user data: {str(e)}")
             return pd.DataFrame()
     
+    def _fetch_user_data_from_store(self, days_inactive: int, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        특성 저장소를 증분 갱신한 뒤 비활성 사용자 데이터 조회
+        
+        Args:
+            days_inactive (int): 비활성으로 간주할 최소 일수
+            limit (int, optional): 반환할 최대 사용자 수. 기본값은 None(전체).
+            
+        Returns:
+            pd.DataFrame: 사용자 데이터
+        """
+        try:
+            self.feature_store.refresh()
+            user_df = self.feature_store.get_features(days_inactive=days_inactive)
+        except Exception as e:
+            logger.error(f"Error fetching user data from feature store: {str(e)}")
+            return pd.DataFrame()
+        
+        if user_df.empty:
+            logger.warning(f"No inactive users found with days_inactive={days_inactive}")
+            return pd.DataFrame()
+        
+        user_df = user_df[self.USER_DATA_COLUMNS]
+        if limit is not None:
+            user_df = user_df.head(limit)
+        
+        logger.info(f"Fetched {len(user_df)} inactive users from feature store")
+        return user_df.reset_index(drop=True)
+    
     def calculate_historical_spending_score(self, user_data: pd.DataFrame) -> pd.DataFrame:
         """
         사용자의 과거 지출 패턴에 기반한 점수 계산
@@ -387,10 +487,7 @@ class UserValueScoring:
         
         # 추가: 플레이 규칙성 점수 (일수 대비 게임 수의 비율)
         if 'total_games_played' in df.columns and 'total_days_played' in df.columns:
-            df['play_regularity_score'] = df.apply(
-                lambda x: x['total_games_played'] / max(x['total_days_played'], 1),
-                axis=1
-            )
+            df['play_regularity_score'] = ratio(df['total_games_played'], df['total_days_played'])
             # 정규화
             max_regularity = max(df['play_regularity_score'].max(), 1)
             df['play_regularity_score'] = df['play_regularity_score'] / max_regularity
@@ -445,13 +542,10 @@ class UserValueScoring:
         
         # 입금 규모 점수 (로그 스케일 적용)
         max_deposit = max(df['deposit_amount_after_event'].max(), 1)
-        df['deposit_size_score'] = np.log1p(df['deposit_amount_after_event']) / np.log1p(max_deposit)
+        df['deposit_size_score'] = log_normalize(df['deposit_amount_after_event'], max_deposit)
         
         # 이벤트 전환 효율성 점수 (이벤트 대비 전환율)
-        df['conversion_efficiency_score'] = df.apply(
-            lambda x: x['converted_after_event'] / max(x['events_received'], 1),
-            axis=1
-        )
+        df['conversion_efficiency_score'] = ratio(df['converted_after_event'], df['events_received'])
         
         # 최종 참여 이력 점수 계산
         df['engagement_history_score'] = (
@@ -541,19 +635,18 @@ class UserValueScoring:
         # 일일 가치 예상 수치 추가
         # 사용자의 총 가치를 일일 ARPU로 환산한 대략적인 지표
         if 'total_deposits_1y' in df.columns and 'total_days_played' in df.columns:
-            df['estimated_daily_value'] = df.apply(
-                lambda x: (x['total_deposits_1y'] / max(365, x['total_days_played'])) * x['user_value_score'],
-                axis=1
+            df['estimated_daily_value'] = (
+                ratio(df['total_deposits_1y'], df['total_days_played'], min_denominator=365) * df['user_value_score']
             )
         else:
             df['estimated_daily_value'] = df['user_value_score'] * 100  # 기본값 
         
         # 예상 LTV(Lifetime Value) 추가
         # 사용자의 가치 점수와 과거 지출 정보를 기반으로 한 간단한 추정
-        df['estimated_ltv'] = df.apply(
-            lambda x: x['total_deposits_1y'] * (1 + x['user_value_score'] * 2) if 'total_deposits_1y' in df.columns else x['user_value_score'] * 10000,
-            axis=1
-        )
+        if 'total_deposits_1y' in df.columns:
+            df['estimated_ltv'] = df['total_deposits_1y'] * (1 + df['user_value_score'] * 2)
+        else:
+            df['estimated_ltv'] = df['user_value_score'] * 10000
         
         return df
     
@@ -582,10 +675,7 @@ class UserValueScoring:
         
         # 백분위 추가 (상위 % 표시)
         total_users = len(ranked_users)
-        ranked_users['value_percentile'] = ranked_users.apply(
-            lambda x: 100 - (x['value_rank'] / total_users * 100),
-            axis=1
-        )
+        ranked_users['value_percentile'] = 100 - (ranked_users['value_rank'] / total_users * 100)
         
         # 상위 N명만 반환
         if top_n is not None and top_n > 0:
@@ -5,12 +5,12 @@
 JSON 형식으로 제공하는 API를 구현합니다.
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_cors import CORS
 import sys
 import os
+import json
 from pathlib import Path
-from datetime import datetime, timedelta
 import logging
 
 # 프로젝트 루트 디렉토리 추가
@@ -22,6 +22,8 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from src.database.mariadb_connection import MariaDBConnection
+from src.database.connection_pool import get_pool_metrics
+from src.utils.response_cache import cached_response
 
 # 로깅 설정
 logging.basicConfig(
@@ -33,225 +35,368 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)  # CORS 활성화 (다른 도메인에서의 요청 허용)
 
-# 날짜 계산 함수
-def calculate_date_diff(date_str1, date_str2):
-    """두 날짜 사이의 일수 차이 계산"""
-    if not date_str1 or not date_str2:
-        return 0
-    
-    try:
-        date1 = datetime.strptime(date_str1, '%Y-%m-%d')
-        date2 = datetime.strptime(date_str2, '%Y-%m-%d')
-        return abs((date2 - date1).days)
-    except Exception as e:
-        logger.error(f"날짜 계산 오류: {e}")
-        return 0
+# 상세(플레이어별) 조회 페이지 크기
+DEFAULT_PLAYER_PAGE_SIZE = 500
+MAX_PLAYER_PAGE_SIZE = 5000
+
+# fields= 파라미터로 선택할 수 있는 항목
+RESPONSE_SECTIONS = ('overall_summary', 'events', 'query_params')
+EVENT_FIELDS = (
+    'event_id', 'event_name', 'total_rewards', 'total_players', 'players_played',
+    'players_deposited', 'total_play_days', 'total_net_bet', 'total_deposits',
+    'total_deposit_amount', 'avg_days_to_play', 'avg_days_to_deposit', 'retention_rate',
+    'deposit_conversion_rate', 'roi'
+)
+PLAYER_FIELDS = (
+    'reward_id', 'event_id', 'player_id', 'player_account', 'reward_amount', 'event_date',
+    'has_played_after', 'first_play_after', 'play_days_after', 'net_bet_after',
+    'has_deposit_after', 'first_deposit_after', 'deposit_count_after', 'deposit_amount_after',
+    'days_active_after', 'days_to_first_play', 'days_to_first_deposit'
+)
+
+def _date_str(value):
+    """DATE 값을 'YYYY-MM-DD' 문자열로 변환 (없으면 None)"""
+    return value.isoformat() if value else None
+
+def _parse_fields(value, allowed):
+    """
+    쉼표로 구분한 fields= 파라미터 검증
+
+    Returns:
+        list: 선택한 항목 목록 (지정하지 않으면 None)
+
+    Raises:
+        ValueError: 허용되지 않는 항목이 있는 경우
+    """
+    if not value:
+        return None
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+    return fields
+
+def _reward_effect_query(days_after, event_id=None, player_status='all', before_id=None):
+    """
+    지급 건별 이벤트 효과 쿼리와 파라미터 생성
+
+    원본 로그 대신 플레이어별 일 단위 롤업(player_daily_activity)을 조인하므로
+    지급 건당 읽는 행 수는 해당 플레이어의 활동 일수입니다. 롤업이 일 단위이므로
+    지급일 당일의 활동은 지급 이후로 집계됩니다.
+
+    Args:
+        days_after (int): 지급 후 분석할 일수
+        event_id (str, optional): 특정 이벤트 ID
+        player_status (str, optional): 사용자 상태 필터 (all, active, dormant)
+        before_id (int, optional): 이 지급 ID보다 작은 지급만 포함 (키셋 페이지네이션)
+
+    Returns:
+        tuple: (SQL, 파라미터 튜플)
+    """
+    reward_conditions = ["er.applied_at IS NOT NULL"]  # 실제 지급된 이벤트만 포함
+    params = [days_after]
+
+    if event_id:
+        reward_conditions.append("er.event_id = %s")
+        params.append(event_id)
+    if before_id is not None:
+        reward_conditions.append("er.id < %s")
+        params.append(before_id)
+
+    reward_where = " AND ".join(reward_conditions)
+    query = f"""
+            SELECT 
+                r.id AS reward_id,
+                e.id AS event_id,
+                e.name AS event_name,
+                r.player_id,
+                p.account AS player_account,
+                r.reward_amount,
+                r.applied_at,
+                r.reward_day AS event_date,
+                MAX(CASE WHEN a.day >= r.reward_day AND a.play_count > 0 THEN 1 ELSE 0 END) AS has_played_after,
+                MIN(CASE WHEN a.day >= r.reward_day AND a.play_count > 0 THEN a.day ELSE NULL END) AS first_play_after,
+                SUM(CASE WHEN a.day >= r.reward_day AND a.day <= r.window_end AND a.play_count > 0 THEN 1 ELSE 0 END) AS play_days_after,
+                SUM(CASE WHEN a.day >= r.reward_day AND a.day <= r.window_end THEN a.net_bet ELSE 0 END) AS net_bet_after,
+                MAX(CASE WHEN a.day >= r.reward_day AND a.deposit_count > 0 THEN 1 ELSE 0 END) AS has_deposit_after,
+                MIN(CASE WHEN a.day >= r.reward_day AND a.deposit_count > 0 THEN a.day ELSE NULL END) AS first_deposit_after,
+                SUM(CASE WHEN a.day >= r.reward_day AND a.day <= r.window_end THEN a.deposit_count ELSE 0 END) AS deposit_count_after,
+                SUM(CASE WHEN a.day >= r.reward_day AND a.day <= r.window_end THEN a.deposit_amount ELSE 0 END) AS deposit_amount_after,
+                MAX(CASE WHEN a.play_count > 0 THEN a.day ELSE NULL END) AS last_play_day,
+                DATEDIFF(MAX(CASE WHEN a.play_count > 0 THEN a.day ELSE NULL END), r.reward_day) AS days_active_after,
+                DATEDIFF(MIN(CASE WHEN a.day >= r.reward_day AND a.play_count > 0 THEN a.day ELSE NULL END), r.reward_day) AS days_to_first_play,
+                DATEDIFF(MIN(CASE WHEN a.day >= r.reward_day AND a.deposit_count > 0 THEN a.day ELSE NULL END), r.reward_day) AS days_to_first_deposit
+            FROM (
+                SELECT 
+                    er.id,
+                    er.event_id,
+                    er.player_id,
+                    er.reward_amount,
+                    er.applied_at,
+                    DATE(er.applied_at) AS reward_day,
+                    DATE(er.applied_at) + INTERVAL %s DAY AS window_end
+                FROM 
+                    event_rewards er
+                WHERE 
+                    {reward_where}
+            ) r
+            JOIN 
+                events e ON r.event_id = e.id
+            JOIN 
+                players p ON r.player_id = p.id
+            LEFT JOIN 
+                player_daily_activity a ON a.player_id = r.player_id
+            GROUP BY 
+                r.id
+            """
+
+    # 사용자 상태 필터 추가 (마지막 플레이일 기준)
+    if player_status == 'active':
+        query += " HAVING DATEDIFF(NOW(), last_play_day) <= 30"
+    elif player_status == 'dormant':
+        query += " HAVING DATEDIFF(NOW(), last_play_day) > 30"
+
+    return query, tuple(params)
+
+def _event_summary(row):
+    """이벤트별 집계 행에 평균 및 비율 추가"""
+    total_players = int(row['total_players'])
+    players_played = int(row['players_played'] or 0)
+    players_deposited = int(row['players_deposited'] or 0)
+    total_rewards = float(row['total_rewards'] or 0)
+    total_deposit_amount = float(row['total_deposit_amount'] or 0)
+
+    event_data = {
+        'event_id': row['event_id'],
+        'event_name': row['event_name'],
+        'total_rewards': total_rewards,
+        'total_players': total_players,
+        'players_played': players_played,
+        'players_deposited': players_deposited,
+        'total_play_days': int(row['total_play_days'] or 0),
+        'total_net_bet': float(row['total_net_bet'] or 0),
+        'total_deposits': int(row['total_deposits'] or 0),
+        'total_deposit_amount': total_deposit_amount,
+        'avg_days_to_play': 0,
+        'avg_days_to_deposit': 0,
+        'retention_rate': 0,
+        'deposit_conversion_rate': 0,
+        'roi': 0
+    }
+
+    if players_played > 0:
+        event_data['avg_days_to_play'] = round(float(row['days_to_play_sum'] or 0) / players_played, 1)
+
+    if players_deposited > 0:
+        event_data['avg_days_to_deposit'] = round(float(row['days_to_deposit_sum'] or 0) / players_deposited, 1)
+
+    if total_players > 0:
+        event_data['retention_rate'] = round(players_played / total_players * 100, 1)
+        event_data['deposit_conversion_rate'] = round(players_deposited / total_players * 100, 1)
+
+    if total_rewards > 0:
+        event_data['roi'] = round((total_deposit_amount - total_rewards) / total_rewards * 100, 1)
+
+    return event_data
+
+def _player_row(row):
+    """지급 건별 쿼리 결과를 JSON 직렬화 가능한 플레이어 데이터로 변환"""
+    return {
+        'reward_id': row['reward_id'],
+        'event_id': row['event_id'],
+        'player_id': row['player_id'],
+        'player_account': row['player_account'],
+        'reward_amount': float(row['reward_amount'] or 0),
+        'event_date': _date_str(row['event_date']),
+        'has_played_after': bool(row['has_played_after']),
+        'first_play_after': _date_str(row['first_play_after']),
+        'play_days_after': int(row['play_days_after'] or 0),
+        'net_bet_after': float(row['net_bet_after'] or 0),
+        'has_deposit_after': bool(row['has_deposit_after']),
+        'first_deposit_after': _date_str(row['first_deposit_after']),
+        'deposit_count_after': int(row['deposit_count_after'] or 0),
+        'deposit_amount_after': float(row['deposit_amount_after'] or 0),
+        'days_active_after': int(row['days_active_after'] or 0),
+        'days_to_first_play': int(row['days_to_first_play'] or 0),
+        'days_to_first_deposit': int(row['days_to_first_deposit'] or 0)
+    }
 
 @app.route('/api/event-effect', methods=['GET'])
+@cached_response()
 def get_event_effect():
     """
-    이벤트가 미치는 효과 데이터를 JSON 형식으로 반환
+    이벤트가 미치는 효과의 이벤트별 요약을 JSON 형식으로 반환
+    
+    이벤트별 집계는 SQL GROUP BY로 계산하며, 플레이어별 상세는
+    /api/event-effect/players에서 페이지 단위 또는 NDJSON 스트림으로 제공합니다.
     
     쿼리 파라미터:
     - event_id: 특정 이벤트 ID (선택적)
     - days: 이벤트 후 분석할 일수 (기본값 30)
     - player_status: 사용자 상태 필터 (all, active, dormant)
+    - fields: 반환할 항목 (쉼표 구분, 예: overall_summary 또는 events.event_id,events.roi)
     """
     event_id = request.args.get('event_id')
     days_after = int(request.args.get('days', 30))
     player_status = request.args.get('player_status', 'all')
     
+    try:
+        fields = _parse_fields(
+            request.args.get('fields'),
+            RESPONSE_SECTIONS + tuple(f'events.{field}' for field in EVENT_FIELDS)
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
     try:
         with MariaDBConnection() as db:
-            # 기본 쿼리 - 이벤트를 받은 사용자 및 지급 정보
-            base_query = """
-            SELECT 
-                e.id AS event_id,
-                e.name AS event_name,
-                er.player_id,
-                p.account AS player_account,
-                er.reward_amount,
-                er.applied_at AS event_date,
-                MAX(CASE WHEN g.played_at > er.applied_at THEN 1 ELSE 0 END) AS has_played_after,
-                MIN(CASE WHEN g.played_at > er.applied_at THEN g.played_at ELSE NULL END) AS first_play_after,
-                COUNT(DISTINCT CASE WHEN g.played_at > er.applied_at AND g.played_at <= DATE_ADD(er.applied_at, INTERVAL %s DAY) THEN DATE(g.played_at) ELSE NULL END) AS play_days_after,
-                SUM(CASE WHEN g.played_at > er.applied_at AND g.played_at <= DATE_ADD(er.applied_at, INTERVAL %s DAY) THEN g.net_bet ELSE 0 END) AS net_bet_after,
-                MAX(CASE WHEN d.deposit_date > er.applied_at THEN 1 ELSE 0 END) AS has_deposit_after,
-                MIN(CASE WHEN d.deposit_date > er.applied_at THEN d.deposit_date ELSE NULL END) AS first_deposit_after,
-                COUNT(DISTINCT CASE WHEN d.deposit_date > er.applied_at AND d.deposit_date <= DATE_ADD(er.applied_at, INTERVAL %s DAY) THEN d.deposit_date ELSE NULL END) AS deposit_count_after,
-                SUM(CASE WHEN d.deposit_date > er.applied_at AND d.deposit_date <= DATE_ADD(er.applied_at, INTERVAL %s DAY) THEN d.amount ELSE 0 END) AS deposit_amount_after,
-                DATEDIFF(MAX(g.played_at), er.applied_at) AS days_active_after
-            FROM 
-                event_rewards er
-            JOIN 
-                events e ON er.event_id = e.id
-            JOIN 
-                players p ON er.player_id = p.id
-            LEFT JOIN 
-                game_logs g ON er.player_id = g.player
-            LEFT JOIN 
-                deposits d ON er.player_id = d.player_id
-            """
-            
-            # 이벤트 ID 필터 추가
-            where_conditions = ["er.applied_at IS NOT NULL"]  # 실제 지급된 이벤트만 포함
-            query_params = [days_after, days_after, days_after, days_after]
-            
-            if event_id:
-                where_conditions.append("e.id = %s")
-                query_params.append(event_id)
+            reward_query, query_params = _reward_effect_query(days_after, event_id, player_status)
             
-            # 사용자 상태 필터 추가
-            if player_status == 'active':
-                where_conditions.append("DATEDIFF(NOW(), MAX(g.played_at)) <= 30")
-            elif player_status == 'dormant':
-                where_conditions.append("DATEDIFF(NOW(), MAX(g.played_at)) > 30")
-            
-            # 조건절 조합
-            if where_conditions:
-                base_query += " WHERE " + " AND ".join(where_conditions)
-            
-            # 그룹화 및 정렬
-            base_query += """
+            # 이벤트별 집계 쿼리
+            summary_query = f"""
+            SELECT 
+                x.event_id,
+                x.event_name,
+                SUM(x.reward_amount) AS total_rewards,
+                COUNT(*) AS total_players,
+                SUM(x.has_played_after) AS players_played,
+                SUM(x.has_deposit_after) AS players_deposited,
+                SUM(x.play_days_after) AS total_play_days,
+                SUM(x.net_bet_after) AS total_net_bet,
+                SUM(x.deposit_count_after) AS total_deposits,
+                SUM(x.deposit_amount_after) AS total_deposit_amount,
+                SUM(CASE WHEN x.has_played_after = 1 AND x.days_to_first_play > 0 THEN x.days_to_first_play ELSE 0 END) AS days_to_play_sum,
+                SUM(CASE WHEN x.has_deposit_after = 1 AND x.days_to_first_deposit > 0 THEN x.days_to_first_deposit ELSE 0 END) AS days_to_deposit_sum
+            FROM ({reward_query}) x
             GROUP BY 
-                e.id, er.player_id, er.applied_at
+                x.event_id, x.event_name
             ORDER BY 
-                er.applied_at DESC
+                MAX(x.applied_at) DESC
             """
             
-            # 쿼리 실행
-            results = db.query(base_query, tuple(query_params))
-            
-            # 이벤트별 집계 데이터
-            event_summary = {}
-            all_players = []
-            
-            for result in results:
-                event_id = result['event_id']
-                event_name = result['event_name']
-                
-                # 플레이어 데이터 가공
-                player_data = {
-                    'player_id': result['player_id'],
-                    'player_account': result['player_account'],
-                    'reward_amount': float(result['reward_amount']),
-                    'event_date': result['event_date'].strftime('%Y-%m-%d') if result['event_date'] else None,
-                    'has_played_after': bool(result['has_played_after']),
-                    'first_play_after': result['first_play_after'].strftime('%Y-%m-%d') if result['first_play_after'] else None,
-                    'play_days_after': result['play_days_after'],
-                    'net_bet_after': float(result['net_bet_after']),
-                    'has_deposit_after': bool(result['has_deposit_after']),
-                    'first_deposit_after': result['first_deposit_after'].strftime('%Y-%m-%d') if result['first_deposit_after'] else None,
-                    'deposit_count_after': result['deposit_count_after'],
-                    'deposit_amount_after': float(result['deposit_amount_after']),
-                    'days_active_after': result['days_active_after'] or 0,
-                    'days_to_first_play': calculate_date_diff(
-                        result['event_date'].strftime('%Y-%m-%d') if result['event_date'] else None,
-                        result['first_play_after'].strftime('%Y-%m-%d') if result['first_play_after'] else None
-                    ),
-                    'days_to_first_deposit': calculate_date_diff(
-                        result['event_date'].strftime('%Y-%m-%d') if result['event_date'] else None,
-                        result['first_deposit_after'].strftime('%Y-%m-%d') if result['first_deposit_after'] else None
-                    )
-                }
-                all_players.append(player_data)
-                
-                # 이벤트별 집계에 추가
-                if event_id not in event_summary:
-                    event_summary[event_id] = {
-                        'event_id': event_id,
-                        'event_name': event_name,
-                        'total_rewards': 0,
-                        'total_players': 0,
-                        'players_played': 0,
-                        'players_deposited': 0,
-                        'total_play_days': 0,
-                        'total_net_bet': 0,
-                        'total_deposits': 0,
-                        'total_deposit_amount': 0,
-                        'avg_days_to_play': 0,
-                        'avg_days_to_deposit': 0,
-                        'retention_rate': 0,
-                        'deposit_conversion_rate': 0,
-                        'roi': 0,
-                        'player_data': []
-                    }
-                
-                event_data = event_summary[event_id]
-                event_data['total_rewards'] += float(result['reward_amount'])
-                event_data['total_players'] += 1
-                event_data['players_played'] += 1 if result['has_played_after'] else 0
-                event_data['players_deposited'] += 1 if result['has_deposit_after'] else 0
-                event_data['total_play_days'] += result['play_days_after']
-                event_data['total_net_bet'] += float(result['net_bet_after'])
-                event_data['total_deposits'] += result['deposit_count_after']
-                event_data['total_deposit_amount'] += float(result['deposit_amount_after'])
-                
-                if result['has_played_after'] and player_data['days_to_first_play'] > 0:
-                    event_data['avg_days_to_play'] += player_data['days_to_first_play']
-                
-                if result['has_deposit_after'] and player_data['days_to_first_deposit'] > 0:
-                    event_data['avg_days_to_deposit'] += player_data['days_to_first_deposit']
-                
-                # 개별 플레이어 데이터 추가
-                event_data['player_data'].append(player_data)
-            
-            # 평균 및 비율 계산
-            events_list = []
-            for event_id, event_data in event_summary.items():
-                if event_data['players_played'] > 0:
-                    event_data['avg_days_to_play'] = round(event_data['avg_days_to_play'] / event_data['players_played'], 1)
-                
-                if event_data['players_deposited'] > 0:
-                    event_data['avg_days_to_deposit'] = round(event_data['avg_days_to_deposit'] / event_data['players_deposited'], 1)
-                
-                if event_data['total_players'] > 0:
-                    event_data['retention_rate'] = round(event_data['players_played'] / event_data['total_players'] * 100, 1)
-                    event_data['deposit_conversion_rate'] = round(event_data['players_deposited'] / event_data['total_players'] * 100, 1)
-                
-                if event_data['total_rewards'] > 0:
-                    event_data['roi'] = round((event_data['total_deposit_amount'] - event_data['total_rewards']) / event_data['total_rewards'] * 100, 1)
-                
-                events_list.append(event_data)
-            
-            # 전체 이벤트 분석 요약
-            overall_summary = {
-                'total_event_count': len(event_summary),
-                'total_players_rewarded': sum(e['total_players'] for e in events_list),
-                'total_reward_amount': sum(e['total_rewards'] for e in events_list),
-                'total_players_played': sum(e['players_played'] for e in events_list),
-                'total_players_deposited': sum(e['players_deposited'] for e in events_list),
-                'total_net_bet': sum(e['total_net_bet'] for e in events_list),
-                'total_deposit_amount': sum(e['total_deposit_amount'] for e in events_list),
-                'overall_retention_rate': 0,
-                'overall_deposit_conversion_rate': 0,
-                'overall_roi': 0
-            }
-            
-            if overall_summary['total_players_rewarded'] > 0:
-                overall_summary['overall_retention_rate'] = round(overall_summary['total_players_played'] / overall_summary['total_players_rewarded'] * 100, 1)
-                overall_summary['overall_deposit_conversion_rate'] = round(overall_summary['total_players_deposited'] / overall_summary['total_players_rewarded'] * 100, 1)
-            
-            if overall_summary['total_reward_amount'] > 0:
-                overall_summary['overall_roi'] = round((overall_summary['total_deposit_amount'] - overall_summary['total_reward_amount']) / overall_summary['total_reward_amount'] * 100, 1)
-            
-            response = {
-                'overall_summary': overall_summary,
-                'events': events_list,
-                'query_params': {
-                    'event_id': event_id,
-                    'days_after': days_after,
-                    'player_status': player_status
-                }
+            events_list = [_event_summary(row) for row in db.query(summary_query, query_params)]
+        
+        # 전체 이벤트 분석 요약
+        overall_summary = {
+            'total_event_count': len(events_list),
+            'total_players_rewarded': sum(e['total_players'] for e in events_list),
+            'total_reward_amount': sum(e['total_rewards'] for e in events_list),
+            'total_players_played': sum(e['players_played'] for e in events_list),
+            'total_players_deposited': sum(e['players_deposited'] for e in events_list),
+            'total_net_bet': sum(e['total_net_bet'] for e in events_list),
+            'total_deposit_amount': sum(e['total_deposit_amount'] for e in events_list),
+            'overall_retention_rate': 0,
+            'overall_deposit_conversion_rate': 0,
+            'overall_roi': 0
+        }
+        
+        if overall_summary['total_players_rewarded'] > 0:
+            overall_summary['overall_retention_rate'] = round(overall_summary['total_players_played'] / overall_summary['total_players_rewarded'] * 100, 1)
+            overall_summary['overall_deposit_conversion_rate'] = round(overall_summary['total_players_deposited'] / overall_summary['total_players_rewarded'] * 100, 1)
+        
+        if overall_summary['total_reward_amount'] > 0:
+            overall_summary['overall_roi'] = round((overall_summary['total_deposit_amount'] - overall_summary['total_reward_amount']) / overall_summary['total_reward_amount'] * 100, 1)
+        
+        response = {
+            'overall_summary': overall_summary,
+            'events': events_list,
+            'query_params': {
+                'event_id': event_id,
+                'days_after': days_after,
+                'player_status': player_status
             }
-            
-            return jsonify(response)
+        }
+        
+        # fields= 프로젝션 (섹션 이름 또는 events.<항목>)
+        if fields:
+            event_fields = [field.split('.', 1)[1] for field in fields if field.startswith('events.')]
+            if event_fields:
+                response['events'] = [{k: e[k] for k in event_fields} for e in events_list]
+            sections = set(field.split('.', 1)[0] for field in fields)
+            response = {k: v for k, v in response.items() if k in sections}
+        
+        return jsonify(response)
     
     except Exception as e:
         logger.error(f"이벤트 효과 분석 API 오류: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/event-effect/players', methods=['GET'])
+def get_event_effect_players():
+    """
+    이벤트를 받은 플레이어별 효과 데이터를 지급 ID 내림차순으로 반환
+    
+    쿼리 파라미터:
+    - event_id: 특정 이벤트 ID (선택적)
+    - days: 이벤트 후 분석할 일수 (기본값 30)
+    - player_status: 사용자 상태 필터 (all, active, dormant)
+    - fields: 반환할 플레이어 항목 (쉼표 구분)
+    - limit: 페이지당 항목 수 (기본값 500, 최대 5000)
+    - after: 이전 페이지의 next_after 값 (키셋 페이지네이션)
+    - format: json(기본값, 페이지 단위) 또는 ndjson(전체를 한 줄에 한 행씩 스트리밍)
+    """
+    event_id = request.args.get('event_id')
+    days_after = int(request.args.get('days', 30))
+    player_status = request.args.get('player_status', 'all')
+    output_format = request.args.get('format', 'json')
+    
+    try:
+        fields = _parse_fields(request.args.get('fields'), PLAYER_FIELDS)
+        limit = min(max(int(request.args.get('limit', DEFAULT_PLAYER_PAGE_SIZE)), 1), MAX_PLAYER_PAGE_SIZE)
+        after = int(request.args['after']) if request.args.get('after') else None
+        if output_format not in ('json', 'ndjson'):
+            raise ValueError(f"Unknown format: {output_format}")
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    reward_query, query_params = _reward_effect_query(days_after, event_id, player_status, before_id=after)
+    reward_query += """
+            ORDER BY 
+                r.id DESC
+            """
+    
+    def project(row):
+        player = _player_row(row)
+        return {k: player[k] for k in fields} if fields else player
+    
+    if output_format == 'ndjson':
+        def generate():
+            try:
+                with MariaDBConnection() as db:
+                    for row in db.stream(reward_query, query_params):
+                        yield json.dumps(project(row), ensure_ascii=False) + '\n'
+            except Exception as e:
+                # 헤더를 이미 보낸 뒤이므로 마지막 줄로 오류를 알림
+                logger.error(f"이벤트 효과 상세 스트리밍 오류: {e}")
+                yield json.dumps({'error': str(e)}, ensure_ascii=False) + '\n'
+        
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+    
+    try:
+        with MariaDBConnection() as db:
+            rows = db.query(reward_query + " LIMIT %s", query_params + (limit + 1,))
+        
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        return jsonify({
+            'players': [project(row) for row in rows],
+            'next_after': rows[-1]['reward_id'] if has_more else None,
+            'query_params': {
+                'event_id': event_id,
+                'days_after': days_after,
+                'player_status': player_status,
+                'limit': limit,
+                'after': after
+            }
+        })
+    
+    except Exception as e:
+        logger.error(f"이벤트 효과 상세 API 오류: {e}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/event-list', methods=['GET'])
+@cached_response()
 def get_event_list():
     """
     이벤트 목록을 JSON 형식으로 반환
@@ -299,13 +444,14 @@ def get_event_list():
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/dormant-segment-stats', methods=['GET'])
+@cached_response()
 def get_dormant_segment_stats():
     """
     휴면 사용자 세그먼트별 통계 데이터를 JSON 형식으로 반환
     """
     try:
         with MariaDBConnection() as db:
-            # 휴면 기간별 사용자 통계 쿼리
+            # 휴면 기간별 사용자 통계 쿼리 (플레이어별 일 단위 롤업 기준)
             query = """
             SELECT 
                 CASE 
@@ -326,25 +472,24 @@ def get_dormant_segment_stats():
                 COUNT(CASE WHEN has_event_reward = 1 AND has_deposit_after = 1 THEN 1 END) AS users_deposited_after_event
             FROM (
                 SELECT 
-                    p.id,
-                    DATEDIFF(NOW(), MAX(g.played_at)) AS days_inactive,
-                    COUNT(DISTINCT DATE(g.played_at)) AS play_days,
-                    SUM(g.net_bet) AS total_valid_bet,
-                    COUNT(DISTINCT d.id) AS total_deposits,
-                    SUM(d.amount) AS deposit_amount,
-                    MAX(CASE WHEN er.id IS NOT NULL THEN 1 ELSE 0 END) AS has_event_reward,
-                    MAX(CASE WHEN er.applied_at < g.played_at THEN 1 ELSE 0 END) AS has_played_after,
-                    MAX(CASE WHEN er.applied_at < d.deposit_date THEN 1 ELSE 0 END) AS has_deposit_after
+                    a.player_id,
+                    DATEDIFF(NOW(), MAX(CASE WHEN a.play_count > 0 THEN a.day ELSE NULL END)) AS days_inactive,
+                    SUM(CASE WHEN a.play_count > 0 THEN 1 ELSE 0 END) AS play_days,
+                    SUM(a.net_bet) AS total_valid_bet,
+                    SUM(a.deposit_count) AS total_deposits,
+                    SUM(a.deposit_amount) AS deposit_amount,
+                    MAX(CASE WHEN er.player_id IS NOT NULL THEN 1 ELSE 0 END) AS has_event_reward,
+                    MAX(CASE WHEN a.day >= er.first_reward_day AND a.play_count > 0 THEN 1 ELSE 0 END) AS has_played_after,
+                    MAX(CASE WHEN a.day >= er.first_reward_day AND a.deposit_count > 0 THEN 1 ELSE 0 END) AS has_deposit_after
                 FROM 
-                    players p
-                LEFT JOIN 
-                    game_logs g ON p.id = g.player
-                LEFT JOIN 
-                    deposits d ON p.id = d.player_id
-                LEFT JOIN 
-                    event_rewards er ON p.id = er.player_id
+                    player_daily_activity a
+                LEFT JOIN (
+                    SELECT player_id, DATE(MIN(applied_at)) AS first_reward_day
+                    FROM event_rewards
+                    GROUP BY player_id
+                ) er ON er.player_id = a.player_id
                 GROUP BY 
-                    p.id
+                    a.player_id
                 HAVING 
                     days_inactive > 30
                     AND play_days >= 7
@@ -389,6 +534,13 @@ def get_dormant_segment_stats():
         logger.error(f"휴면 사용자 세그먼트 통계 API 오류: {e}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/db-pool-stats', methods=['GET'])
+def get_db_pool_stats():
+    """
+    공유 데이터베이스 연결 풀 지표를 JSON 형식으로 반환 (모니터링용)
+    """
+    return jsonify({'pools': get_pool_metrics()})
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5060))
     app.run(host='0.0.0.0', port=port, debug=True)
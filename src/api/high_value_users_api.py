@@ -9,6 +9,10 @@ from flask import Flask, jsonify, request
 from flask_cors import CORS
 import sys
 import os
+import json
+import base64
+import bisect
+import threading
 from pathlib import Path
 from datetime import datetime
 
@@ -21,10 +25,28 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from src.database.connection import DatabaseConnection
+from src.database.result_cache import MemoryCache
+from src.database.high_value_snapshot import HighValueSnapshot
+from src.utils.response_cache import cached_response
 
 app = Flask(__name__)
 CORS(app)  # CORS 활성화 (다른 도메인에서의 요청 허용)
 
+# 고가치 사용자 스냅샷 유효 시간(초)
+SNAPSHOT_TTL = float(os.environ.get('HIGH_VALUE_SNAPSHOT_TTL', 60))
+
+# 정렬 기준 매핑
+SORT_COLUMNS = {
+    'validBet': 'total_valid_bet',
+    'playDays': 'play_days',
+    'lastPlay': 'last_play_date',
+    'daysSince': 'last_play_date'  # 경과일수는 마지막 플레이 날짜를 기준으로 정렬
+}
+
+# (상태 필터, 검색어, 정렬 기준, 방향)별로 정렬된 고가치 사용자 목록
+_snapshots = MemoryCache(max_bytes=128 * 1024 * 1024, default_ttl=SNAPSHOT_TTL)
+_snapshot_lock = threading.Lock()
+
 def calculate_days_since(date_str):
     """마지막 플레이 날짜로부터 현재까지의 경과일 계산"""
     if not date_str:
@@ -37,148 +59,164 @@ def calculate_days_since(date_str):
     except Exception:
         return 0
 
+def _sort_value(user, sort_column):
+    """정렬/커서 비교용 숫자 값 (날짜는 서수)"""
+    value = user[sort_column]
+    if sort_column == 'last_play_date':
+        return value.toordinal() if value else 0
+    return value
+
+def _sort_key(sort_column, descending):
+    """(정렬 값, id) 키셋 순서의 정렬 키 함수"""
+    sign = -1 if descending else 1
+    return lambda user: (sign * _sort_value(user, sort_column), sign * user['id'])
+
+def encode_cursor(sort, direction, user, sort_column):
+    """페이지 마지막 사용자의 (정렬 값, id)를 불투명한 커서 문자열로 변환"""
+    payload = {'s': sort, 'd': direction, 'v': _sort_value(user, sort_column), 'id': user['id']}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode().rstrip('=')
+
+def decode_cursor(cursor, sort, direction):
+    """
+    커서 문자열 해석
+
+    Returns:
+        dict: 정렬 값('v')과 id
+
+    Raises:
+        ValueError: 잘못된 커서이거나 다른 정렬 기준으로 만든 커서인 경우
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        value, user_id = payload['v'], int(payload['id'])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if payload.get('s') != sort or payload.get('d') != direction:
+        raise ValueError("Cursor does not match sort/direction")
+    return {'v': value, 'id': user_id}
+
+def load_snapshot(status_filter, search, sort, direction):
+    """
+    조건에 맞는 고가치 사용자 전체를 정렬된 목록으로 조회 (SNAPSHOT_TTL 동안 재사용)
+
+    구체화된 high_value_users 스냅샷 테이블을 한 번만 읽고, 이후 페이지는
+    메모리의 목록에서 잘라 반환하므로 페이지 깊이와 무관하게 DB를 다시 조회하지 않습니다.
+    같은 스냅샷을 동시에 요청하면 하나의 요청만 DB를 조회합니다.
+
+    Returns:
+        list: (정렬 값, id) 순서로 정렬된 사용자 딕셔너리 목록
+    """
+    sort_column = SORT_COLUMNS.get(sort, 'total_valid_bet')
+    key = json.dumps([status_filter, search, sort, direction])
+    users = _snapshots.get(key)
+    if users is not None:
+        return users
+    
+    with _snapshot_lock:
+        users = _snapshots.get(key)
+        if users is not None:
+            return users
+        
+        with DatabaseConnection() as db:
+            rows = HighValueSnapshot(db).read(status=status_filter, search=search)
+        
+        users = [
+            {
+                'id': int(row['player_id']),
+                'username': row.get('username') or 'Unknown',
+                'play_days': int(row.get('play_days') or 0),
+                'total_valid_bet': float(row.get('total_valid_bet') or 0),
+                'last_play_date': row.get('last_play_date')
+            }
+            for row in rows
+        ]
+        users.sort(key=_sort_key(sort_column, direction == 'desc'))
+        _snapshots.set(key, users)
+        return users
+
+def format_user(user, index):
+    """스냅샷 사용자를 응답 형식으로 변환"""
+    last_play = user['last_play_date'].strftime('%Y-%m-%d') if user['last_play_date'] else 'N/A'
+    days_since = calculate_days_since(last_play)
+    
+    return {
+        'index': index,
+        'username': user['username'],
+        'play_days': user['play_days'],
+        'total_valid_bet': user['total_valid_bet'],
+        'last_play': last_play,
+        'days_since': days_since,
+        'status': 'active' if days_since <= 30 else 'dormant'  # 상태 결정 (30일 기준)
+    }
+
 @app.route('/api/high-value-users', methods=['GET'])
+@cached_response(ttl=SNAPSHOT_TTL)
 def get_high_value_users():
     """
     고가치 사용자 목록을 페이지네이션하여 JSON 형식으로 반환
     
+    cursor를 지정하면 이전 페이지의 마지막 (정렬 값, id) 다음부터 반환하는
+    키셋 페이지네이션을, 지정하지 않으면 page 번호 페이지네이션을 사용합니다.
+    두 방식 모두 스냅샷에서 잘라 반환하며 응답의 next_cursor로 다음 페이지를 요청합니다.
+    
     쿼리 파라미터:
     - page: 페이지 번호 (1부터 시작, 기본값 1)
+    - cursor: 이전 응답의 pagination.next_cursor (지정 시 page 무시)
     - limit: 페이지당 항목 수 (기본값 10)
-    - sort: 정렬 기준 (유효배팅, 플레이일수, 마지막플레이, 경과일수)
+    - sort: 정렬 기준 (validBet, playDays, lastPlay, daysSince)
     - direction: 정렬 방향 (asc, desc)
     - filter: 상태 필터 (all, active, dormant)
     - search: 사용자명 검색
     """
-    page = int(request.args.get('page', 1))
-    limit = int(request.args.get('limit', 10))
+    try:
+        page = max(int(request.args.get('page', 1)), 1)
+        limit = max(int(request.args.get('limit', 10)), 1)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     sort = request.args.get('sort', 'validBet')
-    direction = request.args.get('direction', 'desc')
+    if sort not in SORT_COLUMNS:
+        sort = 'validBet'
+    direction = 'asc' if request.args.get('direction', 'desc') == 'asc' else 'desc'
     status_filter = request.args.get('filter', 'all')
+    if status_filter not in ('active', 'dormant'):
+        status_filter = 'all'
     search = request.args.get('search', '')
+    cursor = request.args.get('cursor')
+    sort_column = SORT_COLUMNS[sort]
     
-    offset = (page - 1) * limit
-    
-    # 정렬 기준 매핑
-    sort_column_mapping = {
-        'validBet': 'total_valid_bet',
-        'playDays': 'play_days',
-        'lastPlay': 'last_play_date',
-        'daysSince': 'last_play_date'  # 경과일수는 마지막 플레이 날짜를 기준으로 정렬
-    }
-    
-    # 정렬 방향 매핑
-    direction_mapping = {
-        'asc': 'ASC',
-        'desc': 'DESC'
-    }
-    
-    sort_column = sort_column_mapping.get(sort, 'total_valid_bet')
-    sort_direction = direction_mapping.get(direction, 'DESC')
-    
-    # 상태 필터 조건 구성
-    status_condition = ""
-    if status_filter == 'active':
-        status_condition = "AND DATEDIFF(NOW(), last_play_date) <= 30"
-    elif status_filter == 'dormant':
-        status_condition = "AND DATEDIFF(NOW(), last_play_date) > 30"
-    
-    # 검색 조건 구성
-    search_condition = ""
-    if search:
-        search_condition = f"AND p.userId LIKE '%{search}%'"
+    cursor_key = None
+    if cursor:
+        try:
+            position = decode_cursor(cursor, sort, direction)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        sign = -1 if direction == 'desc' else 1
+        cursor_key = (sign * position['v'], sign * position['id'])
     
     try:
-        with DatabaseConnection() as db:
-            # 총 레코드 수 조회
-            count_query = f"""
-            SELECT COUNT(*) as total_count
-            FROM (
-                SELECT 
-                    p.id,
-                    p.userId,
-                    COUNT(DISTINCT gs.gameDate) AS play_days,
-                    SUM(gs.netBet) AS total_valid_bet,
-                    MAX(gs.gameDate) AS last_play_date
-                FROM players p
-                JOIN game_scores gs ON p.userId = gs.userId
-                WHERE 1=1 {search_condition}
-                GROUP BY p.id
-                HAVING COUNT(DISTINCT gs.gameDate) >= 7
-                AND SUM(gs.netBet) >= 50000
-                {status_condition}
-            ) as high_value_users
-            """
-            
-            count_result = db.query_one(count_query)
-            total_records = count_result['total_count'] if count_result else 0
-            
-            # 사용자 데이터 조회 쿼리
-            user_query = f"""
-            SELECT 
-                p.id,
-                p.userId AS username,
-                COUNT(DISTINCT gs.gameDate) AS play_days,
-                SUM(gs.netBet) AS total_valid_bet,
-                MAX(gs.gameDate) AS last_play_date
-            FROM 
-                players p
-            JOIN 
-                game_scores gs ON p.userId = gs.userId
-            WHERE 1=1 {search_condition}
-            GROUP BY 
-                p.id
-            HAVING 
-                COUNT(DISTINCT gs.gameDate) >= 7
-                AND SUM(gs.netBet) >= 50000
-                {status_condition}
-            ORDER BY 
-                {sort_column} {sort_direction}
-            LIMIT {offset}, {limit}
-            """
-            
-            users = db.query(user_query)
-            
-            # 결과 가공
-            formatted_users = []
-            for i, user in enumerate(users):
-                # 마지막 플레이 날짜 포맷팅
-                if 'last_play_date' in user and user['last_play_date']:
-                    last_play = user['last_play_date'].strftime('%Y-%m-%d')
-                else:
-                    last_play = 'N/A'
-                
-                # 경과일수 계산
-                days_since = calculate_days_since(last_play)
-                
-                # 상태 결정 (30일 기준)
-                status = 'active' if days_since <= 30 else 'dormant'
-                
-                formatted_user = {
-                    'index': offset + i + 1,
-                    'username': user.get('username', 'Unknown'),
-                    'play_days': user.get('play_days', 0),
-                    'total_valid_bet': float(user.get('total_valid_bet', 0)),
-                    'last_play': last_play,
-                    'days_since': days_since,
-                    'status': status
-                }
-                formatted_users.append(formatted_user)
-            
-            # 페이지네이션 정보
-            total_pages = (total_records + limit - 1) // limit  # 올림 나눗셈
-            
-            response = {
-                'users': formatted_users,
-                'pagination': {
-                    'total': total_records,
-                    'page': page,
-                    'limit': limit,
-                    'total_pages': total_pages
-                }
+        users = load_snapshot(status_filter, search, sort, direction)
+        
+        if cursor_key is not None:
+            start = bisect.bisect_right(users, cursor_key, key=_sort_key(sort_column, direction == 'desc'))
+        else:
+            start = (page - 1) * limit
+        page_users = users[start:start + limit]
+        
+        total_records = len(users)
+        has_more = start + limit < total_records
+        
+        response = {
+            'users': [format_user(user, start + i + 1) for i, user in enumerate(page_users)],
+            'pagination': {
+                'total': total_records,
+                'page': start // limit + 1,
+                'limit': limit,
+                'total_pages': (total_records + limit - 1) // limit,  # 올림 나눗셈
+                'next_cursor': encode_cursor(sort, direction, page_users[-1], sort_column) if has_more and page_users else None
             }
-            
-            return jsonify(response)
+        }
+        
+        return jsonify(response)
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
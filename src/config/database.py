@@ -49,9 +49,15 @@ class DatabaseConfig:
             "charset": os.getenv("DB_CHARSET", "utf8mb4"),
             "connection_pool_size": int(os.getenv("DB_POOL_SIZE", "5")),
             "connection_timeout": int(os.getenv("DB_TIMEOUT", "30")),
+            "pool_max_idle_time": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+            "pool_max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "3600")),
+            "pool_health_check_interval": float(os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", "30")),
             "retry_max_attempts": int(os.getenv("DB_RETRY_MAX", "3")),
             "retry_base_delay": float(os.getenv("DB_RETRY_DELAY", "0.1")),
             "retry_max_delay": float(os.getenv("DB_RETRY_MAX_DELAY", "2.0")),
+            "local_infile": os.getenv("DB_LOCAL_INFILE", "false").lower() in ("1", "true", "yes"),
+            "multi_statements": os.getenv("DB_MULTI_STATEMENTS", "false").lower() in ("1", "true", "yes"),
+            "statement_cache_size": int(os.getenv("DB_STATEMENT_CACHE_SIZE", "64")),
         }
         
         return config
@@ -63,7 +69,7 @@ class DatabaseConfig:
         Returns:
             Dict[str, Any]: 연결 파라미터를 담은 딕셔너리
         """
-        return {
+        params = {
             "host": self.config["host"],
             "port": self.config["port"],
             "database": self.config["database"],
@@ -71,6 +77,12 @@ class DatabaseConfig:
             "password": self.config["password"],
             "charset": self.config["charset"],
         }
+        
+        # LOAD DATA LOCAL INFILE 대량 적재 허용 (DB_LOCAL_INFILE=true)
+        if self.config.get("local_infile"):
+            params["local_infile"] = True
+        
+        return params
     
     def get_pool_config(self) -> Dict[str, Any]:
         """
@@ -82,6 +94,9 @@ class DatabaseConfig:
         return {
             "size": self.config["connection_pool_size"],
             "timeout": self.config["connection_timeout"],
+            "max_idle_time": self.config["pool_max_idle_time"],
+            "max_lifetime": self.config["pool_max_lifetime"],
+            "health_check_interval": self.config["pool_health_check_interval"],
         }
     
     def get_retry_config(self) -> Dict[str, Any]:
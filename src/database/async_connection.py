@@ -0,0 +1,433 @@
+"""
+MariaDB 비동기 실행 모듈
+
+이 모듈은 asyncio 코드에서 MariaDB 쿼리를 실행하기 위한 AsyncMariaDBConnection을 제공합니다.
+별도의 비동기 드라이버 대신 기존 공유 연결 풀 위에 풀 크기만큼의 스레드 풀을 두고
+동기 드라이버 호출을 넘기므로, 연결 관리(재시도, 세션 초기화, 지표)는 MariaDBConnection과 같습니다.
+
+- query / query_one / execute / query_named: 쿼리별 제한 시간 지원
+- stream: 서버 측 커서에서 청크 단위로 읽는 비동기 반복자
+- gather: 독립적인 쿼리를 동시에 실행 (동시 실행 수는 연결 풀 크기로 제한)
+- run_sync: 기존 동기 조회 함수를 같은 스레드 풀에서 실행해 gather로 겹쳐 실행
+
+제한 시간이 지나거나 작업이 취소되면 별도 연결에서 KILL QUERY를 보내 서버의 실행을 중단하고,
+중단된 연결은 풀에 반환하지 않고 폐기합니다.
+연결 풀이 없는 연결 객체(MockDBConnection 등)도 받을 수 있으며, 이때는 객체의 동기 메서드를
+제한된 크기의 스레드 풀에서 실행하고 KILL QUERY는 보내지 않습니다.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generator, List, Optional, Tuple, Union
+
+import mariadb
+
+from .mariadb_connection import MariaDBConnection, QueryError
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+QuerySpec = Union[str, Tuple[str], Tuple[str, Optional[Union[Tuple, Dict]]], Awaitable[Any]]
+
+class QueryTimeoutError(QueryError):
+    """제한 시간 초과로 중단된 쿼리"""
+    pass
+
+def _execute(cursor: Any, query: str, params: Optional[Union[Tuple, Dict]]) -> None:
+    """파라미터가 있을 때만 바인딩해 실행"""
+    if params:
+        cursor.execute(query, params)
+    else:
+        cursor.execute(query)
+
+class _RunningQuery:
+    """실행 중인 쿼리의 서버 스레드 ID와 취소 상태 (KILL QUERY 대상 보호용 잠금 포함)"""
+
+    __slots__ = ("lock", "connection_id", "cancelled", "killed")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.connection_id: Optional[int] = None
+        self.cancelled = False
+        self.killed = False
+
+class _ServerCursor:
+    """stream()에서 여러 작업 스레드 호출에 걸쳐 연결과 비버퍼 커서를 유지"""
+
+    def __init__(self, owner: 'AsyncMariaDBConnection', handle: _RunningQuery, query: str,
+                 params: Optional[Union[Tuple, Dict]]):
+        self.owner = owner
+        self.query = query
+        self.params = params
+        self.checkout = owner._checkout(handle)
+        self.conn = None
+        self.cursor = None
+
+    def open(self) -> None:
+        """연결 획득 및 쿼리 실행"""
+        conn = self.checkout.__enter__()
+        try:
+            self.cursor = conn.cursor(dictionary=True, buffered=False)
+            _execute(self.cursor, self.query, self.params)
+        except BaseException:
+            self.checkout.__exit__(*sys.exc_info())
+            raise
+        self.conn = conn
+
+    def fetch(self, size: int) -> List[Dict[str, Any]]:
+        """다음 청크 읽기"""
+        return self.cursor.fetchmany(size)
+
+    def close(self, abandoned: bool) -> None:
+        """커서를 닫고 연결 반환 (결과를 다 읽지 않았으면 연결 폐기)"""
+        if self.conn is None:
+            return
+        if abandoned:
+            # 남은 결과를 모두 읽어야 하는 cursor.close() 대신 연결째 폐기
+            self.owner.db.connection_pool.connection_state(self.conn)["discard"] = True
+        else:
+            self.cursor.close()
+        self.conn = None
+        self.checkout.__exit__(None, None, None)
+
+# 연결 풀이 없는 연결 객체에 사용할 작업 스레드 수
+DEFAULT_UNPOOLED_WORKERS = 4
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+def _shared_executor(pool_name: str, size: int) -> ThreadPoolExecutor:
+    """연결 풀별 공유 스레드 풀 (풀보다 많은 스레드가 연결을 기다리지 않도록 같은 크기)"""
+    with _executors_lock:
+        executor = _executors.get(pool_name)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="mariadb-async")
+            _executors[pool_name] = executor
+        return executor
+
+def _reset_executors_after_fork() -> None:
+    """fork된 자식 프로세스에서 작업 스레드가 없는 부모의 스레드 풀을 쓰지 않도록 초기화"""
+    global _executors_lock
+    _executors_lock = threading.Lock()
+    _executors.clear()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_executors_after_fork)
+
+class AsyncMariaDBConnection:
+    """
+    공유 연결 풀 기반 asyncio 쿼리 실행 클래스
+
+    Flask 라우트나 Dash 콜백 같은 동기 코드에서는 asyncio.run(db.gather(...))으로
+    여러 독립 쿼리를 동시에 실행할 수 있습니다.
+    """
+
+    def __init__(self, db: Optional[MariaDBConnection] = None, default_timeout: Optional[float] = None,
+                 cancel_grace: float = 5.0, max_workers: int = DEFAULT_UNPOOLED_WORKERS):
+        """
+        AsyncMariaDBConnection 초기화
+
+        Args:
+            db (MariaDBConnection, optional): 사용할 동기 연결 객체. 기본값은 None (새로 생성).
+            default_timeout (float, optional): 쿼리별 기본 제한 시간(초). 기본값은 None (제한 없음).
+            cancel_grace (float, optional): KILL QUERY 후 작업 스레드가 연결을 반환하기를
+                기다릴 최대 시간(초). 기본값은 5.
+            max_workers (int, optional): db에 연결 풀이 없을 때의 작업 스레드 수.
+                기본값은 DEFAULT_UNPOOLED_WORKERS.
+        """
+        self.db = db if db is not None else MariaDBConnection()
+        self.default_timeout = default_timeout
+        self.cancel_grace = cancel_grace
+        pool = getattr(self.db, 'connection_pool', None)
+        self.pooled = pool is not None
+        if self.pooled:
+            self._executor = _shared_executor(pool.name, pool.size)
+        else:
+            self._executor = _shared_executor(f"unpooled:{type(self.db).__name__}", max_workers)
+
+    @contextmanager
+    def _checkout(self, handle: _RunningQuery) -> Generator[mariadb.Connection, None, None]:
+        """연결을 획득하고 취소 대상(서버 스레드 ID)으로 등록"""
+        with self.db.get_connection() as conn:
+            state = self.db.connection_pool.connection_state(conn)
+            with handle.lock:
+                if handle.cancelled:
+                    raise QueryError("Query cancelled before execution")
+                handle.connection_id = conn.connection_id
+            try:
+                yield conn
+            finally:
+                with handle.lock:
+                    handle.connection_id = None
+                    if handle.killed:
+                        state["discard"] = True
+
+    def _kill(self, handle: _RunningQuery) -> None:
+        """
+        실행 중인 쿼리 중단 (KILL QUERY)
+
+        풀이 고갈되어도 보낼 수 있도록 별도 연결을 사용합니다. 작업 스레드는 잠금을
+        기다린 뒤에야 연결을 반환하므로 다른 요청에 재사용된 연결을 중단하지 않습니다.
+        """
+        with handle.lock:
+            handle.cancelled = True
+            if handle.connection_id is None:
+                return
+            try:
+                killer = mariadb.connect(**self.db._get_connection_params())
+                try:
+                    cursor = killer.cursor()
+                    cursor.execute(f"KILL QUERY {int(handle.connection_id)}")
+                    cursor.close()
+                finally:
+                    killer.close()
+                handle.killed = True
+                logger.info("Killed query on connection %d", handle.connection_id)
+            except mariadb.Error as e:
+                logger.warning("Failed to kill query on connection %d: %s", handle.connection_id, str(e))
+
+    async def _call(self, handle: _RunningQuery, func: Callable[[], Any], timeout: Optional[float],
+                    description: str) -> Any:
+        """작업 스레드에서 func 실행 (제한 시간 초과/취소 시 서버 쿼리 중단)"""
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, func)
+        timeout = self.default_timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            await self._cancel(handle, future)
+            raise QueryTimeoutError(f"Query timed out after {timeout:.2f} seconds: {description[:100]}") from None
+        except asyncio.CancelledError:
+            await self._cancel(handle, future)
+            raise
+
+    async def _cancel(self, handle: _RunningQuery, future: asyncio.Future) -> None:
+        """KILL QUERY를 보내고 작업 스레드가 연결을 반환할 때까지 대기"""
+        # 작업 스레드 풀이 가득 차 있어도 바로 실행되도록 기본 실행기 사용
+        await asyncio.get_running_loop().run_in_executor(None, self._kill, handle)
+        if not handle.killed:
+            # 중단한 쿼리가 없으면(run_sync, query_named, 연결 획득 전) 기다려도 끝나지 않으므로 바로 반환
+            return
+        try:
+            await asyncio.wait_for(future, self.cancel_grace)
+        except Exception:
+            # 중단된 쿼리의 오류(또는 유예 시간 초과)는 취소 결과로 대체
+            pass
+
+    async def _run(self, operation: Callable[[mariadb.Connection], Any], timeout: Optional[float],
+                   description: str, fallback: Callable[[], Any]) -> Any:
+        """연결 하나로 operation을 실행 (연결 풀이 없으면 db의 동기 메서드를 부르는 fallback 실행)"""
+        if not self.pooled:
+            return await self._call(_RunningQuery(), fallback, timeout, description)
+
+        handle = _RunningQuery()
+
+        def run() -> Any:
+            with self._checkout(handle) as conn:
+                return operation(conn)
+
+        return await self._call(handle, run, timeout, description)
+
+    async def query(self, query: str, params: Optional[Union[Tuple, Dict]] = None,
+                    timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        SQL 쿼리 실행 및 결과 반환 (SELECT)
+
+        Args:
+            query (str): 실행할 SQL 쿼리
+            params (Union[Tuple, Dict], optional): 쿼리 파라미터. 기본값은 None.
+            timeout (float, optional): 제한 시간(초). 기본값은 None (default_timeout 사용).
+
+        Returns:
+            List[Dict[str, Any]]: 쿼리 결과 (딕셔너리 리스트)
+
+        Raises:
+            QueryTimeoutError: 제한 시간 초과 시 발생
+            QueryError: 쿼리 실행 실패 시 발생
+        """
+        def operation(conn: mariadb.Connection) -> List[Dict[str, Any]]:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                start_time = time.time()
+                _execute(cursor, query, params)
+                results = cursor.fetchall()
+                logger.debug("Async query executed in %.4f seconds. Returned %d rows",
+                             time.time() - start_time, len(results))
+                return results
+            finally:
+                cursor.close()
+
+        return await self._run(operation, timeout, query, lambda: self.db.query(query, params))
+
+    async def query_one(self, query: str, params: Optional[Union[Tuple, Dict]] = None,
+                        timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        SQL 쿼리 실행 및 첫 번째 결과 반환 (SELECT)
+
+        Args:
+            query (str): 실행할 SQL 쿼리
+            params (Union[Tuple, Dict], optional): 쿼리 파라미터. 기본값은 None.
+            timeout (float, optional): 제한 시간(초). 기본값은 None (default_timeout 사용).
+
+        Returns:
+            Optional[Dict[str, Any]]: 첫 번째 결과 또는 None
+        """
+        def operation(conn: mariadb.Connection) -> Optional[Dict[str, Any]]:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                _execute(cursor, query, params)
+                return cursor.fetchone()
+            finally:
+                cursor.close()
+
+        return await self._run(operation, timeout, query, lambda: self.db.query_one(query, params))
+
+    async def execute(self, query: str, params: Optional[Union[Tuple, Dict]] = None,
+                      timeout: Optional[float] = None) -> int:
+        """
+        데이터 변경 쿼리 실행 (INSERT, UPDATE, DELETE)
+
+        Args:
+            query (str): 실행할 SQL 쿼리
+            params (Union[Tuple, Dict], optional): 쿼리 파라미터. 기본값은 None.
+            timeout (float, optional): 제한 시간(초). 기본값은 None (default_timeout 사용).
+
+        Returns:
+            int: 영향받은 행 수
+        """
+        def operation(conn: mariadb.Connection) -> int:
+            cursor = conn.cursor()
+            try:
+                _execute(cursor, query, params)
+                conn.commit()
+                return cursor.rowcount
+            except mariadb.Error:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+        return await self._run(operation, timeout, query, lambda: self.db.execute(query, params))
+
+    async def query_named(self, name: str, params: Optional[Union[Tuple, Dict]] = None,
+                          timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        SQL 카탈로그의 이름 있는 쿼리 실행 (MariaDBConnection.query_named와 같은 prepared statement 캐시 사용)
+
+        제한 시간이 지나면 결과를 기다리지 않고 QueryTimeoutError를 발생시키지만,
+        서버 쿼리 중단(KILL QUERY)은 지원하지 않습니다.
+
+        Args:
+            name (str): 쿼리 이름
+            params (Union[Tuple, Dict], optional): 쿼리 파라미터. 기본값은 None.
+            timeout (float, optional): 제한 시간(초). 기본값은 None (default_timeout 사용).
+
+        Returns:
+            List[Dict[str, Any]]: 쿼리 결과
+        """
+        return await self._call(_RunningQuery(), lambda: self.db.query_named(name, params), timeout, name)
+
+    async def run_sync(self, func: Callable[..., Any], *args: Any, timeout: Optional[float] = None,
+                       **kwargs: Any) -> Any:
+        """
+        같은 DB 연결을 쓰는 동기 함수를 작업 스레드에서 실행 (분석기 조회 메서드 등)
+
+        gather()에 넘겨 다른 쿼리와 동시에 실행할 수 있습니다. 제한 시간이 지나면
+        결과를 기다리지 않고 QueryTimeoutError를 발생시키지만, 서버 쿼리 중단(KILL QUERY)은
+        지원하지 않습니다.
+
+        Args:
+            func (Callable): 실행할 함수
+            *args: func에 넘길 위치 인자
+            timeout (float, optional): 제한 시간(초). 기본값은 None (default_timeout 사용).
+            **kwargs: func에 넘길 키워드 인자
+
+        Returns:
+            Any: func의 반환값
+        """
+        name = getattr(func, '__name__', repr(func))
+        return await self._call(_RunningQuery(), lambda: func(*args, **kwargs), timeout, name)
+
+    async def stream(self, query: str, params: Optional[Union[Tuple, Dict]] = None,
+                     chunk_size: int = 1000, timeout: Optional[float] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        비버퍼(서버 측) 커서로 결과를 한 행씩 비동기 반환 (SELECT)
+
+        서버에서 chunk_size 행씩 작업 스레드로 읽어 오며, 반복을 중간에 멈추면
+        읽지 않은 결과가 남은 연결은 폐기합니다. 연결 풀이 없는 db는 전체 결과를
+        한 번에 읽어 반환합니다.
+
+        Args:
+            query (str): 실행할 SQL 쿼리
+            params (Union[Tuple, Dict], optional): 쿼리 파라미터. 기본값은 None.
+            chunk_size (int, optional): 한 번에 읽을 행 수. 기본값은 1000.
+            timeout (float, optional): 실행 및 청크마다의 제한 시간(초). 기본값은 None.
+
+        Yields:
+            Dict[str, Any]: 결과 행
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        if not self.pooled:
+            for row in await self.query(query, params, timeout=timeout):
+                yield row
+            return
+
+        handle = _RunningQuery()
+        server_cursor = _ServerCursor(self, handle, query, params)
+        finished = False
+        try:
+            await self._call(handle, server_cursor.open, timeout, query)
+            while True:
+                rows = await self._call(handle, lambda: server_cursor.fetch(chunk_size), timeout, query)
+                if not rows:
+                    finished = True
+                    break
+                for row in rows:
+                    yield row
+        finally:
+            await asyncio.get_running_loop().run_in_executor(self._executor, server_cursor.close, not finished)
+
+    async def gather(self, *queries: QuerySpec, timeout: Optional[float] = None,
+                     return_exceptions: bool = False) -> List[Any]:
+        """
+        여러 쿼리를 동시에 실행
+
+        Args:
+            *queries (QuerySpec): SQL 문자열, (SQL, 파라미터) 튜플 또는 이 객체의
+                query/query_one/execute/run_sync 코루틴
+            timeout (float, optional): 전체 제한 시간(초). 초과하면 남은 쿼리를 모두 중단합니다.
+                기본값은 None.
+            return_exceptions (bool, optional): 실패한 쿼리의 예외를 결과 목록에 담을지 여부.
+                기본값은 False (첫 실패 시 나머지를 취소하고 예외 발생).
+
+        Returns:
+            List[Any]: 입력 순서대로의 결과
+        """
+        awaitables = []
+        for spec in queries:
+            if isinstance(spec, str):
+                awaitables.append(self.query(spec))
+            elif isinstance(spec, tuple):
+                awaitables.append(self.query(*spec))
+            else:
+                awaitables.append(spec)
+
+        tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+        try:
+            return await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=return_exceptions), timeout)
+        except asyncio.TimeoutError:
+            raise QueryTimeoutError(f"{len(tasks)} concurrent queries timed out after {timeout:.2f} seconds") from None
+        finally:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
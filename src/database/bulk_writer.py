@@ -0,0 +1,220 @@
+"""
+대량 쓰기 보조 모듈
+
+이 모듈은 MariaDB 대량 쓰기(executemany, 다중 행 INSERT, LOAD DATA LOCAL INFILE)에
+필요한 드라이버 독립적인 부분을 제공합니다.
+
+- 입력 정규화: DataFrame, 딕셔너리 리스트, 튜플 리스트를 (열 목록, 행 튜플 리스트)로 변환
+- SQL 생성: 식별자 검증, 다중 행 INSERT, ON DUPLICATE KEY UPDATE 절
+- 청크 분할: max_allowed_packet과 자리표시자 수 제한을 넘지 않도록 행 묶음 생성
+- LOAD DATA 파일: NULL(\\N)과 백슬래시를 MariaDB 규칙에 맞게 인코딩한 CSV 작성
+"""
+
+import io
+import re
+import csv
+import math
+import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+IDENTIFIER_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_$]*$')
+
+# 서버 측 prepared statement의 최대 자리표시자 수
+MAX_PLACEHOLDERS = 65535
+
+# INSERT 문 한 행당 고정 오버헤드 추정치 (괄호, 쉼표 등)
+ROW_OVERHEAD_BYTES = 8
+
+Rows = Union[pd.DataFrame, Sequence[Dict[str, Any]], Sequence[Sequence[Any]]]
+
+def quote_identifier(name: str) -> str:
+    """
+    테이블/열 이름을 백틱으로 감싸기 (db.table 형식 허용)
+
+    Args:
+        name (str): 식별자
+
+    Returns:
+        str: 백틱으로 감싼 식별자
+
+    Raises:
+        ValueError: 허용되지 않는 문자가 포함된 경우
+    """
+    parts = name.split('.')
+    if not parts or not all(IDENTIFIER_PATTERN.match(part) for part in parts):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return '.'.join(f"`{part}`" for part in parts)
+
+def _to_db_value(value: Any) -> Any:
+    """pandas/NumPy 값을 드라이버가 받을 수 있는 파이썬 값으로 변환 (결측치는 None)"""
+    if value is None:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if hasattr(value, 'item') and not isinstance(value, (str, bytes)):
+        # NumPy 스칼라
+        value = value.item()
+        if isinstance(value, float) and math.isnan(value):
+            return None
+    return value
+
+def normalize_rows(rows: Rows, columns: Optional[Sequence[str]] = None) -> Tuple[List[str], List[Tuple]]:
+    """
+    입력 데이터를 열 목록과 행 튜플 리스트로 변환
+
+    Args:
+        rows (Rows): DataFrame, 딕셔너리 리스트 또는 튜플 리스트
+        columns (Sequence[str], optional): 사용할 열 목록. 튜플 리스트에는 필수,
+            DataFrame/딕셔너리에서는 열 선택 및 순서 지정에 사용.
+
+    Returns:
+        Tuple[List[str], List[Tuple]]: 열 목록과 행 튜플 리스트
+
+    Raises:
+        ValueError: 튜플 리스트에 열 목록이 없는 경우
+    """
+    if isinstance(rows, pd.DataFrame):
+        columns = list(columns) if columns is not None else [str(col) for col in rows.columns]
+        frame = rows[columns].astype(object)
+        return columns, [tuple(_to_db_value(v) for v in row) for row in frame.itertuples(index=False, name=None)]
+
+    rows = list(rows)
+    if not rows:
+        return list(columns or []), []
+
+    if isinstance(rows[0], dict):
+        columns = list(columns) if columns is not None else list(rows[0].keys())
+        return columns, [tuple(_to_db_value(row.get(col)) for col in columns) for row in rows]
+
+    if columns is None:
+        raise ValueError("columns is required when rows are sequences")
+    return list(columns), [tuple(_to_db_value(v) for v in row) for row in rows]
+
+def build_insert_sql(table: str, columns: Sequence[str], row_count: int = 1,
+                     update_columns: Optional[Sequence[str]] = None, ignore: bool = False) -> str:
+    """
+    (다중 행) INSERT 문 생성
+
+    Args:
+        table (str): 테이블 이름
+        columns (Sequence[str]): 열 목록
+        row_count (int, optional): VALUES 행 수. 기본값은 1 (executemany용).
+        update_columns (Sequence[str], optional): 키 중복 시 갱신할 열 (upsert)
+        ignore (bool, optional): INSERT IGNORE 사용 여부. 기본값은 False.
+
+    Returns:
+        str: INSERT 문 (%s 자리표시자)
+    """
+    column_sql = ', '.join(quote_identifier(col) for col in columns)
+    row_sql = '(' + ', '.join(['%s'] * len(columns)) + ')'
+    sql = (f"INSERT {'IGNORE ' if ignore else ''}INTO {quote_identifier(table)} ({column_sql}) "
+           f"VALUES {', '.join([row_sql] * row_count)}")
+    if update_columns:
+        sql += ' ' + build_upsert_clause(update_columns)
+    return sql
+
+def build_upsert_clause(update_columns: Sequence[str]) -> str:
+    """
+    ON DUPLICATE KEY UPDATE 절 생성 (새 값으로 덮어쓰기)
+
+    Args:
+        update_columns (Sequence[str]): 갱신할 열
+
+    Returns:
+        str: ON DUPLICATE KEY UPDATE 절
+    """
+    assignments = ', '.join(f"{quote_identifier(col)} = VALUES({quote_identifier(col)})" for col in update_columns)
+    return f"ON DUPLICATE KEY UPDATE {assignments}"
+
+def estimate_value_bytes(value: Any) -> int:
+    """SQL 문에서 값이 차지하는 바이트 수 추정 (따옴표/이스케이프 여유 포함)"""
+    if value is None:
+        return 4
+    if isinstance(value, bytes):
+        return 2 * len(value) + 3
+    if isinstance(value, str):
+        return len(value.encode('utf-8')) + 2 + value.count("'") + value.count('\\')
+    if isinstance(value, (datetime.date, datetime.datetime, datetime.time)):
+        return 28
+    if isinstance(value, (int, float, Decimal, bool)):
+        return len(str(value))
+    return len(str(value)) + 2
+
+def iter_packet_chunks(rows: Sequence[Tuple], max_packet_bytes: int, base_bytes: int = 0,
+                       max_rows: Optional[int] = None) -> Iterator[Tuple[int, int, int]]:
+    """
+    max_allowed_packet을 넘지 않도록 행을 연속 구간으로 분할
+
+    Args:
+        rows (Sequence[Tuple]): 행 튜플 리스트
+        max_packet_bytes (int): 한 문장의 최대 크기 (바이트)
+        base_bytes (int, optional): 행과 무관한 문장 길이 (INSERT ... VALUES, ON DUPLICATE 절)
+        max_rows (int, optional): 한 문장의 최대 행 수
+
+    Yields:
+        Tuple[int, int, int]: (시작 인덱스, 끝 인덱스(미포함), 추정 바이트 수)
+    """
+    start, size = 0, base_bytes
+    for index, row in enumerate(rows):
+        row_bytes = ROW_OVERHEAD_BYTES + sum(estimate_value_bytes(v) for v in row)
+        too_large = size + row_bytes > max_packet_bytes
+        too_many = max_rows is not None and index - start >= max_rows
+        if index > start and (too_large or too_many):
+            yield start, index, size
+            start, size = index, base_bytes
+        size += row_bytes
+    if start < len(rows):
+        yield start, len(rows), size
+
+def _encode_infile_value(value: Any) -> str:
+    """LOAD DATA 파일용 값 인코딩 (ESCAPED BY '\\\\' 기준)"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(sep=' ')
+    if isinstance(value, bytes):
+        value = value.decode('utf-8')
+    return str(value).replace('\\', '\\\\')
+
+def write_infile(rows: Sequence[Tuple], stream: io.TextIOBase) -> None:
+    """
+    LOAD DATA LOCAL INFILE로 읽을 CSV 작성
+
+    필드는 쉼표로 구분하고 필요할 때만 큰따옴표로 감싸며(따옴표는 두 번 써서 이스케이프),
+    NULL은 \\N, 백슬래시는 \\\\로 기록합니다. load_data_sql()의 옵션과 짝을 이룹니다.
+
+    Args:
+        rows (Sequence[Tuple]): 행 튜플 리스트
+        stream (io.TextIOBase): 기록할 텍스트 스트림
+    """
+    writer = csv.writer(stream, lineterminator='\n', quoting=csv.QUOTE_MINIMAL)
+    writer.writerows([_encode_infile_value(v) for v in row] for row in rows)
+
+def load_data_sql(table: str, columns: Sequence[str], duplicate_mode: Optional[str] = None) -> str:
+    """
+    write_infile() 형식의 파일을 읽는 LOAD DATA LOCAL INFILE 문 생성
+
+    Args:
+        table (str): 대상 테이블
+        columns (Sequence[str]): 파일의 열 순서
+        duplicate_mode (str, optional): 키 중복 처리 ('REPLACE' 또는 'IGNORE')
+
+    Returns:
+        str: LOAD DATA 문 (파일 경로는 %s 자리표시자)
+    """
+    if duplicate_mode not in (None, 'REPLACE', 'IGNORE'):
+        raise ValueError(f"Unsupported duplicate mode: {duplicate_mode}")
+    column_sql = ', '.join(quote_identifier(col) for col in columns)
+    return (f"LOAD DATA LOCAL INFILE %s {duplicate_mode + ' ' if duplicate_mode else ''}"
+            f"INTO TABLE {quote_identifier(table)} CHARACTER SET utf8mb4 "
+            f"FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '\\\\' "
+            f"LINES TERMINATED BY '\\n' ({column_sql})")
@@ -8,9 +8,9 @@
 import time
 import random
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 import pymysql
-from pymysql.cursors import DictCursor
+from pymysql.cursors import DictCursor, SSDictCursor
 
 from ..config.database import DatabaseConfig
 
@@ -209,6 +209,81 @@ class DatabaseConnection:
                 logger.error("Failed to execute query: %s", str(e))
                 raise
     
+    def iter_query(self, query: str, params: Optional[Tuple] = None,
+                   chunk_size: int = 1000) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        서버 측 커서(SSDictCursor)로 쿼리 결과를 청크 단위로 순차 반환 (SELECT)
+        
+        비버퍼 결과를 읽는 동안에는 같은 연결로 다른 쿼리를 실행할 수 없으므로
+        스트리밍 전용 연결을 별도로 열고, 종료 시 닫습니다. 제너레이터를 중간에
+        닫으면 남은 결과를 읽지 않고 전용 연결을 바로 닫습니다.
+        
+        Args:
+            query (str): 실행할 SQL 쿼리
+            params (Tuple, optional): 쿼리 파라미터. 기본값은 None.
+            chunk_size (int, optional): 한 번에 읽을 행 수. 기본값은 1000.
+            
+        Yields:
+            List[Dict[str, Any]]: 최대 chunk_size 개의 행 (딕셔너리 리스트)
+            
+        Raises:
+            pymysql.Error: 쿼리 실행 실패 시 발생
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        
+        connection = pymysql.connect(
+            **self.config.get_connection_params(),
+            cursorclass=SSDictCursor,
+            autocommit=True,
+        )
+        cursor = connection.cursor()
+        completed = False
+        try:
+            cursor.execute(query, params)
+            row_count = 0
+            
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                row_count += len(rows)
+                yield rows
+            
+            completed = True
+            logger.debug("Streaming query returned %d rows", row_count)
+        except pymysql.Error as e:
+            logger.error("Failed to execute streaming query: %s", str(e))
+            raise
+        finally:
+            # SSCursor.close()는 남은 행을 모두 읽으므로 완료된 경우에만 호출
+            if completed:
+                cursor.close()
+            connection.close()
+    
+    def stream(self, query: str, params: Optional[Tuple] = None,
+               chunk_size: int = 1000) -> Generator[Dict[str, Any], None, None]:
+        """
+        서버 측 커서(SSDictCursor)로 쿼리 결과를 한 행씩 순차 반환 (SELECT)
+        
+        Args:
+            query (str): 실행할 SQL 쿼리
+            params (Tuple, optional): 쿼리 파라미터. 기본값은 None.
+            chunk_size (int, optional): 서버에서 한 번에 읽을 행 수. 기본값은 1000.
+            
+        Yields:
+            Dict[str, Any]: 결과 행
+            
+        Raises:
+            pymysql.Error: 쿼리 실행 실패 시 발생
+        """
+        chunks = self.iter_query(query, params, chunk_size)
+        try:
+            for chunk in chunks:
+                yield from chunk
+        finally:
+            chunks.close()
+    
     def close(self) -> None:
         """
         데이터베이스 연결 종료
@@ -0,0 +1,488 @@
+"""
+프로세스 공유 연결 풀 모듈
+
+이 모듈은 요청마다 새 연결 풀을 만드는 대신, 동일한 접속 정보에 대해
+프로세스 전체에서 하나의 연결 풀을 공유하기 위한 레지스트리를 제공합니다.
+상태 점검(ping), 유휴 연결 정리, 최대 수명 재활용, fork 안전성(gunicorn
+pre-fork 이후 자식 프로세스에서 재생성), 모니터링용 풀 지표를 지원합니다.
+"""
+
+import os
+import time
+import atexit
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Generator, List, Optional, Tuple
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+class PoolError(Exception):
+    """연결 풀 관련 오류의 기본 클래스"""
+    pass
+
+class PoolExhaustedError(PoolError):
+    """대기 시간 내에 사용 가능한 연결이 없을 때 발생하는 오류"""
+    pass
+
+class _PooledEntry:
+    """풀에 보관된 연결과 수명 정보"""
+
+    __slots__ = ("conn", "created_at", "last_used", "state")
+
+    def __init__(self, conn: Any):
+        now = time.monotonic()
+        self.conn = conn
+        # 연결 수명 동안 유지되는 드라이버별 상태 (prepared statement 캐시 등)
+        self.state: Dict[str, Any] = {}
+        self.created_at = now
+        self.last_used = now
+
+class SharedConnectionPool:
+    """
+    스레드 안전한 공유 연결 풀
+
+    연결 생성 함수(connect)를 받아 최대 size 개의 연결을 관리합니다.
+    드라이버에 의존하지 않으므로 mariadb, pymysql 연결 모두에 사용할 수 있습니다.
+    """
+
+    def __init__(self, name: str, connect: Callable[[], Any], size: int = 5,
+                 acquire_timeout: float = 30.0, max_idle_time: float = 300.0,
+                 max_lifetime: float = 3600.0, health_check_interval: float = 30.0,
+                 reset_session: Optional[Callable[[Any, Dict[str, Any]], None]] = None):
+        """
+        SharedConnectionPool 초기화
+
+        Args:
+            name (str): 풀 이름 (로그 및 지표 표시용)
+            connect (Callable[[], Any]): 새 연결을 생성하는 함수
+            size (int, optional): 최대 연결 수. 기본값은 5.
+            acquire_timeout (float, optional): 연결 획득 최대 대기 시간(초). 기본값은 30.
+            max_idle_time (float, optional): 유휴 연결 유지 시간(초). 기본값은 300.
+                0 이하인 경우 유휴 정리를 하지 않습니다.
+            max_lifetime (float, optional): 연결 최대 수명(초). 기본값은 3600.
+                0 이하인 경우 수명 재활용을 하지 않습니다.
+            health_check_interval (float, optional): 반환된 연결을 다시 ping하기 전
+                최소 유휴 시간(초). 기본값은 30.
+            reset_session (Callable[[Any, Dict[str, Any]], None], optional): 연결 반환 시
+                세션 상태를 초기화하는 함수. 연결과 connection_state() 딕셔너리를 받습니다.
+                기본값은 None.
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.name = name
+        self.size = size
+        self.acquire_timeout = acquire_timeout
+        self.max_idle_time = max_idle_time
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self._connect = connect
+        self._reset_session = reset_session
+        self._init_state()
+
+    def _init_state(self) -> None:
+        """풀 내부 상태 초기화 (생성 시 및 fork 이후 호출)"""
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._idle: Deque[_PooledEntry] = deque()
+        self._in_use: Dict[int, _PooledEntry] = {}
+        self._total = 0
+        self._closed = False
+        self._stats = {
+            "checkouts": 0,
+            "checkins": 0,
+            "created": 0,
+            "discarded": 0,
+            "health_check_failures": 0,
+            "idle_evictions": 0,
+            "lifetime_recycles": 0,
+            "exhaustion_count": 0,
+            "waits": 0,
+            "total_wait_time": 0.0,
+            "max_wait_time": 0.0,
+        }
+
+    def _check_fork(self) -> None:
+        """
+        fork 이후 자식 프로세스인지 확인하고 상태를 재생성
+
+        부모 프로세스의 소켓을 자식이 닫으면 부모 연결까지 끊어지므로,
+        기존 연결은 닫지 않고 참조만 버립니다.
+        """
+        if self._pid != os.getpid():
+            logger.info("Fork detected, re-creating connection pool %s in pid %d",
+                        self.name, os.getpid())
+            self._init_state()
+
+    def _is_expired(self, entry: _PooledEntry, now: float) -> Optional[str]:
+        """
+        연결이 수명 또는 유휴 시간을 초과했는지 확인
+
+        Returns:
+            Optional[str]: 초과 사유 ('lifetime', 'idle') 또는 None
+        """
+        if self.max_lifetime > 0 and now - entry.created_at >= self.max_lifetime:
+            return "lifetime"
+        if self.max_idle_time > 0 and now - entry.last_used >= self.max_idle_time:
+            return "idle"
+        return None
+
+    def _collect_expired_locked(self, now: float) -> List[_PooledEntry]:
+        """
+        만료된 유휴 연결을 풀에서 분리 (잠금을 보유한 상태에서 호출)
+
+        Returns:
+            List[_PooledEntry]: 닫아야 할 연결 목록
+        """
+        expired = []
+        kept = deque()
+        for entry in self._idle:
+            reason = self._is_expired(entry, now)
+            if reason is None:
+                kept.append(entry)
+                continue
+            expired.append(entry)
+            self._total -= 1
+            if reason == "lifetime":
+                self._stats["lifetime_recycles"] += 1
+            else:
+                self._stats["idle_evictions"] += 1
+        self._idle = kept
+        if expired:
+            self._available.notify(len(expired))
+        return expired
+
+    def _close_quietly(self, conn: Any) -> None:
+        """연결을 닫고 오류는 로그로만 남김"""
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug("Error while closing pooled connection: %s", str(e))
+
+    def _is_healthy(self, entry: _PooledEntry, now: float) -> bool:
+        """
+        연결 상태 점검
+
+        최근 health_check_interval 이내에 사용된 연결은 점검을 생략합니다.
+        점검에 성공한 연결은 곧바로 대여되면서 last_used가 갱신되므로 별도의 점검 시각은 두지 않습니다.
+        """
+        if now - entry.last_used < self.health_check_interval:
+            return True
+        try:
+            entry.conn.ping()
+            return True
+        except Exception as e:
+            logger.warning("Health check failed on pool %s: %s", self.name, str(e))
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        풀에서 연결 획득
+
+        Args:
+            timeout (float, optional): 최대 대기 시간(초). 기본값은 None.
+                None인 경우 acquire_timeout을 사용합니다.
+
+        Returns:
+            Any: 데이터베이스 연결
+
+        Raises:
+            PoolError: 닫힌 풀에서 획득을 시도한 경우
+            PoolExhaustedError: 대기 시간 내에 연결을 얻지 못한 경우
+        """
+        self._check_fork()
+        timeout = self.acquire_timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        waited = False
+
+        while True:
+            entry = None
+            create = False
+            with self._available:
+                if self._closed:
+                    raise PoolError(f"Connection pool {self.name} is closed")
+
+                to_close = self._collect_expired_locked(time.monotonic())
+
+                while not self._idle and self._total >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["exhaustion_count"] += 1
+                        self._record_wait(time.monotonic() - start, waited)
+                        raise PoolExhaustedError(
+                            f"Connection pool {self.name} exhausted "
+                            f"({self.size} connections in use, waited {timeout:.2f}s)")
+                    waited = True
+                    self._available.wait(remaining)
+                    if self._closed:
+                        raise PoolError(f"Connection pool {self.name} is closed")
+
+                if self._idle:
+                    # 최근에 반환된 연결부터 재사용 (LIFO)
+                    entry = self._idle.pop()
+                else:
+                    self._total += 1
+                    create = True
+
+            for expired in to_close:
+                self._close_quietly(expired.conn)
+
+            if create:
+                try:
+                    entry = _PooledEntry(self._connect())
+                except Exception:
+                    with self._available:
+                        self._total -= 1
+                        self._available.notify()
+                    raise
+                with self._lock:
+                    self._stats["created"] += 1
+            elif not self._is_healthy(entry, time.monotonic()):
+                self._discard(entry, health_failure=True)
+                continue
+
+            now = time.monotonic()
+            with self._lock:
+                entry.last_used = now
+                self._in_use[id(entry.conn)] = entry
+                self._stats["checkouts"] += 1
+                self._record_wait(now - start, waited)
+            return entry.conn
+
+    def _record_wait(self, elapsed: float, waited: bool) -> None:
+        """연결 대기 시간 지표 기록 (잠금을 보유한 상태에서 호출)"""
+        if not waited:
+            return
+        self._stats["waits"] += 1
+        self._stats["total_wait_time"] += elapsed
+        self._stats["max_wait_time"] = max(self._stats["max_wait_time"], elapsed)
+
+    def _discard(self, entry: _PooledEntry, health_failure: bool = False) -> None:
+        """연결을 풀에서 제거하고 닫기"""
+        with self._available:
+            self._total -= 1
+            self._stats["discarded"] += 1
+            if health_failure:
+                self._stats["health_check_failures"] += 1
+            self._available.notify()
+        self._close_quietly(entry.conn)
+
+    def release(self, conn: Any, discard: bool = False) -> None:
+        """
+        연결을 풀에 반환
+
+        Args:
+            conn (Any): 반환할 연결
+            discard (bool, optional): 연결을 재사용하지 않고 폐기할지 여부. 기본값은 False.
+        """
+        if self._pid != os.getpid():
+            # fork 이전에 획득한 연결은 이 프로세스의 풀 소속이 아님
+            return
+
+        with self._lock:
+            entry = self._in_use.pop(id(conn), None)
+        if entry is None:
+            logger.warning("Connection released to pool %s was not checked out from it", self.name)
+            return
+
+        if not discard and self._reset_session is not None:
+            try:
+                self._reset_session(conn, entry.state)
+            except Exception as e:
+                logger.warning("Failed to reset session on pool %s: %s", self.name, str(e))
+                discard = True
+
+        now = time.monotonic()
+        if discard or self._closed or (self.max_lifetime > 0 and now - entry.created_at >= self.max_lifetime):
+            if not discard and not self._closed:
+                with self._lock:
+                    self._stats["lifetime_recycles"] += 1
+            self._discard(entry)
+            return
+
+        with self._available:
+            entry.last_used = now
+            self._idle.append(entry)
+            self._stats["checkins"] += 1
+            self._available.notify()
+
+    def connection_state(self, conn: Any) -> Dict[str, Any]:
+        """
+        획득한 연결의 상태 딕셔너리 반환
+
+        연결이 풀에 있는 동안 유지되며 연결이 폐기되면 함께 사라집니다.
+
+        Args:
+            conn (Any): acquire()로 획득한 연결
+
+        Returns:
+            Dict[str, Any]: 연결별 상태
+
+        Raises:
+            PoolError: 이 풀에서 획득한 연결이 아닌 경우
+        """
+        with self._lock:
+            entry = self._in_use.get(id(conn))
+        if entry is None or entry.conn is not conn:
+            raise PoolError(f"Connection is not checked out from pool {self.name}")
+        return entry.state
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Generator[Any, None, None]:
+        """
+        연결 획득/반환 컨텍스트 매니저
+
+        Args:
+            timeout (float, optional): 최대 대기 시간(초). 기본값은 None.
+
+        Yields:
+            Any: 데이터베이스 연결
+        """
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def evict_idle(self) -> int:
+        """
+        만료된 유휴 연결 정리
+
+        Returns:
+            int: 정리된 연결 수
+        """
+        self._check_fork()
+        with self._lock:
+            expired = self._collect_expired_locked(time.monotonic())
+        for entry in expired:
+            self._close_quietly(entry.conn)
+        return len(expired)
+
+    def close(self) -> None:
+        """
+        풀 종료
+
+        유휴 연결은 즉시 닫고, 사용 중인 연결은 반환 시점에 닫습니다.
+        """
+        if self._pid != os.getpid():
+            return
+        with self._available:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._total -= len(idle)
+            self._available.notify_all()
+        for entry in idle:
+            self._close_quietly(entry.conn)
+        logger.info("Connection pool %s closed", self.name)
+
+    @property
+    def closed(self) -> bool:
+        """풀 종료 여부"""
+        return self._closed
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        풀 지표 반환
+
+        Returns:
+            Dict[str, Any]: 체크아웃 수, 대기 시간, 고갈 횟수 등의 지표
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({
+                "name": self.name,
+                "pid": self._pid,
+                "size": self.size,
+                "open_connections": self._total,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "closed": self._closed,
+            })
+        stats["avg_wait_time"] = stats["total_wait_time"] / stats["waits"] if stats["waits"] else 0.0
+        return stats
+
+
+# 프로세스 전역 풀 레지스트리
+_registry: Dict[Tuple, SharedConnectionPool] = {}
+_registry_lock = threading.Lock()
+
+def make_pool_key(conn_params: Dict[str, Any]) -> Tuple:
+    """
+    접속 파라미터로 풀 레지스트리 키 생성
+
+    Args:
+        conn_params (Dict[str, Any]): 연결 파라미터
+
+    Returns:
+        Tuple: 해시 가능한 레지스트리 키
+    """
+    return tuple(sorted((key, str(value)) for key, value in conn_params.items()))
+
+def get_shared_pool(key: Tuple, name: str, connect: Callable[[], Any],
+                    **pool_options) -> SharedConnectionPool:
+    """
+    레지스트리에서 공유 풀을 조회하거나 새로 생성
+
+    Args:
+        key (Tuple): 레지스트리 키 (make_pool_key 결과)
+        name (str): 풀 이름
+        connect (Callable[[], Any]): 새 연결을 생성하는 함수
+        **pool_options: SharedConnectionPool 옵션
+
+    Returns:
+        SharedConnectionPool: 공유 연결 풀
+    """
+    with _registry_lock:
+        pool = _registry.get(key)
+        if pool is None or pool.closed:
+            pool = SharedConnectionPool(name, connect, **pool_options)
+            _registry[key] = pool
+            logger.info("Created shared connection pool %s with size %d", name, pool.size)
+        return pool
+
+def get_pool_metrics() -> List[Dict[str, Any]]:
+    """
+    등록된 모든 풀의 지표 반환
+
+    Returns:
+        List[Dict[str, Any]]: 풀별 지표 목록
+    """
+    with _registry_lock:
+        pools = list(_registry.values())
+    return [pool.metrics() for pool in pools]
+
+def evict_idle_connections() -> int:
+    """
+    등록된 모든 풀에서 만료된 유휴 연결 정리
+
+    Returns:
+        int: 정리된 연결 수
+    """
+    with _registry_lock:
+        pools = list(_registry.values())
+    return sum(pool.evict_idle() for pool in pools)
+
+def close_all_pools() -> None:
+    """등록된 모든 풀 종료 (프로세스 종료 시 자동 호출)"""
+    with _registry_lock:
+        pools = list(_registry.values())
+        _registry.clear()
+    for pool in pools:
+        pool.close()
+
+def _reset_registry_after_fork() -> None:
+    """fork된 자식 프로세스에서 부모의 풀을 상속하지 않도록 레지스트리 초기화"""
+    global _registry_lock
+    _registry_lock = threading.Lock()
+    _registry.clear()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_registry_after_fork)
+
+atexit.register(close_all_pools)
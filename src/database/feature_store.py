@@ -0,0 +1,444 @@
+"""
+플레이어 특성 저장소 모듈
+
+이 모듈은 타겟팅 파이프라인, 가치 점수화, 예측 모델이 공통으로 사용하는
+플레이어별 집계(입출금 합계, 게임 수, 첫 이벤트 일자, 마지막 플레이 일자 등)를
+로컬 SQLite 파일에 보관합니다.
+
+원본 테이블(money_flows, game_scores, promotion_players)별로 마지막으로 반영한
+위치(high-water mark)를 기록하고, 실행할 때마다 그 이후에 추가된 행만 읽어
+집계에 더합니다. 365일 기간 집계는 일 단위 부분 집계를 저장해 두고 조회 시점에
+기간을 잘라 계산하므로, 오래된 행이 기간에서 빠지는 경우에도 정확합니다.
+
+game_scores는 자동 증가 id 기준이라 시각 지연을 둘 수 없으므로, 새 행이 있으면
+high-water mark 아래 id_rescan_window개 id까지 다시 읽어 해당 (userId, 일자) 집계를
+원본에서 다시 계산해 덮어씁니다. id 순서와 다르게 늦게 커밋된 행과 이 구간 안의 수정이
+반영되며, 그보다 오래된 행의 수정은 reset() 후 다시 적재해야 합니다. 다시 집계할 행은
+롤업과 같은 game_scores (userId, gameDate) 인덱스로 찾으며, 첫 refresh()에서 만듭니다.
+"""
+
+import os
+import time
+import logging
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+import pandas as pd
+
+from src.database.rollups import DEFAULT_ID_RESCAN_WINDOW, ensure_source_indexes
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_PATH = Path(__file__).parent.parent.parent / "data" / "feature_store" / "player_features.sqlite"
+
+# 초기 high-water mark (첫 실행 시 전체 이력 적재)
+_EPOCH = "1970-01-01 00:00:00"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS high_water_marks (
+    source TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS players (
+    player INTEGER PRIMARY KEY,
+    userId TEXT,
+    status INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_players_userId ON players (userId);
+CREATE TABLE IF NOT EXISTS daily_games (
+    userId TEXT NOT NULL,
+    day TEXT NOT NULL,
+    game_count INTEGER NOT NULL,
+    net_bet REAL NOT NULL,
+    win_loss REAL NOT NULL,
+    PRIMARY KEY (userId, day)
+);
+CREATE TABLE IF NOT EXISTS daily_money (
+    player INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    deposit_count INTEGER NOT NULL,
+    deposit_amount REAL NOT NULL,
+    withdrawal_count INTEGER NOT NULL,
+    withdrawal_amount REAL NOT NULL,
+    PRIMARY KEY (player, day)
+);
+CREATE TABLE IF NOT EXISTS promotions (
+    player INTEGER PRIMARY KEY,
+    first_event_date TEXT NOT NULL,
+    events_received INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS post_event_deposits (
+    player INTEGER PRIMARY KEY,
+    deposit_count INTEGER NOT NULL,
+    deposit_amount REAL NOT NULL
+);
+"""
+
+_FEATURES_QUERY = """
+SELECT
+    p.userId,
+    p.player AS player_id,
+    p.status,
+    g.last_played_date,
+    g.game_count,
+    g.total_games_played,
+    g.total_days_played,
+    g.net_bet_1y,
+    g.total_win_loss_1y,
+    IFNULL(m.total_deposits_1y, 0) AS total_deposits_1y,
+    IFNULL(m.total_withdrawals_1y, 0) AS total_withdrawals_1y,
+    IFNULL(m.deposit_count_1y, 0) AS deposit_count_1y,
+    IFNULL(m.total_deposits_count, 0) AS total_deposits_count,
+    IFNULL(pr.events_received, 0) AS events_received,
+    pr.first_event_date,
+    IFNULL(pe.deposit_count, 0) AS deposits_after_event,
+    IFNULL(pe.deposit_amount, 0) AS deposit_amount_after_event
+FROM players p
+JOIN (
+    SELECT
+        userId,
+        MAX(day) AS last_played_date,
+        SUM(CASE WHEN day >= :window_start THEN game_count ELSE 0 END) AS game_count,
+        SUM(game_count) AS total_games_played,
+        COUNT(*) AS total_days_played,
+        SUM(CASE WHEN day >= :window_start THEN net_bet ELSE 0 END) AS net_bet_1y,
+        SUM(CASE WHEN day >= :window_start THEN win_loss ELSE 0 END) AS total_win_loss_1y
+    FROM daily_games
+    GROUP BY userId
+) g ON g.userId = p.userId
+LEFT JOIN (
+    SELECT
+        player,
+        SUM(CASE WHEN day >= :window_start THEN deposit_amount ELSE 0 END) AS total_deposits_1y,
+        SUM(CASE WHEN day >= :window_start THEN withdrawal_amount ELSE 0 END) AS total_withdrawals_1y,
+        SUM(CASE WHEN day >= :window_start THEN deposit_count ELSE 0 END) AS deposit_count_1y,
+        SUM(deposit_count) AS total_deposits_count
+    FROM daily_money
+    GROUP BY player
+) m ON m.player = p.player
+LEFT JOIN promotions pr ON pr.player = p.player
+LEFT JOIN post_event_deposits pe ON pe.player = p.player
+"""
+
+def _format_timestamp(value: Any) -> str:
+    """DB 타임스탬프를 저장소 비교용 문자열('YYYY-MM-DD HH:MM:SS')로 변환"""
+    return pd.Timestamp(value).strftime('%Y-%m-%d %H:%M:%S')
+
+class PlayerFeatureStore:
+    """
+    원본 테이블의 증분만 반영하는 플레이어별 특성 저장소
+
+    refresh()로 새 행을 반영하고 get_features()로 플레이어별 특성을 조회합니다.
+    DB 접근에는 연결 객체의 query()와 iter_query()(서버 측 커서)를 사용합니다.
+    """
+
+    def __init__(self, db_connection, store_path: Optional[Union[str, Path]] = None,
+                 window_days: int = 365, safety_lag_seconds: int = 60, chunk_size: int = 10000,
+                 id_rescan_window: int = DEFAULT_ID_RESCAN_WINDOW):
+        """
+        PlayerFeatureStore 초기화
+
+        Args:
+            db_connection: query(), iter_query(), execute()를 제공하는 데이터베이스 연결 객체
+            store_path (Union[str, Path], optional): SQLite 파일 경로.
+                기본값은 data/feature_store/player_features.sqlite.
+            window_days (int, optional): 기간 집계(_1y 컬럼) 일수. 기본값은 365.
+            safety_lag_seconds (int, optional): 아직 커밋되지 않았을 수 있는 최근 행을
+                다음 실행으로 미루기 위한 지연 시간(초). 기본값은 60.
+            chunk_size (int, optional): 증분 행을 읽을 청크 크기. 기본값은 10000.
+            id_rescan_window (int, optional): game_scores에서 high-water mark 아래로 다시
+                계산하는 id 개수. 기본값은 DEFAULT_ID_RESCAN_WINDOW.
+        """
+        self.db = db_connection
+        self.store_path = Path(store_path) if store_path is not None else DEFAULT_STORE_PATH
+        self.window_days = window_days
+        self.safety_lag_seconds = safety_lag_seconds
+        self.chunk_size = chunk_size
+        self.id_rescan_window = id_rescan_window
+        self._refresh_lock = threading.Lock()
+        self._indexes_ready = False
+
+        os.makedirs(self.store_path.parent, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """저장소 연결 생성"""
+        return sqlite3.connect(str(self.store_path), timeout=30)
+
+    def get_high_water_marks(self) -> Dict[str, str]:
+        """
+        원본 테이블별 high-water mark 조회
+
+        Returns:
+            Dict[str, str]: 테이블 이름과 마지막으로 반영한 위치 (game_scores는 id,
+                나머지는 타임스탬프)
+        """
+        with closing(self._connect()) as conn:
+            return dict(conn.execute("SELECT source, value FROM high_water_marks").fetchall())
+
+    @staticmethod
+    def _get_mark(conn: sqlite3.Connection, source: str, default: str) -> str:
+        row = conn.execute("SELECT value FROM high_water_marks WHERE source = ?", (source,)).fetchone()
+        return row[0] if row else default
+
+    @staticmethod
+    def _set_mark(conn: sqlite3.Connection, source: str, value: Any) -> None:
+        conn.execute(
+            "INSERT INTO high_water_marks (source, value, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(source) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+            (source, str(value), datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        )
+
+    def _iter_frames(self, query: str, params: tuple) -> Iterable[pd.DataFrame]:
+        """서버 측 커서로 증분 행을 DataFrame 청크 단위로 읽기"""
+        for rows in self.db.iter_query(query, params, chunk_size=self.chunk_size):
+            yield pd.DataFrame(rows)
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        마지막 실행 이후 추가된 원본 행을 저장소에 반영
+
+        테이블별 반영과 high-water mark 갱신은 하나의 SQLite 트랜잭션으로
+        처리되므로, 중간에 실패하면 해당 테이블은 다음 실행에서 다시 반영됩니다.
+        플레이어 상태는 증분 기준 컬럼이 없으므로 players 테이블 전체(플레이어당 1행)를
+        다시 읽습니다.
+
+        Returns:
+            Dict[str, int]: 테이블별로 읽은 행 수
+        """
+        with self._refresh_lock:
+            start_time = time.time()
+            if not self._indexes_ready:
+                ensure_source_indexes(self.db)
+                self._indexes_ready = True
+            upper = self.db.query(
+                "SELECT DATE_SUB(NOW(), INTERVAL %s SECOND) AS upper_bound",
+                (self.safety_lag_seconds,)
+            )[0]['upper_bound']
+            upper = _format_timestamp(upper)
+
+            counts = {
+                'players': self._refresh_players(),
+                # 첫 이벤트 일자가 입금 반영보다 먼저 갱신되어야 이벤트 후 입금을 정확히 집계함
+                'promotion_players': self._refresh_promotions(upper),
+                'money_flows': self._refresh_money(upper),
+                'game_scores': self._refresh_games(),
+            }
+
+            logger.info(f"Feature store refreshed in {time.time() - start_time:.2f}s: {counts}")
+            return counts
+
+    def _refresh_players(self) -> int:
+        """플레이어 ID/상태 전체 갱신"""
+        count = 0
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM players")
+            for frame in self._iter_frames("SELECT id AS player, userId, status FROM players", ()):
+                conn.executemany(
+                    "INSERT INTO players (player, userId, status) VALUES (?, ?, ?)",
+                    frame[['player', 'userId', 'status']].itertuples(index=False, name=None)
+                )
+                count += len(frame)
+        return count
+
+    def _refresh_promotions(self, upper: str) -> int:
+        """새로 지급된 이벤트 반영 (appliedAt 기준)"""
+        query = """
+            SELECT player, MIN(appliedAt) AS first_event_date, COUNT(*) AS events_received
+            FROM promotion_players
+            WHERE appliedAt > %s AND appliedAt <= %s
+            GROUP BY player
+        """
+        count = 0
+        with closing(self._connect()) as conn, conn:
+            lower = self._get_mark(conn, 'promotion_players', _EPOCH)
+            for frame in self._iter_frames(query, (lower, upper)):
+                rows = [
+                    (int(row.player), _format_timestamp(row.first_event_date), int(row.events_received))
+                    for row in frame.itertuples(index=False)
+                ]
+                conn.executemany(
+                    "INSERT INTO promotions (player, first_event_date, events_received) VALUES (?, ?, ?) "
+                    "ON CONFLICT(player) DO UPDATE SET "
+                    "first_event_date = MIN(first_event_date, excluded.first_event_date), "
+                    "events_received = events_received + excluded.events_received",
+                    rows
+                )
+                count += int(frame['events_received'].sum())
+            self._set_mark(conn, 'promotion_players', upper)
+        return count
+
+    def _refresh_money(self, upper: str) -> int:
+        """새 입출금 행 반영 (createdAt 기준, 일 단위 집계와 첫 이벤트 이후 입금)"""
+        query = """
+            SELECT player, type, amount, createdAt
+            FROM money_flows
+            WHERE type IN (0, 1) AND createdAt > %s AND createdAt <= %s
+        """
+        count = 0
+        with closing(self._connect()) as conn, conn:
+            lower = self._get_mark(conn, 'money_flows', _EPOCH)
+            for frame in self._iter_frames(query, (lower, upper)):
+                frame['amount'] = frame['amount'].astype(float)
+                frame['createdAt'] = pd.to_datetime(frame['createdAt'])
+                frame['day'] = frame['createdAt'].dt.strftime('%Y-%m-%d')
+                is_deposit = frame['type'] == 0
+                frame['deposit_count'] = is_deposit.astype(int)
+                frame['deposit_amount'] = frame['amount'].where(is_deposit, 0.0)
+                frame['withdrawal_count'] = (~is_deposit).astype(int)
+                frame['withdrawal_amount'] = frame['amount'].where(~is_deposit, 0.0)
+
+                daily = frame.groupby(['player', 'day'], as_index=False)[
+                    ['deposit_count', 'deposit_amount', 'withdrawal_count', 'withdrawal_amount']
+                ].sum()
+                conn.executemany(
+                    "INSERT INTO daily_money VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(player, day) DO UPDATE SET "
+                    "deposit_count = deposit_count + excluded.deposit_count, "
+                    "deposit_amount = deposit_amount + excluded.deposit_amount, "
+                    "withdrawal_count = withdrawal_count + excluded.withdrawal_count, "
+                    "withdrawal_amount = withdrawal_amount + excluded.withdrawal_amount",
+                    [
+                        (int(r.player), r.day, int(r.deposit_count), float(r.deposit_amount),
+                         int(r.withdrawal_count), float(r.withdrawal_amount))
+                        for r in daily.itertuples(index=False)
+                    ]
+                )
+
+                deposits = frame[is_deposit]
+                if not deposits.empty:
+                    players = [int(p) for p in deposits['player'].unique()]
+                    first_events = pd.DataFrame(
+                        conn.execute(
+                            f"SELECT player, first_event_date FROM promotions "
+                            f"WHERE player IN ({','.join('?' * len(players))})",
+                            players
+                        ).fetchall(),
+                        columns=['player', 'first_event_date']
+                    )
+                    after = deposits.merge(first_events, on='player')
+                    after = after[after['createdAt'] > pd.to_datetime(after['first_event_date'])]
+                    if not after.empty:
+                        post = after.groupby('player')['amount'].agg(['count', 'sum']).reset_index()
+                        conn.executemany(
+                            "INSERT INTO post_event_deposits VALUES (?, ?, ?) "
+                            "ON CONFLICT(player) DO UPDATE SET "
+                            "deposit_count = deposit_count + excluded.deposit_count, "
+                            "deposit_amount = deposit_amount + excluded.deposit_amount",
+                            [(int(r.player), int(r.count), float(r.sum)) for r in post.itertuples(index=False)]
+                        )
+                count += len(frame)
+            self._set_mark(conn, 'money_flows', upper)
+        return count
+
+    def _refresh_games(self) -> int:
+        """
+        새 게임 기록 반영 (자동 증가 id 기준, 일 단위 집계)
+
+        high-water mark 아래 id_rescan_window개 id까지 포함한 구간에 행이 있는
+        (userId, 일자)를 원본 전체에서 다시 집계해 덮어쓰므로 구간을 다시 읽어도 중복 합산되지 않습니다.
+        """
+        query = """
+            SELECT s.userId, s.gameDate AS day, COUNT(*) AS game_count,
+                   SUM(ROUND(s.netBet)) AS net_bet, SUM(ROUND(s.winLoss)) AS win_loss
+            FROM game_scores s
+            JOIN (
+                SELECT DISTINCT userId, gameDate FROM game_scores
+                WHERE id > %s AND id <= %s
+            ) changed ON changed.userId = s.userId AND changed.gameDate = s.gameDate
+            GROUP BY s.userId, s.gameDate
+        """
+        count = 0
+        with closing(self._connect()) as conn, conn:
+            lower = int(self._get_mark(conn, 'game_scores', '0'))
+            max_id = self.db.query("SELECT MAX(id) AS max_id FROM game_scores")[0]['max_id']
+            upper = int(max_id) if max_id is not None else lower
+            if upper > lower:
+                rescan_lower = max(lower - self.id_rescan_window, 0)
+                for frame in self._iter_frames(query, (rescan_lower, upper)):
+                    conn.executemany(
+                        "INSERT INTO daily_games VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT(userId, day) DO UPDATE SET "
+                        "game_count = excluded.game_count, "
+                        "net_bet = excluded.net_bet, "
+                        "win_loss = excluded.win_loss",
+                        [
+                            (str(r.userId), pd.Timestamp(r.day).strftime('%Y-%m-%d'), int(r.game_count),
+                             float(r.net_bet or 0), float(r.win_loss or 0))
+                            for r in frame.itertuples(index=False)
+                        ]
+                    )
+                    count += int(frame['game_count'].sum())
+            self._set_mark(conn, 'game_scores', upper)
+        return count
+
+    def get_features(self, days_inactive: Optional[int] = None, require_events: bool = False,
+                     status: Optional[int] = 0, as_of: Optional[datetime] = None) -> pd.DataFrame:
+        """
+        플레이어별 특성 조회
+
+        게임 기록이 있는 플레이어만 반환하며, 컬럼은
+        UserValueScoring.fetch_user_data 결과 컬럼에 first_event_date를 더한 것입니다.
+        기간 집계는 일 단위로 잘라 계산합니다.
+
+        Args:
+            days_inactive (int, optional): 지정하면 마지막 플레이 후 이 일수 이상 지난
+                플레이어만 반환. 기본값은 None.
+            require_events (bool, optional): 이벤트를 받은 플레이어만 반환할지 여부.
+                기본값은 False.
+            status (int, optional): 플레이어 상태 필터. None이면 전체. 기본값은 0.
+            as_of (datetime, optional): 기준 시점. 기본값은 현재 시각.
+
+        Returns:
+            pd.DataFrame: 플레이어별 특성
+        """
+        as_of = as_of or datetime.now()
+        window_start = (as_of - timedelta(days=self.window_days)).strftime('%Y-%m-%d')
+
+        with closing(self._connect()) as conn:
+            df = pd.read_sql_query(_FEATURES_QUERY, conn, params={'window_start': window_start})
+
+        df['last_played_date'] = pd.to_datetime(df['last_played_date'])
+        df['first_event_date'] = pd.to_datetime(df['first_event_date'])
+        df['days_inactive'] = (pd.Timestamp(as_of.date()) - df['last_played_date']).dt.days
+
+        if status is not None:
+            df = df[df['status'] == status]
+        if days_inactive is not None:
+            df = df[df['days_inactive'] >= days_inactive]
+        if require_events:
+            df = df[df['events_received'] > 0]
+
+        game_count = df['game_count'].where(df['game_count'] > 0)
+        deposit_count = df['deposit_count_1y'].where(df['deposit_count_1y'] > 0)
+        df = df.assign(
+            avg_net_bet=(df['net_bet_1y'] / game_count).fillna(0),
+            avg_deposit_amount=(df['total_deposits_1y'] / deposit_count).fillna(0).round(),
+            total_deposits_1y=df['total_deposits_1y'].round(),
+            total_withdrawals_1y=df['total_withdrawals_1y'].round(),
+            deposit_amount_after_event=df['deposit_amount_after_event'].round(),
+            converted_after_event=(df['deposits_after_event'] > 0).astype(int),
+        )
+
+        columns = [
+            'userId', 'player_id', 'days_inactive', 'total_deposits_1y', 'total_withdrawals_1y',
+            'avg_deposit_amount', 'game_count', 'last_played_date', 'events_received',
+            'converted_after_event', 'deposit_amount_after_event', 'status', 'total_games_played',
+            'total_days_played', 'total_deposits_count', 'avg_net_bet', 'total_win_loss_1y',
+            'first_event_date'
+        ]
+        return df[columns].reset_index(drop=True)
+
+    def reset(self) -> None:
+        """저장된 집계와 high-water mark를 모두 삭제 (다음 refresh에서 전체 재적재)"""
+        with closing(self._connect()) as conn, conn:
+            for table in ('high_water_marks', 'players', 'daily_games', 'daily_money',
+                          'promotions', 'post_event_deposits'):
+                conn.execute(f"DELETE FROM {table}")
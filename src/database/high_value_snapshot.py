@@ -0,0 +1,326 @@
+"""
+고가치 사용자 스냅샷 모듈
+
+이 모듈은 "유효 게임일수 7일 이상, 유효 배팅 합계 50,000 이상" 고가치 사용자 집합을
+high_value_users 테이블로 구체화하고, API·스크립트·쿼리 파일이 원본 게임 이력 대신
+이 테이블을 읽도록 공통 조회 API를 제공합니다.
+
+스냅샷은 user_daily_scores 롤업(src.database.rollups)에서 계산합니다. refresh()는
+마지막 실행 이후 추가된 game_scores 행(롤업과 같이 워터마크 아래 id_rescan_window개 id 포함)의
+사용자만 다시 집계해 반영하며, 플레이 일수와 배팅 합계는 줄어들지 않으므로 한 번 고가치
+사용자가 된 사용자는 삭제하지 않습니다. 스냅샷을 만든 game_scores 롤업 버전이 바뀌면
+refresh()가 스냅샷을 비우고 다시 계산하며, 기준값을 바꾸거나 원본 이력을 수정한 경우에는
+rebuild()로 전체를 다시 계산합니다.
+
+start_scheduler()는 APScheduler 백그라운드 작업으로 주기적으로 refresh()를 실행하고,
+필요하면 결과를 Parquet 파일로도 내보냅니다.
+"""
+
+import time
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import pandas as pd
+
+from src.database.rollups import DailyRollups, ROLLUP_SOURCES
+from src.database.sql_script import split_statements
+
+try:
+    from apscheduler.schedulers.background import BackgroundScheduler
+except ImportError:  # pragma: no cover - apscheduler 미설치 환경
+    BackgroundScheduler = None
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 고가치 사용자 기준
+MIN_PLAY_DAYS = 7
+MIN_VALID_BET = 50000
+
+# 마지막 플레이 후 이 일수를 넘으면 휴면 사용자
+DORMANT_DAYS = 30
+
+# rollup_watermarks에 기록하는 스냅샷 워터마크 이름 (반영한 game_scores id)
+WATERMARK_SOURCE = 'high_value_users'
+
+# 스냅샷 집계 정의 버전 (rollup_versions에는 game_scores 롤업 버전과 함께 기록)
+SNAPSHOT_VERSION = '1'
+
+ORDER_COLUMNS = ('total_valid_bet', 'play_days', 'last_play_date', 'userId')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS high_value_users (
+    userId VARCHAR(64) NOT NULL PRIMARY KEY,
+    player_id BIGINT NOT NULL,
+    play_days INT NOT NULL,
+    total_valid_bet DECIMAL(20, 2) NOT NULL,
+    last_play_date DATE NOT NULL,
+    updated_at DATETIME NOT NULL,
+    KEY idx_high_value_users_bet (total_valid_bet),
+    KEY idx_high_value_users_last_play (last_play_date)
+);
+"""
+
+# 새 game_scores 행이 있는 사용자만 롤업에서 다시 집계
+_REFRESH_SQL = """
+    INSERT INTO high_value_users (userId, player_id, play_days, total_valid_bet, last_play_date, updated_at)
+    SELECT t.userId, p.id, t.play_days, t.total_valid_bet, t.last_play_date, NOW()
+    FROM (
+        SELECT s.userId, COUNT(*) AS play_days, SUM(s.net_bet) AS total_valid_bet, MAX(s.day) AS last_play_date
+        FROM user_daily_scores s
+        JOIN (
+            SELECT DISTINCT userId FROM game_scores
+            WHERE id > %s AND id <= %s AND netBet > 0
+        ) changed ON changed.userId = s.userId
+        GROUP BY s.userId
+        HAVING COUNT(*) >= %s AND SUM(s.net_bet) >= %s
+    ) t
+    JOIN players p ON p.userId = t.userId
+    ON DUPLICATE KEY UPDATE
+        player_id = VALUES(player_id),
+        play_days = VALUES(play_days),
+        total_valid_bet = VALUES(total_valid_bet),
+        last_play_date = VALUES(last_play_date),
+        updated_at = VALUES(updated_at)
+"""
+
+class HighValueSnapshot:
+    """
+    high_value_users 스냅샷 테이블 관리 및 조회
+
+    refresh()/rebuild()에는 get_connection()을 제공하는 MariaDBConnection이 필요하고,
+    read()/read_frame()은 query()만 사용하므로 DatabaseConnection으로도 호출할 수 있습니다.
+    """
+
+    def __init__(self, db_connection, rollups: Optional[DailyRollups] = None):
+        """
+        HighValueSnapshot 초기화
+
+        Args:
+            db_connection: 데이터베이스 연결 객체
+            rollups (DailyRollups, optional): game_scores 롤업 관리자.
+                기본값은 같은 연결을 사용하는 DailyRollups.
+        """
+        self.db = db_connection
+        self.rollups = rollups or DailyRollups(db_connection)
+        self._schema_ready = False
+
+    def create_tables(self) -> None:
+        """스냅샷 테이블 생성 (이미 있으면 유지)"""
+        for statement in split_statements(_SCHEMA):
+            self.db.execute(statement)
+        self._schema_ready = True
+
+    def refresh(self) -> int:
+        """
+        game_scores 롤업을 갱신한 뒤 새 행이 있는 사용자를 스냅샷에 반영
+
+        Returns:
+            int: 영향받은 스냅샷 행 수 (새 행이 없으면 0)
+        """
+        if not self._schema_ready:
+            self.create_tables()
+        self.rollups.refresh(['game_scores'])
+        # 스냅샷을 만든 롤업 정의가 바뀌었으면 비우고 처음부터 다시 계산
+        if self.rollups.get_versions().get(WATERMARK_SOURCE) != self.version():
+            logger.warning("High value snapshot was built from an older rollup definition; rebuilding")
+            self._reset()
+        start_time = time.time()
+
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "INSERT IGNORE INTO rollup_watermarks (source, value, updated_at) VALUES (%s, '0', NOW())",
+                    (WATERMARK_SOURCE,)
+                )
+                cursor.execute("SELECT value FROM rollup_watermarks WHERE source = %s FOR UPDATE",
+                               (WATERMARK_SOURCE,))
+                lower = int(cursor.fetchone()[0])
+                # 롤업에 이미 반영된 game_scores id까지만 스냅샷에 반영
+                cursor.execute("SELECT value FROM rollup_watermarks WHERE source = 'game_scores'")
+                row = cursor.fetchone()
+                upper = int(row[0]) if row else 0
+
+                if upper <= lower:
+                    conn.rollback()
+                    logger.debug("High value snapshot is up to date (game_scores id %d)", lower)
+                    return 0
+
+                # 롤업에서 늦게 커밋되거나 수정된 행으로 다시 계산된 사용자도 반영
+                rescan_lower = max(lower - self.rollups.id_rescan_window, 0)
+                cursor.execute(_REFRESH_SQL, (rescan_lower, upper, MIN_PLAY_DAYS, MIN_VALID_BET))
+                affected_rows = cursor.rowcount
+                cursor.execute(
+                    "UPDATE rollup_watermarks SET value = %s, updated_at = NOW() WHERE source = %s",
+                    (str(upper), WATERMARK_SOURCE)
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+        logger.info("High value snapshot refreshed for game_scores id (%d, %d] in %.2fs: %d rows affected",
+                    lower, upper, time.time() - start_time, affected_rows)
+        return affected_rows
+
+    def rebuild(self) -> int:
+        """
+        스냅샷을 비우고 롤업 전체에서 다시 계산
+
+        Returns:
+            int: refresh() 결과
+        """
+        if not self._schema_ready:
+            self.create_tables()
+        self._reset()
+        return self.refresh()
+
+    @staticmethod
+    def version() -> str:
+        """스냅샷 버전 (스냅샷 정의 버전과 game_scores 롤업 버전)"""
+        return f"{SNAPSHOT_VERSION}.{ROLLUP_SOURCES['game_scores'].version}"
+
+    def _reset(self) -> None:
+        """스냅샷과 워터마크를 비우고 현재 버전을 기록"""
+        self.db.execute("TRUNCATE TABLE high_value_users")
+        self.db.execute("DELETE FROM rollup_watermarks WHERE source = %s", (WATERMARK_SOURCE,))
+        self.rollups.set_version(WATERMARK_SOURCE, self.version())
+
+    def read(self, status: Optional[str] = None, search: Optional[str] = None,
+             order_by: str = 'total_valid_bet', descending: bool = True,
+             limit: Optional[int] = None, with_names: bool = False) -> List[Dict[str, Any]]:
+        """
+        고가치 사용자 조회
+
+        Args:
+            status (str, optional): 'active'(마지막 플레이 후 DORMANT_DAYS일 이내) 또는
+                'dormant'. None이나 'all'이면 전체. 기본값은 None.
+            search (str, optional): userId 부분 검색어. 기본값은 None.
+            order_by (str, optional): 정렬 기준 (ORDER_COLUMNS 중 하나). 기본값은 'total_valid_bet'.
+            descending (bool, optional): 내림차순 여부. 기본값은 True.
+            limit (int, optional): 최대 행 수. 기본값은 None (전체).
+            with_names (bool, optional): players.name을 name 컬럼으로 포함할지 여부. 기본값은 False.
+
+        Returns:
+            List[Dict[str, Any]]: player_id, username, play_days, total_valid_bet,
+                last_play_date, days_since_last_play (와 name) 컬럼의 행 목록
+
+        Raises:
+            ValueError: 알 수 없는 상태나 정렬 기준인 경우
+        """
+        if order_by not in ORDER_COLUMNS:
+            raise ValueError(f"Unknown order column: {order_by}")
+
+        conditions = []
+        params: List[Any] = []
+        if status == 'active':
+            conditions.append("h.last_play_date >= CURRENT_DATE - INTERVAL %s DAY")
+            params.append(DORMANT_DAYS)
+        elif status == 'dormant':
+            conditions.append("h.last_play_date < CURRENT_DATE - INTERVAL %s DAY")
+            params.append(DORMANT_DAYS)
+        elif status not in (None, 'all'):
+            raise ValueError(f"Unknown status: {status}")
+        if search:
+            conditions.append("h.userId LIKE %s")
+            params.append(f"%{search}%")
+
+        direction = 'DESC' if descending else 'ASC'
+        query = f"""
+            SELECT
+                h.player_id,
+                h.userId AS username,
+                {'p.name,' if with_names else ''}
+                h.play_days,
+                h.total_valid_bet,
+                h.last_play_date,
+                DATEDIFF(CURRENT_DATE, h.last_play_date) AS days_since_last_play
+            FROM high_value_users h
+            {'JOIN players p ON p.id = h.player_id' if with_names else ''}
+            {'WHERE ' + ' AND '.join(conditions) if conditions else ''}
+            ORDER BY h.{order_by} {direction}, h.userId {direction}
+        """
+        if limit is not None:
+            query += " LIMIT %s"
+            params.append(int(limit))
+
+        return self.db.query(query, tuple(params) if params else None)
+
+    def read_frame(self, **kwargs) -> pd.DataFrame:
+        """
+        고가치 사용자를 DataFrame으로 조회
+
+        Args:
+            **kwargs: read()와 같은 인자
+
+        Returns:
+            pd.DataFrame: 조회 결과 (금액은 float)
+        """
+        df = pd.DataFrame(self.read(**kwargs))
+        if not df.empty:
+            df['total_valid_bet'] = df['total_valid_bet'].astype(float)
+        return df
+
+    def export_parquet(self, path: Union[str, Path], **kwargs) -> Path:
+        """
+        고가치 사용자 스냅샷을 Parquet 파일로 저장
+
+        임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 항상 완성된 파일을 봅니다.
+
+        Args:
+            path (Union[str, Path]): 저장할 파일 경로
+            **kwargs: read()와 같은 인자
+
+        Returns:
+            Path: 저장한 파일 경로
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        self.read_frame(**kwargs).to_parquet(tmp_path, index=False)
+        tmp_path.replace(path)
+        return path
+
+def start_scheduler(connection_factory: Callable[[], Any], interval_minutes: float = 15,
+                    parquet_path: Optional[Union[str, Path]] = None):
+    """
+    스냅샷 갱신 백그라운드 작업 시작
+
+    시작 즉시 한 번 실행한 뒤 interval_minutes마다 실행하며, 이전 실행이 끝나지 않았으면
+    다음 실행을 건너뜁니다.
+
+    Args:
+        connection_factory (Callable[[], Any]): get_connection()을 제공하는 연결 객체 생성 함수
+            (예: MariaDBConnection)
+        interval_minutes (float, optional): 실행 주기(분). 기본값은 15.
+        parquet_path (Union[str, Path], optional): 지정하면 갱신 후 Parquet 파일도 저장.
+
+    Returns:
+        BackgroundScheduler: 실행 중인 스케줄러 (shutdown()으로 종료)
+
+    Raises:
+        RuntimeError: apscheduler가 설치되지 않은 경우
+    """
+    if BackgroundScheduler is None:
+        raise RuntimeError("apscheduler is required for the high value snapshot scheduler")
+
+    def job() -> None:
+        try:
+            snapshot = HighValueSnapshot(connection_factory())
+            snapshot.refresh()
+            if parquet_path:
+                snapshot.export_parquet(parquet_path)
+        except Exception as e:
+            logger.error(f"High value snapshot refresh failed: {e}")
+
+    scheduler = BackgroundScheduler(daemon=True)
+    scheduler.add_job(job, 'interval', minutes=interval_minutes, id='high_value_snapshot',
+                      max_instances=1, coalesce=True, next_run_time=datetime.now())
+    scheduler.start()
+    logger.info("High value snapshot scheduler started (every %s minutes)", interval_minutes)
+    return scheduler
@@ -5,14 +5,27 @@ MariaDB 전용 연결 모듈
 MariaDB 전용 기능, 연결 풀링, 고급 쿼리 기능을 제공합니다.
 """
 
+import os
 import time
 import random
 import logging
+import tempfile
+import functools
+import threading
 from typing import Any, Dict, List, Optional, Tuple, Union, Generator
 import mariadb
+from mariadb.constants import CLIENT
+from collections import OrderedDict
 from contextlib import contextmanager
 
 from ..config.database import DatabaseConfig
+from .connection_pool import PoolError, get_shared_pool, make_pool_key
+from .sql_script import parse_script
+from .sql_catalog import SqlCatalog, get_catalog
+from .bulk_writer import (
+    Rows, MAX_PLACEHOLDERS, build_insert_sql, build_upsert_clause, iter_packet_chunks,
+    load_data_sql, normalize_rows, quote_identifier, write_infile
+)
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -29,25 +42,64 @@ class QueryError(DatabaseError):
     """쿼리 실행 오류"""
     pass
 
+def _close_prepared_statements(state: Dict[str, Any]) -> None:
+    """연결에 캐시된 prepared statement 커서 닫기"""
+    statements = state.get("prepared_statements")
+    if not statements:
+        return
+    for cursor in statements.values():
+        try:
+            cursor.close()
+        except mariadb.Error:
+            pass
+    statements.clear()
+
+def _reset_session(conn: mariadb.Connection, state: Dict[str, Any]) -> None:
+    """
+    풀에 반환되는 연결의 세션 상태 초기화
+    
+    카탈로그 문장만 실행한 세션은 캐시된 prepared statement를 유지하도록 트랜잭션만
+    정리합니다. 그 밖의 세션은 COM_RESET_CONNECTION으로 초기화하며, 이때 서버의
+    prepared statement도 해제되므로 캐시를 비웁니다.
+    """
+    if state.get("prepared_statements") and not state.get("session_dirty", True):
+        conn.rollback()
+        conn.autocommit = True
+        return
+    _close_prepared_statements(state)
+    conn.reset()
+    conn.autocommit = True
+
 class MariaDBConnection:
     """MariaDB 연결 관리 클래스"""
     
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: Optional[str] = None, catalog: Optional[SqlCatalog] = None):
         """
         MariaDBConnection 클래스 초기화
         
         Args:
             config_path (str, optional): 설정 파일 경로. 기본값은 None.
+            catalog (SqlCatalog, optional): query_named()에서 사용할 SQL 카탈로그. 기본값은 None.
+                None인 경우 queries/ 디렉토리의 공유 카탈로그를 사용합니다.
         """
         self.config = DatabaseConfig(config_path)
         self.connection_pool = None
+        self._max_allowed_packet = None
+        self._catalog = catalog
+        self.statement_cache_size = self.config.config.get("statement_cache_size", 64)
+        # 풀의 여러 작업 스레드가 함께 갱신하므로 _count_statement()로 잠금을 잡고 증가
+        self.statement_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._statement_stats_lock = threading.Lock()
         self._create_pool()
         
         logger.info("MariaDB connection initialized with config: %s", str(self.config))
     
     def _create_pool(self) -> None:
         """
-        MariaDB 연결 풀 생성
+        프로세스 공유 MariaDB 연결 풀 획득
+        
+        동일한 접속 정보를 사용하는 모든 MariaDBConnection 인스턴스는
+        레지스트리에 등록된 하나의 풀을 재사용합니다.
         
         Raises:
             ConnectionError: 연결 풀 생성 실패 시 발생
@@ -56,15 +108,18 @@ class MariaDBConnection:
             pool_config = self.config.get_pool_config()
             conn_params = self._get_connection_params()
             
-            self.connection_pool = mariadb.ConnectionPool(
-                pool_name="mariadb_pool",
-                pool_size=pool_config["size"],
-                pool_reset_connection=True,
-                **conn_params
+            self.connection_pool = get_shared_pool(
+                make_pool_key(conn_params),
+                name="mariadb_pool:{user}@{host}:{port}/{database}".format(**conn_params),
+                connect=functools.partial(mariadb.connect, **conn_params),
+                size=pool_config["size"],
+                acquire_timeout=pool_config["timeout"],
+                max_idle_time=pool_config["max_idle_time"],
+                max_lifetime=pool_config["max_lifetime"],
+                health_check_interval=pool_config["health_check_interval"],
+                reset_session=_reset_session,
             )
-            
-            logger.info("Created MariaDB connection pool with size %d", pool_config["size"])
-        except mariadb.Error as e:
+        except (ValueError, PoolError) as e:
             error_msg = f"Failed to create connection pool: {str(e)}"
             logger.error(error_msg)
             raise ConnectionError(error_msg) from e
@@ -82,13 +137,28 @@ class MariaDBConnection:
         if "charset" in conn_params:
             conn_params["charset"] = conn_params.pop("charset")
         
+        # 여러 문장을 한 번에 전송하는 스크립트 실행 허용 (DB_MULTI_STATEMENTS=true)
+        if self.config.config.get("multi_statements"):
+            conn_params["client_flag"] = conn_params.get("client_flag", 0) | CLIENT.MULTI_STATEMENTS
+        
         return conn_params
     
+    @property
+    def catalog(self) -> SqlCatalog:
+        """query_named()/execute_named()에서 사용하는 SQL 카탈로그"""
+        if self._catalog is None:
+            self._catalog = get_catalog()
+        return self._catalog
+    
     @contextmanager
-    def get_connection(self) -> Generator[mariadb.Connection, None, None]:
+    def get_connection(self, reuse_session: bool = False) -> Generator[mariadb.Connection, None, None]:
         """
         연결 풀에서 연결 획득 (컨텍스트 매니저)
         
+        Args:
+            reuse_session (bool, optional): 반환 시 세션 초기화를 생략할지 여부. 기본값은 False.
+                카탈로그 문장만 실행해 prepared statement 캐시를 유지하려는 경우에만 사용합니다.
+        
         Yields:
             mariadb.Connection: 데이터베이스 연결
             
@@ -103,9 +173,9 @@ class MariaDBConnection:
         
         for attempt in range(max_attempts):
             try:
-                conn = self.connection_pool.get_connection()
+                conn = self.connection_pool.acquire()
                 break
-            except mariadb.PoolError as e:
+            except (PoolError, mariadb.Error) as e:
                 if attempt >= max_attempts - 1:
                     error_msg = f"Failed to get connection from pool after {max_attempts} attempts: {str(e)}"
                     logger.error(error_msg)
@@ -121,15 +191,29 @@ class MariaDBConnection:
             logger.error(error_msg)
             raise ConnectionError(error_msg)
         
+        state = self.connection_pool.connection_state(conn)
+        state["session_dirty"] = not reuse_session
+        
+        discard = False
         try:
             yield conn
+        except GeneratorExit:
+            # 스트리밍 도중 중단되어 읽지 않은 결과가 남은 연결은 풀에 반환하지 않음
+            discard = True
+            raise
+        except mariadb.InterfaceError as e:
+            # 끊어진 연결은 풀에 반환하지 않음
+            discard = True
+            error_msg = f"Database error occurred: {str(e)}"
+            logger.error(error_msg)
+            raise QueryError(error_msg) from e
         except mariadb.Error as e:
             error_msg = f"Database error occurred: {str(e)}"
             logger.error(error_msg)
             raise QueryError(error_msg) from e
         finally:
-            if conn:
-                conn.close()
+            # 사용 중 상태에 discard가 표시된 연결(예: KILL QUERY 대상)도 재사용하지 않음
+            self.connection_pool.release(conn, discard=discard or state.pop("discard", False))
     
     def execute(self, query: str, params: Optional[Union[Tuple, Dict]] = None) -> int:
         """
@@ -211,6 +295,114 @@ class MariaDBConnection:
                 if 'cursor' in locals():
                     cursor.close()
     
+    def _count_statement(self, field: str) -> None:
+        """prepared statement 캐시 통계 증가 (스레드 안전)"""
+        with self._statement_stats_lock:
+            self.statement_cache_stats[field] += 1
+    
+    def _prepared_cursor(self, conn: mariadb.Connection, sql: str) -> Tuple[Any, bool]:
+        """
+        연결별 prepared statement 커서 조회 또는 생성 (LRU)
+        
+        Returns:
+            Tuple[Any, bool]: 커서와 캐시 보관 여부 (False이면 사용 후 닫아야 함)
+        """
+        if self.statement_cache_size <= 0:
+            return conn.cursor(prepared=True, dictionary=True), False
+        
+        state = self.connection_pool.connection_state(conn)
+        statements = state.setdefault("prepared_statements", OrderedDict())
+        cursor = statements.get(sql)
+        if cursor is not None:
+            statements.move_to_end(sql)
+            self._count_statement("hits")
+            return cursor, True
+        
+        self._count_statement("misses")
+        cursor = conn.cursor(prepared=True, dictionary=True)
+        statements[sql] = cursor
+        while len(statements) > self.statement_cache_size:
+            _, evicted = statements.popitem(last=False)
+            self._count_statement("evictions")
+            try:
+                evicted.close()
+            except mariadb.Error:
+                pass
+        return cursor, True
+    
+    def _execute_named(self, name: str, params: Optional[Union[Dict[str, Any], Tuple]], fetch: bool) -> Any:
+        """카탈로그 문장을 연결별로 재사용되는 prepared statement로 실행"""
+        statement = self.catalog.get(name)
+        sql, values = statement.bind(params)
+        
+        with self.get_connection(reuse_session=self.statement_cache_size > 0) as conn:
+            cursor, cached = self._prepared_cursor(conn, sql)
+            try:
+                start_time = time.time()
+                cursor.execute(sql, values)
+                
+                if fetch:
+                    result = cursor.fetchall()
+                    row_count = len(result)
+                else:
+                    result = row_count = cursor.rowcount
+                    conn.commit()
+                
+                logger.debug("Named query %s executed in %.4f seconds (%d rows)",
+                             name, time.time() - start_time, row_count)
+                return result
+            except mariadb.Error as e:
+                if not fetch:
+                    conn.rollback()
+                if cached:
+                    # 실패한 문장은 다시 준비하도록 캐시에서 제거
+                    self.connection_pool.connection_state(conn)["prepared_statements"].pop(sql, None)
+                    cached = False
+                error_msg = f"Failed to execute named query {name} ({statement.source}.sql:{statement.line}): {str(e)}"
+                logger.error(error_msg)
+                raise QueryError(error_msg) from e
+            finally:
+                if not cached:
+                    cursor.close()
+    
+    def query_named(self, name: str, params: Optional[Union[Dict[str, Any], Tuple]] = None) -> List[Dict[str, Any]]:
+        """
+        SQL 카탈로그의 이름 있는 쿼리 실행 및 결과 반환 (SELECT)
+        
+        문장은 서버 측 prepared statement로 실행되며, 풀의 연결마다 최근
+        DB_STATEMENT_CACHE_SIZE개가 유지되어 같은 연결에서 다시 준비하지 않습니다.
+        
+        Args:
+            name (str): 쿼리 이름 ('-- name:' 섹션 또는 queries/ 기준 파일 경로)
+            params (Union[Dict[str, Any], Tuple], optional): ':이름' 자리표시자는 딕셔너리,
+                '?' 자리표시자는 튜플. 기본값은 None.
+            
+        Returns:
+            List[Dict[str, Any]]: 쿼리 결과 (딕셔너리 리스트)
+            
+        Raises:
+            KeyError: 카탈로그에 없는 이름
+            CatalogError: 파라미터가 누락되었거나 사용되지 않는 파라미터가 있는 경우
+            QueryError: 쿼리 실행 실패 시 발생
+        """
+        return self._execute_named(name, params, fetch=True)
+    
+    def execute_named(self, name: str, params: Optional[Union[Dict[str, Any], Tuple]] = None) -> int:
+        """
+        SQL 카탈로그의 이름 있는 데이터 변경 문장 실행 (INSERT, UPDATE, DELETE)
+        
+        Args:
+            name (str): 쿼리 이름
+            params (Union[Dict[str, Any], Tuple], optional): 쿼리 파라미터. 기본값은 None.
+            
+        Returns:
+            int: 영향받은 행 수
+            
+        Raises:
+            QueryError: 쿼리 실행 실패 시 발생
+        """
+        return self._execute_named(name, params, fetch=False)
+    
     def query_one(self, query: str, params: Optional[Union[Tuple, Dict]] = None) -> Optional[Dict[str, Any]]:
         """
         SQL 쿼리 실행 및 단일 결과 반환
@@ -252,10 +444,92 @@ class MariaDBConnection:
                 if 'cursor' in locals():
                     cursor.close()
     
+    def iter_query(self, query: str, params: Optional[Union[Tuple, Dict]] = None,
+                   chunk_size: int = 1000) -> Generator[List[Dict[str, Any]], None, None]:
+        """
+        비버퍼(서버 측) 커서로 쿼리 결과를 청크 단위로 순차 반환 (SELECT)
+        
+        결과 전체를 메모리에 올리지 않고, 호출자가 다음 청크를 요청할 때만
+        서버에서 chunk_size 행씩 읽습니다. 제너레이터를 중간에 닫으면
+        읽지 않은 결과가 남은 연결은 풀에 반환하지 않고 폐기합니다.
+        
+        Args:
+            query (str): 실행할 SQL 쿼리
+            params (Union[Tuple, Dict], optional): 쿼리 파라미터. 기본값은 None.
+            chunk_size (int, optional): 한 번에 읽을 행 수. 기본값은 1000.
+            
+        Yields:
+            List[Dict[str, Any]]: 최대 chunk_size 개의 행 (딕셔너리 리스트)
+            
+        Raises:
+            QueryError: 쿼리 실행 실패 시 발생
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor(dictionary=True, buffered=False)
+            abandoned = False
+            try:
+                start_time = time.time()
+                row_count = 0
+                
+                if params:
+                    cursor.execute(query, params)
+                else:
+                    cursor.execute(query)
+                
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    row_count += len(rows)
+                    yield rows
+                
+                logger.debug("Streaming query finished in %.4f seconds. Returned %d rows",
+                            time.time() - start_time, row_count)
+            except GeneratorExit:
+                # 남은 결과를 모두 읽어야 하는 cursor.close() 대신 연결째 폐기
+                abandoned = True
+                raise
+            except mariadb.Error as e:
+                error_msg = f"Failed to execute streaming query: {str(e)}"
+                logger.error(error_msg)
+                raise QueryError(error_msg) from e
+            finally:
+                if not abandoned:
+                    cursor.close()
+    
+    def stream(self, query: str, params: Optional[Union[Tuple, Dict]] = None,
+               chunk_size: int = 1000) -> Generator[Dict[str, Any], None, None]:
+        """
+        비버퍼(서버 측) 커서로 쿼리 결과를 한 행씩 순차 반환 (SELECT)
+        
+        Args:
+            query (str): 실행할 SQL 쿼리
+            params (Union[Tuple, Dict], optional): 쿼리 파라미터. 기본값은 None.
+            chunk_size (int, optional): 서버에서 한 번에 읽을 행 수. 기본값은 1000.
+            
+        Yields:
+            Dict[str, Any]: 결과 행
+            
+        Raises:
+            QueryError: 쿼리 실행 실패 시 발생
+        """
+        chunks = self.iter_query(query, params, chunk_size)
+        try:
+            for chunk in chunks:
+                yield from chunk
+        finally:
+            chunks.close()
+    
     def execute_batch(self, query: str, params_list: List[Union[Tuple, Dict]]) -> int:
         """
         배치 쿼리 실행 (INSERT, UPDATE, DELETE)
         
+        cursor.executemany를 사용하므로 MariaDB 서버에서는 커넥터의 배치 프로토콜로
+        모든 파라미터를 한 번의 왕복으로 전송합니다.
+        
         Args:
             query (str): 실행할 SQL 쿼리
             params_list (List[Union[Tuple, Dict]]): 쿼리 파라미터 리스트
@@ -266,16 +540,17 @@ class MariaDBConnection:
         Raises:
             QueryError: 쿼리 실행 실패 시 발생
         """
+        if not params_list:
+            return 0
+        
         with self.get_connection() as conn:
             try:
                 cursor = conn.cursor()
                 start_time = time.time()
-                affected_rows = 0
                 
                 conn.autocommit = False
-                for params in params_list:
-                    cursor.execute(query, params)
-                    affected_rows += cursor.rowcount
+                cursor.executemany(query, params_list)
+                affected_rows = cursor.rowcount
                 
                 conn.commit()
                 execution_time = time.time() - start_time
@@ -294,16 +569,229 @@ class MariaDBConnection:
                     cursor.close()
                 conn.autocommit = True
     
-    def execute_script(self, script: str) -> None:
+    def get_max_allowed_packet(self) -> int:
+        """
+        서버의 max_allowed_packet 값 조회 (인스턴스에 캐시)
+        
+        Returns:
+            int: 최대 패킷 크기 (바이트)
+        """
+        if self._max_allowed_packet is None:
+            row = self.query_one("SELECT @@max_allowed_packet AS max_allowed_packet")
+            self._max_allowed_packet = int(row['max_allowed_packet']) if row else 16 * 1024 * 1024
+        return self._max_allowed_packet
+    
+    def bulk_insert(self, table: str, rows: Rows, columns: Optional[List[str]] = None,
+                    update_columns: Optional[List[str]] = None, method: str = 'executemany',
+                    chunk_size: int = 10000, ignore: bool = False) -> Dict[str, Any]:
+        """
+        대량 INSERT (선택적으로 ON DUPLICATE KEY UPDATE)
+        
+        method별 동작:
+            - 'executemany': 단일 행 INSERT를 chunk_size 행씩 커넥터 배치 프로토콜로 전송
+            - 'multi_row': INSERT ... VALUES (...),(...) 문을 max_allowed_packet과
+              자리표시자 수 제한 안에서 최대한 크게 만들어 전송
+            - 'load_data': load_data()의 LOAD DATA LOCAL INFILE 경로 사용
+        
+        모든 청크는 하나의 트랜잭션으로 실행되며, 실패하면 전체를 롤백합니다.
+        
+        Args:
+            table (str): 대상 테이블
+            rows (Rows): DataFrame, 딕셔너리 리스트 또는 튜플 리스트
+            columns (List[str], optional): 열 목록. 튜플 리스트에는 필수.
+            update_columns (List[str], optional): 키 중복 시 새 값으로 갱신할 열 (upsert)
+            method (str, optional): 전송 방식. 기본값은 'executemany'.
+            chunk_size (int, optional): executemany 한 번에 보낼 행 수. 기본값은 10000.
+            ignore (bool, optional): INSERT IGNORE 사용 여부. 기본값은 False.
+            
+        Returns:
+            Dict[str, Any]: method, rows, affected_rows, seconds,
+                chunks(청크별 rows, bytes(추정), seconds)
+            
+        Raises:
+            ValueError: 지원하지 않는 method인 경우
+            QueryError: 쿼리 실행 실패 시 발생
+        """
+        if method == 'load_data':
+            return self.load_data(table, rows, columns=columns, update_columns=update_columns,
+                                  duplicate_mode='IGNORE' if ignore else None)
+        if method not in ('executemany', 'multi_row'):
+            raise ValueError(f"Unsupported bulk insert method: {method}")
+        
+        columns, values = normalize_rows(rows, columns)
+        result = {'method': method, 'rows': len(values), 'affected_rows': 0, 'seconds': 0.0, 'chunks': []}
+        if not values:
+            return result
+        
+        if method == 'multi_row':
+            base_bytes = len(build_insert_sql(table, columns, 0, update_columns, ignore)) + 64
+            max_packet = int(self.get_max_allowed_packet() * 0.9)
+            chunks = list(iter_packet_chunks(values, max_packet, base_bytes,
+                                             max_rows=MAX_PLACEHOLDERS // len(columns)))
+        else:
+            chunks = [(start, min(start + chunk_size, len(values)), None)
+                      for start in range(0, len(values), chunk_size)]
+        
+        with self.get_connection() as conn:
+            try:
+                cursor = conn.cursor()
+                start_time = time.time()
+                conn.autocommit = False
+                
+                for start, end, estimated_bytes in chunks:
+                    chunk_start = time.time()
+                    if method == 'multi_row':
+                        sql = build_insert_sql(table, columns, end - start, update_columns, ignore)
+                        cursor.execute(sql, [value for row in values[start:end] for value in row])
+                    else:
+                        sql = build_insert_sql(table, columns, 1, update_columns, ignore)
+                        cursor.executemany(sql, values[start:end])
+                    result['affected_rows'] += max(cursor.rowcount, 0)
+                    
+                    chunk_time = time.time() - chunk_start
+                    result['chunks'].append({'rows': end - start, 'bytes': estimated_bytes, 'seconds': chunk_time})
+                    logger.debug("Bulk insert chunk into %s: %d rows in %.4f seconds",
+                                table, end - start, chunk_time)
+                
+                conn.commit()
+                result['seconds'] = time.time() - start_time
+                logger.info("Bulk inserted %d rows into %s via %s in %d chunks (%.2f seconds)",
+                           len(values), table, method, len(chunks), result['seconds'])
+                return result
+            except mariadb.Error as e:
+                conn.rollback()
+                error_msg = f"Failed to bulk insert into {table}: {str(e)}"
+                logger.error(error_msg)
+                raise QueryError(error_msg) from e
+            finally:
+                if 'cursor' in locals():
+                    cursor.close()
+                conn.autocommit = True
+    
+    def load_data(self, table: str, rows: Union[Rows, str], columns: Optional[List[str]] = None,
+                  update_columns: Optional[List[str]] = None,
+                  duplicate_mode: Optional[str] = None) -> Dict[str, Any]:
+        """
+        LOAD DATA LOCAL INFILE로 대량 적재
+        
+        DataFrame이나 행 목록은 임시 CSV 파일로 기록한 뒤 적재합니다. update_columns를
+        지정하면 같은 구조의 임시 테이블에 적재한 다음 INSERT ... SELECT ...
+        ON DUPLICATE KEY UPDATE로 반영합니다. 연결 설정에 local_infile
+        (환경 변수 DB_LOCAL_INFILE=true)이 켜져 있어야 합니다.
+        
+        Args:
+            table (str): 대상 테이블
+            rows (Union[Rows, str]): 적재할 데이터 또는 write_infile() 형식의 CSV 파일 경로
+            columns (List[str], optional): 열 목록. 튜플 리스트나 CSV 파일에는 필수.
+            update_columns (List[str], optional): 키 중복 시 새 값으로 갱신할 열 (upsert)
+            duplicate_mode (str, optional): upsert가 아닐 때 키 중복 처리 ('REPLACE' 또는 'IGNORE')
+            
+        Returns:
+            Dict[str, Any]: method, rows, affected_rows, seconds, chunks(단계별 실행 시간)
+            
+        Raises:
+            QueryError: 쿼리 실행 실패 시 발생
+        """
+        temp_path = None
+        if isinstance(rows, str):
+            if columns is None:
+                raise ValueError("columns is required when loading from a CSV file")
+            file_path, row_count = rows, None
+        else:
+            columns, values = normalize_rows(rows, columns)
+            with tempfile.NamedTemporaryFile('w', suffix='.csv', encoding='utf-8', newline='',
+                                             delete=False) as f:
+                write_infile(values, f)
+                temp_path = file_path = f.name
+            row_count = len(values)
+        
+        result = {'method': 'load_data', 'rows': row_count, 'affected_rows': 0, 'seconds': 0.0, 'chunks': []}
+        
+        def timed(step: str, cursor, sql: str, params: Optional[Tuple] = None) -> None:
+            step_start = time.time()
+            if params:
+                cursor.execute(sql, params)
+            else:
+                cursor.execute(sql)
+            result['chunks'].append({'step': step, 'rows': cursor.rowcount, 'seconds': time.time() - step_start})
+        
+        try:
+            with self.get_connection() as conn:
+                try:
+                    cursor = conn.cursor()
+                    start_time = time.time()
+                    conn.autocommit = False
+                    
+                    if update_columns:
+                        staging = f"{table.split('.')[-1]}_load_{os.getpid()}"
+                        timed('create_staging', cursor,
+                              f"CREATE TEMPORARY TABLE `{staging}` LIKE {quote_identifier(table)}")
+                        try:
+                            timed('load', cursor, load_data_sql(staging, columns), (file_path,))
+                            column_sql = ', '.join(quote_identifier(col) for col in columns)
+                            timed('upsert', cursor,
+                                  f"INSERT INTO {quote_identifier(table)} ({column_sql}) "
+                                  f"SELECT {column_sql} FROM `{staging}` {build_upsert_clause(update_columns)}")
+                        finally:
+                            cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS `{staging}`")
+                    else:
+                        timed('load', cursor, load_data_sql(table, columns, duplicate_mode), (file_path,))
+                    
+                    result['affected_rows'] = max(result['chunks'][-1]['rows'], 0)
+                    conn.commit()
+                    result['seconds'] = time.time() - start_time
+                    logger.info("Loaded %s rows into %s via LOAD DATA (%.2f seconds)",
+                               row_count if row_count is not None else 'file', table, result['seconds'])
+                    return result
+                except mariadb.Error as e:
+                    conn.rollback()
+                    error_msg = f"Failed to load data into {table}: {str(e)}"
+                    logger.error(error_msg)
+                    raise QueryError(error_msg) from e
+                finally:
+                    if 'cursor' in locals():
+                        cursor.close()
+                    conn.autocommit = True
+        finally:
+            if temp_path:
+                os.unlink(temp_path)
+    
+    def execute_script(self, script: str, section: Optional[str] = None,
+                       batch_size: int = 1) -> List[Dict[str, Any]]:
         """
         SQL 스크립트 실행 (여러 쿼리)
         
+        문자열, 주석, DELIMITER 블록을 인식하는 분리기로 문장을 나눈 뒤 하나의
+        트랜잭션에서 실행합니다. batch_size가 2 이상이고 다중 문장 전송
+        (환경 변수 DB_MULTI_STATEMENTS=true)이 켜져 있으면 batch_size개 문장을
+        한 번의 왕복으로 전송합니다.
+        
         Args:
             script (str): 실행할 SQL 스크립트
+            section (str, optional): 실행할 '-- name:' 섹션 이름. 기본값은 None (전체 실행).
+            batch_size (int, optional): 한 번에 전송할 문장 수. 기본값은 1.
+            
+        Returns:
+            List[Dict[str, Any]]: 문장별 실행 정보 (statement, section, line, rows, seconds).
+                다중 문장 전송에서는 각 결과가 도착한 시점 기준의 시간입니다.
             
         Raises:
+            ValueError: 스크립트 구문 오류 또는 존재하지 않는 섹션
             QueryError: 스크립트 실행 실패 시 발생
         """
+        statements = parse_script(script)
+        if section is not None:
+            statements = [statement for statement in statements if statement.section == section]
+            if not statements:
+                raise ValueError(f"Section not found in script: {section}")
+        
+        if batch_size > 1 and not self.config.config.get("multi_statements"):
+            logger.warning("Multi-statement batching requested but DB_MULTI_STATEMENTS is disabled; "
+                           "executing statements one at a time")
+            batch_size = 1
+        
+        timings: List[Dict[str, Any]] = []
+        current_line = statements[0].line if statements else 0
         with self.get_connection() as conn:
             try:
                 cursor = conn.cursor()
@@ -311,20 +799,41 @@ class MariaDBConnection:
                 
                 conn.autocommit = False
                 
-                # 스크립트를 개별 쿼리로 분할하고 실행
-                queries = script.split(';')
-                for query in queries:
-                    query = query.strip()
-                    if query:  # 비어있지 않은 쿼리만 실행
-                        cursor.execute(query)
+                for offset in range(0, len(statements), batch_size):
+                    batch = statements[offset:offset + batch_size]
+                    current_line = batch[0].line
+                    step_start = time.time()
+                    
+                    if len(batch) == 1:
+                        cursor.execute(batch[0].sql)
+                    else:
+                        cursor.execute(";\n".join(statement.sql for statement in batch))
+                    
+                    # 다중 문장 전송에서는 결과 집합마다 다음 문장의 결과를 기다림
+                    for index, statement in enumerate(batch):
+                        current_line = statement.line
+                        if index > 0:
+                            cursor.nextset()
+                        if cursor.description:
+                            cursor.fetchall()
+                        now = time.time()
+                        timings.append({
+                            'statement': statement.sql[:100],
+                            'section': statement.section,
+                            'line': statement.line,
+                            'rows': cursor.rowcount,
+                            'seconds': now - step_start
+                        })
+                        step_start = now
                 
                 conn.commit()
                 execution_time = time.time() - start_time
                 
-                logger.debug("Script executed in %.4f seconds", execution_time)
+                logger.debug("Script executed in %.4f seconds (%d statements)", execution_time, len(statements))
+                return timings
             except mariadb.Error as e:
                 conn.rollback()
-                error_msg = f"Failed to execute script: {str(e)}"
+                error_msg = f"Failed to execute script at line {current_line}: {str(e)}"
                 logger.error(error_msg)
                 raise QueryError(error_msg) from e
             finally:
@@ -332,13 +841,41 @@ class MariaDBConnection:
                     cursor.close()
                 conn.autocommit = True
     
+    def execute_script_file(self, file_path: str, section: Optional[str] = None,
+                            batch_size: int = 1) -> List[Dict[str, Any]]:
+        """
+        .sql 파일 실행 (전체 또는 '-- name:' 섹션 하나)
+        
+        Args:
+            file_path (str): SQL 파일 경로
+            section (str, optional): 실행할 섹션 이름. 기본값은 None (전체 실행).
+            batch_size (int, optional): 한 번에 전송할 문장 수. 기본값은 1.
+            
+        Returns:
+            List[Dict[str, Any]]: 문장별 실행 정보
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            script = f.read()
+        return self.execute_script(script, section=section, batch_size=batch_size)
+    
     def close_pool(self) -> None:
         """
-        연결 풀 종료
+        연결 풀 사용 종료
+        
+        풀은 프로세스 전체에서 공유되므로 실제로 닫지 않고 유휴 연결만 정리합니다.
+        프로세스 종료 시 close_all_pools()가 모든 풀을 닫습니다.
         """
         if self.connection_pool:
-            self.connection_pool.close()
-            logger.info("MariaDB connection pool closed")
+            self.connection_pool.evict_idle()
+    
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """
+        현재 사용 중인 공유 연결 풀의 지표 반환
+        
+        Returns:
+            Dict[str, Any]: 체크아웃 수, 대기 시간, 고갈 횟수 등의 지표
+        """
+        return self.connection_pool.metrics()
     
     def __enter__(self) -> 'MariaDBConnection':
         """
@@ -6,11 +6,12 @@ SQLAlchemy 기반 ORM 모듈
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Type, TypeVar, Generic, Union, Callable
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type, TypeVar, Generic, Union, Callable
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine, MetaData, Column, Table, inspect, select, update, delete, func, text
-from sqlalchemy.orm import sessionmaker, declarative_base, Session
+from sqlalchemy import create_engine, MetaData, Column, Table, inspect, select, update, delete, func, text, insert
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.orm import sessionmaker, declarative_base, Session, selectinload
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -50,7 +51,8 @@ class DatabaseSession:
         """
         self.config = DatabaseConfig(config_path)
         self.engine = self._create_engine(echo)
-        self.Session = sessionmaker(bind=self.engine)
+        # 세션 종료 후에도 반환한 인스턴스(즉시 로딩한 관계 포함)를 읽을 수 있도록 만료하지 않음
+        self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
         self.metadata = MetaData()
         
         logger.info("SQLAlchemy ORM initialized")
@@ -152,18 +154,208 @@ class Repository(Generic[T]):
     모델 클래스에 대한 CRUD 작업을 제공합니다.
     """
     
-    def __init__(self, db_session: DatabaseSession, model_class: Type[T]):
+    def __init__(self, db_session: DatabaseSession, model_class: Type[T],
+                 eager_load: Optional[Sequence[str]] = None):
         """
         Repository 클래스 초기화
         
         Args:
             db_session (DatabaseSession): 데이터베이스 세션 관리자
             model_class (Type[T]): 이 Repository가 다룰 모델 클래스
+            eager_load (Sequence[str], optional): find_by/iter_all/page에서 기본으로
+                selectinload할 관계 이름 (예: ['wallets']). 기본값은 None.
         """
         self.db_session = db_session
         self.model_class = model_class
+        self.eager_load = list(eager_load or [])
         logger.info("Repository initialized for model %s", model_class.__name__)
     
+    def _load_options(self, eager_load: Optional[Sequence[str]]) -> List[Any]:
+        """
+        관계 이름을 selectinload 옵션으로 변환
+        
+        관계마다 IN 조건 쿼리 하나로 한꺼번에 읽으므로 인스턴스별 지연 로딩(N+1)이 없습니다.
+        
+        Raises:
+            ModelError: 모델에 없는 관계 이름인 경우
+        """
+        names = self.eager_load if eager_load is None else eager_load
+        relationships = inspect(self.model_class).relationships
+        options = []
+        for name in names:
+            if name not in relationships:
+                raise ModelError(f"{self.model_class.__name__} has no relationship named {name!r}")
+            options.append(selectinload(getattr(self.model_class, name)))
+        return options
+    
+    def _primary_key(self) -> Column:
+        """단일 기본 키 열 (키셋 페이지네이션과 스트리밍 정렬 기준)"""
+        primary_key = inspect(self.model_class).primary_key
+        if len(primary_key) != 1:
+            raise ModelError(f"{self.model_class.__name__} must have a single-column primary key")
+        return primary_key[0]
+    
+    def bulk_create(self, rows: Sequence[Dict[str, Any]], chunk_size: int = 1000) -> int:
+        """
+        여러 행을 한 번에 INSERT
+        
+        인스턴스를 만들어 flush/refresh하지 않고, 청크마다 INSERT 한 문장을
+        여러 파라미터 세트로 실행합니다 (드라이버의 executemany/다중 행 INSERT).
+        열 기본값(created_at 등)은 그대로 적용됩니다. 하나의 트랜잭션에서 실행됩니다.
+        
+        Args:
+            rows (Sequence[Dict[str, Any]]): 모델 필드와 값 딕셔너리 목록
+            chunk_size (int, optional): 한 번에 실행할 행 수. 기본값은 1000.
+            
+        Returns:
+            int: INSERT한 행 수
+            
+        Raises:
+            QueryError: 실행 실패 시 발생
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        
+        try:
+            with self.db_session.session_scope() as session:
+                for start in range(0, len(rows), chunk_size):
+                    session.execute(insert(self.model_class), rows[start:start + chunk_size])
+                logger.debug("Bulk created %d %s rows", len(rows), self.model_class.__name__)
+                return len(rows)
+        except SQLAlchemyError as e:
+            error_msg = f"Failed to bulk create {self.model_class.__name__}: {str(e)}"
+            logger.error(error_msg)
+            raise QueryError(error_msg) from e
+    
+    def build_upsert(self, update_columns: Sequence[str]) -> Any:
+        """
+        INSERT ... ON DUPLICATE KEY UPDATE 문 생성 (MariaDB/MySQL)
+        
+        Args:
+            update_columns (Sequence[str]): 키 중복 시 새 값으로 덮어쓸 열
+            
+        Returns:
+            sqlalchemy.dialects.mysql.Insert: upsert 문
+        """
+        stmt = mysql_insert(self.model_class.__table__)
+        return stmt.on_duplicate_key_update({name: stmt.inserted[name] for name in update_columns})
+    
+    def bulk_upsert(self, rows: Sequence[Dict[str, Any]], update_columns: Optional[Sequence[str]] = None,
+                    chunk_size: int = 1000) -> int:
+        """
+        여러 행을 INSERT ... ON DUPLICATE KEY UPDATE로 저장
+        
+        Args:
+            rows (Sequence[Dict[str, Any]]): 모델 필드와 값 딕셔너리 목록
+            update_columns (Sequence[str], optional): 키 중복 시 갱신할 열. 기본값은 None.
+                None인 경우 첫 행의 열 중 기본 키와 created_at을 제외한 열과
+                updated_at(모델에 있는 경우)을 갱신합니다.
+            chunk_size (int, optional): 한 번에 실행할 행 수. 기본값은 1000.
+            
+        Returns:
+            int: 드라이버가 보고한 영향받은 행 수 (새 행 1, 갱신된 행 2)
+            
+        Raises:
+            QueryError: 실행 실패 시 발생
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+        
+        if update_columns is None:
+            columns = self.model_class.__table__.columns
+            primary_keys = {column.name for column in columns if column.primary_key}
+            update_columns = [name for name in rows[0] if name not in primary_keys and name != 'created_at']
+            if 'updated_at' in columns and 'updated_at' not in update_columns:
+                update_columns.append('updated_at')
+        
+        try:
+            with self.db_session.session_scope() as session:
+                stmt = self.build_upsert(update_columns)
+                affected = 0
+                for start in range(0, len(rows), chunk_size):
+                    result = session.execute(stmt, rows[start:start + chunk_size])
+                    affected += max(result.rowcount, 0)
+                logger.debug("Bulk upserted %d %s rows (%d affected)",
+                            len(rows), self.model_class.__name__, affected)
+                return affected
+        except SQLAlchemyError as e:
+            error_msg = f"Failed to bulk upsert {self.model_class.__name__}: {str(e)}"
+            logger.error(error_msg)
+            raise QueryError(error_msg) from e
+    
+    def iter_all(self, chunk_size: int = 1000, eager_load: Optional[Sequence[str]] = None) -> Iterator[T]:
+        """
+        모든 모델 인스턴스를 기본 키 순서로 스트리밍
+        
+        yield_per로 서버 측 커서에서 chunk_size개씩 읽으므로 전체 결과를 메모리에
+        올리지 않습니다. 반복을 마치거나 중단할 때까지 세션이 열려 있습니다.
+        
+        Args:
+            chunk_size (int, optional): 한 번에 읽을 행 수. 기본값은 1000.
+            eager_load (Sequence[str], optional): 청크마다 selectinload할 관계 이름.
+                기본값은 None (Repository의 eager_load 사용).
+            
+        Yields:
+            T: 모델 인스턴스
+            
+        Raises:
+            QueryError: 조회 실패 시 발생
+        """
+        stmt = (select(self.model_class)
+                .options(*self._load_options(eager_load))
+                .order_by(self._primary_key())
+                .execution_options(yield_per=chunk_size))
+        try:
+            with self.db_session.session_scope() as session:
+                count = 0
+                for instance in session.scalars(stmt):
+                    count += 1
+                    yield instance
+                logger.debug("Streamed %d %s instances", count, self.model_class.__name__)
+        except SQLAlchemyError as e:
+            error_msg = f"Failed to stream {self.model_class.__name__}: {str(e)}"
+            logger.error(error_msg)
+            raise QueryError(error_msg) from e
+    
+    def page(self, after_id: Optional[Any] = None, limit: int = 100,
+             eager_load: Optional[Sequence[str]] = None) -> List[T]:
+        """
+        기본 키 기준 키셋 페이지 조회
+        
+        OFFSET 대신 'id > after_id'로 이어서 읽으므로 뒤쪽 페이지도 인덱스 범위 검색
+        한 번으로 끝납니다. 다음 페이지는 마지막 인스턴스의 ID를 after_id로 전달합니다.
+        
+        Args:
+            after_id (Any, optional): 이전 페이지의 마지막 ID. 기본값은 None (첫 페이지).
+            limit (int, optional): 페이지 크기. 기본값은 100.
+            eager_load (Sequence[str], optional): selectinload할 관계 이름.
+                기본값은 None (Repository의 eager_load 사용).
+            
+        Returns:
+            List[T]: 모델 인스턴스 목록 (limit개 미만이면 마지막 페이지)
+            
+        Raises:
+            QueryError: 조회 실패 시 발생
+        """
+        primary_key = self._primary_key()
+        stmt = select(self.model_class).options(*self._load_options(eager_load))
+        if after_id is not None:
+            stmt = stmt.where(primary_key > after_id)
+        stmt = stmt.order_by(primary_key).limit(limit)
+        
+        try:
+            with self.db_session.session_scope() as session:
+                instances = list(session.scalars(stmt))
+                logger.debug("Retrieved page of %d %s instances after %s",
+                            len(instances), self.model_class.__name__, str(after_id))
+                return instances
+        except SQLAlchemyError as e:
+            error_msg = f"Failed to get page of {self.model_class.__name__}: {str(e)}"
+            logger.error(error_msg)
+            raise QueryError(error_msg) from e
+    
     def create(self, **kwargs) -> T:
         """
         새 모델 인스턴스 생성 및 저장
@@ -222,6 +414,8 @@ class Repository(Generic[T]):
         """
         모든 모델 인스턴스 조회
         
+        큰 테이블에는 iter_all() 또는 page()를 사용하세요.
+        
         Returns:
             List[T]: 모델 인스턴스 목록
             
@@ -239,11 +433,13 @@ class Repository(Generic[T]):
             logger.error(error_msg)
             raise QueryError(error_msg) from e
     
-    def find_by(self, **kwargs) -> List[T]:
+    def find_by(self, *, eager_load: Optional[Sequence[str]] = None, **kwargs) -> List[T]:
         """
         조건에 맞는 모델 인스턴스 조회
         
         Args:
+            eager_load (Sequence[str], optional): selectinload할 관계 이름 (예: ['wallets']).
+                기본값은 None (Repository의 eager_load 사용).
             **kwargs: 검색 조건 (필드=값)
             
         Returns:
@@ -252,9 +448,10 @@ class Repository(Generic[T]):
         Raises:
             QueryError: 조회 실패 시 발생
         """
+        options = self._load_options(eager_load)
         try:
             with self.db_session.session_scope() as session:
-                query = session.query(self.model_class)
+                query = session.query(self.model_class).options(*options)
                 for key, value in kwargs.items():
                     query = query.filter(getattr(self.model_class, key) == value)
                 
@@ -7,15 +7,21 @@
 
 import os
 import time
+import functools
 import hashlib
 import json
 import logging
 import pandas as pd
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Tuple, Callable
+from typing import Any, Dict, List, Optional, Sequence, Union, Tuple, Callable
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from .result_cache import CacheBackend, MemoryCache, create_cache_backend
+from .query_stats import QueryPerformanceLog
+from .sql_catalog import CatalogError, SqlCatalog, get_catalog
+
 # 프로젝트 루트 디렉토리 설정
 project_root = Path(__file__).parent.parent.parent
 
@@ -26,6 +32,44 @@ class QueryError(Exception):
     """쿼리 실행 관련 오류 클래스"""
     pass
 
+def _frame_from_records(data: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    캐시에 저장할 DataFrame 생성
+
+    NULL이 섞인 정수 컬럼은 float64 대신 Int64로 저장해 캐시 적중 시 정수로 복원합니다.
+    """
+    df = pd.DataFrame(data)
+    for column in df.columns:
+        series = df[column]
+        if series.dtype.kind == 'f' and series.isna().any():
+            values = [row.get(column) for row in data]
+            if all(isinstance(value, int) and not isinstance(value, bool)
+                   for value in values if value is not None):
+                df[column] = series.astype('Int64')
+    return df
+
+def _records_from_frame(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    캐시된 DataFrame을 조회 결과와 같은 딕셔너리 리스트로 변환
+
+    NaN/NaT는 None, Timestamp는 datetime, numpy 스칼라는 파이썬 값으로 바꿉니다.
+    """
+    values = df.astype(object).where(df.notna(), None)
+    columns = []
+    for column in df.columns:
+        column_values = values[column].tolist()
+        if pd.api.types.is_datetime64_any_dtype(df[column]):
+            column_values = [value.to_pydatetime() if value is not None else None for value in column_values]
+        columns.append(column_values)
+    return [dict(zip(df.columns, row)) for row in zip(*columns)]
+
+def _frame_as_fetched(df: pd.DataFrame) -> pd.DataFrame:
+    """캐시된 DataFrame을 캐시 미스 시 pd.DataFrame(결과)와 같은 dtype으로 변환"""
+    nullable_ints = [column for column in df.columns if isinstance(df[column].dtype, pd.Int64Dtype)]
+    if nullable_ints:
+        df = df.astype({column: 'float64' for column in nullable_ints})
+    return df
+
 class QueryManager:
     """
     SQL 쿼리 실행 및 관리를 위한 클래스
@@ -34,7 +78,11 @@ class QueryManager:
     파라미터 바인딩, 캐싱, 대용량 결과 처리 등을 지원합니다.
     """
     
-    def __init__(self, db_connection, use_cache: bool = True, cache_dir: Optional[str] = None):
+    def __init__(self, db_connection, use_cache: bool = True, cache_dir: Optional[str] = None,
+                 cache_backend: Optional[Union[str, CacheBackend]] = None,
+                 memory_cache_bytes: int = 256 * 1024 * 1024, memory_cache_policy: str = 'lru',
+                 cache_sweep_interval: Optional[float] = 60.0, performance_log_size: int = 1000,
+                 catalog: Optional[SqlCatalog] = None):
         """
         QueryManager 초기화
         
@@ -43,11 +91,28 @@ class QueryManager:
             use_cache (bool, optional): 캐싱 사용 여부. 기본값은 True.
             cache_dir (str, optional): 캐시 디렉토리 경로. 기본값은 None.
                 None인 경우 project_root/data/cache를 사용합니다.
+            cache_backend (Union[str, CacheBackend], optional): 파일 캐시 백엔드
+                ('arrow', 'parquet', 'json' 또는 CacheBackend 인스턴스). 기본값은 None.
+                None인 경우 pyarrow가 있으면 'arrow', 없으면 'json'을 사용합니다.
+            memory_cache_bytes (int, optional): 메모리 캐시 최대 크기(바이트). 기본값은 256MB.
+            memory_cache_policy (str, optional): 메모리 캐시 제거 정책 ('lru' 또는 'lfu').
+                기본값은 'lru'.
+            cache_sweep_interval (float, optional): 만료된 메모리 캐시 항목 정리 주기(초).
+                기본값은 60. None인 경우 조회 시점에만 만료를 확인합니다.
+            performance_log_size (int, optional): 보관할 최근 성능 기록 수. 기본값은 1000.
+                쿼리별 누적 통계는 이와 별도로 유지됩니다.
+            catalog (SqlCatalog, optional): 템플릿과 이름 있는 쿼리를 조회할 SQL 카탈로그.
+                기본값은 None (queries/ 디렉토리의 공유 카탈로그).
         """
         self.connection = db_connection
         self.use_cache = use_cache
-        self.query_cache = {}
-        self.performance_log = []
+        self._catalog = catalog
+        self.query_cache = MemoryCache(
+            memory_cache_bytes,
+            policy=memory_cache_policy,
+            sweep_interval=cache_sweep_interval if use_cache else None
+        )
+        self.performance_log = QueryPerformanceLog(max_records=performance_log_size)
         
         # 캐시 디렉토리 설정
         if cache_dir:
@@ -55,10 +120,19 @@ class QueryManager:
         else:
             self.cache_dir = project_root / "data" / "cache"
         
+        self.cache_backend = create_cache_backend(cache_backend, self.cache_dir)
+        
         # 캐시 디렉토리 생성
         if self.use_cache and not self.cache_dir.exists():
             self.cache_dir.mkdir(parents=True, exist_ok=True)
     
+    @property
+    def catalog(self) -> SqlCatalog:
+        """템플릿과 이름 있는 쿼리를 조회하는 SQL 카탈로그"""
+        if self._catalog is None:
+            self._catalog = get_catalog()
+        return self._catalog
+    
     def execute_query(self, query: str, params: Optional[Union[Dict, List, Tuple]] = None, 
                      use_cache: Optional[bool] = None, cache_ttl: int = 3600,
                      as_dataframe: bool = True) -> Union[pd.DataFrame, List[Dict[str, Any]]]:
@@ -80,6 +154,16 @@ class QueryManager:
         Raises:
             QueryError: 쿼리 실행 실패 시 발생
         """
+        if params:
+            fetch = functools.partial(self.connection.query, query, params)
+        else:
+            fetch = functools.partial(self.connection.query, query)
+        return self._execute_cached(query, params, fetch, use_cache, cache_ttl, as_dataframe)
+    
+    def _execute_cached(self, query: str, params: Optional[Union[Dict, List, Tuple]],
+                        fetch: Callable[[], List[Dict[str, Any]]], use_cache: Optional[bool],
+                        cache_ttl: int, as_dataframe: bool) -> Union[pd.DataFrame, List[Dict[str, Any]]]:
+        """캐시 확인, 조회 함수 실행, 성능 기록, 결과 캐싱 (execute_query/execute_named 공통)"""
         # 캐싱 설정
         use_cache_for_query = self.use_cache if use_cache is None else use_cache
         
@@ -100,14 +184,11 @@ class QueryManager:
                     self._log_performance(query, params, execution_time, True, len(cached_result))
                     
                     if as_dataframe:
-                        return pd.DataFrame(cached_result)
-                    return cached_result
+                        return _frame_as_fetched(cached_result)
+                    return _records_from_frame(cached_result)
             
             # 캐시된 결과가 없거나 캐싱을 사용하지 않는 경우 쿼리 실행
-            if params:
-                result = self.connection.query(query, params)
-            else:
-                result = self.connection.query(query)
+            result = fetch()
             
             # 실행 시간 및 성능 로깅
             execution_time = time.time() - start_time
@@ -115,7 +196,7 @@ class QueryManager:
             
             # 결과 캐싱
             if use_cache_for_query:
-                self._save_to_cache(cache_key, result)
+                self._save_to_cache(cache_key, result, cache_ttl)
             
             # 결과 반환
             if as_dataframe:
@@ -180,11 +261,14 @@ class QueryManager:
             if not template_name.endswith('.sql'):
                 template_name += '.sql'
             
-            # 절대 경로가 아닌 경우 queries 디렉토리 기준으로 처리
+            # queries 디렉토리 기준 경로는 카탈로그에 캐시된 내용 사용 (파일 변경 시 다시 읽음)
             if not os.path.isabs(template_name):
-                template_path = project_root / "queries" / template_name
-            else:
-                template_path = Path(template_name)
+                try:
+                    return self.catalog.source(template_name)
+                except KeyError:
+                    raise QueryError(f"쿼리 템플릿을 찾을 수 없습니다: {project_root / 'queries' / template_name}")
+            
+            template_path = Path(template_name)
             
             # 템플릿 파일 존재 확인
             if not template_path.exists():
@@ -199,6 +283,42 @@ class QueryManager:
         except Exception as e:
             raise QueryError(f"쿼리 템플릿 로드 실패: {str(e)}") from e
     
+    def execute_named(self, name: str, params: Optional[Union[Dict[str, Any], Tuple]] = None,
+                      use_cache: Optional[bool] = None, cache_ttl: int = 3600,
+                      as_dataframe: bool = True) -> Union[pd.DataFrame, List[Dict[str, Any]]]:
+        """
+        SQL 카탈로그의 이름 있는 쿼리 실행
+        
+        연결이 query_named()를 지원하면 연결별로 재사용되는 prepared statement로 실행하고,
+        그렇지 않으면 파라미터를 바인딩한 SQL을 query()로 실행합니다.
+        
+        Args:
+            name (str): 쿼리 이름 ('-- name:' 섹션 또는 queries/ 기준 파일 경로)
+            params (Union[Dict[str, Any], Tuple], optional): 쿼리 파라미터. 기본값은 None.
+            use_cache (bool, optional): 이 쿼리에 캐싱 사용 여부. 기본값은 None.
+            cache_ttl (int, optional): 캐시 유효 시간(초). 기본값은 3600(1시간).
+            as_dataframe (bool, optional): 결과를 pandas DataFrame으로 반환할지 여부. 기본값은 True.
+            
+        Returns:
+            Union[pd.DataFrame, List[Dict[str, Any]]]: 쿼리 결과
+            
+        Raises:
+            QueryError: 이름이 없거나 파라미터가 맞지 않거나 쿼리 실행 실패 시 발생
+        """
+        prepared = hasattr(self.connection, 'query_named')
+        try:
+            statement = self.catalog.get(name)
+            # query()만 있는 연결(pymysql 기반 DatabaseConnection)은 '%s' 자리표시자 사용
+            sql, values = statement.bind(params, paramstyle='qmark' if prepared else 'format')
+        except (KeyError, CatalogError) as e:
+            raise QueryError(f"이름 있는 쿼리 준비 실패: {str(e)}") from e
+        
+        if prepared:
+            fetch = functools.partial(self.connection.query_named, name, params)
+        else:
+            fetch = functools.partial(self.connection.query, sql, values)
+        return self._execute_cached(sql, values, fetch, use_cache, cache_ttl, as_dataframe)
+    
     def execute_template(self, template_name: str, params: Optional[Dict[str, Any]] = None,
                        use_cache: Optional[bool] = None, cache_ttl: int = 3600,
                        as_dataframe: bool = True) -> Union[pd.DataFrame, List[Dict[str, Any]]]:
@@ -311,12 +431,58 @@ class QueryManager:
             self._log_performance(query, {'batch_size': len(params_list)}, execution_time, False, 0, str(e))
             raise QueryError(f"배치 쿼리 실행 실패: {str(e)}") from e
     
-    def execute_script(self, script: str) -> None:
+    def bulk_insert(self, table: str, rows: Any, columns: Optional[List[str]] = None,
+                    update_columns: Optional[List[str]] = None, method: str = 'executemany',
+                    **kwargs) -> Dict[str, Any]:
+        """
+        대량 INSERT (MariaDBConnection.bulk_insert 위임)
+        
+        Args:
+            table (str): 대상 테이블
+            rows (Any): DataFrame, 딕셔너리 리스트 또는 튜플 리스트
+            columns (List[str], optional): 열 목록
+            update_columns (List[str], optional): 키 중복 시 갱신할 열 (upsert)
+            method (str, optional): 'executemany', 'multi_row' 또는 'load_data'. 기본값은 'executemany'.
+            **kwargs: bulk_insert의 추가 인자 (chunk_size, ignore)
+        
+        Returns:
+            Dict[str, Any]: 적재 결과 (행 수, 영향받은 행 수, 청크별 실행 시간)
+        
+        Raises:
+            QueryError: 쿼리 실행 실패 시 발생
+        """
+        start_time = time.time()
+        label = f"BULK INSERT {table} ({method})"
+        
+        try:
+            result = self.connection.bulk_insert(table, rows, columns=columns, update_columns=update_columns,
+                                                 method=method, **kwargs)
+            
+            execution_time = time.time() - start_time
+            self._log_performance(label, {'chunks': len(result['chunks'])}, execution_time, False,
+                                  result['affected_rows'])
+            
+            return result
+        
+        except Exception as e:
+            execution_time = time.time() - start_time
+            self._log_performance(label, None, execution_time, False, 0, str(e))
+            raise QueryError(f"대량 INSERT 실행 실패: {str(e)}") from e
+
+    def execute_script(self, script: str, section: Optional[str] = None,
+                       batch_size: int = 1) -> List[Dict[str, Any]]:
         """
         SQL 스크립트 실행
         
+        문장별 실행 시간도 성능 로그에 기록됩니다.
+        
         Args:
             script (str): 실행할 SQL 스크립트
+            section (str, optional): 실행할 '-- name:' 섹션 이름. 기본값은 None (전체 실행).
+            batch_size (int, optional): 한 번에 전송할 문장 수. 기본값은 1.
+            
+        Returns:
+            List[Dict[str, Any]]: 문장별 실행 정보 (statement, section, line, rows, seconds)
             
         Raises:
             QueryError: 스크립트 실행 실패 시 발생
@@ -326,11 +492,14 @@ class QueryManager:
         
         try:
             # 스크립트 실행
-            self.connection.execute_script(script)
+            timings = self.connection.execute_script(script, section=section, batch_size=batch_size)
             
             # 실행 시간 및 성능 로깅
             execution_time = time.time() - start_time
+            for timing in timings or []:
+                self._log_performance(timing['statement'], None, timing['seconds'], False, max(timing['rows'] or 0, 0))
             self._log_performance("SQL Script", None, execution_time, False, 0)
+            return timings
         
         except Exception as e:
             # 실행 시간 및 오류 로깅
@@ -355,33 +524,29 @@ class QueryManager:
                 'error', 'timestamp'
             ])
         
-        # 성능 로그를 데이터프레임으로 변환
-        df = pd.DataFrame(self.performance_log)
-        
-        # 쿼리 패턴으로 필터링
-        if query_pattern:
-            pattern = re.compile(query_pattern, re.IGNORECASE)
-            df = df[df['query'].str.contains(pattern, regex=True)]
-        
-        # 통계 계산을 위한 그룹화
-        if not df.empty:
-            # 쿼리별 평균 실행 시간, 실행 횟수, 캐시 히트율 등 계산
-            stats = df.groupby('query').agg({
-                'execution_time': ['mean', 'min', 'max', 'count'],
-                'from_cache': 'mean',  # 캐시 히트율
-                'result_count': 'mean',
-                'error': lambda x: (x != '').sum()  # 오류 발생 횟수
-            }).reset_index()
-            
-            # 컬럼명 정리
-            stats.columns = [
-                'query', 'avg_time', 'min_time', 'max_time', 'count', 
-                'cache_hit_rate', 'avg_result_count', 'error_count'
-            ]
-            
-            return stats
-        
-        return df
+        # 쿼리별 누적 통계 (최근 기록 링 버퍼가 순환해도 전체 기간을 반영)
+        return self.performance_log.stats(query_pattern)
+    
+    def get_latency_histogram(self, query_pattern: Optional[str] = None) -> pd.DataFrame:
+        """
+        쿼리별 실행 시간 히스토그램 조회
+        
+        Args:
+            query_pattern (str, optional): 필터링할 쿼리 패턴 (정규식). 기본값은 None.
+            
+        Returns:
+            pd.DataFrame: 쿼리별 실행 시간 구간별 실행 횟수
+        """
+        return self.performance_log.histogram(query_pattern)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        메모리 캐시 통계 조회
+        
+        Returns:
+            Dict[str, Any]: 적중/실패/제거 횟수, 현재 크기 등
+        """
+        return self.query_cache.stats()
     
     def clear_cache(self, pattern: Optional[str] = None) -> int:
         """
@@ -398,27 +563,17 @@ class QueryManager:
             return 0
         
         try:
-            deleted_count = 0
+            # 캐시 파일 삭제
+            deleted_count = self.cache_backend.clear(pattern)
             
-            # 패턴 컴파일
+            # 메모리 캐시도 정리
             if pattern:
                 regex = re.compile(pattern)
-            
-            # 캐시 디렉토리의 파일 순회
-            for cache_file in self.cache_dir.glob('*.cache'):
-                if pattern:
-                    # 패턴과 일치하는 파일만 삭제
-                    if regex.search(cache_file.name):
-                        cache_file.unlink()
-                        deleted_count += 1
-                else:
-                    # 모든 캐시 파일 삭제
-                    cache_file.unlink()
-                    deleted_count += 1
-            
-            # 메모리 캐시도 초기화
-            if not pattern:
-                self.query_cache = {}
+                for cache_key in self.query_cache.keys():
+                    if regex.search(self.cache_backend.path_for(cache_key).name):
+                        self.query_cache.delete(cache_key)
+            else:
+                self.query_cache.clear()
             
             return deleted_count
         
@@ -447,73 +602,59 @@ class QueryManager:
         
         return cache_key
     
-    def _get_from_cache(self, cache_key: str, ttl: int) -> Optional[List[Dict[str, Any]]]:
+    def _get_from_cache(self, cache_key: str, ttl: int) -> Optional[pd.DataFrame]:
         """
         캐시에서 결과 조회
         
+        메모리 캐시를 먼저 확인하고, 없으면 파일 캐시를 읽어 메모리 캐시에 올립니다.
+        호출자가 결과를 수정해도 캐시가 바뀌지 않도록 복사본을 반환합니다.
+        
         Args:
             cache_key (str): 캐시 키
             ttl (int): 캐시 유효 시간(초)
             
         Returns:
-            Optional[List[Dict[str, Any]]]: 캐시된 결과 또는 None
+            Optional[pd.DataFrame]: 캐시된 결과 또는 None
         """
         if not self.use_cache:
             return None
         
         # 메모리 캐시에서 조회
-        if cache_key in self.query_cache:
-            cached_item = self.query_cache[cache_key]
-            # 캐시 유효 기간 확인
-            if time.time() - cached_item['timestamp'] < ttl:
-                return cached_item['data']
-            # 유효 기간이 지난 경우 캐시에서 제거
-            del self.query_cache[cache_key]
+        cached_df = self.query_cache.get(cache_key, ttl)
+        if cached_df is not None:
+            return cached_df.copy()
         
         # 파일 캐시에서 조회
-        cache_file = self.cache_dir / f"{cache_key}.cache"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_item = json.load(f)
-                
-                # 캐시 유효 기간 확인
-                if time.time() - cached_item['timestamp'] < ttl:
-                    # 메모리 캐시에도 저장
-                    self.query_cache[cache_key] = cached_item
-                    return cached_item['data']
-                # 유효 기간이 지난 경우 캐시 파일 삭제
-                cache_file.unlink()
-            except Exception as e:
-                logger.warning(f"캐시 파일 읽기 실패: {str(e)}")
+        cached_item = self.cache_backend.get(cache_key, ttl)
+        if cached_item is None:
+            return None
         
-        return None
+        timestamp, cached_df = cached_item
+        # 메모리 캐시에도 저장
+        self.query_cache.set(cache_key, cached_df, timestamp, ttl=ttl)
+        return cached_df.copy()
     
-    def _save_to_cache(self, cache_key: str, data: List[Dict[str, Any]]) -> None:
+    def _save_to_cache(self, cache_key: str, data: List[Dict[str, Any]],
+                       ttl: Optional[int] = None) -> None:
         """
         결과를 캐시에 저장
         
         Args:
             cache_key (str): 캐시 키
             data (List[Dict[str, Any]]): 저장할 데이터
+            ttl (int, optional): 메모리 캐시 만료 정리에 사용할 유효 시간(초). 기본값은 None.
         """
         if not self.use_cache:
             return
         
         try:
-            # 캐시 아이템 생성
-            cached_item = {
-                'timestamp': time.time(),
-                'data': data
-            }
+            df = _frame_from_records(data)
             
             # 메모리 캐시에 저장
-            self.query_cache[cache_key] = cached_item
+            self.query_cache.set(cache_key, df, ttl=ttl)
             
             # 파일 캐시에 저장
-            cache_file = self.cache_dir / f"{cache_key}.cache"
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cached_item, f, ensure_ascii=False)
+            self.cache_backend.set(cache_key, df)
         
         except Exception as e:
             logger.warning(f"캐시 저장 실패: {str(e)}")
@@ -563,16 +704,26 @@ class QueryManager:
             logger.debug(log_message)
     
     def process_large_results(self, query: str, params: Optional[Union[Dict, List, Tuple]] = None,
-                            batch_size: int = 1000, processor: Callable[[pd.DataFrame], None] = None) -> int:
+                            batch_size: int = 1000, processor: Callable[[pd.DataFrame], None] = None,
+                            keyset: Optional[Union[str, Sequence[str]]] = None,
+                            prefetch: bool = False) -> int:
         """
         대용량 결과를 일괄 처리
         
+        keyset을 지정하면 LIMIT/OFFSET 대신 키셋(seek) 페이지네이션을 사용합니다.
+        각 배치는 직전 배치의 마지막 키 이후부터 읽으므로, 배치 번호와 관계없이
+        배치당 비용이 일정합니다.
+        
         Args:
             query (str): 실행할 SQL 쿼리
             params (Union[Dict, List, Tuple], optional): 쿼리 파라미터. 기본값은 None.
             batch_size (int, optional): 일괄 처리할 레코드 수. 기본값은 1000.
             processor (Callable[[pd.DataFrame], None], optional): 각 배치를 처리할 콜백 함수.
                 기본값은 None. None인 경우 아무 동작도 하지 않습니다.
+            keyset (Union[str, Sequence[str]], optional): 정렬 키 컬럼명 또는 컬럼명 목록
+                (예: 'id', ('createdAt', 'id')). 결과에서 유일해야 합니다. 기본값은 None.
+            prefetch (bool, optional): 키셋 모드에서 콜백이 현재 배치를 처리하는 동안
+                다음 배치를 백그라운드 스레드에서 미리 조회할지 여부. 기본값은 False.
             
         Returns:
             int: 처리된 총 레코드 수
@@ -580,6 +731,10 @@ class QueryManager:
         Raises:
             QueryError: 쿼리 실행 실패 시 발생
         """
+        if keyset:
+            keys = [keyset] if isinstance(keyset, str) else list(keyset)
+            return self._process_keyset_pages(query, params, batch_size, processor, keys, prefetch)
+        
         # 쿼리에 LIMIT 절이 있는지 확인
         has_limit = re.search(r'\bLIMIT\s+\d+', query, re.IGNORECASE)
         
@@ -634,3 +789,127 @@ class QueryManager:
             offset += batch_size
         
         return total_processed
+    
+    def _build_keyset_query(self, query: str, params: Optional[Union[Dict, List, Tuple]],
+                            keys: List[str], last_seen: Optional[Tuple],
+                            batch_size: int) -> Tuple[str, Optional[Union[Dict, List]]]:
+        """
+        키셋 페이지 쿼리 생성
+        
+        원본 쿼리를 파생 테이블로 감싸고 `(k1, k2) > (v1, v2)` 조건을
+        인덱스 범위 검색이 가능한 OR 조건으로 전개하여 추가합니다.
+        
+        Args:
+            query (str): 원본 SQL 쿼리
+            params (Union[Dict, List, Tuple], optional): 원본 쿼리 파라미터
+            keys (List[str]): 정렬 키 컬럼명 목록
+            last_seen (Tuple, optional): 직전 배치의 마지막 키 값. 첫 배치는 None.
+            batch_size (int): 배치 크기
+            
+        Returns:
+            Tuple[str, Optional[Union[Dict, List]]]: 페이지 쿼리와 파라미터
+        """
+        quoted = [f"`{key}`" for key in keys]
+        page_query = f"SELECT * FROM ({query.strip().rstrip(';')}) AS _keyset_page"
+        
+        if isinstance(params, dict):
+            page_params: Optional[Union[Dict, List]] = dict(params)
+        else:
+            page_params = list(params) if params else []
+        
+        if last_seen is not None:
+            def placeholder(value: Any) -> str:
+                if isinstance(page_params, dict):
+                    name = f"_keyset_{len(page_params)}"
+                    page_params[name] = value
+                    return f"%({name})s"
+                page_params.append(value)
+                return "%s"
+            
+            conditions = []
+            for i in range(len(keys)):
+                parts = [f"{quoted[j]} = {placeholder(last_seen[j])}" for j in range(i)]
+                parts.append(f"{quoted[i]} > {placeholder(last_seen[i])}")
+                conditions.append("(" + " AND ".join(parts) + ")")
+            page_query += " WHERE " + " OR ".join(conditions)
+        
+        page_query += f" ORDER BY {', '.join(quoted)} LIMIT {int(batch_size)}"
+        return page_query, page_params or None
+    
+    @staticmethod
+    def _to_db_value(value: Any) -> Any:
+        """pandas/NumPy 스칼라를 DB 드라이버가 바인딩할 수 있는 파이썬 값으로 변환"""
+        if isinstance(value, pd.Timestamp):
+            return value.to_pydatetime()
+        if hasattr(value, 'item'):
+            return value.item()
+        return value
+    
+    def _process_keyset_pages(self, query: str, params: Optional[Union[Dict, List, Tuple]],
+                              batch_size: int, processor: Optional[Callable[[pd.DataFrame], None]],
+                              keys: List[str], prefetch: bool) -> int:
+        """
+        키셋 페이지네이션으로 대용량 결과를 일괄 처리
+        
+        Args:
+            query (str): 실행할 SQL 쿼리
+            params (Union[Dict, List, Tuple], optional): 쿼리 파라미터
+            batch_size (int): 배치 크기
+            processor (Callable[[pd.DataFrame], None], optional): 각 배치를 처리할 콜백 함수
+            keys (List[str]): 정렬 키 컬럼명 목록
+            prefetch (bool): 다음 배치 선조회 여부
+            
+        Returns:
+            int: 처리된 총 레코드 수
+            
+        Raises:
+            QueryError: 쿼리 실행 실패 시 발생
+        """
+        for key in keys:
+            if not re.fullmatch(r'\w+', key):
+                raise QueryError(f"키셋 컬럼명이 올바르지 않습니다: {key}")
+        
+        def fetch(last_seen: Optional[Tuple]) -> pd.DataFrame:
+            page_query, page_params = self._build_keyset_query(query, params, keys, last_seen, batch_size)
+            try:
+                return self.execute_query(page_query, page_params, use_cache=False, as_dataframe=True)
+            except Exception as e:
+                raise QueryError(f"대용량 결과 처리 중 쿼리 실행 실패: {str(e)}") from e
+        
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="keyset-prefetch") if prefetch else None
+        total_processed = 0
+        
+        try:
+            page = fetch(None)
+            while not page.empty:
+                batch_count = len(page)
+                total_processed += batch_count
+                
+                # 다음 배치 요청 (선조회 모드에서는 콜백 처리와 동시에 실행)
+                next_page = None
+                last_seen = None
+                if batch_count >= batch_size:
+                    missing = [key for key in keys if key not in page.columns]
+                    if missing:
+                        raise QueryError(f"결과에 키셋 컬럼이 없습니다: {', '.join(missing)}")
+                    last_row = page.iloc[-1]
+                    last_seen = tuple(self._to_db_value(last_row[key]) for key in keys)
+                    if executor:
+                        next_page = executor.submit(fetch, last_seen)
+                
+                if processor:
+                    try:
+                        processor(page)
+                    except Exception as e:
+                        logger.error(f"배치 처리 중 오류 발생: {str(e)}")
+                
+                # 배치 크기보다 작은 결과를 받았다면 마지막 배치
+                if last_seen is None:
+                    break
+                
+                page = next_page.result() if next_page else fetch(last_seen)
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+        
+        return total_processed
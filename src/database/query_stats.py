@@ -0,0 +1,157 @@
+"""
+쿼리 성능 로그 모듈
+
+이 모듈은 QueryManager의 쿼리 성능 기록을 일정한 메모리 안에서 관리합니다.
+최근 실행 기록은 고정 크기 링 버퍼에 보관하고, 전체 기간의 통계는 쿼리별
+집계값과 실행 시간 히스토그램으로 누적합니다.
+"""
+
+import re
+import bisect
+import threading
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+# 실행 시간 히스토그램 구간 상한(초)
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, float('inf'))
+
+STATS_COLUMNS = [
+    'query', 'avg_time', 'min_time', 'max_time', 'count',
+    'cache_hit_rate', 'avg_result_count', 'error_count', 'p95_time'
+]
+
+class QueryPerformanceLog:
+    """
+    크기가 제한된 쿼리 성능 로그
+
+    리스트처럼 순회할 수 있으며(최근 max_records 개), 쿼리별 집계는
+    max_queries 개까지 유지하고 가장 오래 실행되지 않은 쿼리부터 제거합니다.
+    """
+
+    def __init__(self, max_records: int = 1000, max_queries: int = 500):
+        """
+        QueryPerformanceLog 초기화
+
+        Args:
+            max_records (int, optional): 보관할 최근 실행 기록 수. 기본값은 1000.
+            max_queries (int, optional): 집계를 유지할 고유 쿼리 수. 기본값은 500.
+        """
+        self.max_queries = max_queries
+        self._records: Deque[Dict[str, Any]] = deque(maxlen=max_records)
+        self._aggregates: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        실행 기록 추가 및 집계 갱신
+
+        Args:
+            record (Dict[str, Any]): query, execution_time, from_cache,
+                result_count, error 키를 가진 실행 기록
+        """
+        with self._lock:
+            self._records.append(record)
+
+            query = record['query']
+            agg = self._aggregates.get(query)
+            if agg is None:
+                agg = {
+                    'count': 0,
+                    'total_time': 0.0,
+                    'min_time': float('inf'),
+                    'max_time': 0.0,
+                    'cache_hits': 0,
+                    'total_results': 0,
+                    'error_count': 0,
+                    'histogram': [0] * len(LATENCY_BUCKETS),
+                }
+                self._aggregates[query] = agg
+                if len(self._aggregates) > self.max_queries:
+                    self._aggregates.popitem(last=False)
+            else:
+                self._aggregates.move_to_end(query)
+
+            execution_time = record['execution_time']
+            agg['count'] += 1
+            agg['total_time'] += execution_time
+            agg['min_time'] = min(agg['min_time'], execution_time)
+            agg['max_time'] = max(agg['max_time'], execution_time)
+            agg['cache_hits'] += 1 if record['from_cache'] else 0
+            agg['total_results'] += record['result_count']
+            agg['error_count'] += 1 if record['error'] else 0
+            agg['histogram'][bisect.bisect_left(LATENCY_BUCKETS, execution_time)] += 1
+
+    def _matching(self, query_pattern: Optional[str]) -> List[tuple]:
+        """패턴과 일치하는 쿼리의 집계 스냅샷 반환"""
+        regex = re.compile(query_pattern, re.IGNORECASE) if query_pattern else None
+        with self._lock:
+            return [
+                (query, dict(agg, histogram=list(agg['histogram'])))
+                for query, agg in self._aggregates.items()
+                if regex is None or regex.search(query)
+            ]
+
+    @staticmethod
+    def _percentile(agg: Dict[str, Any], fraction: float) -> float:
+        """히스토그램에서 백분위 실행 시간 추정 (해당 구간의 상한, 최대값으로 제한)"""
+        target = agg['count'] * fraction
+        cumulative = 0
+        for upper, bucket_count in zip(LATENCY_BUCKETS, agg['histogram']):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return min(upper, agg['max_time'])
+        return agg['max_time']
+
+    def stats(self, query_pattern: Optional[str] = None) -> pd.DataFrame:
+        """
+        쿼리별 누적 통계 반환
+
+        Args:
+            query_pattern (str, optional): 필터링할 쿼리 패턴 (정규식). 기본값은 None.
+
+        Returns:
+            pd.DataFrame: 쿼리별 평균/최소/최대 실행 시간, 실행 횟수, 캐시 히트율 등
+        """
+        rows = []
+        for query, agg in self._matching(query_pattern):
+            rows.append({
+                'query': query,
+                'avg_time': agg['total_time'] / agg['count'],
+                'min_time': agg['min_time'],
+                'max_time': agg['max_time'],
+                'count': agg['count'],
+                'cache_hit_rate': agg['cache_hits'] / agg['count'],
+                'avg_result_count': agg['total_results'] / agg['count'],
+                'error_count': agg['error_count'],
+                'p95_time': self._percentile(agg, 0.95),
+            })
+        return pd.DataFrame(rows, columns=STATS_COLUMNS)
+
+    def histogram(self, query_pattern: Optional[str] = None) -> pd.DataFrame:
+        """
+        쿼리별 실행 시간 히스토그램 반환
+
+        Args:
+            query_pattern (str, optional): 필터링할 쿼리 패턴 (정규식). 기본값은 None.
+
+        Returns:
+            pd.DataFrame: 행은 쿼리, 컬럼은 구간 상한('<=0.01s' 등)인 실행 횟수 표
+        """
+        columns = [f"<={upper}s" if upper != float('inf') else f">{LATENCY_BUCKETS[-2]}s" for upper in LATENCY_BUCKETS]
+        rows = {query: agg['histogram'] for query, agg in self._matching(query_pattern)}
+        return pd.DataFrame.from_dict(rows, orient='index', columns=columns)
+
+    def clear(self) -> None:
+        """모든 기록과 집계 삭제"""
+        with self._lock:
+            self._records.clear()
+            self._aggregates.clear()
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            return iter(list(self._records))
+
+    def __len__(self) -> int:
+        return len(self._records)
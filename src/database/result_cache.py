@@ -0,0 +1,512 @@
+"""
+쿼리 결과 캐시 모듈
+
+이 모듈은 QueryManager가 사용하는 쿼리 결과 캐시를 제공합니다.
+메모리 캐시(바이트 예산 기반 LRU/LFU)와 교체 가능한 파일 캐시 백엔드
+(Arrow IPC, Parquet, JSON)로 구성됩니다.
+"""
+
+import os
+import re
+import json
+import time
+import logging
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow 미설치 환경
+    pa = None
+    pa_ipc = None
+    pq = None
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+def estimate_size(data: Any) -> int:
+    """
+    캐시 항목의 메모리 사용량(바이트) 추정
+
+    Args:
+        data (Any): DataFrame 또는 딕셔너리 리스트
+
+    Returns:
+        int: 추정 바이트 수
+    """
+    if isinstance(data, pd.DataFrame):
+        return int(data.memory_usage(index=True, deep=True).sum())
+    if isinstance(data, list):
+        if not data:
+            return 64
+        # 앞쪽 일부 레코드의 크기로 전체 크기 추정
+        sample = data[:100]
+        sample_size = len(json.dumps(sample, default=str, ensure_ascii=False).encode('utf-8'))
+        return int(sample_size / len(sample) * len(data))
+    return len(str(data))
+
+class _CacheEntry:
+    """메모리 캐시 항목"""
+
+    __slots__ = ("timestamp", "data", "size", "ttl", "hits", "last_access")
+
+    def __init__(self, timestamp: float, data: Any, size: int, ttl: Optional[float]):
+        self.timestamp = timestamp
+        self.data = data
+        self.size = size
+        self.ttl = ttl
+        self.hits = 0
+        self.last_access = time.monotonic()
+
+    def expired(self, now: float, ttl: Optional[float] = None) -> bool:
+        """유효 시간 만료 여부 (ttl 인자가 없으면 저장 시 지정한 ttl 사용)"""
+        ttl = self.ttl if ttl is None else ttl
+        return ttl is not None and now - self.timestamp >= ttl
+
+class MemoryCache:
+    """
+    바이트 예산을 가진 메모리 캐시
+
+    항목 크기 합계가 max_bytes를 넘으면 정책에 따라 항목을 제거합니다.
+    - 'lru': 가장 오래 사용되지 않은 항목부터 제거
+    - 'lfu': 조회 횟수가 가장 적은 항목부터 제거 (동률이면 오래 사용되지 않은 항목)
+
+    sweep_interval을 지정하면 백그라운드 스레드가 주기적으로 만료 항목을 제거하므로,
+    다시 조회되지 않는 항목도 메모리에 남지 않습니다.
+    """
+
+    POLICIES = ('lru', 'lfu')
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, policy: str = 'lru',
+                 default_ttl: Optional[float] = None, sweep_interval: Optional[float] = None):
+        """
+        MemoryCache 초기화
+
+        Args:
+            max_bytes (int, optional): 최대 메모리 사용량(바이트). 기본값은 256MB.
+            policy (str, optional): 제거 정책 ('lru' 또는 'lfu'). 기본값은 'lru'.
+            default_ttl (float, optional): 항목별 ttl을 지정하지 않았을 때의 유효 시간(초).
+                기본값은 None (만료 없음).
+            sweep_interval (float, optional): 만료 항목 정리 주기(초). 기본값은 None.
+                None인 경우 백그라운드 정리를 하지 않습니다.
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown cache policy: {policy}")
+
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.default_ttl = default_ttl
+        self.current_bytes = 0
+        self._items: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "rejected": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweeper_stop = threading.Event()
+        if sweep_interval:
+            self.start_sweeper(sweep_interval)
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """
+        캐시 항목 조회
+
+        Args:
+            key (str): 캐시 키
+            ttl (float, optional): 유효 시간(초). None이면 저장 시 지정한 ttl을 사용합니다.
+
+        Returns:
+            Optional[Any]: 캐시된 데이터 또는 None
+        """
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            if entry.expired(time.time(), ttl):
+                self._remove(key)
+                self._stats["expirations"] += 1
+                self._stats["misses"] += 1
+                return None
+            entry.hits += 1
+            entry.last_access = time.monotonic()
+            self._items.move_to_end(key)
+            self._stats["hits"] += 1
+            return entry.data
+
+    def set(self, key: str, data: Any, timestamp: Optional[float] = None,
+            ttl: Optional[float] = None) -> bool:
+        """
+        캐시 항목 저장
+
+        Args:
+            key (str): 캐시 키
+            data (Any): 저장할 데이터
+            timestamp (float, optional): 저장 시각. 기본값은 현재 시각.
+            ttl (float, optional): 유효 시간(초). 기본값은 default_ttl.
+
+        Returns:
+            bool: 저장 여부 (예산보다 큰 항목은 저장하지 않음)
+        """
+        size = estimate_size(data)
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+            if size > self.max_bytes:
+                self._stats["rejected"] += 1
+                return False
+            self._items[key] = _CacheEntry(timestamp or time.time(), data, size,
+                                           self.default_ttl if ttl is None else ttl)
+            self.current_bytes += size
+            self._stats["sets"] += 1
+            while self.current_bytes > self.max_bytes:
+                self._remove(self._select_victim(exclude=key))
+                self._stats["evictions"] += 1
+            return True
+
+    def _select_victim(self, exclude: str) -> str:
+        """
+        제거할 항목의 키 선택 (잠금을 보유한 상태에서 호출)
+
+        방금 저장한 항목(exclude)은 조회 횟수가 0이므로 LFU 후보에서 제외합니다.
+        """
+        if self.policy == 'lfu':
+            candidates = [k for k in self._items if k != exclude]
+            return min(candidates, key=lambda k: (self._items[k].hits, self._items[k].last_access))
+        return next(iter(self._items))
+
+    def _remove(self, key: str) -> None:
+        """캐시 항목 제거 (잠금을 보유한 상태에서 호출)"""
+        entry = self._items.pop(key)
+        self.current_bytes -= entry.size
+
+    def delete(self, key: str) -> bool:
+        """
+        캐시 항목 삭제
+
+        Returns:
+            bool: 삭제 여부
+        """
+        with self._lock:
+            if key not in self._items:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self) -> None:
+        """모든 캐시 항목 삭제"""
+        with self._lock:
+            self._items.clear()
+            self.current_bytes = 0
+
+    def sweep(self) -> int:
+        """
+        만료된 항목 제거
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        now = time.time()
+        with self._lock:
+            expired = [key for key, entry in self._items.items() if entry.expired(now)]
+            for key in expired:
+                self._remove(key)
+            self._stats["expirations"] += len(expired)
+        return len(expired)
+
+    def start_sweeper(self, interval: float) -> None:
+        """
+        백그라운드 만료 항목 정리 스레드 시작
+
+        스레드는 캐시 객체를 약한 참조로만 가지므로, 캐시가 더 이상 사용되지 않으면
+        함께 종료됩니다.
+
+        Args:
+            interval (float): 정리 주기(초)
+        """
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+
+        cache_ref = weakref.ref(self)
+        stop_event = self._sweeper_stop
+        stop_event.clear()
+
+        def run() -> None:
+            while not stop_event.wait(interval):
+                cache = cache_ref()
+                if cache is None:
+                    return
+                try:
+                    removed = cache.sweep()
+                    if removed:
+                        logger.debug("Swept %d expired cache entries", removed)
+                except Exception as e:
+                    logger.warning(f"캐시 만료 항목 정리 실패: {str(e)}")
+                del cache
+
+        self._sweeper = threading.Thread(target=run, name="memory-cache-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        """백그라운드 만료 항목 정리 스레드 중지"""
+        self._sweeper_stop.set()
+        if self._sweeper is not None:
+            self._sweeper.join(timeout=1.0)
+            self._sweeper = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            Dict[str, Any]: 적중/실패/제거 횟수, 현재 크기 등
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({
+                "policy": self.policy,
+                "entries": len(self._items),
+                "current_bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            })
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def keys(self) -> Iterator[str]:
+        """캐시 키 목록 반환"""
+        with self._lock:
+            return iter(list(self._items.keys()))
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._items
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+class CacheBackend:
+    """
+    파일 캐시 백엔드 기본 클래스
+
+    하위 클래스는 파일 확장자와 DataFrame 직렬화/역직렬화 방법을 정의합니다.
+    모든 쓰기는 임시 파일에 기록한 뒤 원자적으로 이름을 바꾸므로, 여러 워커가
+    동시에 같은 키를 읽고 써도 쓰다 만 파일을 읽지 않습니다.
+    """
+
+    suffix = ".cache"
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        CacheBackend 초기화
+
+        Args:
+            cache_dir (Union[str, Path]): 캐시 디렉토리 경로
+        """
+        self.cache_dir = Path(cache_dir)
+
+    def path_for(self, key: str) -> Path:
+        """캐시 키에 해당하는 파일 경로 반환"""
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def get(self, key: str, ttl: float) -> Optional[Tuple[float, pd.DataFrame]]:
+        """
+        캐시 파일에서 결과 조회
+
+        Args:
+            key (str): 캐시 키
+            ttl (float): 유효 시간(초)
+
+        Returns:
+            Optional[Tuple[float, pd.DataFrame]]: (저장 시각, 결과) 또는 None
+        """
+        path = self.path_for(key)
+        try:
+            timestamp = self._read_timestamp(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"캐시 파일 읽기 실패: {str(e)}")
+            return None
+
+        if time.time() - timestamp >= ttl:
+            # 유효 기간이 지난 경우 캐시 파일 삭제
+            self._unlink(path)
+            return None
+
+        try:
+            return timestamp, self._read(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"캐시 파일 읽기 실패: {str(e)}")
+            return None
+
+    def set(self, key: str, df: pd.DataFrame) -> None:
+        """
+        결과를 캐시 파일에 원자적으로 저장
+
+        Args:
+            key (str): 캐시 키
+            df (pd.DataFrame): 저장할 결과
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_dir), prefix=f".{key}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            self._write(Path(tmp_path), df)
+            os.replace(tmp_path, self.path_for(key))
+        except BaseException:
+            self._unlink(Path(tmp_path))
+            raise
+
+    def clear(self, pattern: Optional[str] = None) -> int:
+        """
+        캐시 파일 삭제
+
+        Args:
+            pattern (str, optional): 삭제할 캐시 파일 이름 패턴 (정규식). 기본값은 None.
+
+        Returns:
+            int: 삭제된 파일 수
+        """
+        regex = re.compile(pattern) if pattern else None
+        deleted_count = 0
+        for cache_file in self.cache_dir.glob(f"*{self.suffix}"):
+            # 다른 백엔드의 파일(예: JSON 백엔드에서 본 *.arrow.cache)은 제외
+            if '.' in cache_file.name[:-len(self.suffix)]:
+                continue
+            if regex and not regex.search(cache_file.name):
+                continue
+            if self._unlink(cache_file):
+                deleted_count += 1
+        return deleted_count
+
+    @staticmethod
+    def _unlink(path: Path) -> bool:
+        """파일 삭제 (이미 없으면 False)"""
+        try:
+            path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _read_timestamp(self, path: Path) -> float:
+        """캐시 파일의 저장 시각 반환 (원자적 교체 시 보존되는 mtime 사용)"""
+        return path.stat().st_mtime
+
+    def _read(self, path: Path) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def _write(self, path: Path, df: pd.DataFrame) -> None:
+        raise NotImplementedError
+
+class ArrowCacheBackend(CacheBackend):
+    """
+    Arrow IPC 파일 캐시 백엔드
+
+    타입 스키마(datetime, Decimal 포함)를 보존하며, 읽을 때 메모리 맵으로 열어
+    숫자형 컬럼은 복사 없이 DataFrame으로 재구성합니다.
+    """
+
+    suffix = ".arrow.cache"
+
+    def _read(self, path: Path) -> pd.DataFrame:
+        with pa.memory_map(str(path), 'r') as source:
+            table = pa_ipc.open_file(source).read_all()
+        return table.to_pandas(split_blocks=True)
+
+    def _write(self, path: Path, df: pd.DataFrame) -> None:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(str(path), 'wb') as sink:
+            with pa_ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+class ParquetCacheBackend(CacheBackend):
+    """
+    Parquet 파일 캐시 백엔드
+
+    압축률이 높아 디스크 사용량이 작지만, 읽을 때 압축 해제 비용이 있습니다.
+    """
+
+    suffix = ".parquet.cache"
+
+    def _read(self, path: Path) -> pd.DataFrame:
+        return pq.read_table(str(path), memory_map=True).to_pandas(split_blocks=True)
+
+    def _write(self, path: Path, df: pd.DataFrame) -> None:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, str(path), compression='snappy')
+
+class JsonCacheBackend(CacheBackend):
+    """
+    JSON 파일 캐시 백엔드 (pyarrow 미설치 환경용)
+
+    기존 `{timestamp, data}` 형식과 호환됩니다. datetime/Decimal 값은 문자열로 저장됩니다.
+    """
+
+    suffix = ".cache"
+
+    def _read_timestamp(self, path: Path) -> float:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)['timestamp']
+
+    def _read(self, path: Path) -> pd.DataFrame:
+        with open(path, 'r', encoding='utf-8') as f:
+            return pd.DataFrame(json.load(f)['data'])
+
+    def _write(self, path: Path, df: pd.DataFrame) -> None:
+        cached_item = {
+            'timestamp': time.time(),
+            'data': df.to_dict(orient='records')
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(cached_item, f, ensure_ascii=False, default=str)
+
+CACHE_BACKENDS: Dict[str, type] = {
+    'arrow': ArrowCacheBackend,
+    'parquet': ParquetCacheBackend,
+    'json': JsonCacheBackend,
+}
+
+def create_cache_backend(backend: Union[str, CacheBackend, None],
+                         cache_dir: Union[str, Path]) -> CacheBackend:
+    """
+    캐시 백엔드 생성
+
+    Args:
+        backend (Union[str, CacheBackend, None]): 백엔드 이름('arrow', 'parquet', 'json')
+            또는 CacheBackend 인스턴스. None인 경우 pyarrow가 설치되어 있으면 'arrow',
+            아니면 'json'을 사용합니다.
+        cache_dir (Union[str, Path]): 캐시 디렉토리 경로
+
+    Returns:
+        CacheBackend: 캐시 백엔드
+
+    Raises:
+        ValueError: 알 수 없는 백엔드 이름인 경우
+    """
+    if isinstance(backend, CacheBackend):
+        return backend
+
+    name = backend or ('arrow' if pa is not None else 'json')
+    if name not in CACHE_BACKENDS:
+        raise ValueError(f"Unknown cache backend: {name}")
+    if name != 'json' and pa is None:
+        logger.warning("pyarrow가 설치되어 있지 않아 JSON 캐시 백엔드를 사용합니다.")
+        name = 'json'
+    return CACHE_BACKENDS[name](cache_dir)
@@ -0,0 +1,392 @@
+"""
+일 단위 롤업 테이블 모듈
+
+이 모듈은 분석 API가 원본 로그 대신 읽을 플레이어별·일별 요약 테이블을
+MariaDB 안에 유지합니다.
+
+- player_daily_activity: 플레이어·일자별 게임 횟수, 순 배팅액, 입금 횟수, 입금액
+  (game_logs, deposits)
+- user_daily_scores: 사용자(userId)·일자별 유효 게임 수, 유효 배팅액 (game_scores 중 netBet > 0)
+
+원본 테이블별로 마지막으로 반영한 위치(워터마크)를 rollup_watermarks 테이블에 기록하고,
+refresh()를 실행할 때마다 그 이후의 행만 서버에서 INSERT ... SELECT ... GROUP BY로
+집계해 ON DUPLICATE KEY UPDATE로 더합니다. 집계 반영과 워터마크 갱신은 하나의
+트랜잭션이므로 실패한 원본은 다음 실행에서 다시 반영됩니다.
+
+타임스탬프 기준 원본은 아직 커밋되지 않았을 수 있는 최근 행을 safety_lag_seconds만큼
+다음 실행으로 미룹니다. 워터마크보다 이전 시각으로 늦게 들어온 행은 반영되지 않으므로
+rebuild()로 전체를 다시 적재해야 합니다.
+
+id 기준 원본(game_scores)은 시각 컬럼이 없어 지연을 둘 수 없으므로, 새 행이 있으면
+워터마크 아래 id_rescan_window개 id까지 다시 읽어 해당 (userId, 일자) 롤업 행을
+더하지 않고 처음부터 다시 계산합니다. 그래서 id 순서와 다르게 늦게 커밋된 행과 이 구간
+안에서 수정된 행도 반영됩니다. 이 구간보다 오래된 행의 수정은 rebuild()가 필요합니다.
+다시 계산할 (userId, 일자) 행은 game_scores의 (userId, gameDate) 인덱스로 찾으므로
+create_tables()가 ensure_source_indexes()로 이 인덱스를 함께 만듭니다.
+
+원본별 집계 정의에는 버전(RollupSource.version)이 있습니다. 집계 SQL의 의미를 바꾸면
+버전을 올리고, refresh()는 rollup_versions에 기록된 버전과 다른 원본을 먼저 다시 적재합니다.
+"""
+
+import time
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set
+
+from src.database.sql_script import split_statements
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 초기 워터마크 (첫 실행 시 전체 이력 적재)
+_EPOCH = "1970-01-01 00:00:00"
+
+# id 기준 원본에서 워터마크 아래로 다시 읽는 id 개수
+DEFAULT_ID_RESCAN_WINDOW = 10000
+
+# rollup_versions에 기록이 없는 원본의 버전 (버전 관리 도입 전에 적재된 롤업)
+_INITIAL_VERSION = '1'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rollup_watermarks (
+    source VARCHAR(64) NOT NULL PRIMARY KEY,
+    value VARCHAR(32) NOT NULL,
+    updated_at DATETIME NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rollup_versions (
+    source VARCHAR(64) NOT NULL PRIMARY KEY,
+    version VARCHAR(32) NOT NULL,
+    updated_at DATETIME NOT NULL
+);
+CREATE TABLE IF NOT EXISTS player_daily_activity (
+    player_id BIGINT NOT NULL,
+    day DATE NOT NULL,
+    play_count INT NOT NULL DEFAULT 0,
+    net_bet DECIMAL(20, 2) NOT NULL DEFAULT 0,
+    deposit_count INT NOT NULL DEFAULT 0,
+    deposit_amount DECIMAL(20, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (player_id, day),
+    KEY idx_player_daily_activity_day (day)
+);
+CREATE TABLE IF NOT EXISTS user_daily_scores (
+    userId VARCHAR(64) NOT NULL,
+    day DATE NOT NULL,
+    game_count INT NOT NULL DEFAULT 0,
+    net_bet DECIMAL(20, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (userId, day),
+    KEY idx_user_daily_scores_day (day)
+);
+"""
+
+# 증분 재계산이 원본 테이블을 전체 스캔하지 않도록 필요한 인덱스 (MariaDB 10.1.4 이상)
+_SOURCE_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_game_scores_user_date ON game_scores (userId, gameDate);
+"""
+
+def ensure_source_indexes(db_connection) -> None:
+    """
+    증분 재계산에 필요한 원본 테이블 인덱스 생성 (이미 있으면 유지)
+
+    game_scores는 기본 키(id) 외에 인덱스가 없으므로, id 구간에 나온 (userId, gameDate)의
+    전체 행을 다시 집계하려면 (userId, gameDate) 인덱스가 필요합니다.
+    롤업(DailyRollups)과 특성 저장소(PlayerFeatureStore)가 함께 사용합니다.
+
+    Args:
+        db_connection: execute()를 제공하는 데이터베이스 연결 객체
+    """
+    for statement in split_statements(_SOURCE_INDEXES):
+        db_connection.execute(statement)
+
+class RollupSource(NamedTuple):
+    """롤업에 반영하는 원본 테이블 정의"""
+    name: str
+    # 'timestamp'이면 시각 기준, 'id'이면 자동 증가 id 기준 워터마크
+    kind: str
+    upper_sql: str
+    refresh_sql: str
+    # refresh_sql 전에 같은 (lower, upper) 파라미터로 실행 (다시 계산할 롤업 행 삭제)
+    delete_sql: Optional[str] = None
+    # 집계 정의 버전 (바꾸면 다음 refresh()에서 해당 원본을 다시 적재)
+    version: str = _INITIAL_VERSION
+
+ROLLUP_SOURCES: Dict[str, RollupSource] = {
+    'game_logs': RollupSource(
+        name='game_logs',
+        kind='timestamp',
+        upper_sql="SELECT DATE_SUB(NOW(), INTERVAL %s SECOND)",
+        refresh_sql="""
+            INSERT INTO player_daily_activity (player_id, day, play_count, net_bet)
+            SELECT player, DATE(played_at), COUNT(*), IFNULL(SUM(net_bet), 0)
+            FROM game_logs
+            WHERE played_at > %s AND played_at <= %s
+            GROUP BY player, DATE(played_at)
+            ON DUPLICATE KEY UPDATE
+                play_count = play_count + VALUES(play_count),
+                net_bet = net_bet + VALUES(net_bet)
+        """,
+    ),
+    'deposits': RollupSource(
+        name='deposits',
+        kind='timestamp',
+        upper_sql="SELECT DATE_SUB(NOW(), INTERVAL %s SECOND)",
+        refresh_sql="""
+            INSERT INTO player_daily_activity (player_id, day, deposit_count, deposit_amount)
+            SELECT player_id, DATE(deposit_date), COUNT(*), IFNULL(SUM(amount), 0)
+            FROM deposits
+            WHERE deposit_date > %s AND deposit_date <= %s
+            GROUP BY player_id, DATE(deposit_date)
+            ON DUPLICATE KEY UPDATE
+                deposit_count = deposit_count + VALUES(deposit_count),
+                deposit_amount = deposit_amount + VALUES(deposit_amount)
+        """,
+    ),
+    'game_scores': RollupSource(
+        name='game_scores',
+        kind='id',
+        upper_sql="SELECT MAX(id) FROM game_scores",
+        # 2: netBet > 0인 행만 집계
+        version='2',
+        # id 구간에 행이 있는 (userId, 일자)는 원본 전체에서 다시 계산 (구간을 다시 읽어도 중복 합산 없음)
+        delete_sql="""
+            DELETE d FROM user_daily_scores d
+            JOIN (
+                SELECT DISTINCT userId, gameDate FROM game_scores
+                WHERE id > %s AND id <= %s
+            ) changed ON changed.userId = d.userId AND changed.gameDate = d.day
+        """,
+        refresh_sql="""
+            INSERT INTO user_daily_scores (userId, day, game_count, net_bet)
+            SELECT s.userId, s.gameDate, COUNT(*), IFNULL(SUM(s.netBet), 0)
+            FROM game_scores s
+            JOIN (
+                SELECT DISTINCT userId, gameDate FROM game_scores
+                WHERE id > %s AND id <= %s
+            ) changed ON changed.userId = s.userId AND changed.gameDate = s.gameDate
+            WHERE s.netBet > 0
+            GROUP BY s.userId, s.gameDate
+            ON DUPLICATE KEY UPDATE
+                game_count = VALUES(game_count),
+                net_bet = VALUES(net_bet)
+        """,
+    ),
+}
+
+def _format_watermark(value: Any) -> str:
+    """워터마크 값을 rollup_watermarks 저장용 문자열로 변환"""
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    return str(value)
+
+def _with_shared_sources(sources: Sequence[str]) -> Set[str]:
+    """같은 롤업 테이블을 채우는 원본까지 포함한 이름 집합 (game_logs와 deposits)"""
+    names = set(sources)
+    if names & {'game_logs', 'deposits'}:
+        names |= {'game_logs', 'deposits'}
+    return names
+
+class DailyRollups:
+    """
+    원본 테이블의 증분만 반영하는 일 단위 롤업 테이블 관리자
+
+    refresh()로 새 행을 롤업에 반영하고, 분석 API는 롤업 테이블을 직접 조회합니다.
+    DB 접근에는 연결 객체의 get_connection()(트랜잭션)과 execute()를 사용합니다.
+    """
+
+    def __init__(self, db_connection, safety_lag_seconds: int = 60,
+                 id_rescan_window: int = DEFAULT_ID_RESCAN_WINDOW):
+        """
+        DailyRollups 초기화
+
+        Args:
+            db_connection: get_connection()과 execute()를 제공하는 데이터베이스 연결 객체
+                (MariaDBConnection)
+            safety_lag_seconds (int, optional): 타임스탬프 기준 원본에서 최근 행을
+                다음 실행으로 미루는 지연 시간(초). 기본값은 60.
+            id_rescan_window (int, optional): id 기준 원본에서 워터마크 아래로 다시 읽는
+                id 개수. 기본값은 DEFAULT_ID_RESCAN_WINDOW.
+        """
+        self.db = db_connection
+        self.safety_lag_seconds = safety_lag_seconds
+        self.id_rescan_window = id_rescan_window
+        self._schema_ready = False
+
+    def create_tables(self) -> None:
+        """롤업 테이블, 워터마크 테이블과 원본 인덱스 생성 (이미 있으면 유지)"""
+        for statement in split_statements(_SCHEMA):
+            self.db.execute(statement)
+        ensure_source_indexes(self.db)
+        self._schema_ready = True
+
+    def get_watermarks(self) -> Dict[str, str]:
+        """
+        원본 테이블별 워터마크 조회
+
+        Returns:
+            Dict[str, str]: 원본 테이블 이름과 마지막으로 반영한 위치
+                (game_scores는 id, 나머지는 타임스탬프)
+        """
+        rows = self.db.query("SELECT source, value FROM rollup_watermarks")
+        return {row['source']: row['value'] for row in rows}
+
+    def get_versions(self) -> Dict[str, str]:
+        """
+        rollup_versions에 기록된 버전 조회
+
+        Returns:
+            Dict[str, str]: 이름과 버전 (롤업 원본과 HighValueSnapshot 같은 파생 테이블)
+        """
+        rows = self.db.query("SELECT source, version FROM rollup_versions")
+        return {row['source']: row['version'] for row in rows}
+
+    def set_version(self, name: str, version: str) -> None:
+        """
+        버전 기록
+
+        Args:
+            name (str): 롤업 원본 또는 파생 테이블 이름
+            version (str): 버전
+        """
+        self.db.execute(
+            "INSERT INTO rollup_versions (source, version, updated_at) VALUES (%s, %s, NOW()) "
+            "ON DUPLICATE KEY UPDATE version = VALUES(version), updated_at = VALUES(updated_at)",
+            (name, version)
+        )
+
+    def refresh(self, sources: Optional[Sequence[str]] = None) -> Dict[str, int]:
+        """
+        마지막 실행 이후 추가된 원본 행을 롤업 테이블에 반영
+
+        rollup_versions에 기록된 버전이 집계 정의 버전과 다른 원본(같은 테이블을 채우는
+        원본 포함)은 먼저 비우고 전체 이력을 다시 적재합니다.
+
+        Args:
+            sources (Sequence[str], optional): 반영할 원본 테이블 이름.
+                기본값은 ROLLUP_SOURCES 전체.
+
+        Returns:
+            Dict[str, int]: 원본 테이블별 영향받은 롤업 행 수 (건너뛴 원본은 0)
+
+        Raises:
+            ValueError: 알 수 없는 원본 이름인 경우
+        """
+        names = self._resolve_sources(sources)
+        if not self._schema_ready:
+            self.create_tables()
+
+        # 집계 정의가 바뀐 원본은 비운 뒤 전체 이력을 다시 적재
+        versions = self.get_versions()
+        outdated = [name for name in ROLLUP_SOURCES if name in _with_shared_sources(names)
+                    and versions.get(name, _INITIAL_VERSION) != ROLLUP_SOURCES[name].version]
+        if outdated:
+            logger.warning("Rollup definition changed for %s; reloading full history", ', '.join(outdated))
+            reset = self._reset(outdated)
+            names = [name for name in ROLLUP_SOURCES if name in reset or name in names]
+
+        counts = {}
+        for name in names:
+            counts[name] = self._refresh_source(ROLLUP_SOURCES[name])
+        return counts
+
+    @staticmethod
+    def _resolve_sources(sources: Optional[Sequence[str]]) -> List[str]:
+        """원본 이름 검증 (ROLLUP_SOURCES 순서로 반환)"""
+        if sources is None:
+            return list(ROLLUP_SOURCES)
+        unknown = [name for name in sources if name not in ROLLUP_SOURCES]
+        if unknown:
+            raise ValueError(f"Unknown rollup source(s): {', '.join(unknown)}")
+        return [name for name in ROLLUP_SOURCES if name in sources]
+
+    def _refresh_source(self, source: RollupSource) -> int:
+        """원본 하나의 증분 반영과 워터마크 갱신을 하나의 트랜잭션으로 실행"""
+        initial = _EPOCH if source.kind == 'timestamp' else '0'
+        start_time = time.time()
+
+        with self.db.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                # 워터마크 행을 잠가 동시에 실행된 refresh가 같은 구간을 두 번 더하지 않도록 함
+                cursor.execute(
+                    "INSERT IGNORE INTO rollup_watermarks (source, value, updated_at) VALUES (%s, %s, NOW())",
+                    (source.name, initial)
+                )
+                cursor.execute("SELECT value FROM rollup_watermarks WHERE source = %s FOR UPDATE",
+                               (source.name,))
+                lower = cursor.fetchone()[0]
+
+                if source.kind == 'timestamp':
+                    cursor.execute(source.upper_sql, (self.safety_lag_seconds,))
+                else:
+                    cursor.execute(source.upper_sql)
+                upper = cursor.fetchone()[0]
+
+                if upper is None or (source.kind == 'id' and int(upper) <= int(lower)):
+                    conn.rollback()
+                    logger.debug("Rollup source %s has no new rows", source.name)
+                    return 0
+
+                if source.kind == 'id':
+                    # 늦게 커밋되거나 수정된 행을 반영하도록 워터마크 아래 구간도 다시 계산
+                    lower, upper = max(int(lower) - self.id_rescan_window, 0), int(upper)
+                else:
+                    upper = _format_watermark(upper)
+
+                if source.delete_sql:
+                    cursor.execute(source.delete_sql, (lower, upper))
+                cursor.execute(source.refresh_sql, (lower, upper))
+                affected_rows = cursor.rowcount
+                cursor.execute(
+                    "UPDATE rollup_watermarks SET value = %s, updated_at = NOW() WHERE source = %s",
+                    (_format_watermark(upper), source.name)
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+        logger.info("Rollup source %s refreshed (%s, %s] in %.2fs: %d rows affected",
+                    source.name, lower, upper, time.time() - start_time, affected_rows)
+        return affected_rows
+
+    def rebuild(self, sources: Optional[Sequence[str]] = None) -> Dict[str, int]:
+        """
+        롤업과 워터마크를 비우고 원본 전체를 다시 적재
+
+        player_daily_activity는 game_logs와 deposits가 함께 채우므로 둘 중 하나만
+        지정해도 두 원본을 모두 다시 적재합니다.
+
+        Args:
+            sources (Sequence[str], optional): 다시 적재할 원본 테이블 이름.
+                기본값은 ROLLUP_SOURCES 전체.
+
+        Returns:
+            Dict[str, int]: refresh() 결과
+
+        Raises:
+            ValueError: 알 수 없는 원본 이름인 경우
+        """
+        names = self._resolve_sources(sources)
+        if not self._schema_ready:
+            self.create_tables()
+        reset = self._reset(names)
+        return self.refresh([name for name in ROLLUP_SOURCES if name in reset])
+
+    def _reset(self, sources: Sequence[str]) -> Set[str]:
+        """롤업 테이블과 워터마크를 비우고 현재 버전을 기록 (테이블을 공유하는 원본까지 포함한 이름 반환)"""
+        names = _with_shared_sources(sources)
+
+        tables: List[str] = []
+        if names & {'game_logs', 'deposits'}:
+            tables.append('player_daily_activity')
+        if 'game_scores' in names:
+            tables.append('user_daily_scores')
+
+        for table in tables:
+            self.db.execute(f"TRUNCATE TABLE {table}")
+        placeholders = ', '.join(['%s'] * len(names))
+        self.db.execute(f"DELETE FROM rollup_watermarks WHERE source IN ({placeholders})", tuple(sorted(names)))
+        for name in sorted(names):
+            self.set_version(name, ROLLUP_SOURCES[name].version)
+        return names
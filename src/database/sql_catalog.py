@@ -0,0 +1,365 @@
+"""
+SQL 카탈로그 모듈
+
+이 모듈은 queries/ 디렉토리의 .sql 파일을 한 번 읽어 이름 있는 파라미터 쿼리로 보관합니다.
+
+- 이름: '-- name: 이름' 섹션의 문장은 섹션 이름으로, 섹션이 없고 문장이 하나뿐인 파일은
+  확장자를 뺀 상대 경로(예: 'user/get_user_name')로 등록합니다. 이름이 겹치면 오류입니다.
+- 파라미터: ':이름' 또는 위치 기반 '?'를 사용하며 한 문장에서 섞어 쓸 수 없습니다.
+  로드할 때 자리표시자를 검사하고, 실행할 때 누락/미사용 파라미터를 오류로 처리합니다.
+- 다시 읽기: check_interval 초마다 파일 수정 시각을 확인해 바뀐 파일만 다시 파싱합니다.
+
+문장은 드라이버의 qmark('?') 형식으로 변환되어 MariaDBConnection.query_named()에서
+서버 측 prepared statement로 실행됩니다.
+"""
+
+import os
+import re
+import time
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .sql_script import parse_script
+
+# 프로젝트 루트 디렉토리 설정
+project_root = Path(__file__).parent.parent.parent
+
+DEFAULT_QUERY_DIR = project_root / "queries"
+
+PARAMETER_NAME = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+class CatalogError(ValueError):
+    """카탈로그 로드(중복 이름, 잘못된 자리표시자) 및 파라미터 바인딩 오류"""
+    pass
+
+def compile_placeholders(sql: str, paramstyle: str = 'qmark') -> Tuple[str, List[str], int]:
+    """
+    ':이름' 자리표시자를 드라이버 형식으로 변환
+
+    문자열/식별자 리터럴과 '::', ':='는 자리표시자로 보지 않습니다.
+
+    Args:
+        sql (str): 주석이 제거된 SQL 문 (parse_script 결과)
+        paramstyle (str, optional): 'qmark'('?') 또는 'format'('%s', 리터럴 %는 %%로 변환).
+            기본값은 'qmark'.
+
+    Returns:
+        Tuple[str, List[str], int]: 변환된 SQL, 등장 순서의 파라미터 이름, 위치 기반 '?' 개수
+
+    Raises:
+        CatalogError: 이름 있는 자리표시자와 '?'를 섞어 쓴 경우
+    """
+    if paramstyle not in ('qmark', 'format'):
+        raise ValueError(f"Unsupported paramstyle: {paramstyle}")
+    marker = '?' if paramstyle == 'qmark' else '%s'
+
+    parts: List[str] = []
+    names: List[str] = []
+    positional = 0
+    i = 0
+    n = len(sql)
+    while i < n:
+        char = sql[i]
+        if char in ("'", '"', '`'):
+            j = i + 1
+            while j < n:
+                if sql[j] == '\\' and char != '`':
+                    j += 2
+                    continue
+                if sql[j] == char:
+                    if j + 1 < n and sql[j + 1] == char:
+                        j += 2
+                        continue
+                    break
+                j += 1
+            parts.append(sql[i:j + 1])
+            i = j + 1
+            continue
+        if char == ':' and (i == 0 or sql[i - 1] != ':'):
+            match = PARAMETER_NAME.match(sql, i + 1)
+            if match:
+                names.append(match.group(0))
+                parts.append(marker)
+                i = match.end()
+                continue
+        if char == '?':
+            positional += 1
+            parts.append(marker)
+            i += 1
+            continue
+        parts.append(char)
+        i += 1
+
+    if names and positional:
+        raise CatalogError("Named (:name) and positional (?) placeholders cannot be mixed")
+
+    compiled = ''.join(parts)
+    if paramstyle == 'format':
+        # '%s' 자리표시자를 제외한 모든 %를 이스케이프
+        compiled = '%s'.join(segment.replace('%', '%%') for segment in compiled.split('%s'))
+    return compiled, names, positional
+
+class NamedQuery(NamedTuple):
+    """카탈로그에 등록된 파라미터 쿼리"""
+    name: str
+    sql: str
+    params: Tuple[str, ...]
+    positional: int
+    source: str
+    line: int
+
+    def bind(self, params: Optional[Union[Mapping[str, Any], Sequence[Any]]] = None,
+             paramstyle: str = 'qmark') -> Tuple[str, Tuple[Any, ...]]:
+        """
+        파라미터를 검사하고 드라이버에 전달할 (SQL, 값 튜플) 반환
+
+        Args:
+            params (Union[Mapping[str, Any], Sequence[Any]], optional): 이름 있는 자리표시자는
+                딕셔너리, '?' 자리표시자는 시퀀스. 기본값은 None.
+            paramstyle (str, optional): 'qmark' 또는 'format'. 기본값은 'qmark'.
+
+        Returns:
+            Tuple[str, Tuple[Any, ...]]: SQL 문과 파라미터 값
+
+        Raises:
+            CatalogError: 파라미터가 누락되었거나 사용되지 않는 파라미터가 있는 경우
+        """
+        sql = self.sql if paramstyle == 'qmark' else compile_placeholders(self.sql, paramstyle)[0]
+
+        if self.params:
+            if not isinstance(params, Mapping):
+                raise CatalogError(f"Query {self.name} expects named parameters: {sorted(set(self.params))}")
+            missing = set(self.params) - set(params)
+            unused = set(params) - set(self.params)
+            if missing or unused:
+                raise CatalogError(f"Query {self.name}: missing parameters {sorted(missing)}, "
+                                   f"unexpected parameters {sorted(unused)}")
+            return sql, tuple(params[name] for name in self.params)
+
+        if isinstance(params, Mapping):
+            if params:
+                raise CatalogError(f"Query {self.name} has no named parameters: {sorted(params)}")
+            params = ()
+        values = tuple(params or ())
+        if len(values) != self.positional:
+            raise CatalogError(f"Query {self.name} expects {self.positional} parameters, got {len(values)}")
+        return sql, values
+
+class SqlCatalog:
+    """
+    queries/ 디렉토리의 이름 있는 SQL 문 카탈로그
+
+    스레드 안전하며, 조회 시 check_interval이 지났으면 변경된 파일만 다시 읽습니다.
+    """
+
+    def __init__(self, query_dir: Optional[Union[str, Path]] = None, check_interval: Optional[float] = 2.0):
+        """
+        SqlCatalog 초기화 (모든 파일을 즉시 로드)
+
+        Args:
+            query_dir (Union[str, Path], optional): 쿼리 디렉토리. 기본값은 None.
+                None인 경우 project_root/queries를 사용합니다.
+            check_interval (float, optional): 파일 변경 확인 주기(초). 기본값은 2.
+                0이면 조회할 때마다, None이면 다시 읽지 않습니다.
+
+        Raises:
+            CatalogError: 이름 중복 또는 잘못된 자리표시자가 있는 경우
+        """
+        self.query_dir = Path(query_dir) if query_dir is not None else DEFAULT_QUERY_DIR
+        self.check_interval = check_interval
+        self._lock = threading.RLock()
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._queries: Dict[str, NamedQuery] = {}
+        self._last_check = 0.0
+        self.reload_count = 0
+        self.refresh(force=True)
+
+    def _scan(self) -> Dict[str, float]:
+        """디렉토리의 .sql 파일과 수정 시각"""
+        if not self.query_dir.is_dir():
+            return {}
+        return {
+            path.relative_to(self.query_dir).with_suffix('').as_posix(): path.stat().st_mtime
+            for path in sorted(self.query_dir.rglob('*.sql'))
+        }
+
+    def _parse_file(self, key: str) -> Dict[str, Any]:
+        """파일 하나를 읽어 문장 목록으로 파싱"""
+        path = self.query_dir / f"{key}.sql"
+        text = path.read_text(encoding='utf-8')
+        statements = parse_script(text)
+
+        queries: Dict[str, NamedQuery] = {}
+        for statement in statements:
+            if statement.section is not None:
+                name = statement.section
+            elif len(statements) == 1:
+                name = key
+            else:
+                # 이름 없는 다중 문장 파일의 문장은 스크립트로만 사용
+                continue
+            if name in queries:
+                raise CatalogError(f"Duplicate query name {name!r} in {path} (line {statement.line})")
+            try:
+                sql, names, positional = compile_placeholders(statement.sql)
+            except CatalogError as e:
+                raise CatalogError(f"{path}:{statement.line}: {e}") from e
+            queries[name] = NamedQuery(name, sql, tuple(names), positional, key, statement.line)
+
+        return {'mtime': path.stat().st_mtime, 'text': text, 'queries': queries}
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        변경된 파일 다시 읽기
+
+        파싱에 실패한 파일은 이전 내용을 유지하고 오류를 기록합니다 (최초 로드에서는 예외 발생).
+
+        Args:
+            force (bool, optional): check_interval과 무관하게 확인할지 여부. 기본값은 False.
+
+        Returns:
+            bool: 카탈로그가 바뀌었는지 여부
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and (self.check_interval is None or now - self._last_check < self.check_interval):
+                return False
+            self._last_check = now
+
+            initial = not self._files
+            current = self._scan()
+            files = {key: entry for key, entry in self._files.items() if key in current}
+            changed = len(files) != len(self._files)
+
+            for key, mtime in current.items():
+                entry = files.get(key)
+                if entry is not None and entry['mtime'] == mtime:
+                    continue
+                try:
+                    files[key] = self._parse_file(key)
+                    changed = True
+                except (OSError, ValueError) as e:
+                    if initial:
+                        raise
+                    logger.error("Failed to reload query file %s: %s", key, str(e))
+
+            if not changed:
+                return False
+
+            queries: Dict[str, NamedQuery] = {}
+            for key, entry in files.items():
+                for name, query in entry['queries'].items():
+                    if name in queries:
+                        error = (f"Query name {name!r} is defined in both {queries[name].source}.sql "
+                                 f"and {key}.sql")
+                        if initial:
+                            raise CatalogError(error)
+                        logger.error(error)
+                        continue
+                    queries[name] = query
+
+            self._files = files
+            self._queries = queries
+            self.reload_count += 1
+            logger.debug("Loaded %d named queries from %d files in %s", len(queries), len(files), self.query_dir)
+            return True
+
+    def get(self, name: str) -> NamedQuery:
+        """
+        이름으로 쿼리 조회
+
+        Args:
+            name (str): 섹션 이름 또는 파일 상대 경로(확장자 제외)
+
+        Returns:
+            NamedQuery: 파라미터 쿼리
+
+        Raises:
+            KeyError: 등록되지 않은 이름
+        """
+        self.refresh()
+        with self._lock:
+            try:
+                return self._queries[name]
+            except KeyError:
+                raise KeyError(f"Unknown query name: {name}") from None
+
+    def __contains__(self, name: str) -> bool:
+        self.refresh()
+        with self._lock:
+            return name in self._queries
+
+    def names(self) -> List[str]:
+        """등록된 쿼리 이름 목록"""
+        self.refresh()
+        with self._lock:
+            return sorted(self._queries)
+
+    def source(self, path: str) -> str:
+        """
+        파일 원문 조회 (템플릿 및 스크립트용)
+
+        Args:
+            path (str): queries/ 기준 상대 경로 ('.sql' 생략 가능)
+
+        Returns:
+            str: 파일 내용
+
+        Raises:
+            KeyError: 카탈로그에 없는 파일
+        """
+        key = path[:-4] if path.endswith('.sql') else path
+        self.refresh()
+        with self._lock:
+            try:
+                return self._files[key]['text']
+            except KeyError:
+                raise KeyError(f"Unknown query file: {path}") from None
+
+_catalogs: Dict[str, SqlCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+def get_catalog(query_dir: Optional[Union[str, Path]] = None) -> SqlCatalog:
+    """
+    디렉토리별 공유 카탈로그 조회 (처음 호출할 때 로드)
+
+    Args:
+        query_dir (Union[str, Path], optional): 쿼리 디렉토리. 기본값은 None (project_root/queries).
+
+    Returns:
+        SqlCatalog: 공유 카탈로그
+    """
+    key = os.path.abspath(query_dir if query_dir is not None else DEFAULT_QUERY_DIR)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = SqlCatalog(key)
+            _catalogs[key] = catalog
+        return catalog
+
+def run_named_query(db: Any, name: str, params: Optional[Union[Mapping[str, Any], Sequence[Any]]] = None,
+                    catalog: Optional[SqlCatalog] = None) -> List[Dict[str, Any]]:
+    """
+    연결 객체로 이름 있는 쿼리 실행
+
+    query_named()를 지원하는 연결(MariaDBConnection)은 prepared statement 캐시를 사용하고,
+    그 밖의 연결(pymysql 기반 DatabaseConnection, 모의 연결)은 '%s' 형식으로 바인딩해 query()로 실행합니다.
+
+    Args:
+        db (Any): 데이터베이스 연결 객체
+        name (str): 쿼리 이름
+        params (Union[Mapping[str, Any], Sequence[Any]], optional): 쿼리 파라미터. 기본값은 None.
+        catalog (SqlCatalog, optional): query_named()가 없는 연결에 사용할 카탈로그. 기본값은 None.
+
+    Returns:
+        List[Dict[str, Any]]: 쿼리 결과
+    """
+    if hasattr(db, 'query_named'):
+        return db.query_named(name, params)
+    sql, values = (catalog or get_catalog()).get(name).bind(params, paramstyle='format')
+    return db.query(sql, values)
@@ -0,0 +1,175 @@
+"""
+SQL 스크립트 분석 모듈
+
+이 모듈은 여러 SQL 문이 들어 있는 스크립트를 실행 가능한 개별 문장으로 나눕니다.
+단순히 ';'로 자르지 않고 문자열 리터럴('...', "...", `...`), 주석(--, #, /* */),
+mysql 클라이언트의 DELIMITER 명령을 인식하므로, 문자열이나 주석 안의 ';'에서
+문장이 잘리지 않습니다.
+
+'-- name: 섹션이름' 주석으로 스크립트를 이름 있는 섹션으로 나눌 수 있으며,
+각 문장은 자신이 속한 섹션 이름과 시작 줄 번호를 함께 가집니다.
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+SECTION_PATTERN = re.compile(r'^--\s*name\s*:\s*(\S+)\s*$', re.IGNORECASE)
+DELIMITER_PATTERN = re.compile(r'^[ \t]*DELIMITER[ \t]+(\S+)[ \t]*$', re.IGNORECASE | re.MULTILINE)
+
+class SqlStatement(NamedTuple):
+    """스크립트에서 분리한 SQL 문"""
+    sql: str
+    section: Optional[str]
+    line: int
+
+class ScriptParseError(ValueError):
+    """닫히지 않은 문자열/주석 등 스크립트 구문 오류"""
+    pass
+
+def parse_script(script: str) -> List[SqlStatement]:
+    """
+    SQL 스크립트를 문장 단위로 분리
+
+    주석은 문장 텍스트에서 제거되지만 실행 주석(/*! ... */)과 옵티마이저 힌트(/*+ ... */)는
+    유지합니다. 주석만 있는 조각은 문장으로 반환하지 않습니다.
+
+    Args:
+        script (str): SQL 스크립트
+
+    Returns:
+        List[SqlStatement]: 문장 목록 (SQL, 섹션 이름, 시작 줄 번호)
+
+    Raises:
+        ScriptParseError: 문자열이나 블록 주석이 닫히지 않은 경우
+    """
+    statements: List[SqlStatement] = []
+    delimiter = ';'
+    section: Optional[str] = None
+    buffer: List[str] = []
+    has_code = False
+    start_line = 1
+    line = 1
+    i = 0
+    n = len(script)
+
+    def flush() -> None:
+        nonlocal buffer, has_code
+        sql = ''.join(buffer).strip()
+        if has_code and sql:
+            statements.append(SqlStatement(sql, section, start_line))
+        buffer = []
+        has_code = False
+
+    while i < n:
+        at_line_start = i == 0 or script[i - 1] == '\n'
+
+        # DELIMITER 명령 (문장 시작 위치의 줄 전체)
+        if at_line_start and not has_code:
+            match = DELIMITER_PATTERN.match(script, i)
+            if match:
+                delimiter = match.group(1)
+                i = match.end()
+                continue
+
+        char = script[i]
+
+        # 문자열/식별자 리터럴
+        if char in ("'", '"', '`'):
+            if not has_code:
+                start_line = line
+            has_code = True
+            j = i + 1
+            while True:
+                if j >= n:
+                    raise ScriptParseError(f"Unterminated {char} literal starting at line {line}")
+                if script[j] == '\\' and char != '`':
+                    j += 2
+                    continue
+                if script[j] == char:
+                    if j + 1 < n and script[j + 1] == char:
+                        j += 2
+                        continue
+                    break
+                j += 1
+            literal = script[i:j + 1]
+            buffer.append(literal)
+            line += literal.count('\n')
+            i = j + 1
+            continue
+
+        # 줄 주석 (-- 뒤에는 공백이 있어야 함, #)
+        if char == '#' or (script.startswith('--', i) and (i + 2 >= n or script[i + 2] in ' \t\r\n')):
+            end = script.find('\n', i)
+            end = n if end == -1 else end
+            comment = script[i:end].strip()
+            section_match = SECTION_PATTERN.match(comment)
+            if section_match:
+                flush()
+                section = section_match.group(1)
+            elif has_code:
+                buffer.append(' ')
+            i = end
+            continue
+
+        # 블록 주석 (실행 주석과 힌트는 유지)
+        if script.startswith('/*', i):
+            end = script.find('*/', i + 2)
+            if end == -1:
+                raise ScriptParseError(f"Unterminated block comment starting at line {line}")
+            comment = script[i:end + 2]
+            if comment.startswith(('/*!', '/*+')):
+                if not has_code:
+                    start_line = line
+                has_code = True
+                buffer.append(comment)
+            elif has_code:
+                buffer.append(' ')
+            line += comment.count('\n')
+            i = end + 2
+            continue
+
+        # 문장 구분자
+        if script.startswith(delimiter, i):
+            flush()
+            i += len(delimiter)
+            continue
+
+        if char == '\n':
+            line += 1
+        elif not char.isspace() and not has_code:
+            start_line = line
+            has_code = True
+        if has_code:
+            buffer.append(char)
+        i += 1
+
+    flush()
+    return statements
+
+def split_statements(script: str) -> List[str]:
+    """
+    SQL 스크립트를 문장 문자열 목록으로 분리
+
+    Args:
+        script (str): SQL 스크립트
+
+    Returns:
+        List[str]: SQL 문 목록
+    """
+    return [statement.sql for statement in parse_script(script)]
+
+def script_sections(script: str) -> Dict[str, List[str]]:
+    """
+    '-- name:' 섹션별 SQL 문 목록 반환
+
+    Args:
+        script (str): SQL 스크립트
+
+    Returns:
+        Dict[str, List[str]]: 섹션 이름과 SQL 문 목록 (섹션 이전 문장은 제외)
+    """
+    sections: Dict[str, List[str]] = {}
+    for statement in parse_script(script):
+        if statement.section is not None:
+            sections.setdefault(statement.section, []).append(statement.sql)
+    return sections
@@ -0,0 +1,145 @@
+"""
+의존성 기반 병렬 실행 모듈
+
+이 모듈은 작업 간 의존 관계를 선언하고, 의존 작업이 끝난 작업부터
+스레드 풀에서 동시에 실행하는 작은 DAG 실행기를 제공합니다.
+여러 작업이 공유하는 하위 조회는 하나의 노드로 선언해 한 번만 실행하고,
+그 결과를 의존 노드에 키워드 인자로 전달합니다.
+"""
+
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class DAGExecutionError(Exception):
+    """DAG 노드 실행 실패 예외"""
+
+    def __init__(self, node: str, error: Exception):
+        super().__init__(f"Node '{node}' failed: {error}")
+        self.node = node
+        self.error = error
+
+class DAGExecutor:
+    """
+    의존성을 고려해 작업을 병렬 실행하는 DAG 실행기
+
+    각 노드의 함수는 의존 노드의 결과를 노드 이름을 키로 하는 키워드 인자로 받습니다.
+    run() 후 timings에 노드별 실행 시간(초)이 기록됩니다.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        DAGExecutor 초기화
+
+        Args:
+            max_workers (int, optional): 동시에 실행할 최대 노드 수. 기본값은 4.
+        """
+        self.max_workers = max_workers
+        self._nodes: Dict[str, Callable[..., Any]] = {}
+        self._deps: Dict[str, List[str]] = {}
+        self.timings: Dict[str, float] = {}
+
+    def add(self, name: str, func: Callable[..., Any], deps: Iterable[str] = ()) -> "DAGExecutor":
+        """
+        노드 추가
+
+        Args:
+            name (str): 노드 이름 (결과 딕셔너리의 키)
+            func (Callable): 실행할 함수. 의존 노드 결과를 키워드 인자로 받음
+            deps (Iterable[str], optional): 먼저 실행되어야 하는 노드 이름들
+
+        Returns:
+            DAGExecutor: 메서드 체이닝을 위한 자기 자신
+
+        Raises:
+            ValueError: 이미 같은 이름의 노드가 있는 경우
+        """
+        if name in self._nodes:
+            raise ValueError(f"Duplicate node: {name}")
+        self._nodes[name] = func
+        self._deps[name] = list(deps)
+        return self
+
+    def _validate(self) -> None:
+        """알 수 없는 의존성과 순환 의존성 검사"""
+        for name, deps in self._deps.items():
+            unknown = [dep for dep in deps if dep not in self._nodes]
+            if unknown:
+                raise ValueError(f"Node '{name}' depends on unknown nodes: {unknown}")
+
+        visiting, done = set(), set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle detected at node '{name}'")
+            visiting.add(name)
+            for dep in self._deps[name]:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self._nodes:
+            visit(name)
+
+    def _run_node(self, name: str, kwargs: Dict[str, Any]) -> Any:
+        start_time = time.time()
+        try:
+            return self._nodes[name](**kwargs)
+        finally:
+            self.timings[name] = time.time() - start_time
+
+    def run(self) -> Dict[str, Any]:
+        """
+        모든 노드 실행
+
+        Returns:
+            Dict[str, Any]: 노드 이름과 결과 매핑
+
+        Raises:
+            ValueError: 의존성이 잘못 선언된 경우
+            DAGExecutionError: 노드 실행이 실패한 경우. 아직 시작하지 않은 노드는
+                실행하지 않고, 실행 중인 노드가 끝날 때까지 기다린 뒤 발생
+        """
+        self._validate()
+        self.timings = {}
+        results: Dict[str, Any] = {}
+        pending = dict(self._deps)
+        start_time = time.time()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            failure: Optional[DAGExecutionError] = None
+
+            while pending or running:
+                if failure is None:
+                    ready = [name for name, deps in pending.items() if all(dep in results for dep in deps)]
+                    for name in ready:
+                        kwargs = {dep: results[dep] for dep in pending.pop(name)}
+                        running[executor.submit(self._run_node, name, kwargs)] = name
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        logger.error("DAG node '%s' failed: %s", name, str(e))
+                        if failure is None:
+                            failure = DAGExecutionError(name, e)
+
+            if failure is not None:
+                raise failure
+
+        for name, elapsed in sorted(self.timings.items(), key=lambda item: -item[1]):
+            logger.info("DAG node '%s' finished in %.2fs", name, elapsed)
+        logger.info("DAG with %d nodes finished in %.2fs", len(self._nodes), time.time() - start_time)
+
+        return results
@@ -0,0 +1,280 @@
+"""
+범위 기반 메모이제이션 모듈
+
+이 모듈은 분석 클래스의 조회 메서드 결과를 메서드 이름과 인자를 키로
+재사용하는 메모이제이션 계층을 제공합니다. 캐시는 명시적인 범위(보고서 한 번,
+대시보드 콜백 한 번 등) 동안만 유지되며, 선택적으로 TTL을 지정할 수 있습니다.
+
+사용 예:
+    class Analyzer(MemoizedMixin):
+        @memoized
+        def get_users(self, days=10): ...
+
+    with analyzer.memo_scope():
+        analyzer.get_users()      # DB 조회
+        analyzer.get_users(10)    # 같은 키이므로 재사용
+"""
+
+import time
+import inspect
+import logging
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 겹치는 memo_scope() 호출이 계속되어 범위가 닫히지 않을 때 공유 범위를 유지하는 최대 시간(초)
+DEFAULT_MAX_SCOPE_AGE = 60.0
+
+def _freeze(value: Any) -> Hashable:
+    """인자 값을 캐시 키로 쓸 수 있는 형태로 변환"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+def _copy_result(value: Any) -> Any:
+    """캐시된 DataFrame이 호출자의 수정에 영향받지 않도록 복사"""
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    return value
+
+class MemoScope:
+    """
+    하나의 메모이제이션 범위
+
+    같은 키의 동시 요청은 먼저 들어온 요청의 결과를 기다려 함께 사용하므로,
+    범위 안에서 같은 조회는 정확히 한 번만 실행됩니다.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        """
+        MemoScope 초기화
+
+        Args:
+            ttl (float, optional): 항목 유효 시간(초). None이면 범위가 끝날 때까지 유지.
+        """
+        self.ttl = ttl
+        self.created_at = time.monotonic()
+        self._entries: Dict[Tuple, Tuple[float, Any]] = {}
+        self._in_flight: Dict[Tuple, threading.Event] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._method_stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, method: str, field: str) -> None:
+        stats = self._method_stats.setdefault(method, {'hits': 0, 'misses': 0})
+        stats[field] += 1
+        if field == 'hits':
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def get_or_compute(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """
+        캐시된 결과 반환, 없으면 계산 후 저장
+
+        Args:
+            key (Tuple): (메서드 이름, 인자...) 형태의 캐시 키
+            compute (Callable): 결과를 계산하는 함수
+
+        Returns:
+            Any: 결과 (DataFrame은 복사본)
+        """
+        method = key[0]
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and (self.ttl is None or time.time() - entry[0] < self.ttl):
+                    self._count(method, 'hits')
+                    return _copy_result(entry[1])
+                waiter = self._in_flight.get(key)
+                if waiter is None:
+                    self._entries.pop(key, None)
+                    self._in_flight[key] = threading.Event()
+                    self._count(method, 'misses')
+                    break
+            # 같은 키를 다른 스레드가 계산 중이면 끝날 때까지 대기 후 다시 확인
+            waiter.wait()
+
+        try:
+            value = compute()
+            with self._lock:
+                self._entries[key] = (time.time(), value)
+            return _copy_result(value)
+        finally:
+            with self._lock:
+                self._in_flight.pop(key).set()
+
+    def invalidate(self, *methods: str) -> int:
+        """
+        캐시 항목 삭제
+
+        Args:
+            *methods (str): 삭제할 메서드 이름. 지정하지 않으면 전체 삭제.
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        with self._lock:
+            keys = [key for key in self._entries if not methods or key[0] in methods]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            Dict[str, Any]: 항목 수, 히트/미스 수, 히트율, 메서드별 히트/미스 수
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'ttl': self.ttl,
+                'methods': {name: dict(stats) for name, stats in self._method_stats.items()},
+            }
+
+def memoized(method: Callable) -> Callable:
+    """
+    활성 메모이제이션 범위가 있을 때 결과를 재사용하는 메서드 데코레이터
+
+    캐시 키는 메서드 이름과 기본값을 채운 인자이므로 get_users()와
+    get_users(days=10)은 같은 키가 됩니다. 범위 밖에서는 그대로 실행합니다.
+    MemoizedMixin을 상속한 클래스의 메서드에 사용합니다.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        scope = self.active_memo_scope
+        if scope is None:
+            return method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = list(bound.arguments.items())[1:]
+        key = (method.__name__,) + tuple((name, _freeze(value)) for name, value in arguments)
+        return scope.get_or_compute(key, lambda: method(self, *args, **kwargs))
+
+    return wrapper
+
+class MemoizedMixin:
+    """
+    memoized 메서드에 범위 관리, 무효화 훅, 통계를 제공하는 믹스인
+
+    memo_scope()는 중첩하거나 여러 스레드에서 동시에 열 수 있으며, 이미 열린
+    범위가 있으면 그 범위를 함께 사용하고 가장 바깥 범위가 닫힐 때 캐시를 비웁니다.
+    공유 범위가 max_scope_age보다 오래되면 새로 여는 호출부터 새 범위를 사용하므로,
+    대시보드 콜백처럼 겹치는 호출이 끊이지 않아도 결과가 무기한 재사용되지 않습니다.
+    default_memo_ttl을 지정하면 범위 밖에서도 TTL 기반으로 결과를 재사용합니다.
+    """
+
+    def init_memoization(self, default_memo_ttl: Optional[float] = None,
+                         max_scope_age: Optional[float] = DEFAULT_MAX_SCOPE_AGE) -> None:
+        """
+        메모이제이션 상태 초기화 (하위 클래스의 __init__에서 호출)
+
+        Args:
+            default_memo_ttl (float, optional): 범위 밖 호출에 적용할 TTL(초).
+                None이면 범위 밖에서는 메모이제이션하지 않음.
+            max_scope_age (float, optional): 공유 범위를 새 호출에 넘겨주는 최대 시간(초).
+                None이면 제한 없음. 기본값은 DEFAULT_MAX_SCOPE_AGE.
+        """
+        self._memo_lock = threading.Lock()
+        self._memo_scope: Optional[MemoScope] = None
+        self._memo_depth = 0
+        self._max_scope_age = max_scope_age
+        self._default_memo_scope = MemoScope(ttl=default_memo_ttl) if default_memo_ttl else None
+        self._invalidation_hooks: List[Callable[[Tuple[str, ...]], None]] = []
+
+    @property
+    def active_memo_scope(self) -> Optional[MemoScope]:
+        """현재 적용 중인 메모이제이션 범위"""
+        return self._memo_scope or self._default_memo_scope
+
+    @contextmanager
+    def memo_scope(self, ttl: Optional[float] = None) -> Iterator[MemoScope]:
+        """
+        메모이제이션 범위 열기
+
+        Args:
+            ttl (float, optional): 범위 안 항목의 유효 시간(초). 가장 바깥 범위에서만
+                적용됩니다. 기본값은 None(범위가 끝나거나 max_scope_age가 지날 때까지 유지).
+
+        Yields:
+            MemoScope: 현재 범위 (stats() 조회용)
+        """
+        with self._memo_lock:
+            scope = self._memo_scope
+            if scope is None or (self._max_scope_age is not None
+                                 and time.monotonic() - scope.created_at >= self._max_scope_age):
+                # 열려 있는 호출도 이후 조회부터는 새 범위를 사용
+                self._memo_scope = MemoScope(ttl=ttl if scope is None else scope.ttl)
+            self._memo_depth += 1
+            scope = self._memo_scope
+        try:
+            yield scope
+        finally:
+            with self._memo_lock:
+                self._memo_depth -= 1
+                if self._memo_depth == 0:
+                    scope = self._memo_scope
+                    stats = scope.stats()
+                    logger.debug("Memo scope closed: %d hits, %d misses", stats['hits'], stats['misses'])
+                    self._memo_scope = None
+
+    def add_invalidation_hook(self, hook: Callable[[Tuple[str, ...]], None]) -> None:
+        """
+        무효화 시 호출할 함수 등록
+
+        Args:
+            hook (Callable): 무효화된 메서드 이름 튜플(전체 무효화 시 빈 튜플)을 받는 함수
+        """
+        self._invalidation_hooks.append(hook)
+
+    def invalidate_memo(self, *methods: str) -> int:
+        """
+        현재 범위와 기본 범위의 캐시 항목 삭제
+
+        Args:
+            *methods (str): 삭제할 메서드 이름. 지정하지 않으면 전체 삭제.
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        removed = 0
+        for scope in (self._memo_scope, self._default_memo_scope):
+            if scope is not None:
+                removed += scope.invalidate(*methods)
+        for hook in self._invalidation_hooks:
+            try:
+                hook(methods)
+            except Exception as e:
+                logger.warning("Invalidation hook failed: %s", str(e))
+        return removed
+
+    def memo_stats(self) -> Dict[str, Any]:
+        """
+        현재 적용 중인 범위의 캐시 통계 반환
+
+        Returns:
+            Dict[str, Any]: MemoScope.stats() 결과. 활성 범위가 없으면 빈 딕셔너리.
+        """
+        scope = self.active_memo_scope
+        return scope.stats() if scope is not None else {}
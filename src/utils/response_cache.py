@@ -0,0 +1,399 @@
+"""
+HTTP 응답 캐시 모듈
+
+이 모듈은 Flask 분석 엔드포인트의 JSON 응답을 캐시하는 cached_response 데코레이터를
+제공합니다. 같은 대시보드 요청이 무거운 집계를 반복하지 않도록 다음을 처리합니다.
+
+- 캐시 키: 경로 + 정규화한 쿼리 인자(이름순 정렬) + 인증 범위(사용자)
+- 저장소: 앱 설정(또는 환경 변수)의 REDIS_URL에 연결되면 Redis, 아니면 프로세스 메모리
+- ttl 동안은 캐시 응답을 그대로 반환하고, 이후 stale_ttl 동안은 오래된 응답을 반환하면서
+  백그라운드 스레드에서 다시 계산 (stale-while-revalidate)
+- 본문 해시로 ETag를 붙이고 If-None-Match가 일치하면 304 반환
+- 같은 키의 동시 요청은 한 요청만 뷰를 실행하고 나머지는 그 결과를 사용
+  (프로세스 안에서는 키별 이벤트, Redis 사용 시 프로세스 간에는 SET NX 잠금)
+
+200 응답만 캐시하며 스트리밍 응답(NDJSON 등)과 오류 응답은 그대로 반환합니다.
+"""
+
+import os
+import json
+import time
+import base64
+import hashlib
+import logging
+import threading
+import functools
+from typing import Any, Callable, Dict, Optional
+
+from flask import copy_current_request_context, current_app, g, make_response, request, session
+
+from src.database.result_cache import MemoryCache
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - redis 미설치 환경
+    redis = None
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 기본 유효 시간(초)
+DEFAULT_TTL = int(os.environ.get('RESPONSE_CACHE_TTL', '60'))
+DEFAULT_STALE_TTL = int(os.environ.get('RESPONSE_CACHE_STALE_TTL', '300'))
+
+# 다른 요청이 계산 중인 응답을 기다리는 최대 시간(초)
+LOCK_TIMEOUT = 30
+
+KEY_PREFIX = 'response-cache'
+
+class MemoryResponseStore:
+    """프로세스 메모리 응답 저장소 (MemoryCache 사용)"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        MemoryResponseStore 초기화
+
+        Args:
+            max_bytes (int, optional): 최대 메모리 사용량(바이트). 기본값은 64MB.
+        """
+        self._cache = MemoryCache(max_bytes=max_bytes)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._cache.get(key)
+
+    def set(self, key: str, entry: Dict[str, Any], ttl: float) -> None:
+        self._cache.set(key, entry, ttl=ttl)
+
+    def acquire_lock(self, key: str, timeout: float) -> bool:
+        # 프로세스 안의 중복 계산은 ResponseCache가 이미 막으므로 항상 성공
+        return True
+
+    def release_lock(self, key: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+class RedisResponseStore:
+    """
+    Redis 응답 저장소
+
+    여러 API 프로세스가 캐시와 계산 잠금을 공유합니다. Redis 오류는 경고만 남기고
+    캐시 미스(잠금은 획득 성공)로 처리하므로 Redis 장애가 API 장애로 이어지지 않습니다.
+    """
+
+    def __init__(self, client, prefix: str = KEY_PREFIX):
+        """
+        RedisResponseStore 초기화
+
+        Args:
+            client: redis.Redis 클라이언트
+            prefix (str, optional): 키 접두사. 기본값은 KEY_PREFIX.
+        """
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            raw = self.client.get(f"{self.prefix}:{key}")
+        except redis.RedisError as e:
+            logger.warning(f"응답 캐시 조회 실패: {str(e)}")
+            return None
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        entry['body'] = base64.b64decode(entry['body'])
+        return entry
+
+    def set(self, key: str, entry: Dict[str, Any], ttl: float) -> None:
+        payload = dict(entry, body=base64.b64encode(entry['body']).decode('ascii'))
+        try:
+            self.client.set(f"{self.prefix}:{key}", json.dumps(payload), px=max(int(ttl * 1000), 1))
+        except redis.RedisError as e:
+            logger.warning(f"응답 캐시 저장 실패: {str(e)}")
+
+    def acquire_lock(self, key: str, timeout: float) -> bool:
+        try:
+            return bool(self.client.set(f"{self.prefix}:lock:{key}", '1', nx=True,
+                                        px=max(int(timeout * 1000), 1)))
+        except redis.RedisError as e:
+            logger.warning(f"응답 캐시 잠금 실패: {str(e)}")
+            return True
+
+    def release_lock(self, key: str) -> None:
+        try:
+            self.client.delete(f"{self.prefix}:lock:{key}")
+        except redis.RedisError as e:
+            logger.warning(f"응답 캐시 잠금 해제 실패: {str(e)}")
+
+    def clear(self) -> None:
+        try:
+            keys = list(self.client.scan_iter(match=f"{self.prefix}:*"))
+            if keys:
+                self.client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning(f"응답 캐시 삭제 실패: {str(e)}")
+
+def create_store(redis_url: Optional[str] = None):
+    """
+    응답 저장소 생성
+
+    redis_url에 연결할 수 있으면 RedisResponseStore, 아니면 MemoryResponseStore를 반환합니다.
+
+    Args:
+        redis_url (str, optional): Redis 접속 URL. 기본값은 None (메모리 저장소).
+
+    Returns:
+        MemoryResponseStore 또는 RedisResponseStore
+    """
+    if redis_url and redis is not None:
+        try:
+            client = redis.Redis.from_url(redis_url, socket_connect_timeout=0.5, socket_timeout=1)
+            client.ping()
+            logger.info("Response cache uses Redis at %s", redis_url)
+            return RedisResponseStore(client)
+        except redis.RedisError as e:
+            logger.warning(f"Redis에 연결할 수 없어 메모리 응답 캐시를 사용합니다: {str(e)}")
+    elif redis_url:
+        logger.warning("redis 패키지가 없어 메모리 응답 캐시를 사용합니다")
+    return MemoryResponseStore()
+
+class ResponseCache:
+    """
+    응답 저장소와 동시 계산 상태 관리
+
+    Flask 앱마다 하나씩 만들어 app.extensions['response_cache']에 보관합니다.
+    """
+
+    def __init__(self, store):
+        """
+        ResponseCache 초기화
+
+        Args:
+            store: MemoryResponseStore 또는 RedisResponseStore
+        """
+        self.store = store
+        self._in_flight: Dict[str, threading.Event] = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """캐시된 응답 전체 삭제"""
+        self.store.clear()
+
+    def _store_response(self, key: str, response, lifetime: float) -> Optional[Dict[str, Any]]:
+        """200 응답을 저장 항목으로 변환해 저장 (캐시할 수 없는 응답이면 None)"""
+        if response.status_code != 200 or response.is_streamed:
+            return None
+        body = response.get_data()
+        entry = {
+            'body': body,
+            'mimetype': response.mimetype,
+            'etag': hashlib.sha256(body).hexdigest()[:32],
+            'created_at': time.time(),
+        }
+        self.store.set(key, entry, lifetime)
+        return entry
+
+    def fill(self, key: str, compute: Callable[[], Any], lifetime: float):
+        """
+        캐시 미스 응답 계산
+
+        같은 키를 계산 중인 요청이 있으면 끝날 때까지 기다린 뒤 저장된 응답을 사용합니다.
+
+        Args:
+            key (str): 캐시 키
+            compute (Callable[[], Any]): Flask 응답을 만드는 함수
+            lifetime (float): 저장 유효 시간(초, ttl + stale_ttl)
+
+        Returns:
+            Tuple[Optional[Dict[str, Any]], Any]: (저장 항목, 직접 계산한 응답).
+                다른 요청의 결과를 사용했으면 응답은 None, 캐시할 수 없는 응답이면 항목은 None.
+        """
+        with self._lock:
+            waiter = self._in_flight.get(key)
+            if waiter is None:
+                self._in_flight[key] = threading.Event()
+
+        if waiter is not None:
+            # 같은 프로세스의 다른 요청이 계산 중
+            waiter.wait(LOCK_TIMEOUT)
+            entry = self.store.get(key)
+            if entry is not None:
+                return entry, None
+            # 계산 결과를 캐시할 수 없었으면 직접 계산
+            response = compute()
+            return self._store_response(key, response, lifetime), response
+
+        try:
+            if not self.store.acquire_lock(key, LOCK_TIMEOUT):
+                # 다른 프로세스가 계산 중이면 저장될 때까지 대기
+                deadline = time.monotonic() + LOCK_TIMEOUT
+                while time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    entry = self.store.get(key)
+                    if entry is not None:
+                        return entry, None
+            try:
+                response = compute()
+                return self._store_response(key, response, lifetime), response
+            finally:
+                self.store.release_lock(key)
+        finally:
+            with self._lock:
+                self._in_flight.pop(key).set()
+
+    def refresh_in_background(self, key: str, compute: Callable[[], Any], lifetime: float) -> bool:
+        """
+        오래된 응답을 백그라운드 스레드에서 다시 계산
+
+        Args:
+            key (str): 캐시 키
+            compute (Callable[[], Any]): 요청 컨텍스트를 복사한 응답 계산 함수
+            lifetime (float): 저장 유효 시간(초)
+
+        Returns:
+            bool: 새로 갱신을 시작했으면 True (이미 갱신 중이면 False)
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+
+        def run() -> None:
+            try:
+                if not self.store.acquire_lock(key, LOCK_TIMEOUT):
+                    return
+                try:
+                    self._store_response(key, compute(), lifetime)
+                finally:
+                    self.store.release_lock(key)
+            except Exception as e:
+                logger.error(f"응답 캐시 갱신 실패 ({key}): {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name=f"response-cache-refresh-{key[:8]}", daemon=True).start()
+        return True
+
+_app_lock = threading.Lock()
+
+def get_response_cache(app=None) -> ResponseCache:
+    """
+    앱의 ResponseCache 반환 (없으면 REDIS_URL 설정으로 생성)
+
+    Args:
+        app (Flask, optional): Flask 앱. 기본값은 current_app.
+
+    Returns:
+        ResponseCache: 앱의 응답 캐시
+    """
+    app = app or current_app._get_current_object()
+    cache = app.extensions.get('response_cache')
+    if cache is None:
+        with _app_lock:
+            cache = app.extensions.get('response_cache')
+            if cache is None:
+                redis_url = app.config.get('REDIS_URL') or os.environ.get('REDIS_URL')
+                cache = app.extensions['response_cache'] = ResponseCache(create_store(redis_url))
+    return cache
+
+def default_scope() -> str:
+    """
+    현재 요청의 인증 범위
+
+    JWT 미들웨어가 설정한 g.user_id, 세션의 user_id, Authorization 헤더 해시 순으로
+    사용하며, 인증 정보가 없으면 빈 문자열(공용)입니다.
+
+    Returns:
+        str: 인증 범위
+    """
+    user_id = g.get('user_id') or session.get('user_id')
+    if user_id:
+        return f"user:{user_id}"
+    authorization = request.headers.get('Authorization')
+    if authorization:
+        return "auth:" + hashlib.sha256(authorization.encode('utf-8')).hexdigest()[:16]
+    return ''
+
+def cache_key(scope: str = '') -> str:
+    """
+    현재 요청의 캐시 키 생성
+
+    쿼리 인자는 이름순으로 정렬하며 같은 이름의 값 순서는 유지합니다.
+
+    Args:
+        scope (str, optional): 인증 범위. 기본값은 ''.
+
+    Returns:
+        str: 캐시 키 (sha256 hex)
+    """
+    args = sorted(((name, values) for name, values in request.args.lists()), key=lambda item: item[0])
+    raw = json.dumps([request.path, args, scope], ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+def cached_response(ttl: float = DEFAULT_TTL, stale_ttl: float = DEFAULT_STALE_TTL,
+                    scope: Optional[Callable[[], str]] = default_scope) -> Callable:
+    """
+    GET 응답 캐시 데코레이터
+
+    응답에는 ETag, Cache-Control(max-age, stale-while-revalidate)과
+    X-Cache(HIT/MISS/STALE) 헤더를 붙입니다.
+
+    Args:
+        ttl (float, optional): 캐시 응답을 그대로 반환하는 시간(초). 기본값은 DEFAULT_TTL.
+        stale_ttl (float, optional): ttl 이후 오래된 응답을 반환하며 백그라운드에서 갱신하는
+            시간(초). 0이면 ttl이 지나면 바로 다시 계산. 기본값은 DEFAULT_STALE_TTL.
+        scope (Callable[[], str], optional): 인증 범위를 반환하는 함수. None이면 모든
+            사용자가 같은 응답을 공유. 기본값은 default_scope.
+
+    Returns:
+        Callable: 데코레이터
+    """
+    lifetime = ttl + stale_ttl
+
+    def decorator(view: Callable) -> Callable:
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(*args, **kwargs)
+
+            cache = get_response_cache()
+            user_scope = scope() if scope else ''
+            key = cache_key(user_scope)
+
+            def compute():
+                return make_response(view(*args, **kwargs))
+
+            entry = cache.store.get(key)
+            age = time.time() - entry['created_at'] if entry is not None else None
+            if entry is None or age >= lifetime:
+                state = 'MISS'
+                entry, response = cache.fill(key, compute, lifetime)
+                if entry is None:
+                    return response
+                age = time.time() - entry['created_at']
+            elif age >= ttl:
+                state = 'STALE'
+                cache.refresh_in_background(key, copy_current_request_context(compute), lifetime)
+            else:
+                state = 'HIT'
+
+            response = current_app.response_class(entry['body'], status=200, mimetype=entry['mimetype'])
+            response.set_etag(entry['etag'])
+            cache_control = [
+                'private' if user_scope else 'public',
+                f"max-age={max(int(ttl - age), 0)}",
+            ]
+            if stale_ttl:
+                cache_control.append(f"stale-while-revalidate={int(stale_ttl)}")
+            response.headers['Cache-Control'] = ', '.join(cache_control)
+            if scope:
+                response.vary.update(('Authorization', 'Cookie'))
+            response.headers['X-Cache'] = state
+            return response.make_conditional(request)
+
+        return wrapper
+
+    return decorator
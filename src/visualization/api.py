@@ -5,15 +5,18 @@ RESTful API 모듈
 """
 
 from flask import Blueprint, jsonify, request, current_app
+import asyncio
 import logging
 
 bp = Blueprint('api', __name__)
 logger = logging.getLogger(__name__)
 
 from ...database.mariadb_connection import MariaDBConnection
+from ...database.async_connection import AsyncMariaDBConnection
 from ...database.orm import DatabaseSession, Repository
 from ...database.models import Player, PlayerWallet, PlayerComment
 from ...utils.config import AppConfig, mask_sensitive_data
+from ...utils.response_cache import cached_response
 
 # 데이터베이스 연결 및 ORM 세션 획득
 def get_db_conn():
@@ -26,6 +29,7 @@ def get_db_session():
 
 # 플레이어 API 엔드포인트
 @bp.route('/players', methods=['GET'])
+@cached_response()
 def get_players():
     """플레이어 목록 API"""
     try:
@@ -70,30 +74,23 @@ def get_players():
         return jsonify({'error': str(e)}), 500
 
 @bp.route('/players/<int:player_id>', methods=['GET'])
+@cached_response()
 def get_player(player_id):
     """단일 플레이어 상세 정보 API"""
     try:
         # 데이터베이스 연결
-        conn = get_db_conn()
+        conn = AsyncMariaDBConnection(get_db_conn())
         
-        # 플레이어 조회
-        player = conn.query_one("SELECT * FROM players WHERE id = %s", (player_id,))
+        # 플레이어, 지갑, 코멘트를 동시에 조회
+        player, wallets, comments = asyncio.run(conn.gather(
+            conn.query_one("SELECT * FROM players WHERE id = %s", (player_id,)),
+            ("SELECT * FROM player_wallets WHERE player_id = %s", (player_id,)),
+            ("SELECT * FROM player_comments WHERE player_id = %s ORDER BY created_at DESC", (player_id,)),
+        ))
         
         if not player:
             return jsonify({'error': 'Player not found'}), 404
         
-        # 지갑 정보 조회
-        wallets = conn.query(
-            "SELECT * FROM player_wallets WHERE player_id = %s",
-            (player_id,)
-        )
-        
-        # 코멘트 조회
-        comments = conn.query(
-            "SELECT * FROM player_comments WHERE player_id = %s ORDER BY created_at DESC",
-            (player_id,)
-        )
-        
         # 결과 조합
         result = {
             'player': player,
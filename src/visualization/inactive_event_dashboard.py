@@ -7,6 +7,7 @@
 
 import os
 import sys
+import asyncio
 from pathlib import Path
 import random
 import pandas as pd
@@ -21,6 +22,10 @@ project_root = Path(__file__).resolve().parent.parent.parent
 sys.path.append(str(project_root))
 
 from src.analysis.user.inactive_event_analyzer import InactiveUserEventAnalyzer
+try:
+    from src.database.async_connection import AsyncMariaDBConnection
+except ImportError:  # mariadb 커넥터 미설치 환경 (모의 연결로만 실행)
+    AsyncMariaDBConnection = None
 
 class InactiveUserEventDashboard:
     """
@@ -37,12 +42,18 @@ class InactiveUserEventDashboard:
         try:
             # 분석기 초기화
             self.analyzer = InactiveUserEventAnalyzer()
+            self.async_db = AsyncMariaDBConnection(self.analyzer.db) if AsyncMariaDBConnection else None
             
-            # 데이터 로드
-            self.inactive_users = pd.DataFrame(self.analyzer.get_inactive_users())
-            self.event_participants = pd.DataFrame(self.analyzer.get_event_participants())
-            self.deposits_after_event = pd.DataFrame(self.analyzer.get_deposits_after_event())
-            self.converted_users = pd.DataFrame(self.analyzer.get_inactive_event_deposit_users())
+            # 데이터 로드 (독립 조회를 동시에 실행하고 하나의 메모이제이션 범위로 묶음)
+            with self.analyzer.memo_scope():
+                results = self._fetch_all(
+                    (self.analyzer.get_inactive_users, {}),
+                    (self.analyzer.get_event_participants, {}),
+                    (self.analyzer.get_deposits_after_event, {}),
+                    (self.analyzer.get_inactive_event_deposit_users, {}),
+                )
+                (self.inactive_users, self.event_participants,
+                 self.deposits_after_event, self.converted_users) = [pd.DataFrame(result) for result in results]
             
             if len(self.converted_users) > 0:
                 # 비활성 기간별 전환율 분석 모의 데이터 생성
@@ -95,6 +106,22 @@ class InactiveUserEventDashboard:
         # 콜백 설정
         self._setup_callbacks()
     
+    def _fetch_all(self, *calls):
+        """
+        독립 조회를 동시에 실행 (비동기 실행 모듈을 쓸 수 없으면 순서대로 실행)
+        
+        Args:
+            *calls: (조회 메서드, 키워드 인자) 튜플
+            
+        Returns:
+            list: 입력 순서대로의 결과
+        """
+        if self.async_db is None:
+            return [func(**kwargs) for func, kwargs in calls]
+        return asyncio.run(self.async_db.gather(
+            *(self.async_db.run_sync(func, **kwargs) for func, kwargs in calls)
+        ))
+    
     def _setup_layout(self):
         """
         대시보드 레이아웃 설정
@@ -265,18 +292,32 @@ class InactiveUserEventDashboard:
                 # 초기 로딩 시 기본 데이터로 그래프 생성
                 return self._create_inactive_period_graph(), self._create_event_amount_graph(), self.converted_users.to_dict('records')
             
-            # 분석 조건으로 다시 분석
+            # 분석 조건으로 다시 분석 (콜백 한 번을 하나의 메모이제이션 범위로 실행)
             try:
-                # 비활성 사용자 목록 업데이트
-                self.converted_users = self.analyzer.get_inactive_event_deposit_users(days_inactive=inactive_days)
-                
-                # 비활성 기간별 전환율 분석
-                analysis_result = self.analyzer.analyze_conversion_by_inactive_period()
-                self.inactive_period_stats = analysis_result['stats']
-                
-                # 이벤트 금액별 전환율 분석
-                amount_analysis = self.analyzer.analyze_conversion_by_event_amount()
-                self.event_amount_stats = amount_analysis['stats']
+                with self.analyzer.memo_scope():
+                    # 두 분석과 사용자 목록에 필요한 독립 조회를 동시에 실행
+                    (self.converted_users, all_inactive_users,
+                     event_participants, deposit_after_event) = self._fetch_all(
+                        (self.analyzer.get_inactive_event_deposit_users, {'days_inactive': inactive_days}),
+                        (self.analyzer.get_inactive_users, {'days_inactive': 0}),
+                        (self.analyzer.get_event_participants, {}),
+                        (self.analyzer.get_deposits_after_event, {}),
+                    )
+                    
+                    # 비활성 기간별 전환율 분석
+                    analysis_result = self.analyzer.analyze_conversion_by_inactive_period(
+                        all_inactive_users=all_inactive_users,
+                        event_participants=event_participants,
+                        deposit_after_event=deposit_after_event
+                    )
+                    self.inactive_period_stats = analysis_result['stats']
+                    
+                    # 이벤트 금액별 전환율 분석
+                    amount_analysis = self.analyzer.analyze_conversion_by_event_amount(
+                        event_participants=event_participants,
+                        deposit_after_event=deposit_after_event
+                    )
+                    self.event_amount_stats = amount_analysis['stats']
                 
                 return self._create_inactive_period_graph(), self._create_event_amount_graph(), self.converted_users.to_dict('records')
             except Exception as e:
@@ -0,0 +1,76 @@
+"""
+확장 가능한 클러스터 수 탐색 모듈 테스트
+"""
+
+import os
+import json
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.cluster_search import ClusterCountSearch, data_fingerprint, recommend_cluster_count
+
+class TestClusterCountSearch(unittest.TestCase):
+    """ClusterCountSearch 클래스 테스트"""
+
+    def setUp(self):
+        """테스트 설정 (중심이 뚜렷한 3개 군집)"""
+        rng = np.random.default_rng(0)
+        centers = np.array([[0, 0, 0], [8, 8, 0], [0, 8, 8]], dtype=float)
+        points = np.vstack([center + rng.normal(scale=0.5, size=(300, 3)) for center in centers])
+        self.data = pd.DataFrame(points, columns=['a', 'b', 'c'])
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.temp_dir.name, 'cluster_search_cache.json')
+
+    def tearDown(self):
+        """임시 디렉토리 정리"""
+        self.temp_dir.cleanup()
+
+    def test_fingerprint_and_recommendation(self):
+        """데이터 지문과 최빈값 추천 테스트"""
+        self.assertEqual(data_fingerprint(self.data), data_fingerprint(self.data.copy()))
+        changed = self.data.copy()
+        changed.iloc[0, 0] += 1
+        self.assertNotEqual(data_fingerprint(self.data), data_fingerprint(changed))
+
+        self.assertEqual(recommend_cluster_count([4, 3, 4]), 4)
+        self.assertEqual(recommend_cluster_count([5, 3, 4]), 3)
+
+    def test_search_finds_clusters_and_uses_cache(self):
+        """탐색 결과, 캐시 재사용, warm start 테스트"""
+        search = ClusterCountSearch(cache_path=self.cache_path, max_workers=1, silhouette_sample_size=300)
+
+        first = search.search(self.data, range(2, 7))
+        self.assertFalse(first['from_cache'])
+        self.assertEqual(first['recommended_n_clusters'], 3)
+        self.assertEqual(first['cluster_range'], [2, 3, 4, 5, 6])
+        self.assertEqual(first['warm_started'], [])
+
+        second = search.search(self.data, range(2, 7))
+        self.assertTrue(second['from_cache'])
+        self.assertEqual(second['recommended_n_clusters'], 3)
+
+        # 데이터가 바뀌면 다시 탐색하되 이전 중심점으로 시작
+        shifted = self.data + 0.01
+        third = search.search(shifted, range(2, 7))
+        self.assertFalse(third['from_cache'])
+        self.assertEqual(third['warm_started'], [2, 3, 4, 5, 6])
+        self.assertEqual(third['recommended_n_clusters'], 3)
+
+        with open(self.cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        self.assertEqual(len(cache['results']), 2)
+        self.assertEqual(cache['warm_start']['columns'], ['a', 'b', 'c'])
+        self.assertEqual(os.listdir(self.temp_dir.name), ['cluster_search_cache.json'])
+
+    def test_process_pool_matches_sequential(self):
+        """프로세스 풀 평가가 순차 평가와 같은 결과를 내는지 테스트"""
+        sequential = ClusterCountSearch(max_workers=1).search(self.data, range(2, 5))
+        parallel = ClusterCountSearch(max_workers=2).search(self.data, range(2, 5))
+        self.assertEqual(sequential['recommended_n_clusters'], parallel['recommended_n_clusters'])
+        np.testing.assert_allclose(sequential['inertia_values'], parallel['inertia_values'])
+
+if __name__ == '__main__':
+    unittest.main()
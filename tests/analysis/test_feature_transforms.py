@@ -0,0 +1,65 @@
+"""
+벡터화 특성 변환 모듈 테스트
+"""
+
+import unittest
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.analysis.feature_transforms import safe_divide, ratio, change_rate, days_since, log_normalize
+
+class TestFeatureTransforms(unittest.TestCase):
+    """특성 변환 함수 테스트 (기존 행 단위 계산과 결과 비교)"""
+
+    def setUp(self):
+        """테스트 설정"""
+        rng = np.random.default_rng(0)
+        self.df = pd.DataFrame({
+            'a': rng.integers(0, 5, 200).astype(float),
+            'b': rng.integers(0, 5, 200).astype(float),
+        })
+
+    def test_safe_divide(self):
+        """분모가 0인 행의 기본값 처리 테스트"""
+        expected = self.df.apply(lambda x: x['a'] / x['b'] if x['b'] > 0 else 0, axis=1)
+        result = safe_divide(self.df['a'], self.df['b'])
+        pd.testing.assert_series_equal(result, expected, check_names=False)
+
+        per_row_default = np.where(self.df['a'] == 0, 1.0, self.df['a'])
+        expected = self.df.apply(
+            lambda x: x['a'] / x['b'] if x['b'] > 0 else (1.0 if x['a'] == 0 else x['a']), axis=1
+        )
+        result = safe_divide(self.df['a'], self.df['b'], default=per_row_default)
+        pd.testing.assert_series_equal(result, expected, check_names=False)
+
+    def test_ratio(self):
+        """분모 최소값 보정 테스트"""
+        expected = self.df.apply(lambda x: x['a'] / max(x['b'], 1), axis=1)
+        pd.testing.assert_series_equal(ratio(self.df['a'], self.df['b']), expected, check_names=False)
+
+    def test_change_rate(self):
+        """변화율 테스트 (이전 값 0일 때 inf/0)"""
+        expected = self.df.apply(
+            lambda x: ((x['a'] / x['b']) - 1) * 100 if x['b'] > 0 else (float('inf') if x['a'] > 0 else 0),
+            axis=1
+        )
+        pd.testing.assert_series_equal(change_rate(self.df['a'], self.df['b']), expected, check_names=False)
+
+    def test_days_since(self):
+        """경과 일수 및 결측값 기본값 테스트"""
+        now = datetime(2024, 6, 1, 12, 0)
+        dates = pd.Series([datetime(2024, 5, 31, 13, 0), datetime(2024, 1, 1), None])
+        self.assertEqual(list(days_since(dates, now=now)), [0, 152, 365])
+
+    def test_log_normalize(self):
+        """로그 정규화 테스트"""
+        values = pd.Series([0.0, 9.0, 99.0])
+        result = log_normalize(values)
+        self.assertAlmostEqual(result.iloc[2], 1.0)
+        self.assertAlmostEqual(result.iloc[1], np.log1p(9) / np.log1p(99))
+        self.assertTrue((log_normalize(pd.Series([0.0, 0.0])) == 0).all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+세그먼트 모델 저장/적용 모듈 테스트
+"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+from sklearn.preprocessing import StandardScaler
+
+from src.analysis.segment_model import SegmentModel, latest_model_version
+
+class TestSegmentModel(unittest.TestCase):
+    """SegmentModel 클래스 테스트"""
+
+    def setUp(self):
+        """테스트 설정 (학습 방식과 같은 전처리로 모델 생성)"""
+        rng = np.random.default_rng(1)
+        centers = np.array([[1, 10, 100], [20, 5, 300], [40, 30, 50]], dtype=float)
+        points = np.vstack([center + rng.normal(scale=2.0, size=(200, 3)) for center in centers])
+        self.data = pd.DataFrame(points, columns=['days_inactive', 'promotion_count', 'total_reward'])
+
+        lower = self.data.quantile(0.01)
+        upper = self.data.quantile(0.99)
+        clipped = self.data.clip(lower, upper, axis=1)
+        scaler = StandardScaler()
+        scaled = scaler.fit_transform(clipped)
+        self.kmeans = KMeans(n_clusters=3, n_init=10, random_state=42).fit(scaled)
+
+        self.model = SegmentModel(
+            features=list(self.data.columns),
+            lower_bounds=lower.tolist(),
+            upper_bounds=upper.tolist(),
+            scaler_mean=scaler.mean_.tolist(),
+            scaler_scale=scaler.scale_.tolist(),
+            centroids=self.kmeans.cluster_centers_.tolist(),
+            segment_shares=(np.bincount(self.kmeans.labels_) / len(self.data)).tolist(),
+            segment_definitions={'0': {'name': '세그먼트 A'}, '1': {'name': '세그먼트 B'}, '2': {'name': '세그먼트 C'}}
+        )
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """임시 디렉토리 정리"""
+        self.temp_dir.cleanup()
+
+    def test_assign_matches_kmeans_predict(self):
+        """청크 배정 결과가 KMeans 학습 레이블과 같은지 테스트"""
+        assignment = self.model.assign(self.data, chunk_size=50)
+        np.testing.assert_array_equal(assignment['segment_id'].to_numpy(), self.kmeans.labels_)
+        self.assertTrue((assignment['segment_distance'] >= 0).all())
+        self.assertTrue(assignment.index.equals(self.data.index))
+
+    def test_save_and_load_versions(self):
+        """버전별 저장과 최신 모델 로드 테스트"""
+        model_dir = os.path.join(self.temp_dir.name, 'models')
+        self.assertIsNone(SegmentModel.load_latest(model_dir))
+
+        self.model.save(model_dir)
+        self.model.save(model_dir)
+        self.assertEqual(latest_model_version(model_dir), 2)
+
+        loaded = SegmentModel.load_latest(model_dir)
+        self.assertEqual(loaded.version, 2)
+        self.assertEqual(loaded.segment_names, {0: '세그먼트 A', 1: '세그먼트 B', 2: '세그먼트 C'})
+        pd.testing.assert_frame_equal(loaded.assign(self.data), self.model.assign(self.data))
+
+    def test_drift(self):
+        """같은 분포는 드리프트가 작고, 이동한 분포는 크게 나타나는지 테스트"""
+        stable = self.model.drift(self.data)
+        self.assertLess(stable['segment_psi'], 0.01)
+        self.assertLess(stable['max_feature_shift'], 0.01)
+
+        shifted = self.data[self.data['days_inactive'] > 30].copy()
+        drifted = self.model.drift(shifted)
+        self.assertGreater(drifted['segment_psi'], 0.2)
+        self.assertGreater(drifted['max_feature_shift'], 0.5)
+
+    def test_missing_feature(self):
+        """모델 특성이 없는 데이터 처리 테스트"""
+        with self.assertRaises(KeyError):
+            self.model.assign(self.data.drop(columns=['total_reward']))
+
+if __name__ == '__main__':
+    unittest.main()
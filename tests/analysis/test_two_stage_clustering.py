@@ -0,0 +1,57 @@
+"""
+2단계 계층적 클러스터링 모듈 테스트
+"""
+
+import unittest
+
+import numpy as np
+from scipy.cluster.hierarchy import linkage, fcluster
+from sklearn.metrics import adjusted_rand_score
+
+from src.analysis.two_stage_clustering import TwoStageWardClustering, cut_linkage, weighted_ward_linkage
+
+class TestTwoStageClustering(unittest.TestCase):
+    """가중 Ward 연결과 2단계 클러스터링 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.rng = np.random.default_rng(0)
+
+    def test_unit_weights_match_scipy_ward(self):
+        """가중치가 모두 1이면 scipy Ward 연결과 같은지 테스트"""
+        points = self.rng.normal(size=(200, 4))
+        result = weighted_ward_linkage(points, np.ones(len(points)))
+        expected = linkage(points, 'ward')
+        np.testing.assert_allclose(result, expected)
+
+        for n_clusters in (2, 4, 7):
+            labels = cut_linkage(result, n_clusters)
+            self.assertEqual(len(np.unique(labels)), n_clusters)
+            self.assertEqual(adjusted_rand_score(labels, fcluster(expected, n_clusters, 'maxclust')), 1.0)
+
+    def test_weights_match_duplicated_points(self):
+        """가중치가 중복된 점과 같은 결과를 내는지 테스트"""
+        points = self.rng.normal(size=(40, 3))
+        weights = self.rng.integers(1, 4, len(points))
+        weighted = cut_linkage(weighted_ward_linkage(points, weights), 4)
+
+        duplicated = np.repeat(points, weights, axis=0)
+        expected = fcluster(linkage(duplicated, 'ward'), 4, 'maxclust')
+        self.assertEqual(adjusted_rand_score(np.repeat(weighted, weights), expected), 1.0)
+
+    def test_two_stage_recovers_clusters(self):
+        """미세 클러스터를 거쳐도 뚜렷한 군집을 찾는지 테스트"""
+        centers = np.array([[0, 0, 0], [6, 0, 0], [0, 6, 0], [0, 0, 6]], dtype=float)
+        truth = np.repeat(np.arange(4), 2000)
+        points = centers[truth] + self.rng.normal(scale=0.5, size=(len(truth), 3))
+
+        model = TwoStageWardClustering(n_clusters=4, n_micro_clusters=200)
+        labels = model.fit_predict(points)
+
+        self.assertLessEqual(len(model.micro_centers_), 200)
+        self.assertEqual(model.micro_weights_.sum(), len(points))
+        self.assertEqual(len(model.linkage_matrix_), len(model.micro_centers_) - 1)
+        self.assertEqual(adjusted_rand_score(labels, truth), 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,229 @@
+"""
+사용자 가치 점수화 모듈 테스트
+
+그룹 집계 쿼리로 바꾼 fetch_user_data가 이전의 플레이어별 상관 서브쿼리와 같은 특성과
+점수를 내는지 SQLite 고정 데이터로 비교합니다. MySQL 날짜 함수(NOW, DATEDIFF,
+DATE_SUB ... INTERVAL n DAY)는 고정 기준 시각을 쓰는 SQLite 함수로 바꿔 실행합니다.
+"""
+
+import re
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+try:
+    from src.analysis.user.user_value_scoring import UserValueScoring
+except ImportError:  # mariadb 커넥터, matplotlib 등이 없는 환경
+    UserValueScoring = None
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+# 그룹 집계로 바꾸기 전 fetch_user_data의 플레이어별 상관 서브쿼리 (LIMIT 제외)
+LEGACY_USER_QUERY = """
+    SELECT 
+        p.userId,  -- Using userId as the identifier instead of id or name
+        p.id as player_id,
+        DATEDIFF(NOW(), (SELECT MAX(gameDate) FROM game_scores 
+                         WHERE userId = p.userId)) AS days_inactive,
+        ROUND(IFNULL(
+            (SELECT SUM(amount) FROM money_flows 
+             WHERE player = p.id AND type = 0 AND createdAt >= DATE_SUB(NOW(), INTERVAL 365 DAY)), 
+            0
+        )) AS total_deposits_1y,
+        ROUND(IFNULL(
+            (SELECT SUM(amount) FROM money_flows 
+             WHERE player = p.id AND type = 1 AND createdAt >= DATE_SUB(NOW(), INTERVAL 365 DAY)), 
+            0
+        )) AS total_withdrawals_1y,
+        ROUND(IFNULL(
+            (SELECT AVG(amount) FROM money_flows 
+             WHERE player = p.id AND type = 0 AND createdAt >= DATE_SUB(NOW(), INTERVAL 365 DAY)), 
+            0
+        )) AS avg_deposit_amount,
+        (SELECT COUNT(*) FROM game_scores 
+         WHERE userId = p.userId AND gameDate >= DATE_SUB(NOW(), INTERVAL 365 DAY)) AS game_count,
+        (SELECT MAX(gameDate) FROM game_scores 
+         WHERE userId = p.userId) AS last_played_date,
+        (SELECT COUNT(*) FROM promotion_players pp 
+         WHERE pp.player = p.id AND pp.appliedAt IS NOT NULL) AS events_received,
+        CASE 
+            WHEN (SELECT COUNT(*) FROM money_flows 
+                  WHERE player = p.id AND type = 0 AND 
+                  createdAt > (SELECT MIN(pp2.appliedAt) FROM promotion_players pp2 
+                               WHERE pp2.player = p.id AND pp2.appliedAt IS NOT NULL)) > 0 
+            THEN 1 ELSE 0 
+        END AS converted_after_event,
+        ROUND(IFNULL(
+            (SELECT SUM(amount) FROM money_flows 
+             WHERE player = p.id AND type = 0 AND 
+             createdAt > (SELECT MIN(pp2.appliedAt) FROM promotion_players pp2 
+                         WHERE pp2.player = p.id AND pp2.appliedAt IS NOT NULL)), 
+            0
+        )) AS deposit_amount_after_event,
+        p.status,
+        IFNULL(
+            (SELECT COUNT(*) FROM game_scores 
+             WHERE userId = p.userId), 
+            0
+        ) AS total_games_played,
+        IFNULL(
+            (SELECT COUNT(DISTINCT DATE(gameDate)) FROM game_scores 
+             WHERE userId = p.userId), 
+            0
+        ) AS total_days_played,
+        IFNULL(
+            (SELECT COUNT(*) FROM money_flows 
+             WHERE player = p.id AND type = 0), 
+            0
+        ) AS total_deposits_count,
+        IFNULL(
+            (SELECT AVG(ROUND(netBet)) FROM game_scores 
+             WHERE userId = p.userId AND gameDate >= DATE_SUB(NOW(), INTERVAL 365 DAY)), 
+            0
+        ) AS avg_net_bet,
+        IFNULL(
+            (SELECT SUM(ROUND(winLoss)) FROM game_scores 
+             WHERE userId = p.userId AND gameDate >= DATE_SUB(NOW(), INTERVAL 365 DAY)), 
+            0
+        ) AS total_win_loss_1y
+    FROM 
+        players p
+    WHERE 
+        p.status = 0  -- 활성 계정만 포함
+        AND (
+            -- days_inactive 일 이상 활동이 없지만 과거에는 플레이한 적 있음
+            SELECT MAX(gameDate) FROM game_scores WHERE userId = p.userId
+        ) < DATE_SUB(NOW(), INTERVAL %s DAY)
+        AND (
+            -- 적어도 한 번은 플레이함
+            SELECT COUNT(*) FROM game_scores WHERE userId = p.userId
+        ) > 0
+"""
+
+def to_sqlite(query):
+    """MySQL 날짜 함수와 자리표시자를 SQLite용으로 변환"""
+    query = re.sub(r"DATE_SUB\(NOW\(\), INTERVAL (\S+) DAY\)", r"DATE_SUB_DAYS(\1)", query)
+    return query.replace('%s', '?')
+
+def connect_fixture():
+    conn = sqlite3.connect(':memory:')
+    conn.create_function('NOW', 0, lambda: NOW.strftime('%Y-%m-%d %H:%M:%S'))
+    conn.create_function('DATE_SUB_DAYS', 1,
+                         lambda days: (NOW - timedelta(days=int(days))).strftime('%Y-%m-%d %H:%M:%S'))
+    conn.create_function('DATEDIFF', 2, lambda a, b: (
+        datetime.strptime(a[:10], '%Y-%m-%d') - datetime.strptime(b[:10], '%Y-%m-%d')).days
+        if a and b else None)
+    conn.executescript("""
+        CREATE TABLE players (id INTEGER PRIMARY KEY, userId TEXT, status INTEGER);
+        CREATE TABLE game_scores (id INTEGER PRIMARY KEY, userId TEXT, gameDate TEXT, netBet REAL, winLoss REAL);
+        CREATE TABLE money_flows (id INTEGER PRIMARY KEY, player INTEGER, type INTEGER, amount REAL, createdAt TEXT);
+        CREATE TABLE promotion_players (id INTEGER PRIMARY KEY, player INTEGER, appliedAt TEXT);
+    """)
+
+    def days_ago(days, hour=0):
+        return (NOW - timedelta(days=days)).replace(hour=hour, minute=0, second=0).strftime('%Y-%m-%d %H:%M:%S')
+
+    conn.executemany("INSERT INTO players VALUES (?, ?, ?)", [
+        (1, 'u1', 0),  # 입출금, 이벤트 후 입금 있음
+        (2, 'u2', 0),  # 게임만 있음 (입금/이벤트 없음)
+        (3, 'u3', 0),  # 최근 플레이 (비활성 아님)
+        (4, 'u4', 0),  # 게임 없음
+        (5, 'u5', 1),  # 비활성 계정 상태
+        (6, 'u6', 0),  # 1년 넘은 게임만, 이벤트 전 입금만
+    ])
+    games = [
+        ('u1', 100, 1500.4, -200.6), ('u1', 100, 300.0, 50.0), ('u1', 200, 800.5, 10.5),
+        ('u2', 45, 120.0, -30.0),
+        ('u3', 3, 500.0, 0.0),
+        ('u5', 90, 100.0, 0.0),
+        ('u6', 400, 700.0, -700.0), ('u6', 500, 100.0, 20.0),
+    ]
+    conn.executemany("INSERT INTO game_scores (userId, gameDate, netBet, winLoss) VALUES (?, ?, ?, ?)",
+                     [(user, days_ago(days)[:10], net_bet, win_loss) for user, days, net_bet, win_loss in games])
+    money = [
+        # 1년 평균 입금 150.5, 출금 합계 50.5로 반올림 경계값 포함
+        (1, 0, 100.0, 300), (1, 0, 201.0, 120), (1, 1, 50.5, 140), (1, 0, 999.0, 500),
+        (4, 0, 1000.0, 10),
+        (6, 0, 400.0, 420), (6, 1, 30.0, 410),
+    ]
+    conn.executemany("INSERT INTO money_flows (player, type, amount, createdAt) VALUES (?, ?, ?, ?)",
+                     [(player, kind, amount, days_ago(days, hour=9)) for player, kind, amount, days in money])
+    conn.executemany("INSERT INTO promotion_players (player, appliedAt) VALUES (?, ?)", [
+        (1, days_ago(130)), (1, days_ago(110)), (1, None),
+        (6, days_ago(415)), (6, None),
+    ])
+    return conn
+
+@unittest.skipIf(UserValueScoring is None, "user value scoring dependencies are not installed")
+class TestFetchUserData(unittest.TestCase):
+    """fetch_user_data 그룹 집계 쿼리 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.conn = connect_fixture()
+        conn = self.conn
+
+        class SQLiteScoring(UserValueScoring):
+            def _read_frame(self, query, params=None):
+                return pd.read_sql(to_sqlite(query), conn, params=params)
+
+        self.scoring = SQLiteScoring(db_connection=object(), data_dir=self.temp_dir)
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.conn.close()
+        shutil.rmtree(self.temp_dir)
+
+    def legacy_user_data(self, days_inactive):
+        df = pd.read_sql(to_sqlite(LEGACY_USER_QUERY), self.conn, params=(days_inactive,))
+        return df.sort_values('player_id').reset_index(drop=True)
+
+    @staticmethod
+    def normalize(df):
+        df = df.copy()
+        df['last_played_date'] = df['last_played_date'].astype(str).str[:10]
+        numeric = df.columns.difference(['userId', 'last_played_date'])
+        df[numeric] = df[numeric].astype(float)
+        return df
+
+    def test_grouped_query_matches_per_user_query(self):
+        """그룹 집계 결과가 이전 상관 서브쿼리 결과와 같은지 테스트"""
+        for days_inactive in (90, 30):
+            legacy = self.legacy_user_data(days_inactive)
+            grouped = self.scoring.fetch_user_data(days_inactive=days_inactive, max_workers=1)
+            grouped = grouped.sort_values('player_id').reset_index(drop=True)
+
+            self.assertEqual(list(grouped.columns), list(legacy.columns))
+            pd.testing.assert_frame_equal(self.normalize(grouped), self.normalize(legacy))
+
+        # 게임 없는 사용자(4), 최근 플레이(3), 비활성 계정(5)은 제외
+        self.assertEqual(list(grouped['player_id']), [1, 2, 6])
+        u1 = grouped.set_index('player_id').loc[1]
+        self.assertEqual(u1['avg_deposit_amount'], 151)
+        self.assertEqual(u1['total_withdrawals_1y'], 51)
+        u2 = grouped.set_index('player_id').loc[2]
+        self.assertEqual(u2['total_deposits_count'], 0)
+        self.assertEqual(u2['events_received'], 0)
+        self.assertEqual(u2['converted_after_event'], 0)
+
+    def test_scores_match_per_user_query(self):
+        """두 결과로 계산한 가치 점수가 같은지 테스트"""
+        legacy = self.legacy_user_data(30)
+        grouped = self.scoring.fetch_user_data(days_inactive=30, max_workers=1)
+        grouped = grouped.sort_values('player_id').reset_index(drop=True)
+
+        score_columns = ['historical_spending_score', 'social_influence_score',
+                         'engagement_history_score', 'user_value_score']
+        scores = []
+        for df in (self.normalize(legacy), self.normalize(grouped)):
+            df['reengagement_probability'] = 0.5
+            scores.append(self.scoring.calculate_user_value_score(df)[score_columns])
+        pd.testing.assert_frame_equal(scores[1], scores[0])
+
+if __name__ == '__main__':
+    unittest.main()
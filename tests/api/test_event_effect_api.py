@@ -0,0 +1,141 @@
+"""
+이벤트 효과 분석 API 테스트
+
+실제 DB 대신 쿼리와 파라미터를 기록하고 준비된 행을 반환하는 모의 연결을 사용합니다.
+"""
+
+import json
+import unittest
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+try:
+    import mariadb
+    from src.api import event_effect_api
+    from src.utils.response_cache import get_response_cache
+except ImportError:  # mariadb 커넥터가 없는 환경
+    mariadb = None
+
+def make_reward_row(reward_id, **overrides):
+    row = {
+        'reward_id': reward_id, 'event_id': 1, 'event_name': 'spring', 'player_id': 100 + reward_id,
+        'player_account': f'acc{reward_id}', 'reward_amount': Decimal('1000.00'),
+        'applied_at': None, 'event_date': date(2024, 5, 1),
+        'has_played_after': 1, 'first_play_after': date(2024, 5, 3), 'play_days_after': Decimal(2),
+        'net_bet_after': Decimal('5000.00'), 'has_deposit_after': 0, 'first_deposit_after': None,
+        'deposit_count_after': Decimal(0), 'deposit_amount_after': Decimal(0),
+        'last_play_day': date(2024, 5, 4), 'days_active_after': 3,
+        'days_to_first_play': 2, 'days_to_first_deposit': None,
+    }
+    row.update(overrides)
+    return row
+
+class FakeDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def query(self, sql, params=None):
+        self.calls.append((sql, params))
+        return self.rows
+
+    def stream(self, sql, params=None):
+        self.calls.append((sql, params))
+        yield from self.rows
+
+@unittest.skipIf(mariadb is None, "mariadb connector is not installed")
+class TestEventEffectAPI(unittest.TestCase):
+    """이벤트 효과 API 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        get_response_cache(event_effect_api.app).clear()
+        self.client = event_effect_api.app.test_client()
+
+    def request(self, url, rows):
+        db = FakeDB(rows)
+        with patch.object(event_effect_api, 'MariaDBConnection', return_value=db):
+            response = self.client.get(url)
+            response.get_data()  # 스트리밍 응답도 모의 연결이 유효할 때 소비
+        return response, db
+
+    def test_summary_computed_in_sql(self):
+        """이벤트별 집계를 GROUP BY 결과로 구성하고 플레이어 상세를 포함하지 않는지 테스트"""
+        summary_row = {
+            'event_id': 1, 'event_name': 'spring', 'total_rewards': Decimal('2000'),
+            'total_players': 2, 'players_played': Decimal(1), 'players_deposited': Decimal(1),
+            'total_play_days': Decimal(3), 'total_net_bet': Decimal('7000'), 'total_deposits': Decimal(1),
+            'total_deposit_amount': Decimal('3000'), 'days_to_play_sum': Decimal(4),
+            'days_to_deposit_sum': Decimal(0),
+        }
+        response, db = self.request('/api/event-effect?days=14&event_id=1', [summary_row])
+
+        self.assertEqual(response.status_code, 200)
+        sql, params = db.calls[0]
+        self.assertIn('GROUP BY \n                x.event_id', sql)
+        self.assertEqual(params, (14, '1'))
+
+        data = response.get_json()
+        event = data['events'][0]
+        self.assertNotIn('player_data', event)
+        self.assertEqual(event['retention_rate'], 50.0)
+        self.assertEqual(event['avg_days_to_play'], 4.0)
+        self.assertEqual(event['roi'], 50.0)
+        self.assertEqual(data['overall_summary']['total_players_rewarded'], 2)
+        self.assertEqual(data['query_params']['event_id'], '1')
+
+    def test_fields_projection(self):
+        """fields= 파라미터로 섹션과 이벤트 항목을 선택하는지 테스트"""
+        summary_row = {
+            'event_id': 1, 'event_name': 'spring', 'total_rewards': 0, 'total_players': 1,
+            'players_played': 0, 'players_deposited': 0, 'total_play_days': 0, 'total_net_bet': 0,
+            'total_deposits': 0, 'total_deposit_amount': 0, 'days_to_play_sum': 0, 'days_to_deposit_sum': 0,
+        }
+        response, _ = self.request('/api/event-effect?fields=overall_summary', [summary_row])
+        self.assertEqual(list(response.get_json()), ['overall_summary'])
+
+        response, _ = self.request('/api/event-effect?fields=events.event_id,events.roi', [summary_row])
+        self.assertEqual(response.get_json(), {'events': [{'event_id': 1, 'roi': 0}]})
+
+        response, _ = self.request('/api/event-effect?fields=player_data', [])
+        self.assertEqual(response.status_code, 400)
+
+    def test_players_keyset_page(self):
+        """플레이어 상세를 limit+1 행으로 조회해 next_after를 계산하는지 테스트"""
+        rows = [make_reward_row(i) for i in (9, 8, 7)]
+        response, db = self.request('/api/event-effect/players?limit=2&after=10&fields=reward_id,play_days_after', rows)
+
+        sql, params = db.calls[0]
+        self.assertIn('er.id < %s', sql)
+        self.assertTrue(sql.rstrip().endswith('LIMIT %s'))
+        self.assertEqual(params, (30, 10, 3))
+
+        data = response.get_json()
+        self.assertEqual(data['players'], [
+            {'reward_id': 9, 'play_days_after': 2},
+            {'reward_id': 8, 'play_days_after': 2},
+        ])
+        self.assertEqual(data['next_after'], 8)
+
+    def test_players_ndjson_stream(self):
+        """format=ndjson이면 전체 행을 한 줄에 하나씩 스트리밍하는지 테스트"""
+        rows = [make_reward_row(i) for i in (2, 1)]
+        response, db = self.request('/api/event-effect/players?format=ndjson', rows)
+        body = response.get_data(as_text=True)
+
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        self.assertNotIn('LIMIT', db.calls[0][0])
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([line['reward_id'] for line in lines], [2, 1])
+        self.assertEqual(lines[0]['event_date'], '2024-05-01')
+        self.assertEqual(lines[0]['days_to_first_deposit'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
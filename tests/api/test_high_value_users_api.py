@@ -0,0 +1,101 @@
+"""
+고가치 사용자 API 테스트
+
+실제 DB 대신 쿼리 횟수를 기록하고 준비된 행을 반환하는 모의 연결을 사용합니다.
+"""
+
+import unittest
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from src.api import high_value_users_api
+from src.utils.response_cache import get_response_cache
+
+class FakeDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def __call__(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def query(self, sql, params=None):
+        self.calls.append((sql, params))
+        return [dict(row) for row in self.rows]
+
+class TestHighValueUsersAPI(unittest.TestCase):
+    """고가치 사용자 API 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        high_value_users_api._snapshots.clear()
+        get_response_cache(high_value_users_api.app).clear()
+        self.client = high_value_users_api.app.test_client()
+        today = date.today()
+        # 유효 배팅이 같은 사용자가 있어 id로 순서가 결정되는 경우 포함
+        self.db = FakeDB([
+            {'player_id': i, 'username': f'user{i}', 'play_days': 7 + i,
+             'total_valid_bet': 100000 + (i // 2) * 1000, 'last_play_date': today - timedelta(days=i)}
+            for i in range(1, 8)
+        ])
+        patcher = patch.object(high_value_users_api, 'DatabaseConnection', self.db)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get(self, **params):
+        response = self.client.get('/api/high-value-users', query_string=params)
+        return response.status_code, response.get_json()
+
+    def test_cursor_pages_follow_keyset_order(self):
+        """커서로 이어 받은 페이지가 (정렬 값, id) 내림차순 전체와 같은지 테스트"""
+        seen = []
+        status, data = self.get(limit=3)
+        while True:
+            self.assertEqual(status, 200)
+            seen.extend(user['username'] for user in data['users'])
+            cursor = data['pagination']['next_cursor']
+            if cursor is None:
+                break
+            status, data = self.get(limit=3, cursor=cursor)
+
+        self.assertEqual(seen, ['user7', 'user6', 'user5', 'user4', 'user3', 'user2', 'user1'])
+        self.assertEqual(data['users'][-1]['index'], 7)
+        # 스냅샷은 한 번만 집계
+        self.assertEqual(len(self.db.calls), 1)
+
+    def test_page_number_matches_cursor(self):
+        """page 번호 페이지네이션과 커서 페이지네이션 결과가 같은지 테스트"""
+        _, first = self.get(limit=2, sort='playDays', direction='asc')
+        _, by_cursor = self.get(limit=2, sort='playDays', direction='asc',
+                                cursor=first['pagination']['next_cursor'])
+        _, by_page = self.get(limit=2, sort='playDays', direction='asc', page=2)
+
+        self.assertEqual(by_cursor['users'], by_page['users'])
+        self.assertEqual([u['username'] for u in by_page['users']], ['user3', 'user4'])
+        self.assertEqual(by_page['pagination']['total'], 7)
+        self.assertEqual(by_page['pagination']['total_pages'], 4)
+
+    def test_invalid_cursor(self):
+        """잘못된 커서와 정렬 기준이 다른 커서 테스트"""
+        status, _ = self.get(cursor='not-a-cursor')
+        self.assertEqual(status, 400)
+
+        _, data = self.get(limit=2)
+        status, _ = self.get(limit=2, sort='lastPlay', cursor=data['pagination']['next_cursor'])
+        self.assertEqual(status, 400)
+
+    def test_search_is_parameterized(self):
+        """검색어를 쿼리 파라미터로 전달하는지 테스트"""
+        self.get(search="x' OR '1'='1")
+        sql, params = self.db.calls[0]
+        self.assertIn('LIKE %s', sql)
+        self.assertEqual(params, ("%x' OR '1'='1%",))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,217 @@
+"""
+비동기 쿼리 실행 모듈 테스트
+
+실제 DB 대신 실행 시간을 흉내 내는 모의 연결을 사용합니다.
+"""
+
+import time
+import asyncio
+import threading
+import unittest
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+try:
+    import mariadb
+    from src.database import async_connection
+    from src.database.async_connection import AsyncMariaDBConnection, QueryTimeoutError
+except ImportError:  # mariadb 커넥터가 없는 환경
+    mariadb = None
+
+try:
+    from src.analysis.user.inactive_event_analyzer import InactiveUserEventAnalyzer
+except ImportError:  # matplotlib 등 분석 의존성이 없는 환경
+    InactiveUserEventAnalyzer = None
+
+class FakeCursor:
+    """'SLEEP n' 쿼리는 n초 동안 실행되며 KILL QUERY로 중단되는 모의 커서"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def execute(self, query, params=None):
+        if query.startswith('SLEEP'):
+            if self.conn.killed.wait(float(query.split()[1])):
+                raise mariadb.Error("Query execution was interrupted")
+            self.rows = [{'query': query}]
+        else:
+            self.rows = [{'n': i} for i in range(int(query.split()[1]))]
+
+    def fetchall(self):
+        rows, self.rows = self.rows, []
+        return rows
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchmany(self, size):
+        rows, self.rows = self.rows[:size], self.rows[size:]
+        return rows
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    def __init__(self, connection_id):
+        self.connection_id = connection_id
+        self.killed = threading.Event()
+
+    def cursor(self, **kwargs):
+        return FakeCursor(self)
+
+class FakeDB:
+    """get_connection/connection_pool만 흉내 내는 MariaDBConnection 대역"""
+
+    def __init__(self, size=4):
+        self.connections = [FakeConnection(100 + i) for i in range(size)]
+        self.states = {conn.connection_id: {} for conn in self.connections}
+        self.free = list(self.connections)
+        self.lock = threading.Lock()
+        self.connection_pool = MagicMock()
+        self.connection_pool.name = f"fake_pool_{id(self)}"
+        self.connection_pool.size = size
+        self.connection_pool.connection_state.side_effect = lambda conn: self.states[conn.connection_id]
+        self.discarded = []
+
+    def _get_connection_params(self):
+        return {}
+
+    @contextmanager
+    def get_connection(self):
+        with self.lock:
+            conn = self.free.pop()
+        try:
+            yield conn
+        finally:
+            if self.states[conn.connection_id].pop('discard', False):
+                self.discarded.append(conn.connection_id)
+            with self.lock:
+                self.free.append(conn)
+
+@unittest.skipIf(mariadb is None, "mariadb connector is not installed")
+class TestAsyncMariaDBConnection(unittest.TestCase):
+    """동시 실행, 제한 시간과 KILL QUERY, 스트리밍 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.db = FakeDB()
+        self.adb = AsyncMariaDBConnection(self.db, cancel_grace=1.0)
+
+    def kill_connect(self, **kwargs):
+        """KILL QUERY를 대상 모의 연결에 전달하는 mariadb.connect 대역"""
+        killer = MagicMock()
+
+        def execute(sql):
+            target = int(sql.split()[-1])
+            self.killed_ids.append(target)
+            next(conn for conn in self.db.connections if conn.connection_id == target).killed.set()
+
+        killer.cursor.return_value.execute.side_effect = execute
+        return killer
+
+    def test_gather_runs_concurrently(self):
+        """독립 쿼리의 동시 실행과 결과 순서 테스트"""
+        start = time.monotonic()
+        results = asyncio.run(self.adb.gather(
+            'SLEEP 0.3',
+            ('SLEEP 0.2', None),
+            self.adb.query_one('SLEEP 0.1'),
+        ))
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.55)
+        self.assertEqual(results[0], [{'query': 'SLEEP 0.3'}])
+        self.assertEqual(results[2], {'query': 'SLEEP 0.1'})
+
+    def test_run_sync_in_gather(self):
+        """동기 조회 함수를 다른 쿼리와 동시에 실행하는지 테스트"""
+        def load(seconds, label=None):
+            time.sleep(seconds)
+            return label
+
+        start = time.monotonic()
+        results = asyncio.run(self.adb.gather(
+            self.adb.run_sync(load, 0.3, label='a'),
+            self.adb.run_sync(load, 0.3, label='b'),
+            'SLEEP 0.3',
+        ))
+
+        self.assertLess(time.monotonic() - start, 0.55)
+        self.assertEqual(results, ['a', 'b', [{'query': 'SLEEP 0.3'}]])
+        # 중단할 서버 쿼리가 없으므로 cancel_grace(1초)를 기다리지 않고 바로 실패
+        start = time.monotonic()
+        with self.assertRaises(QueryTimeoutError):
+            asyncio.run(self.adb.run_sync(load, 2.0, timeout=0.1))
+        self.assertLess(time.monotonic() - start, 0.5)
+
+    def test_executors_reset_after_fork(self):
+        """fork된 자식 프로세스에서 공유 스레드 풀을 새로 만드는지 테스트"""
+        executor = self.adb._executor
+        with patch.dict(async_connection._executors, clear=False):
+            async_connection._reset_executors_after_fork()
+            self.assertEqual(async_connection._executors, {})
+            child = AsyncMariaDBConnection(self.db)
+            self.assertIsNot(child._executor, executor)
+
+    def test_timeout_kills_query(self):
+        """제한 시간 초과 시 KILL QUERY 전송 및 연결 폐기 테스트"""
+        self.killed_ids = []
+        with patch('src.database.async_connection.mariadb.connect', side_effect=self.kill_connect):
+            start = time.monotonic()
+            with self.assertRaises(QueryTimeoutError):
+                asyncio.run(self.adb.query('SLEEP 5', timeout=0.1))
+
+        self.assertLess(time.monotonic() - start, 2.0)
+        self.assertEqual(len(self.killed_ids), 1)
+        self.assertEqual(self.db.discarded, self.killed_ids)
+        self.assertEqual(len(self.db.free), 4)
+
+    def test_stream(self):
+        """청크 단위 스트리밍과 중단 시 연결 폐기 테스트"""
+        async def collect(limit=None):
+            rows = []
+            async for row in self.adb.stream('ROWS 25', chunk_size=10):
+                rows.append(row['n'])
+                if limit is not None and len(rows) >= limit:
+                    break
+            return rows
+
+        self.assertEqual(asyncio.run(collect()), list(range(25)))
+        self.assertEqual(self.db.discarded, [])
+
+        self.assertEqual(asyncio.run(collect(limit=5)), list(range(5)))
+        self.assertEqual(len(self.db.discarded), 1)
+        self.assertEqual(len(self.db.free), 4)
+
+@unittest.skipIf(mariadb is None or InactiveUserEventAnalyzer is None,
+                 "mariadb connector or analysis dependencies are not installed")
+class TestUnpooledConnection(unittest.TestCase):
+    """연결 풀이 없는 기본(모의) 연결 사용 테스트"""
+
+    def test_dashboard_analyzer_default_connection(self):
+        """대시보드와 같은 방식으로 분석기의 기본 연결에 비동기 실행기를 만들 수 있는지 테스트"""
+        analyzer = InactiveUserEventAnalyzer()
+        adb = AsyncMariaDBConnection(analyzer.db)
+        self.assertFalse(adb.pooled)
+
+        with analyzer.memo_scope():
+            participants, converted, rows = asyncio.run(adb.gather(
+                adb.run_sync(analyzer.get_event_participants),
+                adb.run_sync(analyzer.get_inactive_event_deposit_users, days_inactive=10),
+                "SELECT player, appliedAt FROM promotion_players",
+            ))
+
+        self.assertGreater(len(participants), 0)
+        self.assertGreater(len(converted), 0)
+        self.assertEqual(len(rows), len(participants))
+
+        async def collect():
+            return [row async for row in adb.stream("SELECT player, appliedAt FROM promotion_players")]
+
+        streamed = asyncio.run(collect())
+        self.assertEqual(len(streamed), len(rows))
+        self.assertEqual(set(streamed[0]), set(rows[0]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+대량 쓰기 보조 모듈 테스트
+"""
+
+import io
+import csv
+import unittest
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.database.bulk_writer import (
+    build_insert_sql, iter_packet_chunks, load_data_sql, normalize_rows, quote_identifier, write_infile
+)
+
+class TestBulkWriter(unittest.TestCase):
+    """대량 쓰기 SQL 생성 및 청크 분할 테스트"""
+
+    def test_normalize_rows(self):
+        """DataFrame/딕셔너리/튜플 입력 정규화 및 결측치 변환 테스트"""
+        frame = pd.DataFrame({
+            'id': np.array([1, 2], dtype=np.int64),
+            'score': [0.5, np.nan],
+            'created_at': [pd.Timestamp('2024-01-01 10:00:00'), pd.NaT],
+        })
+        columns, rows = normalize_rows(frame)
+        self.assertEqual(columns, ['id', 'score', 'created_at'])
+        self.assertEqual(rows, [(1, 0.5, datetime(2024, 1, 1, 10)), (2, None, None)])
+        self.assertIs(type(rows[0][0]), int)
+
+        columns, rows = normalize_rows([{'a': 1, 'b': 'x'}, {'a': 2}], columns=['b', 'a'])
+        self.assertEqual(rows, [('x', 1), (None, 2)])
+
+        with self.assertRaises(ValueError):
+            normalize_rows([(1, 2)])
+
+    def test_build_insert_sql(self):
+        """다중 행 INSERT와 upsert 문 생성 테스트"""
+        sql = build_insert_sql('hermes.targets', ['player_id', 'score'], 2, update_columns=['score'])
+        self.assertEqual(
+            sql,
+            "INSERT INTO `hermes`.`targets` (`player_id`, `score`) VALUES (%s, %s), (%s, %s) "
+            "ON DUPLICATE KEY UPDATE `score` = VALUES(`score`)"
+        )
+        with self.assertRaises(ValueError):
+            quote_identifier('targets; DROP TABLE players')
+
+    def test_iter_packet_chunks(self):
+        """패킷 크기와 최대 행 수를 넘지 않는 청크 분할 테스트"""
+        rows = [(i, 'x' * 90) for i in range(100)]
+        chunks = list(iter_packet_chunks(rows, max_packet_bytes=1000, base_bytes=100))
+
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(chunks[-1][1], 100)
+        for (start, end, size), following in zip(chunks, chunks[1:]):
+            self.assertEqual(end, following[0])
+        self.assertTrue(all(size <= 1000 for _, _, size in chunks))
+
+        limited = list(iter_packet_chunks(rows, max_packet_bytes=10 ** 9, max_rows=30))
+        self.assertEqual([end - start for start, end, _ in limited], [30, 30, 30, 10])
+
+        # 한 행이 패킷보다 커도 단독 청크로 반환
+        self.assertEqual([c[:2] for c in iter_packet_chunks([(1, 'x' * 50)], 10)], [(0, 1)])
+
+    def test_write_infile(self):
+        """LOAD DATA용 CSV의 NULL/백슬래시/따옴표 인코딩 테스트"""
+        stream = io.StringIO()
+        write_infile([(1, None, 'a,"b"', 'c\\N', True)], stream)
+        self.assertEqual(stream.getvalue(), '1,\\N,"a,""b""",c\\\\N,1\n')
+        self.assertEqual(next(csv.reader(io.StringIO(stream.getvalue())))[2], 'a,"b"')
+
+        sql = load_data_sql('audit_logs', ['id', 'message'], duplicate_mode='REPLACE')
+        self.assertTrue(sql.startswith("LOAD DATA LOCAL INFILE %s REPLACE INTO TABLE `audit_logs`"))
+        self.assertIn("ESCAPED BY '\\\\'", sql)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ from unittest.mock import patch, MagicMock
 
 from src.config.database import DatabaseConfig
 from src.database.connection import DatabaseConnection
+from pymysql.cursors import SSDictCursor
 
 class TestDatabaseConfig(unittest.TestCase):
     """DatabaseConfig 클래스 테스트"""
@@ -183,5 +184,59 @@ class TestDatabaseConnection(unittest.TestCase):
         # 종료 시 연결 닫기 확인
         mock_connection.close.assert_called_once()
 
+    @patch('src.database.connection.DatabaseConfig')
+    @patch('src.database.connection.pymysql.connect')
+    def test_iter_query(self, mock_connect, mock_config_class):
+        """서버 측 커서 청크 스트리밍 테스트"""
+        # 설정 모의 객체
+        mock_config = MagicMock()
+        mock_config.get_connection_params.return_value = {"host": "test_host"}
+        mock_config_class.return_value = mock_config
+        
+        # 커서 모의 객체 (5개 행을 2개씩 반환)
+        rows = [{"id": i} for i in range(5)]
+        mock_cursor = MagicMock()
+        mock_cursor.fetchmany.side_effect = [rows[0:2], rows[2:4], rows[4:5], []]
+        
+        # 스트리밍 전용 연결 모의 객체
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_connection
+        
+        db = DatabaseConnection()
+        chunks = list(db.iter_query("SELECT id FROM test", chunk_size=2))
+        
+        # SSDictCursor 사용 및 청크 확인
+        self.assertIs(mock_connect.call_args.kwargs["cursorclass"], SSDictCursor)
+        self.assertEqual(chunks, [rows[0:2], rows[2:4], rows[4:5]])
+        mock_cursor.close.assert_called_once()
+        mock_connection.close.assert_called_once()
+    
+    @patch('src.database.connection.DatabaseConfig')
+    @patch('src.database.connection.pymysql.connect')
+    def test_stream_early_close(self, mock_connect, mock_config_class):
+        """스트리밍 도중 중단 시 연결 정리 테스트"""
+        # 설정 모의 객체
+        mock_config = MagicMock()
+        mock_config.get_connection_params.return_value = {"host": "test_host"}
+        mock_config_class.return_value = mock_config
+        
+        # 커서 모의 객체
+        mock_cursor = MagicMock()
+        mock_cursor.fetchmany.return_value = [{"id": 1}, {"id": 2}]
+        
+        mock_connection = MagicMock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_connection
+        
+        db = DatabaseConnection()
+        rows = db.stream("SELECT id FROM test", chunk_size=2)
+        self.assertEqual(next(rows), {"id": 1})
+        rows.close()
+        
+        # 남은 결과를 읽는 cursor.close() 없이 연결만 닫아야 함
+        mock_cursor.close.assert_not_called()
+        mock_connection.close.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main()
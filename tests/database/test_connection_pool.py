@@ -0,0 +1,170 @@
+"""
+공유 연결 풀 모듈 테스트
+"""
+
+import os
+import time
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.database.connection_pool import (
+    SharedConnectionPool, PoolError, PoolExhaustedError, get_shared_pool, make_pool_key,
+    get_pool_metrics, close_all_pools
+)
+
+class TestSharedConnectionPool(unittest.TestCase):
+    """SharedConnectionPool 클래스 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.connect = MagicMock(side_effect=lambda: MagicMock())
+        self.pool = SharedConnectionPool("test_pool", self.connect, size=2, acquire_timeout=0.05)
+
+    def test_reuses_released_connection(self):
+        """반환된 연결 재사용 테스트"""
+        conn1 = self.pool.acquire()
+        self.pool.release(conn1)
+        conn2 = self.pool.acquire()
+
+        self.assertIs(conn1, conn2)
+        self.assertEqual(self.connect.call_count, 1)
+
+        metrics = self.pool.metrics()
+        self.assertEqual(metrics["checkouts"], 2)
+        self.assertEqual(metrics["created"], 1)
+        self.assertEqual(metrics["in_use"], 1)
+
+    def test_exhaustion(self):
+        """풀 고갈 테스트"""
+        self.pool.acquire()
+        self.pool.acquire()
+
+        with self.assertRaises(PoolExhaustedError):
+            self.pool.acquire()
+
+        metrics = self.pool.metrics()
+        self.assertEqual(metrics["exhaustion_count"], 1)
+        self.assertEqual(metrics["waits"], 1)
+        self.assertGreater(metrics["total_wait_time"], 0)
+
+    def test_waiter_gets_released_connection(self):
+        """대기 중인 스레드가 반환된 연결을 받는지 테스트"""
+        pool = SharedConnectionPool("wait_pool", self.connect, size=1, acquire_timeout=2.0)
+        conn = pool.acquire()
+        acquired = []
+
+        thread = threading.Thread(target=lambda: acquired.append(pool.acquire()))
+        thread.start()
+        time.sleep(0.05)
+        pool.release(conn)
+        thread.join(timeout=2.0)
+
+        self.assertEqual(acquired, [conn])
+        self.assertEqual(pool.metrics()["waits"], 1)
+
+    def test_idle_eviction(self):
+        """유휴 연결 정리 테스트"""
+        pool = SharedConnectionPool("idle_pool", self.connect, size=2, max_idle_time=0.01)
+        conn = pool.acquire()
+        pool.release(conn)
+        time.sleep(0.02)
+
+        self.assertEqual(pool.evict_idle(), 1)
+        conn.close.assert_called_once()
+        self.assertEqual(pool.metrics()["open_connections"], 0)
+        self.assertEqual(pool.metrics()["idle_evictions"], 1)
+
+    def test_max_lifetime_recycle(self):
+        """최대 수명 초과 연결 재활용 테스트"""
+        pool = SharedConnectionPool("life_pool", self.connect, size=2, max_lifetime=0.01)
+        conn1 = pool.acquire()
+        time.sleep(0.02)
+        pool.release(conn1)
+        conn2 = pool.acquire()
+
+        self.assertIsNot(conn1, conn2)
+        conn1.close.assert_called_once()
+        self.assertEqual(pool.metrics()["lifetime_recycles"], 1)
+
+    def test_health_check_failure_discards_connection(self):
+        """상태 점검 실패 연결 폐기 테스트"""
+        pool = SharedConnectionPool("health_pool", self.connect, size=2, health_check_interval=0)
+        conn1 = pool.acquire()
+        conn1.ping.side_effect = Exception("gone away")
+        pool.release(conn1)
+        conn2 = pool.acquire()
+
+        self.assertIsNot(conn1, conn2)
+        self.assertEqual(pool.metrics()["health_check_failures"], 1)
+
+    def test_recently_used_connection_skips_health_check(self):
+        """health_check_interval 이내에 반환된 연결은 ping하지 않는지 테스트"""
+        pool = SharedConnectionPool("recent_pool", self.connect, size=1, health_check_interval=60)
+        conn1 = pool.acquire()
+        pool.release(conn1)
+        conn2 = pool.acquire()
+
+        self.assertIs(conn1, conn2)
+        conn1.ping.assert_not_called()
+
+    def test_reset_failure_discards_connection(self):
+        """세션 초기화 실패 연결 폐기 테스트"""
+        reset = MagicMock(side_effect=Exception("reset failed"))
+        pool = SharedConnectionPool("reset_pool", self.connect, size=1, reset_session=reset)
+        conn = pool.acquire()
+        pool.release(conn)
+
+        conn.close.assert_called_once()
+        self.assertEqual(pool.metrics()["open_connections"], 0)
+
+    def test_connection_state_survives_checkout(self):
+        """연결별 상태 유지 및 세션 초기화 함수 전달 테스트"""
+        reset = MagicMock()
+        pool = SharedConnectionPool("state_pool", self.connect, size=1, reset_session=reset)
+        conn = pool.acquire()
+        pool.connection_state(conn)["prepared"] = {"SELECT 1": "cursor"}
+        pool.release(conn)
+
+        reset.assert_called_once_with(conn, {"prepared": {"SELECT 1": "cursor"}})
+        conn = pool.acquire()
+        self.assertEqual(pool.connection_state(conn)["prepared"], {"SELECT 1": "cursor"})
+        pool.release(conn)
+
+        with self.assertRaises(PoolError):
+            pool.connection_state(conn)
+
+    def test_fork_safety(self):
+        """fork 이후 풀 재생성 테스트"""
+        conn = self.pool.acquire()
+        self.pool.release(conn)
+
+        with patch('src.database.connection_pool.os.getpid', return_value=os.getpid() + 1):
+            child_conn = self.pool.acquire()
+
+        self.assertIsNot(conn, child_conn)
+        # 부모 프로세스의 연결은 닫지 않아야 함
+        conn.close.assert_not_called()
+
+class TestPoolRegistry(unittest.TestCase):
+    """공유 풀 레지스트리 테스트"""
+
+    def tearDown(self):
+        """테스트 정리"""
+        close_all_pools()
+
+    def test_same_params_share_pool(self):
+        """동일 접속 정보의 풀 공유 테스트"""
+        params = {"host": "h", "port": 3306, "user": "u", "password": "p", "database": "d"}
+        pool1 = get_shared_pool(make_pool_key(params), "registry_p1", MagicMock())
+        pool2 = get_shared_pool(make_pool_key(dict(params)), "registry_p1", MagicMock())
+        pool3 = get_shared_pool(make_pool_key({**params, "database": "other"}), "registry_p2", MagicMock())
+
+        self.assertIs(pool1, pool2)
+        self.assertIsNot(pool1, pool3)
+        # 다른 테스트가 등록한 풀은 제외하고 이 테스트의 풀만 확인
+        names = [m["name"] for m in get_pool_metrics() if m["name"].startswith("registry_")]
+        self.assertEqual(sorted(names), ["registry_p1", "registry_p2"])
+
+if __name__ == '__main__':
+    unittest.main()
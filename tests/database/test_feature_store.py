@@ -0,0 +1,199 @@
+"""
+플레이어 특성 저장소 모듈 테스트
+"""
+
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from src.database.feature_store import PlayerFeatureStore
+
+class FakeSourceDB:
+    """원본 테이블을 메모리에 보관하고 증분 쿼리를 흉내 내는 연결 객체"""
+
+    def __init__(self):
+        self.now = datetime(2024, 6, 1, 12, 0, 0)
+        self.players = [
+            {'player': 1, 'userId': 'u1', 'status': 0},
+            {'player': 2, 'userId': 'u2', 'status': 0},
+        ]
+        self.games = []
+        self.money = []
+        self.promotions = []
+        self.queries = []
+        self.executed = []
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+        return 0
+
+    def query(self, query, params=None):
+        self.queries.append((query, params))
+        if 'upper_bound' in query:
+            return [{'upper_bound': self.now}]
+        if 'MAX(id)' in query:
+            return [{'max_id': max((g['id'] for g in self.games), default=None)}]
+        raise AssertionError(query)
+
+    def iter_query(self, query, params=None, chunk_size=1000):
+        self.queries.append((query, params))
+        if 'FROM players' in query:
+            rows = list(self.players)
+        elif 'FROM promotion_players' in query:
+            lower, upper = params
+            grouped = {}
+            for row in self.promotions:
+                if str(lower) < row['appliedAt'].strftime('%Y-%m-%d %H:%M:%S') <= str(upper):
+                    first, count = grouped.get(row['player'], (row['appliedAt'], 0))
+                    grouped[row['player']] = (min(first, row['appliedAt']), count + 1)
+            rows = [
+                {'player': player, 'first_event_date': first, 'events_received': count}
+                for player, (first, count) in grouped.items()
+            ]
+        elif 'FROM money_flows' in query:
+            lower, upper = params
+            rows = [
+                row for row in self.money
+                if str(lower) < row['createdAt'].strftime('%Y-%m-%d %H:%M:%S') <= str(upper)
+            ]
+        elif 'FROM game_scores' in query:
+            lower, upper = params
+            changed = {(row['userId'], row['gameDate']) for row in self.games if lower < row['id'] <= upper}
+            grouped = {}
+            for row in self.games:
+                key = (row['userId'], row['gameDate'])
+                if key in changed:
+                    count, net_bet, win_loss = grouped.get(key, (0, 0, 0))
+                    grouped[key] = (count + 1, net_bet + round(row['netBet']), win_loss + round(row['winLoss']))
+            rows = [
+                {'userId': user, 'day': day, 'game_count': c, 'net_bet': n, 'win_loss': w}
+                for (user, day), (c, n, w) in grouped.items()
+            ]
+        else:
+            raise AssertionError(query)
+        for i in range(0, len(rows), chunk_size):
+            yield rows[i:i + chunk_size]
+
+class TestPlayerFeatureStore(unittest.TestCase):
+    """PlayerFeatureStore 클래스 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = FakeSourceDB()
+        self.store = PlayerFeatureStore(self.db, store_path=Path(self.temp_dir, 'features.sqlite'))
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def add_game(self, user_id, day, net_bet=100.0, win_loss=-10.0):
+        self.db.games.append({
+            'id': len(self.db.games) + 1, 'userId': user_id,
+            'gameDate': datetime.strptime(day, '%Y-%m-%d').date(),
+            'netBet': net_bet, 'winLoss': win_loss,
+        })
+
+    def test_initial_load(self):
+        """첫 실행 시 전체 이력 적재 테스트"""
+        self.add_game('u1', '2024-01-10')
+        self.add_game('u1', '2024-01-10')
+        self.add_game('u1', '2022-01-01')
+        self.add_game('u2', '2024-05-30')
+        self.db.promotions.append({'player': 1, 'appliedAt': datetime(2024, 1, 1, 9, 0)})
+        self.db.money.extend([
+            {'player': 1, 'type': 0, 'amount': 50, 'createdAt': datetime(2023, 12, 31)},
+            {'player': 1, 'type': 0, 'amount': 200, 'createdAt': datetime(2024, 1, 5)},
+            {'player': 1, 'type': 1, 'amount': 30, 'createdAt': datetime(2024, 1, 6)},
+        ])
+
+        counts = self.store.refresh()
+        self.assertEqual(counts['game_scores'], 4)
+        self.assertEqual(counts['money_flows'], 3)
+
+        df = self.store.get_features(as_of=self.db.now).set_index('player_id')
+        u1 = df.loc[1]
+        self.assertEqual(u1['total_games_played'], 3)
+        self.assertEqual(u1['game_count'], 2)
+        self.assertEqual(u1['total_days_played'], 2)
+        self.assertEqual(u1['total_deposits_1y'], 250)
+        self.assertEqual(u1['total_withdrawals_1y'], 30)
+        self.assertEqual(u1['avg_deposit_amount'], 125)
+        self.assertEqual(u1['events_received'], 1)
+        self.assertEqual(u1['converted_after_event'], 1)
+        self.assertEqual(u1['deposit_amount_after_event'], 200)
+        self.assertEqual(u1['days_inactive'], 143)
+
+        inactive = self.store.get_features(days_inactive=30, as_of=self.db.now)
+        self.assertEqual(list(inactive['player_id']), [1])
+
+    def test_incremental_refresh_reads_only_delta(self):
+        """증분 실행 시 새 행만 반영되는지 테스트"""
+        self.add_game('u1', '2024-05-01')
+        self.db.money.append({'player': 1, 'type': 0, 'amount': 100, 'createdAt': datetime(2024, 5, 1)})
+        self.store.refresh()
+
+        self.db.now = datetime(2024, 6, 2, 12, 0, 0)
+        self.add_game('u1', '2024-06-02')
+        self.db.money.append({'player': 1, 'type': 0, 'amount': 40, 'createdAt': datetime(2024, 6, 2, 8)})
+        self.db.queries.clear()
+
+        counts = self.store.refresh()
+        # 기본 id_rescan_window 안의 이전 일자도 다시 계산
+        self.assertEqual(counts['game_scores'], 2)
+        self.assertEqual(counts['money_flows'], 1)
+        game_params = [p for q, p in self.db.queries if 'FROM game_scores' in q and 'GROUP BY' in q]
+        self.assertEqual(game_params, [(0, 2)])
+
+        # game_scores (userId, gameDate) 인덱스는 첫 실행에서 한 번만 생성
+        self.assertEqual(len(self.db.executed), 1)
+        self.assertIn('idx_game_scores_user_date', self.db.executed[0][0])
+
+        marks = self.store.get_high_water_marks()
+        self.assertEqual(marks['game_scores'], '2')
+        self.assertEqual(marks['money_flows'], '2024-06-02 12:00:00')
+
+        u1 = self.store.get_features(as_of=self.db.now).set_index('player_id').loc[1]
+        self.assertEqual(u1['total_games_played'], 2)
+        self.assertEqual(u1['total_deposits_count'], 2)
+        self.assertEqual(u1['total_deposits_1y'], 140)
+        self.assertEqual(u1['converted_after_event'], 0)
+
+    def test_late_commit_within_rescan_window(self):
+        """id 순서와 다르게 늦게 커밋된 행과 수정된 행을 중복 없이 반영하는지 테스트"""
+        self.store = PlayerFeatureStore(self.db, store_path=Path(self.temp_dir, 'rescan.sqlite'),
+                                        id_rescan_window=2)
+        self.add_game('u1', '2024-05-01')
+        self.add_game('u1', '2024-05-01')
+        late = self.db.games.pop(0)  # id 1은 아직 커밋되지 않음
+        self.store.refresh()
+        self.assertEqual(self.store.get_high_water_marks()['game_scores'], '2')
+
+        self.db.games.insert(0, late)
+        self.db.games[1]['netBet'] = 500.0
+        self.add_game('u2', '2024-05-02')
+        self.store.refresh()
+
+        u1 = self.store.get_features(as_of=self.db.now).set_index('player_id').loc[1]
+        self.assertEqual(u1['total_games_played'], 2)
+        self.assertEqual(u1['avg_net_bet'], 300)
+
+    def test_window_excludes_aged_out_days(self):
+        """기간 집계에서 오래된 일 단위 집계가 빠지는지 테스트"""
+        self.add_game('u1', '2023-06-10', net_bet=300.0)
+        self.add_game('u1', '2024-05-10', net_bet=100.0)
+        self.store.refresh()
+
+        u1 = self.store.get_features(as_of=datetime(2024, 6, 1)).set_index('player_id').loc[1]
+        self.assertEqual(u1['game_count'], 2)
+        self.assertEqual(u1['avg_net_bet'], 200)
+
+        u1 = self.store.get_features(as_of=datetime(2024, 7, 1)).set_index('player_id').loc[1]
+        self.assertEqual(u1['game_count'], 1)
+        self.assertEqual(u1['avg_net_bet'], 100)
+        self.assertEqual(u1['total_games_played'], 2)
+
+if __name__ == '__main__':
+    unittest.main()
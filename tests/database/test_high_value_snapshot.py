@@ -0,0 +1,178 @@
+"""
+고가치 사용자 스냅샷 모듈 테스트
+"""
+
+import shutil
+import tempfile
+import unittest
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+
+from src.database.high_value_snapshot import HighValueSnapshot, _REFRESH_SQL
+
+class FakeRollups:
+    def __init__(self, db):
+        self.db = db
+        self.calls = []
+        self.versions = {'high_value_users': HighValueSnapshot.version()}
+        self.id_rescan_window = 4
+
+    def refresh(self, sources=None):
+        self.calls.append(sources)
+        return {'game_scores': 0}
+
+    def get_versions(self):
+        return dict(self.versions)
+
+    def set_version(self, name, version):
+        self.versions[name] = version
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.result = None
+        self.rowcount = 0
+
+    def execute(self, sql, params=None):
+        self.db.statements.append((sql, params))
+        if sql.startswith("SELECT value FROM rollup_watermarks WHERE source = %s"):
+            self.result = (self.db.watermarks.setdefault(params[0], '0'),)
+        elif sql.startswith("SELECT value FROM rollup_watermarks WHERE source = 'game_scores'"):
+            self.result = (self.db.watermarks['game_scores'],)
+        elif sql.startswith("UPDATE rollup_watermarks"):
+            self.db.watermarks[params[1]] = params[0]
+        elif sql == _REFRESH_SQL:
+            self.rowcount = 2
+
+    def fetchone(self):
+        return self.result
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+class FakeDB:
+    def __init__(self):
+        self.watermarks = {'game_scores': '10'}
+        self.statements = []
+        self.executed = []
+        self.queries = []
+        self.rows = []
+
+    @contextmanager
+    def get_connection(self):
+        yield FakeConnection(self)
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+        if sql.startswith("DELETE FROM rollup_watermarks"):
+            self.watermarks.pop(params[0], None)
+        return 0
+
+    def query(self, sql, params=None):
+        self.queries.append((sql, params))
+        return self.rows
+
+class TestHighValueSnapshot(unittest.TestCase):
+    """HighValueSnapshot 클래스 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.db = FakeDB()
+        self.rollups = FakeRollups(self.db)
+        self.snapshot = HighValueSnapshot(self.db, self.rollups)
+
+    def refresh_params(self):
+        return [params for sql, params in self.db.statements if sql == _REFRESH_SQL]
+
+    def test_refresh_applies_new_game_scores_range(self):
+        """롤업에 반영된 game_scores id 구간의 사용자만 다시 집계하는지 테스트"""
+        self.assertEqual(self.snapshot.refresh(), 2)
+        self.assertEqual(self.rollups.calls, [['game_scores']])
+        self.assertEqual(self.refresh_params(), [(0, 10, 7, 50000)])
+        self.assertEqual(self.db.watermarks['high_value_users'], '10')
+
+        # 새 행이 없으면 집계하지 않음
+        self.assertEqual(self.snapshot.refresh(), 0)
+        self.assertEqual(len(self.refresh_params()), 1)
+
+        # 롤업과 같이 워터마크 아래 id_rescan_window개 id의 사용자도 다시 집계
+        self.db.watermarks['game_scores'] = '25'
+        self.snapshot.refresh()
+        self.assertEqual(self.refresh_params()[-1], (6, 25, 7, 50000))
+
+    def test_refresh_rebuilds_after_rollup_definition_change(self):
+        """스냅샷을 만든 롤업 버전이 현재와 다르면 비우고 처음부터 다시 계산하는지 테스트"""
+        self.snapshot.refresh()
+        self.rollups.versions['high_value_users'] = '1.1'
+
+        self.snapshot.refresh()
+
+        self.assertIn(("TRUNCATE TABLE high_value_users", None), self.db.executed)
+        self.assertEqual(self.refresh_params()[-1], (0, 10, 7, 50000))
+        self.assertEqual(self.rollups.versions['high_value_users'], HighValueSnapshot.version())
+
+    def test_rebuild_resets_watermark(self):
+        """전체 재계산 시 스냅샷을 비우고 워터마크를 지우는지 테스트"""
+        self.snapshot.rebuild()
+        executed = [sql for sql, _ in self.db.executed]
+        self.assertIn("TRUNCATE TABLE high_value_users", executed)
+        self.assertIn(("DELETE FROM rollup_watermarks WHERE source = %s", ('high_value_users',)),
+                      self.db.executed)
+
+    def test_read_filters(self):
+        """상태/검색 조건과 정렬이 쿼리에 반영되는지 테스트"""
+        self.snapshot.read(status='dormant', search='ab', order_by='last_play_date',
+                           descending=False, limit=5)
+        sql, params = self.db.queries[-1]
+        self.assertIn("h.last_play_date < CURRENT_DATE - INTERVAL %s DAY", sql)
+        self.assertIn("h.userId LIKE %s", sql)
+        self.assertIn("ORDER BY h.last_play_date ASC, h.userId ASC", sql)
+        self.assertNotIn("JOIN players", sql)
+        self.assertEqual(params, (30, '%ab%', 5))
+
+        self.snapshot.read(with_names=True)
+        sql, params = self.db.queries[-1]
+        self.assertIn("p.name", sql)
+        self.assertNotIn("WHERE", sql)
+        self.assertIsNone(params)
+
+    def test_read_rejects_unknown_options(self):
+        """알 수 없는 상태/정렬 기준 테스트"""
+        with self.assertRaises(ValueError):
+            self.snapshot.read(status='new')
+        with self.assertRaises(ValueError):
+            self.snapshot.read(order_by='1; DROP TABLE players')
+
+    def test_export_parquet(self):
+        """스냅샷을 Parquet 파일로 저장하는지 테스트"""
+        self.db.rows = [{
+            'player_id': 1, 'username': 'u1', 'play_days': 9, 'total_valid_bet': Decimal('60000.00'),
+            'last_play_date': date(2024, 5, 1), 'days_since_last_play': 31,
+        }]
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+
+        path = self.snapshot.export_parquet(Path(temp_dir, 'snapshot', 'high_value_users.parquet'))
+        df = pd.read_parquet(path)
+        self.assertEqual(df['username'].tolist(), ['u1'])
+        self.assertEqual(df['total_valid_bet'].tolist(), [60000.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+ORM Repository 대량 작업 및 즉시 로딩 테스트
+
+MariaDB 대신 메모리 SQLite 엔진을 사용합니다.
+"""
+
+import unittest
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import sessionmaker
+
+from src.database.orm import Base, DatabaseSession, ModelError, Repository
+from src.database.models import Player, PlayerWallet
+
+class TestRepository(unittest.TestCase):
+    """Repository 대량 INSERT, 스트리밍, 키셋 페이지, selectinload 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+
+        self.db_session = DatabaseSession.__new__(DatabaseSession)
+        self.db_session.engine = self.engine
+        self.db_session.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
+
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: self.statements.append(statement))
+
+        self.players = Repository(self.db_session, Player)
+        self.wallets = Repository(self.db_session, PlayerWallet)
+        self.players.bulk_create([
+            {'name': f'player{i}', 'account': f'acc{i}', 'status': 'active' if i % 2 else 'dormant'}
+            for i in range(1, 26)
+        ], chunk_size=10)
+        self.wallets.bulk_create([
+            {'player_id': i, 'currency': currency, 'balance': float(i)}
+            for i in range(1, 26) for currency in ('KRW', 'USD')
+        ])
+        self.statements.clear()
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.engine.dispose()
+
+    def test_bulk_create(self):
+        """대량 INSERT와 열 기본값 적용 테스트"""
+        self.assertEqual(self.players.count(), 25)
+        player = self.players.get_by_id(1)
+        self.assertIsNotNone(player.created_at)
+        self.assertEqual(self.players.bulk_create([]), 0)
+
+    def test_find_by_eager_load(self):
+        """selectinload로 관계를 쿼리 두 번에 읽는지 테스트"""
+        players = self.players.find_by(status='active', eager_load=['wallets'])
+
+        self.assertEqual(len(players), 13)
+        self.assertEqual(sum(len(player.wallets) for player in players), 26)
+        self.assertEqual(len(self.statements), 2)
+
+        with self.assertRaises(ModelError):
+            self.players.find_by(eager_load=['missing'])
+
+    def test_iter_all(self):
+        """기본 키 순서 스트리밍 테스트"""
+        ids = [player.id for player in Repository(self.db_session, Player, eager_load=['wallets']).iter_all(chunk_size=7)]
+        self.assertEqual(ids, list(range(1, 26)))
+
+    def test_page(self):
+        """키셋 페이지 조회 테스트"""
+        pages, after_id = [], None
+        while True:
+            page = self.players.page(after_id=after_id, limit=10)
+            pages.append([player.id for player in page])
+            if len(page) < 10:
+                break
+            after_id = page[-1].id
+
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        self.assertEqual(pages[1][0], 11)
+        self.assertIn('players.id > ?', self.statements[-1])
+
+    def test_build_upsert(self):
+        """ON DUPLICATE KEY UPDATE 문 생성 테스트"""
+        sql = str(self.wallets.build_upsert(['balance', 'updated_at']).compile(dialect=mysql.dialect()))
+        self.assertIn('INSERT INTO player_wallets', sql)
+        self.assertIn('ON DUPLICATE KEY UPDATE balance = VALUES(balance), updated_at = VALUES(updated_at)', sql)
+
+if __name__ == '__main__':
+    unittest.main()
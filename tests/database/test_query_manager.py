@@ -14,12 +14,15 @@ import tempfile
 import shutil
 import json
 import time
+from datetime import datetime
+from decimal import Decimal
 
 # 프로젝트 루트 디렉토리를 sys.path에 추가
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
 from src.database.query_manager import QueryManager, QueryError
+from src.database.sql_catalog import SqlCatalog
 
 class TestQueryManager(unittest.TestCase):
     """QueryManager 클래스 테스트"""
@@ -166,6 +169,110 @@ class TestQueryManager(unittest.TestCase):
         # 결과가 영향받은 행 수인지 확인
         self.assertEqual(result, 3)
     
+    def test_bulk_insert(self):
+        """대량 INSERT 위임 및 성능 로깅 테스트"""
+        self.mock_db.bulk_insert = MagicMock(return_value={
+            'method': 'multi_row', 'rows': 3, 'affected_rows': 3, 'seconds': 0.01,
+            'chunks': [{'rows': 3, 'bytes': 120, 'seconds': 0.01}]
+        })
+        rows = pd.DataFrame({'name': ['a', 'b', 'c'], 'value': [1, 2, 3]})
+        
+        result = self.query_manager.bulk_insert('test_table', rows, update_columns=['value'], method='multi_row')
+        
+        self.mock_db.bulk_insert.assert_called_once_with(
+            'test_table', rows, columns=None, update_columns=['value'], method='multi_row'
+        )
+        self.assertEqual(result['affected_rows'], 3)
+        self.assertEqual(list(self.query_manager.performance_log)[-1]['query'], 'BULK INSERT test_table (multi_row)')
+
+    def test_execute_script_timings(self):
+        """스크립트 실행 위임 및 문장별 성능 로깅 테스트"""
+        timings = [
+            {'statement': 'DELETE FROM a', 'section': 'cleanup', 'line': 2, 'rows': 4, 'seconds': 0.02},
+            {'statement': 'DELETE FROM b', 'section': 'cleanup', 'line': 3, 'rows': -1, 'seconds': 0.01},
+        ]
+        self.mock_db.execute_script = MagicMock(return_value=timings)
+
+        result = self.query_manager.execute_script("-- name: cleanup\nDELETE FROM a;\nDELETE FROM b;",
+                                                   section='cleanup', batch_size=2)
+
+        self.mock_db.execute_script.assert_called_once_with(
+            "-- name: cleanup\nDELETE FROM a;\nDELETE FROM b;", section='cleanup', batch_size=2
+        )
+        self.assertEqual(result, timings)
+        log = list(self.query_manager.performance_log)
+        self.assertEqual([entry['query'] for entry in log[-3:]], ['DELETE FROM a', 'DELETE FROM b', 'SQL Script'])
+        self.assertEqual(log[-2]['result_count'], 0)
+
+    def test_execute_named(self):
+        """카탈로그 쿼리 실행 및 템플릿 조회 테스트"""
+        catalog = MagicMock()
+        catalog.get.return_value.bind.return_value = ("SELECT * FROM players WHERE level >= ?", (5,))
+        catalog.source.side_effect = KeyError('missing.sql')
+        self.mock_db.query_named = MagicMock(return_value=self.sample_query_result)
+        query_manager = QueryManager(self.mock_db, cache_dir=self.temp_dir, catalog=catalog)
+        
+        result = query_manager.execute_named('players_by_level', {'min_level': 5}, use_cache=False)
+        
+        self.mock_db.query_named.assert_called_once_with('players_by_level', {'min_level': 5})
+        self.assertEqual(len(result), 3)
+        self.assertEqual(list(query_manager.performance_log)[-1]['query'], "SELECT * FROM players WHERE level >= ?")
+        
+        catalog.get.side_effect = KeyError('unknown')
+        with self.assertRaises(QueryError):
+            query_manager.execute_named('unknown')
+        with self.assertRaises(QueryError):
+            query_manager.load_query_template('missing')
+    
+    def test_execute_named_without_prepared_statements(self):
+        """query_named가 없는 연결에서 '%s' 형식으로 바인딩해 query()로 실행하는지 테스트"""
+        queries_dir = os.path.join(self.temp_dir, 'queries')
+        os.makedirs(queries_dir)
+        with open(os.path.join(queries_dir, 'players.sql'), 'w', encoding='utf-8') as f:
+            f.write("-- name: players_by_level\n"
+                    "SELECT id FROM players WHERE level >= :min_level AND name LIKE 'a%';\n")
+        plain_db = MagicMock(spec=['query'])
+        plain_db.query.return_value = self.sample_query_result
+        query_manager = QueryManager(plain_db, cache_dir=self.temp_dir, catalog=SqlCatalog(queries_dir))
+        
+        result = query_manager.execute_named('players_by_level', {'min_level': 5},
+                                             use_cache=False, as_dataframe=False)
+        
+        plain_db.query.assert_called_once_with(
+            "SELECT id FROM players WHERE level >= %s AND name LIKE 'a%%'", (5,))
+        self.assertEqual(result, self.sample_query_result)
+    
+    def test_cache_hit_matches_miss(self):
+        """캐시 적중 결과가 NULL/날짜/NULL 포함 정수 컬럼까지 미스 결과와 같은지 테스트"""
+        rows = [
+            {'id': 1, 'level': None, 'created_at': datetime(2024, 5, 1, 3, 0), 'amount': Decimal('1.50'), 'memo': 'a'},
+            {'id': 2, 'level': 3, 'created_at': None, 'amount': None, 'memo': None},
+        ]
+        self.mock_db.query.return_value = rows
+        query = "SELECT id, level, created_at, amount, memo FROM players"
+        
+        for backend in ('arrow', 'parquet'):
+            cache_dir = os.path.join(self.temp_dir, backend)
+            query_manager = QueryManager(self.mock_db, cache_dir=cache_dir, cache_backend=backend)
+            miss = query_manager.execute_query(query, use_cache=True, as_dataframe=False)
+            memory_hit = query_manager.execute_query(query, use_cache=True, as_dataframe=False)
+            # 새 인스턴스는 파일 캐시에서 읽음
+            file_hit = QueryManager(self.mock_db, cache_dir=cache_dir, cache_backend=backend).execute_query(
+                query, use_cache=True, as_dataframe=False)
+            
+            for hit in (memory_hit, file_hit):
+                self.assertEqual(hit, rows)
+                self.assertIs(type(hit[0]['created_at']), datetime)
+                self.assertIs(type(hit[1]['level']), int)
+                self.assertIsNone(hit[0]['level'])
+            self.assertIs(miss, rows)
+            
+            df_miss = pd.DataFrame(rows)
+            df_hit = query_manager.execute_query(query, use_cache=True)
+            self.assertEqual(df_hit.dtypes.to_dict(), df_miss.dtypes.to_dict())
+        
+        self.assertEqual(self.mock_db.query.call_count, 2)
+    
     def test_clear_cache(self):
         """캐시 삭제 테스트"""
         # 쿼리 실행 및 캐싱
@@ -209,6 +316,31 @@ class TestQueryManager(unittest.TestCase):
         self.assertEqual(len(filtered_stats), 1)
         self.assertEqual(filtered_stats.iloc[0]['query'], "SELECT * FROM users")
     
+    def test_performance_log_is_bounded(self):
+        """성능 로그 링 버퍼 크기 제한 및 누적 통계 테스트"""
+        query_manager = QueryManager(self.mock_db, use_cache=False, performance_log_size=5)
+        for _ in range(20):
+            query_manager.execute_query("SELECT * FROM users")
+        
+        # 최근 기록은 5개만 보관하지만 통계는 전체 실행 횟수를 반영
+        self.assertEqual(len(query_manager.performance_log), 5)
+        stats = query_manager.get_performance_stats()
+        self.assertEqual(stats.iloc[0]['count'], 20)
+        
+        histogram = query_manager.get_latency_histogram()
+        self.assertEqual(histogram.loc["SELECT * FROM users"].sum(), 20)
+    
+    def test_cache_stats(self):
+        """메모리 캐시 통계 테스트"""
+        query = "SELECT * FROM test_table WHERE stats_test = 1"
+        self.query_manager.execute_query(query, use_cache=True)
+        self.query_manager.execute_query(query, use_cache=True)
+        
+        stats = self.query_manager.get_cache_stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['entries'], 1)
+        self.assertGreater(stats['current_bytes'], 0)
+    
     def test_process_large_results(self):
         """대용량 결과 처리 테스트"""
         # 모의 데이터 설정
@@ -237,6 +369,61 @@ class TestQueryManager(unittest.TestCase):
         self.assertEqual(len(processed_batches[0]), 10)
         self.assertEqual(len(processed_batches[1]), 5)
     
+    def test_process_large_results_keyset(self):
+        """키셋 페이지네이션 대용량 결과 처리 테스트"""
+        # 모의 데이터 설정
+        batch1 = [{'id': i, 'value': i * 10} for i in range(1, 11)]  # 10개
+        batch2 = [{'id': i, 'value': i * 10} for i in range(11, 16)]  # 5개
+        self.mock_db.query.side_effect = [batch1, batch2]
+        
+        processed_batches = []
+        query = "SELECT id, value FROM large_table WHERE value > %s"
+        total = self.query_manager.process_large_results(
+            query, (0,), batch_size=10, processor=processed_batches.append, keyset='id'
+        )
+        
+        # 총 처리된 레코드 수 및 배치 확인 (마지막 배치가 작으므로 추가 조회 없음)
+        self.assertEqual(total, 15)
+        self.assertEqual([len(batch) for batch in processed_batches], [10, 5])
+        self.assertEqual(self.mock_db.query.call_count, 2)
+        
+        # 첫 배치는 키 조건 없이, 두 번째 배치는 마지막 키 이후부터 조회
+        first_query, first_params = self.mock_db.query.call_args_list[0].args
+        second_query, second_params = self.mock_db.query.call_args_list[1].args
+        self.assertNotIn("OFFSET", first_query)
+        self.assertNotIn("WHERE (`id`", first_query)
+        self.assertIn("ORDER BY `id` LIMIT 10", first_query)
+        self.assertEqual(first_params, [0])
+        self.assertIn("WHERE (`id` > %s) ORDER BY `id` LIMIT 10", second_query)
+        self.assertEqual(second_params, [0, 10])
+        self.assertIsInstance(second_params[1], int)
+    
+    def test_process_large_results_composite_keyset_prefetch(self):
+        """복합 키셋 및 다음 배치 선조회 테스트"""
+        batch1 = [{'createdAt': '2024-01-01', 'id': 1}, {'createdAt': '2024-01-01', 'id': 2}]
+        batch2 = [{'createdAt': '2024-01-02', 'id': 3}, {'createdAt': '2024-01-03', 'id': 4}]
+        self.mock_db.query.side_effect = [batch1, batch2, []]
+        
+        processed_batches = []
+        total = self.query_manager.process_large_results(
+            "SELECT createdAt, id FROM money_flows", {'type': 0}, batch_size=2,
+            processor=processed_batches.append, keyset=('createdAt', 'id'), prefetch=True
+        )
+        
+        self.assertEqual(total, 4)
+        self.assertEqual(len(processed_batches), 2)
+        
+        # (createdAt, id) > (마지막 값) 조건이 OR 조건으로 전개되었는지 확인
+        second_query, second_params = self.mock_db.query.call_args_list[1].args
+        self.assertIn(
+            "WHERE (`createdAt` > %(_keyset_1)s) OR "
+            "(`createdAt` = %(_keyset_2)s AND `id` > %(_keyset_3)s)", second_query
+        )
+        self.assertEqual(second_params, {
+            'type': 0, '_keyset_1': '2024-01-01', '_keyset_2': '2024-01-01', '_keyset_3': 2
+        })
+        self.assertIn("ORDER BY `createdAt`, `id` LIMIT 2", second_query)
+    
     def test_query_error_handling(self):
         """쿼리 오류 처리 테스트"""
         # 모의 객체가 예외를 발생시키도록 설정
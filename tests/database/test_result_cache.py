@@ -0,0 +1,163 @@
+"""
+쿼리 결과 캐시 모듈 테스트
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+
+import pandas as pd
+
+from src.database.result_cache import (
+    MemoryCache, ArrowCacheBackend, ParquetCacheBackend, JsonCacheBackend,
+    create_cache_backend, estimate_size
+)
+
+class TestMemoryCache(unittest.TestCase):
+    """MemoryCache 클래스 테스트"""
+
+    def test_evicts_least_recently_used(self):
+        """바이트 예산 초과 시 LRU 제거 테스트"""
+        df = pd.DataFrame({'value': range(100)})
+        size = estimate_size(df)
+        cache = MemoryCache(max_bytes=size * 2)
+
+        cache.set('a', df)
+        cache.set('b', df)
+        cache.get('a')  # a를 최근 사용으로 갱신
+        cache.set('c', df)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertLessEqual(cache.current_bytes, cache.max_bytes)
+
+    def test_oversized_item_not_cached(self):
+        """예산보다 큰 항목 저장 거부 테스트"""
+        cache = MemoryCache(max_bytes=10)
+        self.assertFalse(cache.set('big', pd.DataFrame({'value': range(1000)})))
+        self.assertEqual(len(cache), 0)
+
+    def test_ttl(self):
+        """유효 시간 만료 테스트"""
+        cache = MemoryCache()
+        cache.set('a', [1], timestamp=time.time() - 10)
+        self.assertIsNone(cache.get('a', ttl=5))
+        self.assertEqual(cache.current_bytes, 0)
+
+    def test_lfu_policy(self):
+        """LFU 정책 제거 테스트"""
+        df = pd.DataFrame({'value': range(100)})
+        cache = MemoryCache(max_bytes=estimate_size(df) * 2, policy='lfu')
+
+        cache.set('a', df)
+        cache.set('b', df)
+        cache.get('a')
+        cache.get('a')
+        cache.get('b')
+        cache.set('c', df)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+
+    def test_sweep_and_stats(self):
+        """만료 항목 정리 및 통계 테스트"""
+        cache = MemoryCache()
+        cache.set('old', [1], timestamp=time.time() - 10, ttl=5)
+        cache.set('new', [2], ttl=5)
+        cache.get('new')
+        cache.get('missing')
+
+        self.assertEqual(cache.sweep(), 1)
+        stats = cache.stats()
+        self.assertEqual(stats['entries'], 1)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['expirations'], 1)
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    def test_background_sweeper(self):
+        """백그라운드 만료 항목 정리 스레드 테스트"""
+        cache = MemoryCache(sweep_interval=0.01)
+        try:
+            cache.set('a', [1], ttl=0.01)
+            deadline = time.time() + 2
+            while len(cache) and time.time() < deadline:
+                time.sleep(0.01)
+            self.assertEqual(len(cache), 0)
+        finally:
+            cache.stop_sweeper()
+
+class TestFileCacheBackends(unittest.TestCase):
+    """파일 캐시 백엔드 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.df = pd.DataFrame({
+            'id': [1, 2, 3],
+            'name': ['a', 'b', None],
+            'createdAt': [datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 3)],
+            'amount': [Decimal('10.50'), Decimal('20.25'), Decimal('0.00')],
+        })
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_typed_roundtrip(self):
+        """datetime/Decimal 타입 보존 테스트"""
+        for backend_class in (ArrowCacheBackend, ParquetCacheBackend):
+            backend = backend_class(self.temp_dir)
+            backend.set('key', self.df)
+            _, result = backend.get('key', ttl=60)
+
+            self.assertEqual(list(result.columns), list(self.df.columns))
+            self.assertEqual(result['createdAt'].iloc[1], pd.Timestamp(2024, 1, 2))
+            self.assertEqual(result['amount'].iloc[0], Decimal('10.50'))
+            self.assertTrue(pd.isna(result['name'].iloc[2]))
+
+    def test_atomic_write_leaves_no_temp_files(self):
+        """원자적 쓰기 후 임시 파일이 남지 않는지 테스트"""
+        backend = ArrowCacheBackend(self.temp_dir)
+        backend.set('key', self.df)
+        backend.set('key', self.df.head(1))
+
+        files = sorted(os.listdir(self.temp_dir))
+        self.assertEqual(files, ['key.arrow.cache'])
+        self.assertEqual(len(backend.get('key', ttl=60)[1]), 1)
+
+    def test_expired_file_removed(self):
+        """만료된 캐시 파일 삭제 테스트"""
+        backend = ArrowCacheBackend(self.temp_dir)
+        backend.set('key', self.df)
+        path = backend.path_for('key')
+        old = time.time() - 100
+        os.utime(path, (old, old))
+
+        self.assertIsNone(backend.get('key', ttl=60))
+        self.assertFalse(path.exists())
+
+    def test_json_backend_ignores_other_formats(self):
+        """JSON 백엔드 삭제 시 다른 형식의 파일 제외 테스트"""
+        ArrowCacheBackend(self.temp_dir).set('a', self.df)
+        json_backend = JsonCacheBackend(self.temp_dir)
+        json_backend.set('b', self.df)
+
+        self.assertEqual(json_backend.clear(), 1)
+        self.assertTrue(Path(self.temp_dir, 'a.arrow.cache').exists())
+
+    def test_create_cache_backend(self):
+        """백엔드 생성 테스트"""
+        self.assertIsInstance(create_cache_backend('parquet', self.temp_dir), ParquetCacheBackend)
+        self.assertIsInstance(create_cache_backend(None, self.temp_dir), ArrowCacheBackend)
+        with self.assertRaises(ValueError):
+            create_cache_backend('xml', self.temp_dir)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,219 @@
+"""
+일 단위 롤업 테이블 모듈 테스트
+"""
+
+import unittest
+from contextlib import contextmanager
+from datetime import datetime
+
+from src.database.rollups import DailyRollups, ROLLUP_SOURCES
+
+class FakeCursor:
+    """워터마크 테이블만 흉내 내고 나머지 문장은 기록하는 커서"""
+
+    def __init__(self, db):
+        self.db = db
+        self.result = None
+        self.rowcount = 0
+
+    def execute(self, sql, params=None):
+        self.db.statements.append((sql, params))
+        if self.db.fail_on and self.db.fail_on in sql:
+            raise RuntimeError("refresh failed")
+        if sql.startswith("INSERT IGNORE INTO rollup_watermarks"):
+            source, initial = params
+            self.db.pending.setdefault(source, self.db.watermarks.get(source, initial))
+        elif sql.startswith("SELECT value FROM rollup_watermarks"):
+            self.result = (self.db.pending[params[0]],)
+        elif 'DATE_SUB(NOW()' in sql:
+            self.result = (self.db.now,)
+        elif 'MAX(id)' in sql:
+            self.result = (self.db.max_id,)
+        elif sql.startswith("UPDATE rollup_watermarks"):
+            value, source = params
+            self.db.pending[source] = value
+        else:
+            self.rowcount = 3
+
+    def fetchone(self):
+        return self.result
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    def commit(self):
+        self.db.watermarks.update(self.db.pending)
+        self.db.pending = {}
+        self.db.commits += 1
+
+    def rollback(self):
+        self.db.pending = {}
+        self.db.rollbacks += 1
+
+class FakeDB:
+    """get_connection()/execute()/query()를 제공하는 연결 객체"""
+
+    def __init__(self):
+        self.now = datetime(2024, 6, 1, 12, 0, 0)
+        self.max_id = 10
+        self.watermarks = {}
+        self.versions = {name: source.version for name, source in ROLLUP_SOURCES.items()}
+        self.pending = {}
+        self.statements = []
+        self.executed = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.fail_on = None
+
+    @contextmanager
+    def get_connection(self):
+        yield FakeConnection(self)
+
+    def execute(self, sql, params=None):
+        self.executed.append((sql, params))
+        if sql.startswith("DELETE FROM rollup_watermarks"):
+            for source in params:
+                self.watermarks.pop(source, None)
+        elif sql.startswith("INSERT INTO rollup_versions"):
+            source, version = params
+            self.versions[source] = version
+        return 0
+
+    def query(self, sql, params=None):
+        if 'FROM rollup_versions' in sql:
+            return [{'source': source, 'version': version} for source, version in self.versions.items()]
+        return [{'source': source, 'value': value} for source, value in self.watermarks.items()]
+
+class TestDailyRollups(unittest.TestCase):
+    """DailyRollups 클래스 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.db = FakeDB()
+        self.rollups = DailyRollups(self.db, safety_lag_seconds=60, id_rescan_window=4)
+
+    def refresh_params(self, source):
+        sql = ROLLUP_SOURCES[source].refresh_sql
+        return [params for statement, params in self.db.statements if statement == sql]
+
+    def test_initial_refresh_loads_full_history(self):
+        """첫 실행 시 초기 워터마크부터 적재하고 워터마크를 갱신하는지 테스트"""
+        counts = self.rollups.refresh()
+
+        self.assertEqual(counts, {'game_logs': 3, 'deposits': 3, 'game_scores': 3})
+        self.assertTrue(any('CREATE TABLE IF NOT EXISTS player_daily_activity' in sql
+                            for sql, _ in self.db.executed))
+        self.assertTrue(any('CREATE INDEX IF NOT EXISTS idx_game_scores_user_date' in sql
+                            for sql, _ in self.db.executed))
+        self.assertEqual(self.refresh_params('game_logs'), [("1970-01-01 00:00:00", "2024-06-01 12:00:00")])
+        self.assertEqual(self.refresh_params('game_scores'), [(0, 10)])
+        self.assertEqual(self.rollups.get_watermarks(), {
+            'game_logs': '2024-06-01 12:00:00',
+            'deposits': '2024-06-01 12:00:00',
+            'game_scores': '10',
+        })
+        self.assertEqual(self.db.commits, 3)
+
+    def test_incremental_refresh_reads_only_delta(self):
+        """두 번째 실행은 이전 워터마크 이후 구간만 집계하는지 테스트"""
+        self.rollups.refresh()
+        self.db.statements.clear()
+        self.db.now = datetime(2024, 6, 1, 13, 0, 0)
+        self.db.max_id = 15
+
+        self.rollups.refresh(['game_logs', 'game_scores'])
+
+        self.assertEqual(self.refresh_params('game_logs'), [("2024-06-01 12:00:00", "2024-06-01 13:00:00")])
+        # game_scores는 워터마크 아래 id_rescan_window개 id까지 다시 계산
+        self.assertEqual(self.refresh_params('game_scores'), [(6, 15)])
+        self.assertEqual(self.refresh_params('deposits'), [])
+        self.assertEqual(self.rollups.get_watermarks()['game_scores'], '15')
+
+    def test_id_rescan_recomputes_rows(self):
+        """다시 읽는 id 구간의 롤업 행을 지우고 더하지 않고 다시 계산하는지 테스트"""
+        self.rollups.refresh(['game_scores'])
+        self.db.statements.clear()
+        self.db.max_id = 12
+
+        self.rollups.refresh(['game_scores'])
+
+        source = ROLLUP_SOURCES['game_scores']
+        statements = [statement for statement, _ in self.db.statements]
+        self.assertLess(statements.index(source.delete_sql), statements.index(source.refresh_sql))
+        self.assertEqual([params for statement, params in self.db.statements if statement == source.delete_sql],
+                         [(6, 12)])
+        self.assertIn('game_count = VALUES(game_count)', source.refresh_sql)
+        self.assertNotIn('game_count + VALUES', source.refresh_sql)
+
+    def test_no_new_ids_skips_source(self):
+        """새 id가 없으면 집계 문장을 실행하지 않는지 테스트"""
+        self.rollups.refresh(['game_scores'])
+        self.db.statements.clear()
+
+        counts = self.rollups.refresh(['game_scores'])
+
+        self.assertEqual(counts, {'game_scores': 0})
+        self.assertEqual(self.refresh_params('game_scores'), [])
+        self.assertEqual(self.rollups.get_watermarks()['game_scores'], '10')
+
+    def test_failure_keeps_watermark(self):
+        """집계 실패 시 롤백하고 워터마크를 유지하는지 테스트"""
+        self.rollups.refresh(['deposits'])
+        self.db.now = datetime(2024, 6, 2)
+        self.db.fail_on = 'FROM deposits'
+
+        with self.assertRaises(RuntimeError):
+            self.rollups.refresh(['deposits'])
+
+        self.assertEqual(self.db.rollbacks, 1)
+        self.assertEqual(self.rollups.get_watermarks()['deposits'], '2024-06-01 12:00:00')
+
+    def test_rebuild_resets_shared_table_sources(self):
+        """공유 롤업 테이블의 원본을 함께 다시 적재하는지 테스트"""
+        self.rollups.refresh()
+        self.db.statements.clear()
+
+        counts = self.rollups.rebuild(['deposits'])
+
+        self.assertEqual(set(counts), {'game_logs', 'deposits'})
+        self.assertIn(("TRUNCATE TABLE player_daily_activity", None), self.db.executed)
+        self.assertNotIn(("TRUNCATE TABLE user_daily_scores", None), self.db.executed)
+        self.assertEqual(self.refresh_params('deposits')[0][0], "1970-01-01 00:00:00")
+        self.assertEqual(self.rollups.get_watermarks()['game_scores'], '10')
+
+    def test_changed_definition_reloads_source(self):
+        """기록된 버전과 집계 정의 버전이 다르면 해당 원본만 비우고 다시 적재하는지 테스트"""
+        self.rollups.refresh()
+        # 버전 관리 도입 전에 적재된 game_scores 롤업
+        del self.db.versions['game_scores']
+        self.db.statements.clear()
+        self.db.max_id = 12
+
+        counts = self.rollups.refresh(['game_scores'])
+
+        self.assertEqual(counts, {'game_scores': 3})
+        self.assertIn(("TRUNCATE TABLE user_daily_scores", None), self.db.executed)
+        self.assertNotIn(("TRUNCATE TABLE player_daily_activity", None), self.db.executed)
+        self.assertEqual(self.refresh_params('game_scores'), [(0, 12)])
+        self.assertEqual(self.rollups.get_versions()['game_scores'], ROLLUP_SOURCES['game_scores'].version)
+
+        # 공유 테이블 원본 하나의 정의가 바뀌면 두 원본을 함께 다시 적재
+        self.db.versions['deposits'] = '0'
+        counts = self.rollups.refresh(['game_logs'])
+        self.assertEqual(set(counts), {'game_logs', 'deposits'})
+        self.assertEqual(self.refresh_params('deposits')[-1][0], "1970-01-01 00:00:00")
+
+    def test_unknown_source(self):
+        """알 수 없는 원본 이름 테스트"""
+        with self.assertRaises(ValueError):
+            self.rollups.refresh(['money_flows'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+"""
+SQL 카탈로그 모듈 테스트
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.database.sql_catalog import CatalogError, SqlCatalog, compile_placeholders, run_named_query
+
+try:
+    from src.database.mariadb_connection import MariaDBConnection
+except ImportError:  # mariadb 커넥터가 없는 환경
+    MariaDBConnection = None
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+class TestSqlCatalog(unittest.TestCase):
+    """이름 있는 쿼리 로드, 파라미터 검사, 파일 변경 반영 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.write('user/players.sql', """
+-- name: players_by_level
+SELECT id, name FROM players WHERE level >= :min_level AND name <> ':not_param' LIMIT :limit;
+
+-- name: player_count
+SELECT COUNT(*) AS cnt FROM players WHERE created_at > ?;
+""")
+        self.write('user/single.sql', "-- 단일 문장 파일\nSELECT 1")
+
+    def tearDown(self):
+        """테스트 정리"""
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, relative_path, text, mtime=None):
+        path = Path(self.temp_dir) / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding='utf-8')
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def test_compile_placeholders(self):
+        """자리표시자 변환과 리터럴/캐스트 제외 테스트"""
+        sql, names, positional = compile_placeholders(
+            "SELECT @x := 1, a::text, ':skip' FROM t WHERE a = :a AND b = :b OR a = :a")
+        self.assertEqual(sql, "SELECT @x := 1, a::text, ':skip' FROM t WHERE a = ? AND b = ? OR a = ?")
+        self.assertEqual(names, ['a', 'b', 'a'])
+        self.assertEqual(positional, 0)
+
+        sql, _, _ = compile_placeholders("SELECT DATE_FORMAT(d, '%Y') FROM t WHERE id = :id", 'format')
+        self.assertEqual(sql, "SELECT DATE_FORMAT(d, '%%Y') FROM t WHERE id = %s")
+
+        with self.assertRaises(CatalogError):
+            compile_placeholders("SELECT * FROM t WHERE a = :a AND b = ?")
+
+    def test_load_and_bind(self):
+        """섹션/파일 이름 등록과 파라미터 바인딩 테스트"""
+        catalog = SqlCatalog(self.temp_dir)
+        self.assertEqual(catalog.names(), ['player_count', 'players_by_level', 'user/single'])
+
+        query = catalog.get('players_by_level')
+        self.assertEqual(query.source, 'user/players')
+        self.assertEqual(query.line, 3)
+        sql, values = query.bind({'limit': 10, 'min_level': 5})
+        self.assertIn('level >= ? AND', sql)
+        self.assertEqual(values, (5, 10))
+
+        with self.assertRaises(CatalogError):
+            query.bind({'min_level': 5})
+        with self.assertRaises(CatalogError):
+            query.bind({'min_level': 5, 'limit': 1, 'extra': 1})
+        with self.assertRaises(CatalogError):
+            catalog.get('player_count').bind(())
+        self.assertEqual(catalog.get('player_count').bind(('2024-01-01',))[1], ('2024-01-01',))
+        with self.assertRaises(KeyError):
+            catalog.get('missing')
+
+        self.assertIn('-- name: player_count', catalog.source('user/players.sql'))
+
+    def test_duplicate_names(self):
+        """파일 간 이름 중복 오류 테스트"""
+        self.write('event/dup.sql', "-- name: player_count\nSELECT 2")
+        with self.assertRaises(CatalogError):
+            SqlCatalog(self.temp_dir)
+
+    def test_hot_reload(self):
+        """수정 시각 기반 다시 읽기 테스트"""
+        catalog = SqlCatalog(self.temp_dir, check_interval=0)
+        reloads = catalog.reload_count
+        catalog.get('user/single')
+        self.assertEqual(catalog.reload_count, reloads)
+
+        self.write('user/single.sql', "SELECT 2", mtime=2_000_000_000)
+        self.write('user/new.sql', "-- name: new_query\nSELECT :x")
+        self.assertEqual(catalog.get('user/single').sql, 'SELECT 2')
+        self.assertEqual(catalog.get('new_query').params, ('x',))
+
+        # 잘못된 파일은 이전 내용 유지
+        self.write('user/single.sql', "SELECT 'broken", mtime=2_000_000_100)
+        self.assertEqual(catalog.get('user/single').sql, 'SELECT 2')
+
+        os.remove(Path(self.temp_dir) / 'user' / 'new.sql')
+        self.assertNotIn('new_query', catalog)
+
+    def test_run_named_query_fallback(self):
+        """query_named가 없는 연결은 %s 형식으로 실행하는지 테스트"""
+        catalog = SqlCatalog(self.temp_dir)
+        db = MagicMock(spec=['query'])
+        db.query.return_value = [{'cnt': 3}]
+
+        result = run_named_query(db, 'player_count', ('2024-01-01',), catalog=catalog)
+
+        self.assertEqual(result, [{'cnt': 3}])
+        db.query.assert_called_once_with(
+            'SELECT COUNT(*) AS cnt FROM players WHERE created_at > %s', ('2024-01-01',))
+
+    def test_project_queries(self):
+        """저장소 queries/ 디렉토리 로드 테스트"""
+        catalog = SqlCatalog(PROJECT_ROOT / 'queries')
+        query = catalog.get('inactive_event_deposit_users')
+        self.assertEqual(query.params, ('days_inactive',))
+        self.assertIn('InactiveUsers', query.sql)
+        self.assertEqual(catalog.get('table_columns').params, ('table_name',))
+
+@unittest.skipIf(MariaDBConnection is None, "mariadb connector is not installed")
+class TestStatementCacheStats(unittest.TestCase):
+    """prepared statement 캐시 통계 테스트"""
+
+    def test_counters_are_thread_safe(self):
+        """여러 작업 스레드가 동시에 캐시를 사용해도 히트/미스 수가 정확한지 테스트"""
+        with patch.object(MariaDBConnection, '_create_pool'):
+            db = MariaDBConnection()
+        db.statement_cache_size = 2
+        states = {}
+        db.connection_pool = MagicMock()
+        db.connection_pool.connection_state.side_effect = lambda conn: states.setdefault(id(conn), {})
+        connections = [MagicMock() for _ in range(8)]
+
+        def run(conn):
+            for i in range(500):
+                db._prepared_cursor(conn, f"SELECT {i % 3}")
+
+        threads = [threading.Thread(target=run, args=(conn,)) for conn in connections]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = db.statement_cache_stats
+        self.assertEqual(stats['hits'] + stats['misses'], 8 * 500)
+        self.assertEqual(stats['misses'] - stats['evictions'], 8 * 2)
+
+if __name__ == '__main__':
+    unittest.main()
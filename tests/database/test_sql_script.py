@@ -0,0 +1,76 @@
+"""
+SQL 스크립트 분석 모듈 테스트
+"""
+
+import unittest
+from pathlib import Path
+
+from src.database.sql_script import ScriptParseError, parse_script, script_sections, split_statements
+
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+class TestSqlScript(unittest.TestCase):
+    """문장 분리, DELIMITER, 섹션 테스트"""
+
+    def test_semicolons_in_literals_and_comments(self):
+        """문자열과 주석 안의 ';'에서 문장을 자르지 않는지 테스트"""
+        script = """
+        -- 주석; 무시
+        INSERT INTO notes (body) VALUES ('a;b', "it''s; \\"ok\\"");
+        # 해시 주석;
+        SELECT `odd;name` FROM t /* 블록; 주석 */ WHERE x = 1;
+        SELECT /*+ MAX_EXECUTION_TIME(1000) */ 1;
+        /* 주석만 있는 조각 */;
+        """
+        statements = split_statements(script)
+        self.assertEqual(len(statements), 3)
+        self.assertIn("'a;b'", statements[0])
+        self.assertIn("`odd;name`", statements[1])
+        self.assertNotIn("블록", statements[1])
+        self.assertIn("/*+ MAX_EXECUTION_TIME(1000) */", statements[2])
+
+    def test_delimiter_block(self):
+        """DELIMITER로 감싼 프로시저 본문 테스트"""
+        script = """DROP PROCEDURE IF EXISTS p;
+DELIMITER //
+CREATE PROCEDURE p()
+BEGIN
+    SELECT 1;
+    SELECT 2;
+END //
+DELIMITER ;
+CALL p();
+"""
+        statements = split_statements(script)
+        self.assertEqual(len(statements), 3)
+        self.assertTrue(statements[1].startswith('CREATE PROCEDURE p()'))
+        self.assertTrue(statements[1].endswith('END'))
+        self.assertIn('SELECT 2;', statements[1])
+        self.assertEqual(statements[2], 'CALL p()')
+
+    def test_sections_and_lines(self):
+        """'-- name:' 섹션과 시작 줄 번호 테스트"""
+        script = "SELECT 0;\n-- name: first\nSELECT 1;\n\nSELECT\n  2;\n-- name: second\nSELECT 3"
+        statements = parse_script(script)
+        self.assertEqual([(s.section, s.line) for s in statements],
+                         [(None, 1), ('first', 3), ('first', 5), ('second', 8)])
+        self.assertEqual(script_sections(script), {'first': ['SELECT 1', 'SELECT\n  2'], 'second': ['SELECT 3']})
+
+    def test_unterminated_literal(self):
+        """닫히지 않은 문자열 오류 테스트"""
+        with self.assertRaises(ScriptParseError):
+            parse_script("SELECT 'abc;")
+        with self.assertRaises(ValueError):
+            parse_script("SELECT 1 /* open")
+
+    def test_project_query_file(self):
+        """저장소의 다중 문장 쿼리 파일 분리 테스트"""
+        script = (PROJECT_ROOT / 'queries' / 'event' / 'event_payment_analysis.sql').read_text(encoding='utf-8')
+        statements = split_statements(script)
+        self.assertGreaterEqual(len(statements), 4)
+        for statement in statements:
+            self.assertFalse(statement.startswith('--'))
+            self.assertNotIn(';', statement.replace("';'", ''))
+
+if __name__ == '__main__':
+    unittest.main()
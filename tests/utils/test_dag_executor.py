@@ -0,0 +1,71 @@
+"""
+의존성 기반 병렬 실행 모듈 테스트
+"""
+
+import time
+import threading
+import unittest
+
+from src.utils.dag_executor import DAGExecutor, DAGExecutionError
+
+class TestDAGExecutor(unittest.TestCase):
+    """DAGExecutor 클래스 테스트"""
+
+    def test_passes_dependency_results(self):
+        """의존 노드 결과 전달 및 실행 시간 기록 테스트"""
+        calls = []
+        dag = DAGExecutor(max_workers=4)
+        dag.add('shared', lambda: calls.append('shared') or 2)
+        dag.add('a', lambda shared: shared * 10, deps=['shared'])
+        dag.add('b', lambda shared: shared + 1, deps=['shared'])
+        dag.add('c', lambda a, b: a + b, deps=['a', 'b'])
+
+        results = dag.run()
+
+        self.assertEqual(results, {'shared': 2, 'a': 20, 'b': 3, 'c': 23})
+        self.assertEqual(calls, ['shared'])
+        self.assertEqual(set(dag.timings), {'shared', 'a', 'b', 'c'})
+
+    def test_independent_nodes_run_concurrently(self):
+        """독립 노드 동시 실행 테스트"""
+        barrier = threading.Barrier(3, timeout=2)
+        dag = DAGExecutor(max_workers=3)
+        for name in ('x', 'y', 'z'):
+            dag.add(name, barrier.wait)
+
+        start = time.time()
+        dag.run()
+        self.assertLess(time.time() - start, 2)
+
+    def test_failure_skips_dependents(self):
+        """실패한 노드의 의존 노드를 실행하지 않는지 테스트"""
+        dependent_calls = []
+
+        def fail():
+            raise RuntimeError("query failed")
+
+        dag = DAGExecutor()
+        dag.add('bad', fail)
+        dag.add('child', lambda bad: dependent_calls.append(bad), deps=['bad'])
+
+        with self.assertRaises(DAGExecutionError) as ctx:
+            dag.run()
+        self.assertEqual(ctx.exception.node, 'bad')
+        self.assertEqual(dependent_calls, [])
+
+    def test_invalid_graph(self):
+        """알 수 없는 의존성과 순환 의존성 검사 테스트"""
+        dag = DAGExecutor()
+        dag.add('a', lambda b: b, deps=['b'])
+        with self.assertRaises(ValueError):
+            dag.run()
+
+        dag.add('b', lambda a: a, deps=['a'])
+        with self.assertRaises(ValueError):
+            dag.run()
+
+        with self.assertRaises(ValueError):
+            dag.add('a', lambda: None)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+범위 기반 메모이제이션 모듈 테스트
+"""
+
+import time
+import threading
+import unittest
+
+import pandas as pd
+
+from src.utils.memoize import MemoizedMixin, memoized
+
+class CountingAnalyzer(MemoizedMixin):
+    """조회 횟수를 세는 테스트용 분석기"""
+
+    def __init__(self, memo_ttl=None, max_scope_age=60.0):
+        self.calls = []
+        self.init_memoization(default_memo_ttl=memo_ttl, max_scope_age=max_scope_age)
+
+    @memoized
+    def get_users(self, days_inactive=10):
+        self.calls.append(('get_users', days_inactive))
+        return pd.DataFrame({'id': [1, 2], 'days': [days_inactive] * 2})
+
+    @memoized
+    def get_slow(self):
+        self.calls.append(('get_slow',))
+        time.sleep(0.05)
+        return 42
+
+class TestMemoization(unittest.TestCase):
+    """MemoizedMixin/memoized 테스트"""
+
+    def test_no_memoization_outside_scope(self):
+        """범위 밖에서는 매번 실행되는지 테스트"""
+        analyzer = CountingAnalyzer()
+        analyzer.get_users()
+        analyzer.get_users()
+        self.assertEqual(len(analyzer.calls), 2)
+
+    def test_scope_dedups_by_normalized_arguments(self):
+        """기본값을 채운 인자 기준으로 한 번만 실행되는지 테스트"""
+        analyzer = CountingAnalyzer()
+        with analyzer.memo_scope() as scope:
+            analyzer.get_users()
+            analyzer.get_users(10)
+            analyzer.get_users(days_inactive=10)
+            analyzer.get_users(30)
+
+            stats = scope.stats()
+            self.assertEqual(stats['hits'], 2)
+            self.assertEqual(stats['misses'], 2)
+            self.assertEqual(stats['methods']['get_users'], {'hits': 2, 'misses': 2})
+
+        self.assertEqual(analyzer.calls, [('get_users', 10), ('get_users', 30)])
+
+        # 범위가 닫히면 캐시도 사라짐
+        with analyzer.memo_scope():
+            analyzer.get_users()
+        self.assertEqual(len(analyzer.calls), 3)
+
+    def test_cached_dataframe_is_copied(self):
+        """캐시된 DataFrame이 호출자 수정에 영향받지 않는지 테스트"""
+        analyzer = CountingAnalyzer()
+        with analyzer.memo_scope():
+            first = analyzer.get_users()
+            first['id'] = 0
+            second = analyzer.get_users()
+        self.assertEqual(list(second['id']), [1, 2])
+
+    def test_concurrent_calls_share_single_execution(self):
+        """동시 요청이 한 번의 실행 결과를 공유하는지 테스트"""
+        analyzer = CountingAnalyzer()
+        results = []
+        with analyzer.memo_scope():
+            threads = [threading.Thread(target=lambda: results.append(analyzer.get_slow())) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(results, [42] * 4)
+        self.assertEqual(analyzer.calls, [('get_slow',)])
+
+    def test_overlapping_scopes_rotate_after_max_age(self):
+        """겹치는 범위가 계속 열려 있어도 최대 시간이 지나면 새 범위를 사용하는지 테스트"""
+        analyzer = CountingAnalyzer(max_scope_age=0.05)
+        with analyzer.memo_scope() as first:
+            analyzer.get_users()
+            time.sleep(0.06)
+            # 첫 범위가 닫히기 전에 겹쳐 열린 호출
+            with analyzer.memo_scope() as second:
+                self.assertIsNot(second, first)
+                analyzer.get_users()
+            analyzer.get_users()
+
+        self.assertEqual(len(analyzer.calls), 2)
+        self.assertIsNone(analyzer.active_memo_scope)
+
+    def test_default_ttl_and_invalidation_hook(self):
+        """범위 밖 TTL 재사용과 무효화 훅 테스트"""
+        analyzer = CountingAnalyzer(memo_ttl=60)
+        invalidated = []
+        analyzer.add_invalidation_hook(invalidated.append)
+
+        analyzer.get_users()
+        analyzer.get_users()
+        self.assertEqual(len(analyzer.calls), 1)
+
+        self.assertEqual(analyzer.invalidate_memo('get_users'), 1)
+        self.assertEqual(invalidated, [('get_users',)])
+        analyzer.get_users()
+        self.assertEqual(len(analyzer.calls), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+HTTP 응답 캐시 모듈 테스트
+"""
+
+import time
+import threading
+import unittest
+
+from flask import Flask, jsonify, request
+
+from src.utils.response_cache import (
+    MemoryResponseStore, RedisResponseStore, ResponseCache, cached_response, get_response_cache
+)
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value.encode('utf-8') if isinstance(value, str) else value
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        prefix = match.rstrip('*')
+        return [key for key in self.data if key.startswith(prefix)]
+
+class TestCachedResponse(unittest.TestCase):
+    """cached_response 데코레이터 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.app = Flask(__name__)
+        self.app.config['REDIS_URL'] = None
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+        @self.app.route('/report')
+        @cached_response(ttl=60, stale_ttl=0)
+        def report():
+            self.release.wait(5)
+            self.calls += 1
+            return jsonify({'calls': self.calls, 'days': request.args.getlist('days')})
+
+        @self.app.route('/stale')
+        @cached_response(ttl=0, stale_ttl=60)
+        def stale():
+            self.calls += 1
+            return jsonify({'calls': self.calls})
+
+        @self.app.route('/error')
+        @cached_response()
+        def error():
+            self.calls += 1
+            return jsonify({'error': 'failed'}), 500
+
+        self.client = self.app.test_client()
+
+    def test_hit_and_etag(self):
+        """두 번째 요청은 캐시를 사용하고 If-None-Match가 일치하면 304를 반환하는지 테스트"""
+        first = self.client.get('/report?days=7')
+        second = self.client.get('/report?days=7')
+
+        self.assertEqual(first.headers['X-Cache'], 'MISS')
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(second.get_json(), {'calls': 1, 'days': ['7']})
+        self.assertEqual(first.headers['ETag'], second.headers['ETag'])
+        self.assertIn('max-age=', first.headers['Cache-Control'])
+
+        not_modified = self.client.get('/report?days=7', headers={'If-None-Match': first.headers['ETag']})
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.get_data(), b'')
+        self.assertEqual(self.calls, 1)
+
+    def test_key_normalization_and_scope(self):
+        """쿼리 인자 순서는 무시하고 인증 범위별로 응답을 나누는지 테스트"""
+        self.client.get('/report?a=1&b=2')
+        response = self.client.get('/report?b=2&a=1')
+        self.assertEqual(response.headers['X-Cache'], 'HIT')
+        self.assertTrue(response.headers['Cache-Control'].startswith('public'))
+
+        scoped = self.client.get('/report?a=1&b=2', headers={'Authorization': 'Bearer token'})
+        self.assertEqual(scoped.headers['X-Cache'], 'MISS')
+        self.assertTrue(scoped.headers['Cache-Control'].startswith('private'))
+        self.assertEqual(self.calls, 2)
+
+    def test_stale_while_revalidate(self):
+        """유효 시간이 지나면 오래된 응답을 반환하고 백그라운드에서 갱신하는지 테스트"""
+        self.client.get('/stale')
+        response = self.client.get('/stale')
+
+        self.assertEqual(response.headers['X-Cache'], 'STALE')
+        self.assertEqual(response.get_json(), {'calls': 1})
+        self.assertIn('stale-while-revalidate=60', response.headers['Cache-Control'])
+
+        deadline = time.time() + 5
+        while self.calls < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.calls, 2)
+
+    def test_concurrent_requests_coalesced(self):
+        """같은 키의 동시 요청이 뷰를 한 번만 실행하는지 테스트"""
+        self.release.clear()
+        results = []
+
+        def fetch():
+            results.append(self.app.test_client().get('/report').get_json())
+
+        threads = [threading.Thread(target=fetch) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [{'calls': 1, 'days': []}] * 5)
+
+    def test_error_not_cached(self):
+        """오류 응답은 캐시하지 않는지 테스트"""
+        self.assertEqual(self.client.get('/error').status_code, 500)
+        self.assertEqual(self.client.get('/error').status_code, 500)
+        self.assertEqual(self.calls, 2)
+
+    def test_clear(self):
+        """캐시 삭제 후 다시 계산하는지 테스트"""
+        self.client.get('/report')
+        self.assertIsInstance(get_response_cache(self.app).store, MemoryResponseStore)
+        get_response_cache(self.app).clear()
+        self.assertEqual(self.client.get('/report').headers['X-Cache'], 'MISS')
+
+class TestRedisResponseStore(unittest.TestCase):
+    """RedisResponseStore 테스트"""
+
+    def test_roundtrip_and_lock(self):
+        """본문 직렬화와 SET NX 잠금 테스트"""
+        client = FakeRedis()
+        store = RedisResponseStore(client)
+        store.set('k', {'body': b'{"a": 1}', 'mimetype': 'application/json', 'etag': 'e', 'created_at': 1.0}, 10)
+        self.assertEqual(store.get('k')['body'], b'{"a": 1}')
+
+        self.assertTrue(store.acquire_lock('k', 5))
+        self.assertFalse(store.acquire_lock('k', 5))
+        store.release_lock('k')
+        self.assertTrue(store.acquire_lock('k', 5))
+
+        store.clear()
+        self.assertEqual(client.data, {})
+
+    def test_waits_for_other_process(self):
+        """다른 프로세스가 잠금을 가진 동안 저장된 응답을 기다려 사용하는지 테스트"""
+        store = RedisResponseStore(FakeRedis())
+        cache = ResponseCache(store)
+        store.acquire_lock('k', 5)
+        entry = {'body': b'1', 'mimetype': 'application/json', 'etag': 'e', 'created_at': time.time()}
+        threading.Timer(0.1, store.set, ('k', entry, 10)).start()
+
+        result, response = cache.fill('k', lambda: self.fail("should not compute"), 10)
+        self.assertEqual(result['body'], b'1')
+        self.assertIsNone(response)
+
+if __name__ == '__main__':
+    unittest.main()